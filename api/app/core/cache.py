@@ -0,0 +1,557 @@
+"""
+Shared response cache for expensive read endpoints.
+
+Two tiers:
+- In-process LRU for hot keys (per worker, capped TTL)
+- Redis for sharing results across API replicas and Celery workers
+
+Concurrent misses on the same key are collapsed into a single load
+(single-flight), and every entry carries tags so a write can drop all
+dependent responses at once. Writes to RFPs are detected through SQLAlchemy
+session events and invalidate ``CacheTag.RFPS`` automatically.
+
+Usage:
+    from app.core.cache import CacheTag, cached
+
+    @router.get("/stats/overview")
+    @cached("rfps:stats", ttl=60, tags=[CacheTag.RFPS])
+    async def get_rfp_stats(db: DBDep):
+        ...
+"""
+
+import asyncio
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class CacheTag(str, Enum):
+    """Invalidation tags shared by cached endpoints."""
+
+    RFPS = "rfps"
+    PREDICTIONS = "predictions"
+    GENERATION_CONTEXT = "generation_context"
+
+
+# Tables whose writes invalidate a tag
+TABLE_TAGS: dict[str, str] = {
+    "rfp_opportunities": CacheTag.RFPS.value,
+    "pipeline_events": CacheTag.RFPS.value,
+    "rfp_qa": CacheTag.GENERATION_CONTEXT.value,
+    "rfp_documents": CacheTag.GENERATION_CONTEXT.value,
+    "company_profiles": CacheTag.GENERATION_CONTEXT.value,
+}
+
+# Parameters that never contribute to a cache key
+_NON_KEY_PARAMS = frozenset({"db", "request", "background_tasks", "service"})
+
+# Seconds to wait before retrying Redis after a connection failure
+_REDIS_RETRY_INTERVAL = 30.0
+
+
+@dataclass
+class CacheEntry:
+    """A cached value with its bookkeeping."""
+
+    value: Any
+    stored_at: float
+    expires_at: float
+    tags: frozenset[str]
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.stored_at
+
+    def is_fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+
+def _tag_name(tag: CacheTag | str) -> str:
+    return tag.value if isinstance(tag, CacheTag) else str(tag)
+
+
+def _normalize(value: Any) -> Any:
+    """Normalize a parameter value so equivalent requests share a key."""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, dict):
+        return {str(k): _normalize(v) for k, v in sorted(value.items(), key=lambda kv: str(kv[0]))}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted(_normalize(v) for v in value)
+    if hasattr(value, "model_dump"):
+        return _normalize(value.model_dump())
+    return jsonable_encoder(value)
+
+
+def make_cache_key(namespace: str, params: dict[str, Any] | None = None) -> str:
+    """
+    Build a cache key from a namespace and request parameters.
+
+    Parameters are normalized (enums to values, dicts sorted, models dumped)
+    and hashed so the key length stays bounded.
+    """
+    if not params:
+        return namespace
+    payload = json.dumps(_normalize(params), sort_keys=True, separators=(",", ":"))
+    digest = hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+    return f"{namespace}:{digest}"
+
+
+class LocalLRUCache:
+    """Thread-safe in-process LRU tier."""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate_tags(self, tags: frozenset[str]) -> int:
+        with self._lock:
+            stale = [k for k, e in self._entries.items() if e.tags & tags]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RedisCacheBackend:
+    """
+    Redis tier storing JSON-encoded entries.
+
+    Tag membership is tracked in Redis sets so invalidation from any process
+    reaches every replica. Connection failures disable the tier for a short
+    back-off window instead of slowing every request.
+    """
+
+    def __init__(self, url: str, prefix: str):
+        self.url = url
+        self.prefix = prefix
+        self._client = None
+        self._disabled_until = 0.0
+
+    def _get_client(self):
+        if time.time() < self._disabled_until:
+            return None
+        if self._client is None:
+            try:
+                import redis
+
+                client = redis.from_url(
+                    self.url,
+                    decode_responses=True,
+                    socket_connect_timeout=0.5,
+                    socket_timeout=0.5,
+                )
+                client.ping()
+                self._client = client
+            except Exception as e:
+                logger.debug("Redis cache unavailable: %s", e)
+                self._disabled_until = time.time() + _REDIS_RETRY_INTERVAL
+                return None
+        return self._client
+
+    @property
+    def available(self) -> bool:
+        """Whether the tier is currently reachable."""
+        return self._get_client() is not None
+
+    def _mark_failed(self, e: Exception) -> None:
+        logger.warning("Redis cache error, falling back to local tier: %s", e)
+        self._client = None
+        self._disabled_until = time.time() + _REDIS_RETRY_INTERVAL
+
+    def get(self, key: str) -> CacheEntry | None:
+        client = self._get_client()
+        if client is None:
+            return None
+        try:
+            raw = client.get(self.prefix + key)
+        except Exception as e:
+            self._mark_failed(e)
+            return None
+        if not raw:
+            return None
+        data = json.loads(raw)
+        return CacheEntry(
+            value=data["v"],
+            stored_at=data["t"],
+            expires_at=data["e"],
+            tags=frozenset(data.get("g", [])),
+        )
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        client = self._get_client()
+        if client is None:
+            return
+        ttl = max(1, int(entry.expires_at - time.time()))
+        payload = json.dumps(
+            {"v": entry.value, "t": entry.stored_at, "e": entry.expires_at, "g": sorted(entry.tags)}
+        )
+        try:
+            pipe = client.pipeline()
+            pipe.setex(self.prefix + key, ttl, payload)
+            for tag in entry.tags:
+                tag_key = f"{self.prefix}tag:{tag}"
+                pipe.sadd(tag_key, key)
+                pipe.expire(tag_key, max(ttl, 3600))
+            pipe.execute()
+        except Exception as e:
+            self._mark_failed(e)
+
+    def delete(self, key: str) -> None:
+        client = self._get_client()
+        if client is None:
+            return
+        try:
+            client.delete(self.prefix + key)
+        except Exception as e:
+            self._mark_failed(e)
+
+    def invalidate_tags(self, tags: frozenset[str]) -> None:
+        client = self._get_client()
+        if client is None:
+            return
+        try:
+            for tag in tags:
+                tag_key = f"{self.prefix}tag:{tag}"
+                keys = client.smembers(tag_key)
+                pipe = client.pipeline()
+                for key in keys:
+                    pipe.delete(self.prefix + key)
+                pipe.delete(tag_key)
+                pipe.execute()
+        except Exception as e:
+            self._mark_failed(e)
+
+    def clear(self) -> None:
+        client = self._get_client()
+        if client is None:
+            return
+        try:
+            for key in client.scan_iter(match=f"{self.prefix}*", count=500):
+                client.delete(key)
+        except Exception as e:
+            self._mark_failed(e)
+
+
+class ResponseCache:
+    """
+    Two-tier cache with single-flight loading and tag invalidation.
+
+    Values must be JSON-serializable; ``set`` runs them through
+    ``jsonable_encoder`` so both tiers return identical payloads.
+    """
+
+    def __init__(
+        self,
+        local: LocalLRUCache,
+        remote: RedisCacheBackend | None = None,
+        local_ttl: float = 10.0,
+        enabled: bool = True,
+    ):
+        self.local = local
+        self.remote = remote
+        self.local_ttl = local_ttl
+        self.enabled = enabled
+        self._inflight: dict[str, asyncio.Future] = {}
+        self.stats = {"hits": 0, "misses": 0, "loads": 0, "coalesced": 0}
+
+    def get_entry(self, key: str, allow_stale: bool = False) -> CacheEntry | None:
+        """Look up an entry in the local tier, then Redis."""
+        if not self.enabled:
+            return None
+
+        entry = self.local.get(key)
+        if entry is not None and (entry.is_fresh() or allow_stale):
+            return entry
+
+        if self.remote is not None:
+            remote_entry = self.remote.get(key)
+            if remote_entry is not None and remote_entry.is_fresh():
+                self._store_local(key, remote_entry)
+                return remote_entry
+
+        return entry if allow_stale else None
+
+    def get(self, key: str) -> Any | None:
+        """Return a fresh cached value or None."""
+        entry = self.get_entry(key)
+        return entry.value if entry is not None else None
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: float,
+        tags: Iterable[CacheTag | str] = (),
+    ) -> Any:
+        """Store a value in both tiers and return its encoded form."""
+        encoded = jsonable_encoder(value)
+        if not self.enabled:
+            return encoded
+
+        now = time.time()
+        entry = CacheEntry(
+            value=encoded,
+            stored_at=now,
+            expires_at=now + ttl,
+            tags=frozenset(_tag_name(t) for t in tags),
+        )
+        self._store_local(key, entry)
+        if self.remote is not None:
+            self.remote.set(key, entry)
+        return encoded
+
+    def _store_local(self, key: str, entry: CacheEntry) -> None:
+        # With Redis reachable, the local tier never outlives local_ttl so
+        # other workers' writes and invalidations become visible quickly.
+        # Entries are kept past expiry (until evicted) for stale-on-error.
+        if self.remote is not None and self.remote.available:
+            entry = CacheEntry(
+                value=entry.value,
+                stored_at=entry.stored_at,
+                expires_at=min(entry.expires_at, time.time() + self.local_ttl),
+                tags=entry.tags,
+            )
+        self.local.set(key, entry)
+
+    def delete(self, key: str) -> None:
+        self.local.delete(key)
+        if self.remote is not None:
+            self.remote.delete(key)
+
+    def invalidate_tags(self, *tags: CacheTag | str) -> None:
+        """Drop every entry carrying any of the given tags."""
+        names = frozenset(_tag_name(t) for t in tags)
+        if not names:
+            return
+        dropped = self.local.invalidate_tags(names)
+        if self.remote is not None:
+            self.remote.invalidate_tags(names)
+        logger.debug("Invalidated cache tags %s (%d local entries)", sorted(names), dropped)
+
+    def clear(self) -> None:
+        """Clear both tiers."""
+        self.local.clear()
+        if self.remote is not None:
+            self.remote.clear()
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: float,
+        tags: Iterable[CacheTag | str] = (),
+        refresh: bool = False,
+    ) -> tuple[Any, float | None]:
+        """
+        Return ``(value, age_seconds)``, loading on miss.
+
+        ``age_seconds`` is None when the value was just loaded. Concurrent
+        callers missing on the same key await a single loader call.
+        """
+        if not refresh:
+            entry = self.get_entry(key)
+            if entry is not None:
+                self.stats["hits"] += 1
+                return entry.value, entry.age
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self.stats["coalesced"] += 1
+            return await asyncio.shield(pending), None
+
+        self.stats["misses"] += 1
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            self.stats["loads"] += 1
+            value = self.set(key, await loader(), ttl, tags)
+            future.set_result(value)
+            return value, None
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Avoid "exception was never retrieved" when nobody else waited
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+
+response_cache = ResponseCache(
+    local=LocalLRUCache(max_entries=settings.CACHE_LOCAL_MAX_ENTRIES),
+    remote=(
+        RedisCacheBackend(settings.REDIS_URL, settings.CACHE_KEY_PREFIX)
+        if settings.CACHE_REDIS_ENABLED
+        else None
+    ),
+    local_ttl=settings.CACHE_LOCAL_TTL_SECONDS,
+    enabled=settings.CACHE_ENABLED,
+)
+
+
+def cached(
+    namespace: str,
+    ttl: float,
+    tags: Iterable[CacheTag | str] = (),
+    exclude: Iterable[str] = (),
+    bypass_param: str | None = None,
+    annotate: bool = False,
+    stale_if_error: bool = False,
+):
+    """
+    Cache an async endpoint's response keyed on its normalized parameters.
+
+    Args:
+        namespace: Key prefix identifying the route; also added as a tag so
+            ``response_cache.invalidate_tags(namespace)`` clears the route
+        ttl: Time to live in seconds
+        tags: Invalidation tags the response depends on
+        exclude: Extra parameter names to leave out of the key
+            (``db``, ``request``, ``background_tasks`` are always excluded)
+        bypass_param: Boolean parameter that forces a reload when False
+            (e.g. ``use_cache``); excluded from the key
+        annotate: Merge ``cached``/``cache_age_seconds`` into dict responses
+        stale_if_error: Serve the last local value if the handler raises
+    """
+    entry_tags = [*tags, namespace]
+    skip = _NON_KEY_PARAMS | set(exclude) | ({bypass_param} if bypass_param else set())
+
+    def decorator(func: Callable[..., Awaitable[Any]]):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            bound = signature.bind_partial(*args, **kwargs)
+            bound.apply_defaults()
+            params = {k: v for k, v in bound.arguments.items() if k not in skip}
+            key = make_cache_key(namespace, params)
+            refresh = bool(bypass_param) and bound.arguments.get(bypass_param) is False
+
+            try:
+                value, age = await response_cache.get_or_load(
+                    key, lambda: func(*args, **kwargs), ttl, entry_tags, refresh=refresh
+                )
+            except Exception:
+                stale = response_cache.get_entry(key, allow_stale=True) if stale_if_error else None
+                if stale is None:
+                    raise
+                logger.warning("Serving stale cache for %s after handler error", namespace)
+                value, age = stale.value, stale.age
+                if annotate and isinstance(value, dict):
+                    return {**value, "cached": True, "stale": True, "cache_age_seconds": int(age)}
+                return value
+
+            if annotate and isinstance(value, dict):
+                return {
+                    **value,
+                    "cached": age is not None,
+                    **({"cache_age_seconds": int(age)} if age is not None else {}),
+                }
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+# =============================================================================
+# Write-triggered invalidation
+# =============================================================================
+
+_PENDING_TAGS_KEY = "response_cache_pending_tags"
+
+
+def _tags_for_instances(instances: Iterable[Any]) -> set[str]:
+    tags = set()
+    for obj in instances:
+        tag = TABLE_TAGS.get(getattr(obj, "__tablename__", ""))
+        if tag:
+            tags.add(tag)
+    return tags
+
+
+def _after_flush(session: Session, flush_context) -> None:
+    tags = _tags_for_instances([*session.new, *session.dirty, *session.deleted])
+    if tags:
+        session.info.setdefault(_PENDING_TAGS_KEY, set()).update(tags)
+
+
+def _do_orm_execute(orm_execute_state) -> None:
+    # Bulk query().update()/delete() bypass flush events
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    mapper = orm_execute_state.bind_mapper
+    table = getattr(getattr(mapper, "local_table", None), "name", "")
+    tag = TABLE_TAGS.get(table)
+    if tag:
+        orm_execute_state.session.info.setdefault(_PENDING_TAGS_KEY, set()).add(tag)
+
+
+def _after_commit(session: Session) -> None:
+    tags = session.info.pop(_PENDING_TAGS_KEY, None)
+    if tags:
+        response_cache.invalidate_tags(*tags)
+
+
+def _after_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_TAGS_KEY, None)
+
+
+def register_invalidation_listeners() -> None:
+    """Attach session listeners that invalidate tags on committed writes."""
+    if event.contains(Session, "after_commit", _after_commit):
+        return
+    event.listen(Session, "after_flush", _after_flush)
+    event.listen(Session, "do_orm_execute", _do_orm_execute)
+    event.listen(Session, "after_commit", _after_commit)
+    event.listen(Session, "after_rollback", _after_rollback)
+
+
+register_invalidation_listeners()
@@ -29,6 +29,32 @@ class Settings(BaseSettings):
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
 
+    # Response Cache
+    CACHE_ENABLED: bool = True
+    CACHE_REDIS_ENABLED: bool = True
+    CACHE_KEY_PREFIX: str = "rfp:cache:"
+    CACHE_LOCAL_MAX_ENTRIES: int = 1024
+    CACHE_LOCAL_TTL_SECONDS: int = 10  # Bounds cross-worker staleness of the LRU tier
+
+    # Proposal generation
+    BID_SECTION_CHECKPOINT_TTL_SECONDS: int = 86400  # Completed sections kept for retries
+    GENERATION_CONTEXT_TTL_SECONDS: int = 3600  # Assembled RFP context shared across sections
+
+    # Scraper
+    SCRAPE_RESULT_TTL_SECONDS: int = 600  # Lets /scraper/confirm reuse the /scraper/preview scrape
+    REFRESH_SCHEDULER_ENABLED: bool = False  # Turn on in exactly one API process; runs take no lock
+    REFRESH_RUN_INTERVAL_SECONDS: int = 600
+    REFRESH_BATCH_SIZE: int = 50  # Tracked RFPs checked per scheduler run
+    REFRESH_CONCURRENCY: int = 8
+    REFRESH_PLATFORM_CONCURRENCY: int = 2  # Concurrent checks against one platform
+    REFRESH_PLATFORM_INTERVAL_SECONDS: float = 2.0  # Spacing between requests to one platform
+    REFRESH_MIN_INTERVAL_MINUTES: int = 30
+    REFRESH_MAX_INTERVAL_HOURS: int = 24
+    REFRESH_FULL_SCRAPE_HOURS: int = 72  # Full extraction even when the cheap probe sees no change
+
+    # Compliance
+    COMPLIANCE_STREAM_BATCH_SIZE: int = 25  # Requirements answered and saved per streamed batch
+
     # CORS
     BACKEND_CORS_ORIGINS: list = ["http://localhost:3000", "http://localhost:8000", "http://localhost:3300"]
 
@@ -30,6 +30,8 @@ def init_db():
         Base,
         RFPOpportunity,
         RFPDocument,
+        DocumentProcessingJob,
+        RFPRefreshState,
         RFPQandA,
         CompanyProfile,
         BidDocument,
@@ -46,7 +48,14 @@ def init_db():
         ComplianceRequirement,
         PricingResult,
         SavedRfp,
+        WinRateCell,
     )
     from sqlalchemy.orm import configure_mappers
     configure_mappers()  # Ensure all relationships are resolved
     Base.metadata.create_all(bind=engine)
+
+    # create_all skips indexes on tables that already exist; add any that
+    # were introduced after the table was first created
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
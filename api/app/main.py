@@ -37,10 +37,24 @@ from fastapi.middleware.cors import CORSMiddleware
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events."""
+    import asyncio
     import sys
     import traceback
 
     # Startup
+    from app.services.pipeline_stream import pipeline_stream, register_delta_listeners
+    from app.services.win_rate_index import install_win_rate_index
+
+    pipeline_stream.bind_loop(asyncio.get_running_loop())
+    register_delta_listeners()
+    install_win_rate_index()
+
+    refresh_task = None
+    if settings.REFRESH_SCHEDULER_ENABLED:
+        from app.services.refresh_scheduler import run_refresh_loop
+
+        refresh_task = asyncio.create_task(run_refresh_loop())
+
     try:
         print("Initializing database...")
         init_db()
@@ -83,6 +97,26 @@ async def lifespan(app: FastAPI):
     yield
     # Shutdown
     print("Shutting down application...")
+    pipeline_stream.bind_loop(None)
+
+    if refresh_task is not None:
+        refresh_task.cancel()
+        try:
+            await refresh_task
+        except asyncio.CancelledError:
+            pass
+
+    from src.decision.win_rates import set_win_rate_source
+
+    set_win_rate_source(None)
+
+    from src.utils.text_store import get_text_store
+
+    get_text_store().shutdown()
+
+    from src.agents.scrapers.session_pool import close_browser_pools
+
+    await close_browser_pools()
 
 
 app = FastAPI(title=settings.PROJECT_NAME, version=settings.VERSION, lifespan=lifespan)
@@ -13,6 +13,7 @@ from sqlalchemy import (
     Enum,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -142,6 +143,10 @@ class RFPOpportunity(Base):
         "PostAwardChecklist", back_populates="rfp", uselist=False
     )
     documents = relationship("RFPDocument", back_populates="rfp")
+    processing_jobs = relationship("DocumentProcessingJob", back_populates="rfp")
+    refresh_state = relationship(
+        "RFPRefreshState", back_populates="rfp", uselist=False, cascade="all, delete-orphan"
+    )
     qa_items = relationship("RFPQandA", back_populates="rfp")
     company_profile = relationship("CompanyProfile", back_populates="rfps")
     compliance_requirements = relationship(
@@ -155,6 +160,11 @@ class RFPOpportunity(Base):
     )
     bid_outcome = relationship("BidOutcome", back_populates="rfp", uselist=False)
 
+    # Backs the per-stage window query in /pipeline/status
+    __table_args__ = (
+        Index("ix_rfp_opportunities_stage_updated", "current_stage", "updated_at"),
+    )
+
     def to_dict(self):
         return {
             "id": self.id,
@@ -574,6 +584,96 @@ class RFPDocument(Base):
         }
 
 
+class DocumentProcessingJob(Base):
+    """Ingestion of an uploaded document into the RAG index.
+
+    Persisted so status polling works from any API replica and survives
+    restarts; the worker updates the row as it moves through the stages.
+    """
+
+    __tablename__ = "document_processing_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    document_id = Column(String, unique=True, nullable=False, index=True)
+    rfp_id = Column(Integer, ForeignKey("rfp_opportunities.id"), nullable=False)
+    task_id = Column(String, nullable=True)  # Celery task id when queued
+
+    filename = Column(String, nullable=False)
+    file_path = Column(String, nullable=False)
+
+    status = Column(String, default="pending")  # pending, processing, completed, failed
+    stage = Column(String, default="queued")  # queued, extracting, chunking, indexing, done
+    progress = Column(Float, default=0)
+    chunks_total = Column(Integer, default=0)
+    chunks_indexed = Column(Integer, default=0)
+    error = Column(Text, nullable=True)
+    timings = Column(JSON, default=lambda: {})  # Seconds spent per stage
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime, nullable=True)
+    completed_at = Column(DateTime, nullable=True)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # Relationships
+    rfp = relationship("RFPOpportunity", back_populates="processing_jobs")
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "document_id": self.document_id,
+            "rfp_id": self.rfp_id,
+            "task_id": self.task_id,
+            "filename": self.filename,
+            "status": self.status,
+            "stage": self.stage,
+            "progress": self.progress,
+            "chunks_total": self.chunks_total,
+            "chunks_indexed": self.chunks_indexed,
+            "error": self.error,
+            "timings": self.timings,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "completed_at": (
+                self.completed_at.isoformat() if self.completed_at else None
+            ),
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+        }
+
+
+class RFPRefreshState(Base):
+    """Background refresh bookkeeping for an RFP scraped from a URL.
+
+    Holds the cheap change-detection validators from the last check and the
+    check/change counts the scheduler uses to decide how often to look again.
+    """
+
+    __tablename__ = "rfp_refresh_state"
+
+    id = Column(Integer, primary_key=True, index=True)
+    rfp_id = Column(
+        Integer, ForeignKey("rfp_opportunities.id"), unique=True, nullable=False, index=True
+    )
+
+    # Validators from the last probe
+    etag = Column(String, nullable=True)
+    last_modified = Column(String, nullable=True)
+    content_fingerprint = Column(String, nullable=True)  # Hash of the page's visible text
+
+    checks = Column(Integer, default=0)
+    changes = Column(Integer, default=0)  # Checks that found Q&A, document or metadata changes
+    consecutive_failures = Column(Integer, default=0)
+    last_error = Column(Text, nullable=True)
+
+    last_checked_at = Column(DateTime, nullable=True)
+    last_changed_at = Column(DateTime, nullable=True)
+    # Last browser scrape, including ones that found nothing to save on the RFP
+    last_full_scrape_at = Column(DateTime, nullable=True)
+    next_check_at = Column(DateTime, nullable=True, index=True)
+
+    # Relationships
+    rfp = relationship("RFPOpportunity", back_populates="refresh_state")
+
+
 class RFPQandA(Base):
     """Q&A entries for RFPs with AI-powered analysis."""
 
@@ -798,10 +898,10 @@ class BidOutcome(Base):
     __tablename__ = "bid_outcomes"
 
     id = Column(Integer, primary_key=True, index=True)
-    rfp_id = Column(Integer, ForeignKey("rfp_opportunities.id"), nullable=False)
+    rfp_id = Column(Integer, ForeignKey("rfp_opportunities.id"), nullable=False, index=True)
 
     # Outcome details
-    status = Column(String(20), nullable=False)  # won, lost, pending, no_bid, withdrawn
+    status = Column(String(20), nullable=False, index=True)  # won, lost, pending, no_bid, withdrawn
     award_amount = Column(Float, nullable=True)
     our_bid_amount = Column(Float, nullable=True)
     winning_bidder = Column(String(255), nullable=True)
@@ -815,7 +915,7 @@ class BidOutcome(Base):
 
     # Dates
     award_date = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationship
@@ -899,6 +999,27 @@ class CompetitorProfile(Base):
         }
 
 
+class WinRateCell(Base):
+    """Won/lost bid counts for one NAICS code, agency, value band or set-aside.
+
+    Maintained from ``BidOutcome`` writes by the session listeners in
+    ``app.services.win_rate_index``; never edited directly.
+    """
+
+    __tablename__ = "win_rate_cells"
+
+    id = Column(Integer, primary_key=True, index=True)
+    dimension = Column(String(20), nullable=False)  # overall, naics, agency, value_band, set_aside
+    key = Column(String(255), nullable=False)
+    wins = Column(Integer, nullable=False, default=0)
+    losses = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        UniqueConstraint("dimension", "key", name="uq_win_rate_cells_dimension_key"),
+    )
+
+
 class DashboardMetrics(Base):
     """Cached dashboard metrics for performance."""
 
@@ -1,6 +1,6 @@
 """Win/Loss Analytics API routes."""
 from fastapi import APIRouter, Query, HTTPException, status
-from sqlalchemy import func
+from sqlalchemy import case, func
 from datetime import datetime, timedelta
 from typing import Optional, List
 from pydantic import BaseModel
@@ -16,7 +16,10 @@ from app.schemas.analytics import (
     BidOutcomeUpdate,
     BidOutcomeResponse,
     AnalyticsFilters,
+    WinRateIndexResponse,
 )
+from app.services.win_rate_index import get_win_rate_index
+from src.decision.win_rates import DIMENSIONS
 
 router = APIRouter()
 
@@ -34,36 +37,36 @@ async def get_analytics_overview(
 
     Returns win/loss stats, trends, and competitor analysis.
     """
-    # Base query for outcomes
-    query = db.query(BidOutcome).join(RFPOpportunity)
-
-    # Apply filters
+    # Filters on the outcome/RFP join; every aggregate below is a grouped query
+    filters = []
     if start_date:
-        query = query.filter(BidOutcome.created_at >= start_date)
+        filters.append(BidOutcome.created_at >= start_date)
     if end_date:
-        query = query.filter(BidOutcome.created_at <= end_date)
+        filters.append(BidOutcome.created_at <= end_date)
     if agency:
-        query = query.filter(RFPOpportunity.agency == agency)
+        filters.append(RFPOpportunity.agency == agency)
     if naics_code:
-        query = query.filter(RFPOpportunity.naics_code == naics_code)
-
-    outcomes = query.all()
-
-    # Calculate stats
-    total = len(outcomes)
-    wins = sum(1 for o in outcomes if o.status == "won")
-    losses = sum(1 for o in outcomes if o.status == "lost")
-    pending = sum(1 for o in outcomes if o.status == "pending")
-    no_bid = sum(1 for o in outcomes if o.status == "no_bid")
-    withdrawn = sum(1 for o in outcomes if o.status == "withdrawn")
+        filters.append(RFPOpportunity.naics_code == naics_code)
+
+    # Calculate stats (one row per status)
+    by_status = {
+        status_: (count, amount or 0)
+        for status_, count, amount in _outcomes_query(
+            db, filters, BidOutcome.status, func.count(BidOutcome.id), func.sum(BidOutcome.award_amount)
+        ).group_by(BidOutcome.status)
+    }
+    total = sum(count for count, _ in by_status.values())
+    wins, revenue_won = by_status.get("won", (0, 0))
+    losses, revenue_lost = by_status.get("lost", (0, 0))
+    pending = by_status.get("pending", (0, 0))[0]
+    no_bid = by_status.get("no_bid", (0, 0))[0]
+    withdrawn = by_status.get("withdrawn", (0, 0))[0]
 
     # Win rate excludes pending/no_bid/withdrawn
     decided = wins + losses
     win_rate = wins / decided if decided > 0 else 0.0
 
     # Revenue calculations
-    revenue_won = sum(o.award_amount or 0 for o in outcomes if o.status == "won")
-    revenue_lost = sum(o.award_amount or 0 for o in outcomes if o.status == "lost")
     avg_deal = revenue_won / wins if wins > 0 else 0.0
 
     stats = WinLossStats(
@@ -80,14 +83,19 @@ async def get_analytics_overview(
     )
 
     # Get trends (last 6 months)
-    trends = _calculate_trends(db, outcomes)
+    trends = _calculate_trends(db, filters)
 
     # Get top competitors
     top_competitors = _get_top_competitors(db, limit=5)
 
     # Win rate by category
-    win_rate_by_category = _win_rate_by_field(db, outcomes, "naics_code")
-    win_rate_by_agency = _win_rate_by_field(db, outcomes, "agency")
+    if any((start_date, end_date, agency, naics_code)):
+        win_rate_by_category = _win_rate_by_field(db, filters, "naics_code")
+        win_rate_by_agency = _win_rate_by_field(db, filters, "agency")
+    else:
+        index = get_win_rate_index(db)
+        win_rate_by_category = index.observed_rates("naics")
+        win_rate_by_agency = index.observed_rates("agency")
 
     return AnalyticsDashboard(
         stats=stats,
@@ -98,38 +106,85 @@ async def get_analytics_overview(
     )
 
 
-def _calculate_trends(db, outcomes: list[BidOutcome]) -> list[WinLossTrend]:
+@router.get("/win-rates", response_model=WinRateIndexResponse)
+async def get_win_rates(
+    db: DBDep,
+    dimension: Optional[str] = Query(None, description="naics, agency, value_band or set_aside"),
+):
+    """
+    Get historical win rates from the win-rate index.
+
+    Smoothed rates shrink sparse cells towards the overall win rate; these
+    are the rates go/no-go scoring uses.
+    """
+    if dimension is not None and dimension not in DIMENSIONS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown dimension '{dimension}'. Expected one of: {', '.join(DIMENSIONS)}",
+        )
+
+    index = get_win_rate_index(db)
+    return WinRateIndexResponse(
+        decided_bids=index.decided,
+        prior_win_rate=round(index.prior_rate, 3),
+        prior_strength=index.prior_strength,
+        dimensions={name: index.cells(name) for name in ([dimension] if dimension else DIMENSIONS)},
+    )
+
+
+def _outcomes_query(db, filters: list, *columns):
+    """Query of columns over bid outcomes joined to their RFPs."""
+    return db.query(*columns).select_from(BidOutcome).join(RFPOpportunity).filter(*filters)
+
+
+def _month_bucket(db, column):
+    """SQL expression formatting a timestamp column as YYYY-MM."""
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        return func.to_char(func.date_trunc("month", column), "YYYY-MM")
+    if dialect in ("mysql", "mariadb"):
+        return func.date_format(column, "%Y-%m")
+    return func.strftime("%Y-%m", column)
+
+
+def _decided_counts():
+    """Won and decided (won or lost) outcome counts, for grouped queries."""
+    return (
+        func.sum(case((BidOutcome.status == "won", 1), else_=0)),
+        func.sum(case((BidOutcome.status.in_(("won", "lost")), 1), else_=0)),
+    )
+
+
+def _calculate_trends(db, filters: list) -> list[WinLossTrend]:
     """Calculate win/loss trends by month."""
-    if not outcomes:
-        return []
-
-    # Group by month
-    monthly = {}
-    for outcome in outcomes:
-        if outcome.created_at:
-            key = outcome.created_at.strftime("%Y-%m")
-            if key not in monthly:
-                monthly[key] = {"wins": 0, "losses": 0, "revenue": 0}
-
-            if outcome.status == "won":
-                monthly[key]["wins"] += 1
-                monthly[key]["revenue"] += outcome.award_amount or 0
-            elif outcome.status == "lost":
-                monthly[key]["losses"] += 1
+    period = _month_bucket(db, BidOutcome.created_at).label("period")
+    wins, decided = _decided_counts()
+    rows = (
+        _outcomes_query(
+            db,
+            [*filters, BidOutcome.created_at.isnot(None)],
+            period,
+            wins,
+            decided,
+            func.sum(case((BidOutcome.status == "won", BidOutcome.award_amount), else_=0)),
+        )
+        .group_by(period)
+        .order_by(period.desc())
+        .limit(6)  # Last 6 months
+        .all()
+    )
 
     # Convert to trend objects
     trends = []
-    for period in sorted(monthly.keys())[-6:]:  # Last 6 months
-        data = monthly[period]
-        total = data["wins"] + data["losses"]
-        win_rate = data["wins"] / total if total > 0 else 0.0
+    for period_, period_wins, total, revenue in reversed(rows):
+        win_rate = period_wins / total if total > 0 else 0.0
 
         trends.append(WinLossTrend(
-            period=period,
-            wins=data["wins"],
-            losses=data["losses"],
+            period=period_,
+            wins=period_wins,
+            losses=total - period_wins,
             win_rate=round(win_rate, 3),
-            revenue=data["revenue"],
+            revenue=revenue or 0,
         ))
 
     return trends
@@ -158,25 +213,13 @@ def _get_top_competitors(db, limit: int = 5) -> list[CompetitorStats]:
     ]
 
 
-def _win_rate_by_field(db, outcomes: list[BidOutcome], field: str) -> dict[str, float]:
-    """Calculate win rate grouped by RFP field."""
-    grouped = {}
+def _win_rate_by_field(db, filters: list, field: str) -> dict[str, float]:
+    """Calculate win rate grouped by RFP field, over keys with decided bids (as the win-rate index)."""
+    key = func.coalesce(func.nullif(getattr(RFPOpportunity, field), ""), "Unknown").label("key")
+    wins, decided = _decided_counts()
+    rows = _outcomes_query(db, filters, key, wins, decided).group_by(key).having(decided > 0).all()
 
-    for outcome in outcomes:
-        if outcome.rfp:
-            key = getattr(outcome.rfp, field, None) or "Unknown"
-            if key not in grouped:
-                grouped[key] = {"wins": 0, "total": 0}
-
-            if outcome.status in ("won", "lost"):
-                grouped[key]["total"] += 1
-                if outcome.status == "won":
-                    grouped[key]["wins"] += 1
-
-    return {
-        k: round(v["wins"] / v["total"], 3) if v["total"] > 0 else 0.0
-        for k, v in grouped.items()
-    }
+    return {k: round(w / total, 3) for k, w, total in rows}
 
 
 # =============================================================================
@@ -19,6 +19,7 @@ from typing import Any
 
 from app.dependencies import DBDep, RFPDep
 from app.models.database import RFPOpportunity
+from app.services.generation_context import get_generation_context_builder
 from fastapi import APIRouter, HTTPException, Query
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
@@ -730,15 +731,9 @@ async def send_chat_message(
         enhanced_query = f"{rfp.title} {rfp.agency or ''} {request.message}"
         rag_results = rag_engine.retrieve(enhanced_query, top_k=5)
 
-        # Build context from RAG results and RFP data
-        context_parts = [
-            f"RFP Title: {rfp.title}",
-            f"Agency: {rfp.agency or 'Unknown'}",
-            f"Description: {rfp.description or 'No description'}",
-        ]
-
-        if rfp.requirements:
-            context_parts.append(f"Requirements: {rfp.requirements[:2000]}")
+        # Build context from RAG results and the shared RFP context
+        rfp_context = get_generation_context_builder().get(db, rfp_id)
+        context_parts = [rfp_context.rfp_summary()]
 
         # Add RAG retrieved content
         citations = []
@@ -929,14 +924,8 @@ async def stream_chat_message(
             yield f"data: {json.dumps({'type': 'citations', 'citations': citations})}\n\n"
 
             # Build context
-            context_parts = [
-                f"RFP Title: {rfp.title}",
-                f"Agency: {rfp.agency or 'Unknown'}",
-                f"Description: {rfp.description or 'No description'}",
-            ]
-
-            if rfp.requirements:
-                context_parts.append(f"Requirements: {rfp.requirements[:2000]}")
+            rfp_context = get_generation_context_builder().get(db, rfp_id)
+            context_parts = [rfp_context.rfp_summary()]
 
             for i, result in enumerate(rag_results):
                 content = result.get("content", result.get("text", ""))
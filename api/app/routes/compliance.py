@@ -1,4 +1,5 @@
 """Compliance matrix API routes."""
+import json
 import logging
 from pathlib import Path
 
@@ -22,9 +23,11 @@ from app.schemas.compliance import (
     ExtractionResult,
     ReorderRequirements,
 )
+from app.services.compliance_stream import requirement_type_for, stream_compliance_matrix
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, sessionmaker
 
 logger = logging.getLogger(__name__)
 
@@ -330,6 +333,21 @@ async def extract_requirements(
         # Simple fallback extraction
         extracted = _simple_requirement_extraction(combined_text)
 
+    # Skip near-duplicates, including of requirements saved by earlier extractions
+    from src.compliance.dedup import RequirementDedupIndex
+
+    dedup_index = RequirementDedupIndex()
+    existing_texts = db.query(ComplianceRequirement.requirement_text).filter(
+        ComplianceRequirement.rfp_id == rfp_id
+    )
+    for (existing_text,) in existing_texts:
+        dedup_index.add(existing_text or "")
+    extracted = [
+        req_data
+        for req_data in extracted
+        if dedup_index.add(req_data.get("text", req_data.get("requirement_text", "")))
+    ]
+
     # Get current max order index
     max_order = (
         db.query(func.max(ComplianceRequirement.order_index))
@@ -350,20 +368,7 @@ async def extract_requirements(
         source_docs.append(doc['filename'])
 
     for idx, req_data in enumerate(extracted):
-        # Map category to requirement type
-        type_mapping = {
-            "mandatory": RequirementType.MANDATORY,
-            "technical": RequirementType.TECHNICAL,
-            "financial": RequirementType.ADMINISTRATIVE,
-            "qualification": RequirementType.EVALUATION,
-            "performance": RequirementType.PERFORMANCE,
-            "security": RequirementType.MANDATORY,
-            "legal": RequirementType.MANDATORY,
-            "administrative": RequirementType.ADMINISTRATIVE,
-        }
-        req_type = type_mapping.get(
-            req_data.get("category", "").lower(), RequirementType.MANDATORY
-        )
+        req_type = requirement_type_for(req_data.get("category"))
 
         # Extract source tracking from requirement data
         source_document = req_data.get("source_document")
@@ -406,6 +411,43 @@ async def extract_requirements(
     )
 
 
+@router.get("/rfps/{rfp_id}/matrix/stream")
+async def stream_compliance_matrix_events(
+    rfp_id: int,
+    db: Session = Depends(get_db),
+) -> StreamingResponse:
+    """
+    Generate the compliance matrix over the RFP description, Q&A and all attachments.
+
+    Requirements are extracted document by document, answered and saved in
+    batches; each saved requirement is sent as soon as its batch is stored.
+
+    Returns Server-Sent Events:
+    - started: RFP ID, attachment names and count of already saved requirements
+    - document: a source was analyzed, with its count of new requirements
+    - requirement: a saved requirement with its generated response
+    - complete: totals and compliance status counts
+    - error: generation failed; requirements sent before it remain saved
+    """
+    get_rfp_or_404(rfp_id, db)
+    # The stream outlives the request session, so it opens its own
+    session_factory = sessionmaker(bind=db.get_bind())
+
+    async def events():
+        async for event, payload in stream_compliance_matrix(rfp_id, session_factory=session_factory):
+            yield f"event: {event}\ndata: {json.dumps(payload, default=str)}\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
 def _simple_requirement_extraction(text: str) -> list[dict]:
     """Simple fallback extraction using pattern matching with source tracking."""
     import re
@@ -16,11 +16,17 @@ from pathlib import Path
 
 from app.core.database import get_db
 from app.dependencies import RFPDep
-from app.models.database import RFPDocument
+from app.models.database import DocumentProcessingJob, RFPDocument
+from app.services.document_processing import (
+    create_processing_job,
+    enqueue_processing,
+    get_processing_jobs,
+    process_document,
+)
 from fastapi import APIRouter, BackgroundTasks, Depends, File, HTTPException, UploadFile
 from fastapi.responses import FileResponse
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, sessionmaker
 
 # Add project root to path
 project_root = os.path.dirname(
@@ -62,13 +68,29 @@ class ProcessingStatus(BaseModel):
 
     document_id: str
     status: str  # pending, processing, completed, failed
+    stage: str | None = None  # queued, extracting, chunking, indexing, done
     progress: float = 0
     chunks_created: int = 0
+    chunks_indexed: int = 0
     error: str | None = None
-
-
-# In-memory storage for processing status (would be Redis in production)
-_processing_status: dict[str, ProcessingStatus] = {}
+    timings: dict[str, float] = {}
+    started_at: str | None = None
+    completed_at: str | None = None
+
+    @classmethod
+    def from_job(cls, job: DocumentProcessingJob) -> "ProcessingStatus":
+        return cls(
+            document_id=job.document_id,
+            status=job.status,
+            stage=job.stage,
+            progress=job.progress or 0,
+            chunks_created=job.chunks_total or 0,
+            chunks_indexed=job.chunks_indexed or 0,
+            error=job.error,
+            timings=job.timings or {},
+            started_at=job.started_at.isoformat() if job.started_at else None,
+            completed_at=job.completed_at.isoformat() if job.completed_at else None,
+        )
 
 
 def get_document_upload_dir(rfp_id: str) -> Path:
@@ -81,179 +103,29 @@ def get_document_upload_dir(rfp_id: str) -> Path:
 
 
 def extract_text_from_file(filepath: Path) -> str:
-    """Extract text content from a file with OCR fallback for scanned PDFs."""
-    text = ""
-    suffix = filepath.suffix.lower()
+    """
+    Extract text content from a file with OCR fallback for scanned PDFs.
+
+    Reads from the extracted-text store; the file is only parsed if it has
+    not been extracted before.
+    """
+    from src.utils.text_store import (
+        SUPPORTED_EXTENSIONS,
+        DocumentExtractionError,
+        get_text_store,
+    )
+
+    if filepath.suffix.lower() not in SUPPORTED_EXTENSIONS:
+        return ""
 
     try:
-        if suffix == ".txt" or suffix == ".md":
-            text = filepath.read_text(encoding="utf-8")
-        elif suffix == ".pdf":
-            try:
-                import fitz  # type: ignore[import-untyped] # PyMuPDF
-
-                doc = fitz.open(str(filepath))
-                for page in doc:
-                    text += page.get_text()
-                doc.close()
-            except ImportError:
-                logger.warning("PyMuPDF not installed, trying pdfplumber")
-                try:
-                    import pdfplumber  # type: ignore[import-untyped]
-
-                    with pdfplumber.open(str(filepath)) as pdf:
-                        for page in pdf.pages:
-                            page_text = page.extract_text()
-                            if page_text:
-                                text += page_text + "\n"
-                except ImportError as err:
-                    raise HTTPException(
-                        status_code=500, detail="PDF processing libraries not available"
-                    ) from err
-
-            # If very little text extracted, try OCR (scanned PDF)
-            if len(text.strip()) < 100:
-                logger.info(
-                    f"PDF has little text ({len(text.strip())} chars), attempting OCR"
-                )
-                try:
-                    import pytesseract
-                    from pdf2image import convert_from_path
-
-                    # Convert PDF to images (limit to first 20 pages for performance)
-                    images = convert_from_path(
-                        str(filepath), dpi=200, first_page=1, last_page=20
-                    )
-
-                    ocr_text = ""
-                    for i, image in enumerate(images):
-                        page_text = pytesseract.image_to_string(image)
-                        ocr_text += f"\n[Page {i + 1}]\n{page_text}"
-
-                    # Use OCR text if we got more content
-                    if len(ocr_text.strip()) > len(text.strip()):
-                        logger.info(
-                            f"OCR extracted {len(ocr_text.strip())} chars vs {len(text.strip())} from standard extraction"
-                        )
-                        text = ocr_text
-
-                except ImportError:
-                    logger.warning(
-                        "OCR libraries (pytesseract, pdf2image) not available for scanned PDF"
-                    )
-                except Exception as e:
-                    logger.warning(f"OCR failed: {e}")
-        elif suffix in {".docx", ".doc"}:
-            try:
-                from docx import Document
-
-                doc = Document(str(filepath))
-                text = "\n".join([para.text for para in doc.paragraphs])
-            except ImportError as err:
-                raise HTTPException(
-                    status_code=500, detail="DOCX processing library not available"
-                ) from err
-        elif suffix in {".xlsx", ".xls"}:
-            try:
-                import pandas as pd
-
-                df = pd.read_excel(str(filepath))
-                text = df.to_string()
-            except ImportError as err:
-                raise HTTPException(
-                    status_code=500, detail="Excel processing library not available"
-                ) from err
-    except Exception as e:
+        return get_text_store().get_or_extract(filepath).text
+    except DocumentExtractionError as e:
         logger.exception("Failed to extract text from %s", filepath)
         raise HTTPException(
             status_code=500, detail=f"Failed to extract text: {e!s}"
         ) from e
 
-    return text
-
-
-def process_document_for_rag(
-    document_id: str,
-    filepath: Path,
-    rfp_id: str,
-    filename: str,
-):
-    """Background task to process document and add to RAG index."""
-    global _processing_status
-
-    _processing_status[document_id] = ProcessingStatus(
-        document_id=document_id,
-        status="processing",
-        progress=10,
-    )
-
-    try:
-        # Extract text
-        text = extract_text_from_file(filepath)
-        _processing_status[document_id].progress = 40
-
-        if not text.strip():
-            _processing_status[document_id].status = "failed"
-            _processing_status[document_id].error = "No text content extracted"
-            return
-
-        # Chunk the text
-        chunk_size = 512
-        overlap = 50
-        chunks = []
-        words = text.split()
-
-        for i in range(0, len(words), chunk_size - overlap):
-            chunk = " ".join(words[i : i + chunk_size])
-            if chunk.strip():
-                chunks.append(chunk)
-
-        _processing_status[document_id].progress = 60
-        _processing_status[document_id].chunks_created = len(chunks)
-
-        # Add to RAG index
-        try:
-            from src.rag.chroma_rag_engine import get_rag_engine
-
-            rag_engine = get_rag_engine()
-            if not rag_engine:
-                raise RuntimeError("RAG engine not available")
-
-            # Create document IDs and metadata for each chunk
-            doc_ids = [f"{document_id}_chunk_{i}" for i in range(len(chunks))]
-            docs_for_chroma = [
-                {
-                    "content": chunk,
-                    "source": filename,
-                    "rfp_id": rfp_id,
-                    "document_id": document_id,
-                    "chunk_index": str(i),
-                    "upload_date": datetime.now(timezone.utc).isoformat(),
-                }
-                for i, chunk in enumerate(chunks)
-            ]
-
-            added = rag_engine.add_documents(
-                documents=docs_for_chroma,
-                ids=doc_ids,
-            )
-
-            _processing_status[document_id].progress = 100
-            _processing_status[document_id].status = "completed"
-            _processing_status[document_id].chunks_created = added
-            logger.info(f"Added {added} chunks from {filename} to RAG index")
-
-        except Exception as e:
-            logger.error(f"Failed to add document to RAG: {e}")
-            _processing_status[document_id].status = "completed"
-            _processing_status[document_id].progress = 100
-            # Still mark as completed since file is saved
-
-    except Exception as e:
-        logger.error(f"Document processing failed: {e}")
-        _processing_status[document_id].status = "failed"
-        _processing_status[document_id].error = str(e)
-
 
 @router.post("/{rfp_id}/upload", response_model=UploadedDocument)
 async def upload_document(
@@ -312,14 +184,19 @@ async def upload_document(
     db.commit()
     db.refresh(db_document)
 
-    # Schedule background processing
-    if background_tasks:
+    # Queue processing on the documents queue; without a broker, process in
+    # this process but still record progress in the job table
+    job = create_processing_job(db, rfp.id, document_id, filename, filepath)
+    task_id = enqueue_processing(document_id)
+    if task_id:
+        job.task_id = task_id
+        db.commit()
+    elif background_tasks:
         background_tasks.add_task(
-            process_document_for_rag,
+            process_document,
             document_id,
-            filepath,
-            rfp.rfp_id,
-            filename,
+            sessionmaker(bind=db.get_bind()),
+            True,
         )
 
     return UploadedDocument(
@@ -337,11 +214,15 @@ async def list_uploaded_documents(rfp: RFPDep, db: Session = Depends(get_db)):
     """List all uploaded documents for an RFP."""
     # Query from database
     db_documents = db.query(RFPDocument).filter(RFPDocument.rfp_id == rfp.id).all()
+    doc_ids = [
+        Path(db_doc.file_path).stem if db_doc.file_path else f"db-{db_doc.id}"
+        for db_doc in db_documents
+    ]
+    jobs = get_processing_jobs(db, doc_ids)
     documents = []
 
-    for db_doc in db_documents:
-        doc_id = Path(db_doc.file_path).stem if db_doc.file_path else f"db-{db_doc.id}"
-        status = _processing_status.get(doc_id)
+    for db_doc, doc_id in zip(db_documents, doc_ids, strict=True):
+        status = jobs.get(doc_id)
 
         documents.append(
             UploadedDocument(
@@ -355,7 +236,7 @@ async def list_uploaded_documents(rfp: RFPDep, db: Session = Depends(get_db)):
                     else db_doc.created_at.isoformat()
                 ),
                 status=status.status if status else "completed",
-                chunks_count=status.chunks_created if status else None,
+                chunks_count=status.chunks_total if status else None,
                 error=status.error if status else None,
             )
         )
@@ -367,9 +248,12 @@ async def list_uploaded_documents(rfp: RFPDep, db: Session = Depends(get_db)):
 
 
 @router.get("/{rfp_id}/uploads/{document_id}/status", response_model=ProcessingStatus)
-async def get_processing_status(rfp: RFPDep, document_id: str):
+async def get_processing_status(
+    rfp: RFPDep, document_id: str, db: Session = Depends(get_db)
+):
     """Get the processing status of an uploaded document."""
-    if document_id not in _processing_status:
+    job = get_processing_jobs(db, [document_id]).get(document_id)
+    if job is None:
         # Check if file exists
         upload_dir = get_document_upload_dir(rfp.rfp_id)
         matching = list(upload_dir.glob(f"{document_id}*"))
@@ -383,7 +267,7 @@ async def get_processing_status(rfp: RFPDep, document_id: str):
 
         raise HTTPException(status_code=404, detail="Document not found")
 
-    return _processing_status[document_id]
+    return ProcessingStatus.from_job(job)
 
 
 @router.delete("/{rfp_id}/uploads/{document_id}")
@@ -412,8 +296,10 @@ async def delete_uploaded_document(
     db.commit()
 
     # Clean up processing status
-    if document_id in _processing_status:
-        del _processing_status[document_id]
+    db.query(DocumentProcessingJob).filter(
+        DocumentProcessingJob.document_id == document_id
+    ).delete()
+    db.commit()
 
     return {"status": "deleted", "document_id": document_id}
 
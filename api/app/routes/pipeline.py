@@ -3,27 +3,48 @@ Pipeline monitoring API endpoints.
 
 Provides:
 - Real-time pipeline status with RFPs grouped by stage
+- Delta stream (SSE) so the kanban board can patch instead of polling
 - Pipeline history for individual RFPs
 - Performance metrics
 - Pagination for large datasets
 """
 
+import asyncio
+import json
 import logging
 from datetime import datetime, timezone
 from typing import Any
 
+from app.core.cache import CacheTag, cached, response_cache
 from app.dependencies import DBDep
 from app.models.database import PipelineEvent, PipelineStage, RFPOpportunity
-from fastapi import APIRouter, HTTPException, Query
+from app.services.pipeline_stream import pipeline_stream
+from app.services.streaming import get_streaming_service
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
+from sqlalchemy import func
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
-# Cache for pipeline status (reduces DB load)
-_pipeline_cache: dict | None = None
-_cache_timestamp: float = 0
+PIPELINE_STATUS_NAMESPACE = "pipeline:status"
 _CACHE_TTL = 30  # 30 seconds cache
+_STREAM_KEEPALIVE_SECONDS = 15
+
+# Columns needed by rfp_to_pipeline_dict (avoids loading full ORM rows)
+_PIPELINE_COLUMNS = (
+    RFPOpportunity.id,
+    RFPOpportunity.rfp_id,
+    RFPOpportunity.title,
+    RFPOpportunity.agency,
+    RFPOpportunity.current_stage,
+    RFPOpportunity.triage_score,
+    RFPOpportunity.discovered_at,
+    RFPOpportunity.updated_at,
+)
+
+_STAGE_ORDER = {stage: index for index, stage in enumerate(PipelineStage)}
 
 
 class PipelineRFPResponse(BaseModel):
@@ -67,8 +88,8 @@ class PipelineEventResponse(BaseModel):
         from_attributes = True
 
 
-def rfp_to_pipeline_dict(rfp: RFPOpportunity) -> dict:
-    """Convert RFP model to pipeline response dict."""
+def rfp_to_pipeline_dict(rfp: Any) -> dict:
+    """Convert an RFP model or pipeline column row to a pipeline response dict."""
     return {
         "id": rfp.id,
         "rfp_id": rfp.rfp_id,
@@ -82,6 +103,14 @@ def rfp_to_pipeline_dict(rfp: RFPOpportunity) -> dict:
 
 
 @router.get("/status")
+@cached(
+    PIPELINE_STATUS_NAMESPACE,
+    ttl=_CACHE_TTL,
+    tags=[CacheTag.RFPS],
+    bypass_param="use_cache",
+    annotate=True,
+    stale_if_error=True,
+)
 async def get_pipeline_status(
     skip: int = Query(default=0, ge=0, description="Number of RFPs to skip per stage"),
     limit: int = Query(default=50, ge=1, le=200, description="Max RFPs per stage"),
@@ -91,71 +120,86 @@ async def get_pipeline_status(
     """
     Get overall pipeline status with RFPs grouped by stage.
 
+    Cached per (skip, limit) page and invalidated whenever an RFP is written.
+
     Returns:
         - stages: Dict with stage counts
         - rfps: List of all RFPs with their current stage
         - timestamp: When data was fetched
         - cached: Whether data came from cache
     """
-    import time
-
-    global _pipeline_cache, _cache_timestamp
-
-    # Check cache
-    cache_age = time.time() - _cache_timestamp
-    if use_cache and _pipeline_cache and cache_age < _CACHE_TTL:
-        logger.debug(f"Returning cached pipeline status (age: {cache_age:.1f}s)")
-        return {**_pipeline_cache, "cached": True, "cache_age_seconds": int(cache_age)}
-
     try:
-        # Count RFPs by stage
-        stages = {}
-        for stage in PipelineStage:
-            count = (
-                db.query(RFPOpportunity)
-                .filter(RFPOpportunity.current_stage == stage)
-                .count()
-            )
-            stages[stage.value] = count
-
-        # Get RFPs for each stage (with pagination)
-        rfps = []
-        for stage in PipelineStage:
-            stage_rfps = (
-                db.query(RFPOpportunity)
-                .filter(RFPOpportunity.current_stage == stage)
-                .order_by(RFPOpportunity.updated_at.desc())
-                .offset(skip)
-                .limit(limit)
-                .all()
+        # Stage counts in one GROUP BY
+        stage_counts = dict(
+            db.query(RFPOpportunity.current_stage, func.count(RFPOpportunity.id))
+            .group_by(RFPOpportunity.current_stage)
+            .all()
+        )
+        stages = {stage.value: stage_counts.get(stage, 0) for stage in PipelineStage}
+
+        # Per-stage page in one window-function query
+        stage_rank = (
+            func.row_number()
+            .over(
+                partition_by=RFPOpportunity.current_stage,
+                order_by=RFPOpportunity.updated_at.desc(),
             )
+            .label("stage_rank")
+        )
+        ranked = (
+            db.query(*_PIPELINE_COLUMNS, stage_rank)
+            .filter(RFPOpportunity.current_stage.isnot(None))
+            .subquery()
+        )
+        rows = (
+            db.query(ranked)
+            .filter(ranked.c.stage_rank > skip, ranked.c.stage_rank <= skip + limit)
+            .all()
+        )
+        rows.sort(key=lambda row: (_STAGE_ORDER[row.current_stage], row.stage_rank))
+        rfps = [rfp_to_pipeline_dict(row) for row in rows]
 
-            for rfp in stage_rfps:
-                rfps.append(rfp_to_pipeline_dict(rfp))
-
-        result = {
+        return {
             "stages": stages,
             "rfps": rfps,
             "total_count": sum(stages.values()),
             "timestamp": datetime.now(timezone.utc).isoformat(),
-            "cached": False,
         }
 
-        # Update cache
-        _pipeline_cache = result
-        _cache_timestamp = time.time()
-
-        return result
-
     except Exception as e:
         logger.error(f"Failed to fetch pipeline status: {e}")
-        # Return cached data on error if available
-        if _pipeline_cache:
-            logger.warning("Returning stale cache due to error")
-            return {**_pipeline_cache, "cached": True, "stale": True}
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+@router.get("/stream")
+async def stream_pipeline_updates(request: Request) -> StreamingResponse:
+    """
+    Stream pipeline deltas as Server-Sent Events.
+
+    Clients load ``/status`` once and then apply events from this stream:
+    rfp_added, rfp_moved, rfp_updated, rfp_removed, and resync (refetch
+    ``/status``). Comment lines are sent periodically as keep-alives.
+    """
+    queue = pipeline_stream.subscribe()
+
+    async def event_generator():
+        try:
+            yield ": connected\n\n"
+            while not await request.is_disconnected():
+                try:
+                    delta = await asyncio.wait_for(
+                        queue.get(), timeout=_STREAM_KEEPALIVE_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                yield f"event: {delta['event']}\ndata: {json.dumps(delta)}\n\n"
+        finally:
+            pipeline_stream.unsubscribe(queue)
+
+    return get_streaming_service().create_sse_response(event_generator())
+
+
 @router.get("/{rfp_id}", response_model=list[PipelineEventResponse])
 async def get_rfp_pipeline(rfp_id: str, db: DBDep):
     """Get pipeline history for an RFP."""
@@ -188,8 +232,6 @@ async def get_rfp_pipeline(rfp_id: str, db: DBDep):
 async def get_pipeline_metrics(db: DBDep):
     """Get pipeline performance metrics."""
     # Average processing time by stage
-    from sqlalchemy import func
-
     avg_times = (
         db.query(
             PipelineEvent.to_stage,
@@ -210,9 +252,6 @@ async def get_pipeline_metrics(db: DBDep):
 @router.delete("/cache")
 async def clear_pipeline_cache():
     """Clear the pipeline status cache to force fresh data."""
-    global _pipeline_cache, _cache_timestamp
-
-    _pipeline_cache = None
-    _cache_timestamp = 0
+    response_cache.invalidate_tags(PIPELINE_STATUS_NAMESPACE)
 
     return {"status": "cache_cleared"}
@@ -5,7 +5,7 @@ Provides:
 - Fast initial response with cached/statistical predictions
 - Background AI enhancement via Celery
 - Proper timeout handling (max 60 seconds)
-- Redis caching for performance
+- Shared memory/Redis caching with a file snapshot for restarts
 """
 
 import asyncio
@@ -20,23 +20,19 @@ from typing import Any
 from fastapi import APIRouter, HTTPException, Query, BackgroundTasks
 from pydantic import BaseModel
 
+from app.core.cache import CacheTag, response_cache
 from src.config.paths import PathConfig
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 # Cache configuration
-_cached_predictions: list[dict] | None = None
-_cache_timestamp: float = 0
+PREDICTIONS_CACHE_KEY = "predictions:latest"
 _CACHE_TTL = 3600  # 1 hour cache
 _generation_in_progress = False
 _last_error: str | None = None
 
-# Redis cache keys
-REDIS_PREDICTIONS_KEY = "rfp:predictions:latest"
-REDIS_PREDICTIONS_META_KEY = "rfp:predictions:meta"
-
-# File-based cache (persists across container restarts)
+# File snapshot (persists across container restarts; the shared cache does not)
 CACHE_FILE = PathConfig.DATA_DIR / "cache" / "predictions_cache.json"
 
 
@@ -63,6 +59,44 @@ def cache_predictions_to_file(predictions: list[dict], meta: dict):
         logger.warning(f"File cache write failed: {e}")
 
 
+def get_cached_predictions(
+    allow_stale: bool = False,
+) -> tuple[list[dict] | None, dict | None, float | None]:
+    """
+    Get cached predictions from the shared cache, then the file snapshot.
+
+    Returns (predictions, meta, cache_age_seconds). Age is None when the
+    data came from the file snapshot.
+    """
+    entry = response_cache.get_entry(PREDICTIONS_CACHE_KEY, allow_stale=allow_stale)
+    if entry is not None:
+        return entry.value["predictions"], entry.value["meta"], entry.age
+
+    file_predictions, file_meta = get_cached_predictions_from_file()
+    if file_predictions:
+        # Re-prime the shared cache so other workers skip the file read
+        response_cache.set(
+            PREDICTIONS_CACHE_KEY,
+            {"predictions": file_predictions, "meta": file_meta or {}},
+            _CACHE_TTL,
+            [CacheTag.PREDICTIONS],
+        )
+        return file_predictions, file_meta, None
+
+    return None, None, None
+
+
+def cache_predictions(predictions: list[dict], meta: dict):
+    """Store predictions in the shared cache and the file snapshot."""
+    response_cache.set(
+        PREDICTIONS_CACHE_KEY,
+        {"predictions": predictions, "meta": meta},
+        _CACHE_TTL,
+        [CacheTag.PREDICTIONS],
+    )
+    cache_predictions_to_file(predictions, meta)
+
+
 class PredictionStatus(BaseModel):
     """Status response for prediction generation."""
     status: str
@@ -74,51 +108,6 @@ class PredictionStatus(BaseModel):
     error: str | None = None
 
 
-def get_redis_client():
-    """Get Redis client for caching."""
-    try:
-        import redis
-        import os
-        redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
-        return redis.from_url(redis_url, decode_responses=True)
-    except Exception as e:
-        logger.warning(f"Redis connection failed: {e}")
-        return None
-
-
-def get_cached_predictions_from_redis() -> tuple[list[dict] | None, dict | None]:
-    """Get cached predictions from Redis."""
-    client = get_redis_client()
-    if not client:
-        return None, None
-
-    try:
-        predictions_json = client.get(REDIS_PREDICTIONS_KEY)
-        meta_json = client.get(REDIS_PREDICTIONS_META_KEY)
-
-        if predictions_json:
-            predictions = json.loads(predictions_json)
-            meta = json.loads(meta_json) if meta_json else {}
-            return predictions, meta
-    except Exception as e:
-        logger.warning(f"Redis read failed: {e}")
-
-    return None, None
-
-
-def cache_predictions_to_redis(predictions: list[dict], meta: dict):
-    """Cache predictions to Redis."""
-    client = get_redis_client()
-    if not client:
-        return
-
-    try:
-        client.setex(REDIS_PREDICTIONS_KEY, _CACHE_TTL, json.dumps(predictions))
-        client.setex(REDIS_PREDICTIONS_META_KEY, _CACHE_TTL, json.dumps(meta))
-    except Exception as e:
-        logger.warning(f"Redis write failed: {e}")
-
-
 def get_forecasting_service():
     """Lazy load forecasting service."""
     from src.agents.forecasting_service import ForecastingService
@@ -148,7 +137,7 @@ async def generate_predictions_with_timeout(
 
     Returns (predictions, metadata) tuple.
     """
-    global _generation_in_progress, _cached_predictions, _cache_timestamp, _last_error
+    global _generation_in_progress, _last_error
 
     data_file = find_data_file()
     if not data_file:
@@ -211,10 +200,6 @@ async def generate_predictions_with_timeout(
             except Exception as e:
                 logger.warning(f"AI insight generation failed: {e}")
 
-        # Update in-memory cache
-        _cached_predictions = predictions
-        _cache_timestamp = time.time()
-
         meta = {
             "count": len(predictions),
             "ai_enhanced_count": ai_enhanced_count,
@@ -222,9 +207,8 @@ async def generate_predictions_with_timeout(
             "elapsed_seconds": round(time.time() - start_time, 2),
         }
 
-        # Cache to file (persistent) and Redis (if available)
+        # Snapshot to file; the shared cache is populated by the caller
         cache_predictions_to_file(predictions, meta)
-        cache_predictions_to_redis(predictions, meta)
 
         return predictions, meta
 
@@ -242,6 +226,32 @@ async def generate_predictions_with_timeout(
         _generation_in_progress = False
 
 
+async def load_predictions(
+    use_ai: bool, timeout_seconds: float = 55.0, refresh: bool = False
+) -> tuple[list[dict], dict]:
+    """
+    Load predictions through the shared cache.
+
+    Concurrent callers share a single generation run (single-flight).
+    """
+    async def _generate() -> dict:
+        predictions, meta = await generate_predictions_with_timeout(
+            confidence_threshold=0.15,
+            use_ai=use_ai,
+            timeout_seconds=timeout_seconds,
+        )
+        return {"predictions": predictions, "meta": meta}
+
+    value, _ = await response_cache.get_or_load(
+        PREDICTIONS_CACHE_KEY,
+        _generate,
+        ttl=_CACHE_TTL,
+        tags=[CacheTag.PREDICTIONS],
+        refresh=refresh,
+    )
+    return value["predictions"], value["meta"]
+
+
 @router.get("/upcoming", response_model=list[dict[str, Any]])
 async def get_upcoming_predictions(
     confidence: float = Query(default=0.3, ge=0.0, le=1.0),
@@ -263,48 +273,19 @@ async def get_upcoming_predictions(
     - Cycle detection (quarterly, biannual, annual, etc.)
     - AI-generated insights for top predictions (if use_ai=true)
     """
-    global _cached_predictions, _cache_timestamp
-
-    # Check memory cache first
-    cache_age = time.time() - _cache_timestamp if _cache_timestamp else None
-    cache_valid = (
-        _cached_predictions is not None
-        and not refresh
-        and cache_age is not None
-        and cache_age < _CACHE_TTL
-    )
-
-    if cache_valid:
-        filtered = [p for p in _cached_predictions if p["confidence"] >= confidence]
-        logger.info(f"Returning {len(filtered)} cached predictions (age: {int(cache_age)}s)")
-        return filtered
-
-    # Check file cache first (most reliable), then Redis
+    # Check shared cache (memory/Redis), then the file snapshot
     if not refresh:
-        # Try file cache first (persists across restarts)
-        file_predictions, file_meta = get_cached_predictions_from_file()
-        if file_predictions:
-            _cached_predictions = file_predictions
-            _cache_timestamp = time.time()
-            filtered = [p for p in file_predictions if p["confidence"] >= confidence]
-            logger.info(f"Returning {len(filtered)} file-cached predictions")
-            return filtered
-
-        # Fallback to Redis cache
-        redis_predictions, redis_meta = get_cached_predictions_from_redis()
-        if redis_predictions:
-            _cached_predictions = redis_predictions
-            _cache_timestamp = time.time()
-            filtered = [p for p in redis_predictions if p["confidence"] >= confidence]
-            logger.info(f"Returning {len(filtered)} Redis-cached predictions")
+        cached_predictions, _, cache_age = get_cached_predictions()
+        if cached_predictions:
+            filtered = [p for p in cached_predictions if p["confidence"] >= confidence]
+            age_note = f"age: {int(cache_age)}s" if cache_age is not None else "file snapshot"
+            logger.info(f"Returning {len(filtered)} cached predictions ({age_note})")
             return filtered
 
     # Generate new predictions with timeout
     try:
-        predictions, meta = await generate_predictions_with_timeout(
-            confidence_threshold=confidence,
-            use_ai=use_ai,
-            timeout_seconds=timeout
+        predictions, meta = await load_predictions(
+            use_ai=use_ai, timeout_seconds=timeout, refresh=refresh
         )
 
         filtered = [p for p in predictions if p["confidence"] >= confidence]
@@ -313,16 +294,10 @@ async def get_upcoming_predictions(
 
     except HTTPException as e:
         # On timeout/error, try to return cached data if available
-        if _cached_predictions:
+        stale_predictions, _, _ = get_cached_predictions(allow_stale=True)
+        if stale_predictions:
             logger.warning(f"Generation failed ({e.detail}), returning stale cache")
-            filtered = [p for p in _cached_predictions if p["confidence"] >= confidence]
-            return filtered
-
-        # Check Redis as last resort
-        redis_predictions, _ = get_cached_predictions_from_redis()
-        if redis_predictions:
-            logger.warning(f"Generation failed ({e.detail}), returning Redis cache")
-            filtered = [p for p in redis_predictions if p["confidence"] >= confidence]
+            filtered = [p for p in stale_predictions if p["confidence"] >= confidence]
             return filtered
 
         raise
@@ -331,29 +306,15 @@ async def get_upcoming_predictions(
 @router.get("/status")
 async def get_prediction_status() -> PredictionStatus:
     """Get the current status of prediction generation and cache."""
-    cache_age = int(time.time() - _cache_timestamp) if _cache_timestamp else None
-
-    # Check for cached predictions
-    if _cached_predictions:
-        ai_count = sum(1 for p in _cached_predictions if p.get('ai_enhanced'))
+    cached_predictions, _, cache_age = get_cached_predictions()
+    if cached_predictions:
+        ai_count = sum(1 for p in cached_predictions if p.get('ai_enhanced'))
         return PredictionStatus(
             status="ready",
-            predictions_count=len(_cached_predictions),
+            predictions_count=len(cached_predictions),
             ai_enhanced_count=ai_count,
             cached=True,
-            cache_age_seconds=cache_age,
-            generating=_generation_in_progress,
-        )
-
-    # Check Redis
-    redis_predictions, redis_meta = get_cached_predictions_from_redis()
-    if redis_predictions:
-        return PredictionStatus(
-            status="ready",
-            predictions_count=len(redis_predictions),
-            ai_enhanced_count=redis_meta.get("ai_enhanced_count", 0) if redis_meta else 0,
-            cached=True,
-            cache_age_seconds=None,  # Unknown for Redis
+            cache_age_seconds=int(cache_age) if cache_age is not None else None,
             generating=_generation_in_progress,
         )
 
@@ -404,7 +365,7 @@ async def trigger_prediction_generation(
         # Fallback: run in background task
         async def run_generation():
             try:
-                await generate_predictions_with_timeout(0.15, use_ai, 55.0)
+                await load_predictions(use_ai=use_ai, refresh=True)
             except Exception as ex:
                 logger.error(f"Background generation failed: {ex}")
 
@@ -419,12 +380,9 @@ async def trigger_prediction_generation(
 @router.delete("/cache")
 async def clear_predictions_cache():
     """Clear all prediction caches to force a refresh."""
-    global _cached_predictions, _cache_timestamp
-
-    _cached_predictions = None
-    _cache_timestamp = 0
+    response_cache.invalidate_tags(CacheTag.PREDICTIONS)
 
-    # Clear file cache
+    # Clear file snapshot
     try:
         if CACHE_FILE.exists():
             CACHE_FILE.unlink()
@@ -432,15 +390,6 @@ async def clear_predictions_cache():
     except Exception as e:
         logger.warning(f"Failed to clear file cache: {e}")
 
-    # Clear Redis cache too
-    client = get_redis_client()
-    if client:
-        try:
-            client.delete(REDIS_PREDICTIONS_KEY)
-            client.delete(REDIS_PREDICTIONS_META_KEY)
-        except Exception:
-            pass
-
     return {"status": "cache_cleared"}
 
 
@@ -453,17 +402,18 @@ async def get_fallback_predictions(
 
     Useful when main endpoint times out - returns whatever is cached.
     """
-    # Check memory cache
-    if _cached_predictions:
-        filtered = [p for p in _cached_predictions if p["confidence"] >= confidence]
+    # Check shared cache, including entries past their TTL
+    entry = response_cache.get_entry(PREDICTIONS_CACHE_KEY, allow_stale=True)
+    if entry is not None:
+        filtered = [p for p in entry.value["predictions"] if p["confidence"] >= confidence]
         return {
             "status": "cached",
             "predictions": filtered,
             "count": len(filtered),
-            "cache_age_seconds": int(time.time() - _cache_timestamp) if _cache_timestamp else None,
+            "cache_age_seconds": int(entry.age),
         }
 
-    # Check file cache
+    # Check file snapshot
     file_predictions, file_meta = get_cached_predictions_from_file()
     if file_predictions:
         filtered = [p for p in file_predictions if p["confidence"] >= confidence]
@@ -474,17 +424,6 @@ async def get_fallback_predictions(
             "generated_at": file_meta.get("generated_at") if file_meta else None,
         }
 
-    # Check Redis
-    redis_predictions, redis_meta = get_cached_predictions_from_redis()
-    if redis_predictions:
-        filtered = [p for p in redis_predictions if p["confidence"] >= confidence]
-        return {
-            "status": "redis_cached",
-            "predictions": filtered,
-            "count": len(filtered),
-            "generated_at": redis_meta.get("generated_at") if redis_meta else None,
-        }
-
     # No cached data
     return {
         "status": "no_data",
@@ -5,17 +5,20 @@ Enhanced pricing capabilities with market intelligence, AI recommendations,
 and proposal integration.
 """
 
+import asyncio
+import logging
 from datetime import datetime
 from typing import List, Optional
 
 import numpy as np
-from fastapi import APIRouter, Depends, HTTPException
+import pandas as pd
+from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
 
-from app.core.database import get_db
+from app.dependencies import DBDep
 from app.models.database import PricingResult, RFPOpportunity
 
+logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
@@ -58,6 +61,10 @@ class AIRecommendationRequest(BaseModel):
     target_win_probability: float = 0.7
 
 
+class MLPredictionBatchRequest(BaseModel):
+    rfp_ids: List[int]
+
+
 class OptimizePriceRequest(BaseModel):
     min_margin: float = 0.10
     max_margin: float = 0.35
@@ -67,9 +74,9 @@ class OptimizePriceRequest(BaseModel):
 # ============= Helper Functions =============
 
 def get_pricing_engine():
-    """Get or create pricing engine instance."""
-    from src.pricing.pricing_engine import PricingEngine
-    return PricingEngine()
+    """Get the shared pricing engine instance."""
+    from src.pricing.pricing_engine import get_pricing_engine as get_engine
+    return get_engine()
 
 
 def get_rag_engine():
@@ -84,7 +91,7 @@ def get_rag_engine():
 # ============= Endpoints =============
 
 @router.get("/{rfp_id}/result")
-async def get_pricing_result(rfp_id: int, db: Session = Depends(get_db)):
+async def get_pricing_result(rfp_id: int, db: DBDep):
     """Get existing pricing result for an RFP."""
     pricing = db.query(PricingResult).filter(PricingResult.rfp_id == rfp_id).first()
     if not pricing:
@@ -111,7 +118,7 @@ async def get_pricing_result(rfp_id: int, db: Session = Depends(get_db)):
 async def save_cost_breakdown(
     rfp_id: int,
     breakdown: CostBreakdownInput,
-    db: Session = Depends(get_db)
+    db: DBDep
 ):
     """Save detailed cost breakdown for an RFP."""
     rfp = db.query(RFPOpportunity).filter(RFPOpportunity.id == rfp_id).first()
@@ -177,7 +184,7 @@ async def save_cost_breakdown(
 
 
 @router.get("/{rfp_id}/market-intelligence")
-async def get_market_intelligence(rfp_id: int, db: Session = Depends(get_db)):
+async def get_market_intelligence(rfp_id: int, db: DBDep):
     """Get historical pricing intelligence for an RFP."""
     rfp = db.query(RFPOpportunity).filter(RFPOpportunity.id == rfp_id).first()
     if not rfp:
@@ -192,7 +199,11 @@ async def get_market_intelligence(rfp_id: int, db: Session = Depends(get_db)):
         naics_stats = engine._get_naics_statistics(rfp.naics_code)
 
     # Get category statistics
-    category = engine._determine_category(rfp.title or "", rfp.description or "")
+    category = engine._determine_category({
+        "title": rfp.title or "",
+        "description": rfp.description or "",
+        "naics_code": rfp.naics_code or "",
+    })
     category_stats = engine._get_category_statistics(category)
 
     # Get similar contracts from RAG
@@ -232,20 +243,15 @@ async def get_market_intelligence(rfp_id: int, db: Session = Depends(get_db)):
 
     # Get agency-specific insights
     agency_insights = None
-    if rfp.agency and engine.historical_data is not None:
-        try:
-            agency_data = engine.historical_data[
-                engine.historical_data['agency'].str.contains(rfp.agency[:20], case=False, na=False)
-            ]
-            if len(agency_data) > 0:
-                agency_insights = {
-                    "average_award": float(agency_data['award_amount'].mean()),
-                    "contract_count": len(agency_data),
-                    "typical_duration": "2-3 years",
-                    "budget_peak": "Q4 (September)",
-                }
-        except Exception:
-            pass
+    if rfp.agency:
+        agency_stats = engine.market_stats.agency(rfp.agency[:20])
+        if agency_stats:
+            agency_insights = {
+                "average_award": agency_stats['mean'],
+                "contract_count": int(agency_stats['count']),
+                "typical_duration": "2-3 years",
+                "budget_peak": "Q4 (September)",
+            }
 
     return {
         "naics_stats": naics_stats,
@@ -262,48 +268,26 @@ async def get_pricing_trends(naics_code: str):
     """Get pricing trend data for a NAICS code."""
     engine = get_pricing_engine()
 
-    trends = []
-    yoy_change = None
-
-    if engine.historical_data is not None:
-        try:
-            import pandas as pd
-
-            naics_data = engine.historical_data[
-                engine.historical_data['naics_code'].astype(str).str.startswith(naics_code[:4])
-            ]
-
-            if 'posted_date' in naics_data.columns and len(naics_data) > 0:
-                naics_data = naics_data.copy()
-                naics_data['year'] = pd.to_datetime(naics_data['posted_date'], errors='coerce').dt.year
-                naics_data = naics_data.dropna(subset=['year'])
-
-                yearly = naics_data.groupby('year').agg({
-                    'award_amount': ['mean', 'median', 'count']
-                }).reset_index()
-                yearly.columns = ['year', 'mean', 'median', 'count']
-
-                trends = [
-                    {
-                        "year": int(row['year']),
-                        "award_amount": {
-                            "mean": float(row['mean']),
-                            "median": float(row['median']),
-                            "count": int(row['count']),
-                        }
-                    }
-                    for _, row in yearly.iterrows()
-                ]
+    yearly = engine.market_stats.naics_trend(naics_code[:4])
+    trends = [
+        {
+            "year": point['year'],
+            "award_amount": {
+                "mean": point['mean'],
+                "median": point['median'],
+                "count": int(point['count']),
+            }
+        }
+        for point in yearly
+    ]
 
-                # Calculate YoY change
-                if len(yearly) >= 2:
-                    sorted_years = yearly.sort_values('year')
-                    latest = sorted_years.iloc[-1]['median']
-                    previous = sorted_years.iloc[-2]['median']
-                    if previous > 0:
-                        yoy_change = ((latest - previous) / previous) * 100
-        except Exception as e:
-            print(f"Error calculating trends: {e}")
+    # Calculate YoY change
+    yoy_change = None
+    if len(yearly) >= 2:
+        latest = yearly[-1]['median']
+        previous = yearly[-2]['median']
+        if previous > 0:
+            yoy_change = ((latest - previous) / previous) * 100
 
     return {
         "naics_code": naics_code,
@@ -316,7 +300,7 @@ async def get_pricing_trends(naics_code: str):
 async def get_ai_pricing_recommendation(
     rfp_id: int,
     request: AIRecommendationRequest,
-    db: Session = Depends(get_db)
+    db: DBDep
 ):
     """Get AI-powered pricing recommendation."""
     rfp = db.query(RFPOpportunity).filter(RFPOpportunity.id == rfp_id).first()
@@ -414,8 +398,8 @@ async def get_ai_pricing_recommendation(
 @router.get("/{rfp_id}/ptw-analysis")
 async def get_ptw_analysis(
     rfp_id: int,
+    db: DBDep,
     current_price: Optional[float] = None,
-    db: Session = Depends(get_db)
 ):
     """Get comprehensive Price-to-Win analysis."""
     rfp = db.query(RFPOpportunity).filter(RFPOpportunity.id == rfp_id).first()
@@ -517,7 +501,7 @@ async def get_ptw_analysis(
 
 
 @router.post("/{rfp_id}/narrative")
-async def generate_pricing_narrative(rfp_id: int, db: Session = Depends(get_db)):
+async def generate_pricing_narrative(rfp_id: int, db: DBDep):
     """Generate pricing narrative for proposal inclusion."""
     rfp = db.query(RFPOpportunity).filter(RFPOpportunity.id == rfp_id).first()
     pricing = db.query(PricingResult).filter(PricingResult.rfp_id == rfp_id).first()
@@ -564,7 +548,7 @@ This pricing represents competitive value based on analysis of {pricing.confiden
 
 
 @router.post("/{rfp_id}/basis-of-estimate")
-async def generate_basis_of_estimate(rfp_id: int, db: Session = Depends(get_db)):
+async def generate_basis_of_estimate(rfp_id: int, db: DBDep):
     """Generate Basis of Estimate (BOE) document."""
     rfp = db.query(RFPOpportunity).filter(RFPOpportunity.id == rfp_id).first()
     pricing = db.query(PricingResult).filter(PricingResult.rfp_id == rfp_id).first()
@@ -626,35 +610,101 @@ async def generate_basis_of_estimate(rfp_id: int, db: Session = Depends(get_db))
 
 @router.post("/train-model")
 async def train_pricing_model():
-    """Train/retrain the ML pricing model on historical data."""
+    """
+    Train the ML pricing model on historical data as a new registry version.
+
+    Runs as a Celery job when background jobs are enabled; otherwise trains
+    in a worker thread of this process.
+    """
+    from api.app.core.feature_flags import FeatureFlag, feature_flags
+
+    if feature_flags.is_enabled(FeatureFlag.CELERY_JOBS):
+        try:
+            from api.app.worker.tasks.pricing import train_pricing_model as train_task
+
+            task = train_task.delay()
+            return {"status": "queued", "job_id": task.id}
+        except Exception as e:
+            logger.warning(f"Celery dispatch failed, training in-process: {e}")
+
     try:
-        from src.pricing.pricing_ml import PricingMLModel
+        from src.config.paths import PathConfig
+        from src.pricing.market_stats import load_award_history
+        from src.pricing.model_registry import ModelRegistry
+        from src.pricing.pricing_ml import PricingMLModel, reset_pricing_ml_model
 
-        engine = get_pricing_engine()
-        if engine.historical_data is None:
-            raise HTTPException(status_code=500, detail="No historical data available")
+        # Loaded for this run only, as the Celery task does, not pinned on the shared engine
+        history = await asyncio.to_thread(load_award_history, PathConfig.PROCESSED_DATA_DIR)
+        if history.empty:
+            raise HTTPException(status_code=400, detail="No historical data available")
 
         model = PricingMLModel()
-        results = model.train(engine.historical_data)
-
-        return {"status": "trained", "metrics": results}
-    except ImportError:
-        raise HTTPException(status_code=501, detail="ML model not yet implemented")
+        results = await asyncio.to_thread(model.train, history, save=False)
+        registry = ModelRegistry()
+        version = registry.publish(model, results)
+        registry.prune()
+        reset_pricing_ml_model()
+
+        return {"status": "trained", "version": version, "metrics": results}
+    except HTTPException:
+        raise
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+@router.get("/models")
+async def list_pricing_models():
+    """List the trained pricing model versions and the active one."""
+    from src.pricing.model_registry import ModelRegistry
+
+    registry = ModelRegistry()
+    pointer = registry.pointer()
+    return {
+        "current": pointer.get("current"),
+        "previous": pointer.get("previous"),
+        "versions": registry.versions(),
+    }
+
+
+@router.post("/models/rollback")
+async def rollback_pricing_model():
+    """Re-activate the previous pricing model version."""
+    from src.pricing.model_registry import ModelRegistry
+    from src.pricing.pricing_ml import reset_pricing_ml_model
+
+    try:
+        version = ModelRegistry().rollback()
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e)) from e
+    reset_pricing_ml_model()
+    return {"status": "activated", "version": version}
+
+
+@router.post("/models/{version}/activate")
+async def activate_pricing_model(version: str):
+    """Make a trained pricing model version the active one."""
+    from src.pricing.model_registry import ModelRegistry
+    from src.pricing.pricing_ml import reset_pricing_ml_model
+
+    try:
+        ModelRegistry().activate(version)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+    reset_pricing_ml_model()
+    return {"status": "activated", "version": version}
 
 
 @router.post("/{rfp_id}/ml-prediction")
-async def get_ml_price_prediction(rfp_id: int, db: Session = Depends(get_db)):
+async def get_ml_price_prediction(rfp_id: int, db: DBDep):
     """Get ML-based price prediction for an RFP."""
     rfp = db.query(RFPOpportunity).filter(RFPOpportunity.id == rfp_id).first()
     if not rfp:
         raise HTTPException(status_code=404, detail="RFP not found")
 
     try:
-        from src.pricing.pricing_ml import PricingMLModel
+        from src.pricing.pricing_ml import get_pricing_ml_model
 
-        model = PricingMLModel()
+        model = get_pricing_ml_model()
         prediction = model.predict(
             naics_code=rfp.naics_code or "541511",
             agency=rfp.agency or "Unknown",
@@ -690,11 +740,52 @@ async def get_ml_price_prediction(rfp_id: int, db: Session = Depends(get_db)):
         }
 
 
+@router.post("/ml-predictions")
+async def get_ml_price_predictions(request: MLPredictionBatchRequest, db: DBDep):
+    """Get ML-based price predictions for many RFPs in one call."""
+    from src.pricing.pricing_ml import get_pricing_ml_model
+
+    model = get_pricing_ml_model()
+    if not model.is_trained:
+        raise HTTPException(status_code=503, detail="ML pricing model not trained")
+
+    rfps = db.query(RFPOpportunity).filter(RFPOpportunity.id.in_(request.rfp_ids)).all()
+    if not rfps:
+        return {"predictions": [], "not_found": request.rfp_ids}
+
+    predictions = model.predict_batch(
+        pd.DataFrame(
+            {
+                "naics_code": [rfp.naics_code or "541511" for rfp in rfps],
+                "agency": [rfp.agency or "Unknown" for rfp in rfps],
+                "description_length": [len(rfp.description or "") for rfp in rfps],
+                "requirement_count": 10,
+            }
+        )
+    )
+    found = {rfp.id for rfp in rfps}
+    return {
+        "predictions": [
+            {
+                "rfp_id": rfp.id,
+                "predicted_price": prediction.predicted_price,
+                "confidence_interval": {
+                    "lower": prediction.confidence_interval[0],
+                    "upper": prediction.confidence_interval[1],
+                },
+                "model_confidence": prediction.model_confidence,
+            }
+            for rfp, prediction in zip(rfps, predictions, strict=True)
+        ],
+        "not_found": [rfp_id for rfp_id in request.rfp_ids if rfp_id not in found],
+    }
+
+
 @router.post("/{rfp_id}/optimize")
 async def optimize_price(
     rfp_id: int,
     request: OptimizePriceRequest,
-    db: Session = Depends(get_db)
+    db: DBDep
 ):
     """Find optimal price balancing margin and win probability."""
     rfp = db.query(RFPOpportunity).filter(RFPOpportunity.id == rfp_id).first()
@@ -2,12 +2,14 @@
 RFP management API endpoints.
 """
 
+import asyncio
 import logging
 import os
 from datetime import datetime, timezone
 from typing import Any
 from uuid import uuid4
 
+from app.core.cache import CacheTag, cached
 from app.dependencies import DBDep, RFPDep, RFPServiceDep, rfp_to_processing_dict
 from app.models.database import (
     BidDocument,
@@ -19,12 +21,13 @@ from app.models.database import (
 from app.services.rfp_processor import processing_jobs, processor
 from app.services.rfp_service import RFPService
 from fastapi import APIRouter, BackgroundTasks, HTTPException, Query
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 from sqlalchemy import func, or_
 from sqlalchemy.orm import Session
 
 from src.agents.competitor_analytics import CompetitorAnalyticsService
 from src.pricing.pricing_engine import ScenarioParams
+from src.pricing.simulation import MonteCarloParams
 from src.utils.document_reader import extract_all_document_content
 
 logger = logging.getLogger(__name__)
@@ -215,6 +218,32 @@ class ScenarioInput(BaseModel):
     desired_margin: float = 0.0
 
 
+class MonteCarloInput(BaseModel):
+    """Input for Monte Carlo pricing simulation."""
+
+    draws: int = Field(default=100_000, ge=1_000, le=500_000)
+    material_cost_sd: float = Field(default=0.10, ge=0.0, le=1.0)
+    labor_cost_sd: float = Field(default=0.08, ge=0.0, le=1.0)
+    risk_contingency_min: float = Field(default=0.0, ge=0.0, le=1.0)
+    risk_contingency_likely: float = Field(default=0.05, ge=0.0, le=1.0)
+    risk_contingency_max: float = Field(default=0.15, ge=0.0, le=1.0)
+    competitor_price_sd: float = Field(default=0.15, ge=0.0, le=2.0)
+    min_margin: float = Field(default=0.05, ge=0.0, le=2.0)
+    max_margin: float = Field(default=0.60, ge=0.0, le=2.0)
+    margin_step: float = Field(default=0.01, gt=0.0, le=0.5)
+    seed: int | None = None
+
+    @model_validator(mode="after")
+    def check_ranges(self):
+        if not (
+            self.risk_contingency_min <= self.risk_contingency_likely <= self.risk_contingency_max
+        ):
+            raise ValueError("risk contingency must satisfy min <= likely <= max")
+        if self.min_margin > self.max_margin:
+            raise ValueError("min_margin must not exceed max_margin")
+        return self
+
+
 class RFPBase(BaseModel):
     solicitation_number: str | None = None
     title: str
@@ -266,6 +295,12 @@ class TriageDecision(BaseModel):
     notes: str | None = None
 
 
+class BatchAnalyzeRequest(BaseModel):
+    """RFPs to score in one go/no-go batch (default: all awaiting a decision)."""
+    rfp_ids: list[int] | None = Field(default=None, max_length=5000)
+    refresh: bool = False
+
+
 class ManualRFPSubmit(BaseModel):
     """Schema for manually submitting an RFP for processing."""
 
@@ -549,6 +584,7 @@ async def get_recent_rfps(limit: int = Query(default=10, le=50), db: DBDep = ...
 
 
 @router.get("/stats/overview")
+@cached("rfps:stats", ttl=60, tags=[CacheTag.RFPS])
 async def get_rfp_stats(db: DBDep):
     """Get overview statistics for RFPs."""
     service = RFPService(db)
@@ -620,6 +656,36 @@ async def run_pricing_scenarios(rfp: RFPDep, params: ScenarioInput):
     return processor.pricing_engine.run_war_gaming(rfp_data, custom_params)
 
 
+@router.post("/{rfp_id}/pricing-scenarios")
+async def simulate_pricing_scenarios(rfp: RFPDep, params: MonteCarloInput | None = None):
+    """Run a Monte Carlo pricing simulation over a margin grid."""
+    if not processor.pricing_engine:
+        raise HTTPException(status_code=503, detail="Pricing Engine not initialized")
+
+    params = params or MonteCarloInput()
+    rfp_data = rfp_to_processing_dict(rfp)
+    simulation_params = MonteCarloParams(
+        draws=params.draws,
+        material_cost_sd=params.material_cost_sd,
+        labor_cost_sd=params.labor_cost_sd,
+        risk_contingency=(
+            params.risk_contingency_min,
+            params.risk_contingency_likely,
+            params.risk_contingency_max,
+        ),
+        competitor_price_sd=params.competitor_price_sd,
+        min_margin=params.min_margin,
+        max_margin=params.max_margin,
+        margin_step=params.margin_step,
+        seed=params.seed,
+    )
+
+    # CPU-bound array work; keep it off the event loop
+    return await asyncio.to_thread(
+        processor.pricing_engine.simulate_pricing_scenarios, rfp_data, simulation_params
+    )
+
+
 @router.get("/{rfp_id}/pricing/subcontractors")
 async def get_subcontractor_opportunities(rfp: RFPDep):
     """Identify potential subcontracting opportunities."""
@@ -880,6 +946,39 @@ async def analyze_rfp(rfp: RFPDep, db: DBDep):
     }
 
 
+@router.post("/analyze-batch")
+async def analyze_rfps_batch(request: BatchAnalyzeRequest, db: DBDep):
+    """
+    Run Go/No-Go analysis on many RFPs and persist their scores.
+
+    Stored compliance/pricing summaries are reused, so only new or edited
+    RFPs are analyzed again. Runs as a Celery job when background jobs are
+    enabled; otherwise scores in a worker thread of this process.
+    """
+    from api.app.core.feature_flags import FeatureFlag, feature_flags
+
+    if feature_flags.is_enabled(FeatureFlag.CELERY_JOBS):
+        try:
+            from api.app.worker.tasks.decisions import score_pipeline
+
+            task = score_pipeline.delay(rfp_ids=request.rfp_ids, refresh=request.refresh)
+            return {"status": "queued", "job_id": task.id}
+        except Exception as e:
+            logger.warning(f"Celery dispatch failed, scoring in-process: {e}")
+
+    from app.services.batch_decisions import score_pipeline_rfps
+
+    summary = await asyncio.to_thread(
+        score_pipeline_rfps,
+        db,
+        rfp_ids=request.rfp_ids,
+        refresh=request.refresh,
+        max_workers=1,
+        engine=processor.go_nogo_engine,
+    )
+    return {"status": "completed", **summary}
+
+
 @router.post("/{rfp_id}/generate-bid")
 async def generate_bid_document(
     rfp: RFPDep,
@@ -9,12 +9,17 @@ from datetime import datetime, timezone
 from urllib.parse import urlparse
 from uuid import uuid4
 
+from app.core.cache import make_cache_key, response_cache
+from app.core.config import settings
 from app.dependencies import DBDep
 from app.models.database import PipelineStage, RFPDocument, RFPOpportunity, RFPQandA
+from app.services.rfp_refresh import apply_refresh, download_and_save_documents
 from fastapi import APIRouter, BackgroundTasks, HTTPException
 from fastapi.responses import FileResponse
 from pydantic import BaseModel, field_validator
 
+from src.agents.scrapers import get_scraper
+
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
@@ -85,32 +90,28 @@ class RFPQandAResponse(BaseModel):
         from_attributes = True
 
 
-def get_scraper(url: str):
+async def _scrape_cached(scraper, url: str):
     """
-    Get the appropriate scraper for a URL.
+    Scrape ``url`` for /preview and /confirm, reusing a result scraped within
+    SCRAPE_RESULT_TTL_SECONDS.
 
-    Priority order:
-    1. Platform-specific scrapers (BeaconBid, SAM.gov) - use specialized extraction
-    2. Generic web scraper - fallback for any HTTP(S) URL using AI extraction
+    A preview followed by a confirm would otherwise drive the browser through
+    the same page twice; concurrent requests for one URL share a single scrape.
+    /scrape and refreshes always scrape fresh.
     """
-    from src.agents.scrapers import BeaconBidScraper, GenericWebScraper, SAMGovScraper
-
-    # Platform-specific scrapers in priority order
-    scrapers = [
-        BeaconBidScraper(),
-        SAMGovScraper(),
-    ]
-
-    for scraper in scrapers:
-        if scraper.is_valid_url(url):
-            return scraper
+    from src.agents.scrapers.base_scraper import ScrapedRFP
 
-    # Fallback: GenericWebScraper accepts any HTTP(S) URL
-    generic = GenericWebScraper()
-    if generic.is_valid_url(url):
-        return generic
+    async def load():
+        return (await scraper.scrape(url)).to_dict()
 
-    return None
+    data, age = await response_cache.get_or_load(
+        make_cache_key("scraper:result", {"url": url}),
+        load,
+        ttl=settings.SCRAPE_RESULT_TTL_SECONDS,
+    )
+    if age is not None:
+        logger.info("Reusing scrape of %s from %ss ago", url, int(age))
+    return ScrapedRFP.from_dict(data)
 
 
 @router.post("/scrape", response_model=ScrapeResponse)
@@ -183,7 +184,7 @@ async def scrape_rfp(
 
         # Download documents in background
         background_tasks.add_task(
-            _download_and_save_documents, scraper, scraped_rfp, rfp.id, rfp_id
+            download_and_save_documents, scraper, scraped_rfp, rfp.id, rfp_id
         )
 
         # Save Q&A items
@@ -230,76 +231,6 @@ async def scrape_rfp(
         raise HTTPException(status_code=500, detail=f"Scraping failed: {e!s}") from e
 
 
-async def _download_and_save_documents(
-    scraper, scraped_rfp, rfp_db_id: int, rfp_id: str
-) -> None:
-    """Background task to download documents and save to database."""
-    from app.core.database import SessionLocal
-
-    try:
-        # First, save all document metadata so they appear in the UI
-        with SessionLocal() as session:
-            for doc in scraped_rfp.documents:
-                # Check if document already exists
-                existing = (
-                    session.query(RFPDocument)
-                    .filter(
-                        RFPDocument.rfp_id == rfp_db_id,
-                        RFPDocument.filename == doc.filename,
-                    )
-                    .first()
-                )
-
-                if not existing:
-                    doc_record = RFPDocument(
-                        rfp_id=rfp_db_id,
-                        filename=doc.filename,
-                        file_type=doc.file_type,
-                        document_type=doc.document_type,
-                        source_url=doc.source_url,
-                        # file_path, file_size, checksum will be set after download
-                    )
-                    session.add(doc_record)
-
-            session.commit()
-            logger.info(
-                "Saved %d document records for RFP %s",
-                len(scraped_rfp.documents),
-                rfp_id,
-            )
-
-        # Then attempt to download the files
-        downloaded_docs = await scraper.download_documents(scraped_rfp, rfp_id)
-
-        # Update records with download info
-        with SessionLocal() as session:
-            for doc in downloaded_docs:
-                existing = (
-                    session.query(RFPDocument)
-                    .filter(
-                        RFPDocument.rfp_id == rfp_db_id,
-                        RFPDocument.filename == doc.filename,
-                    )
-                    .first()
-                )
-
-                if existing:
-                    existing.file_path = doc.file_path
-                    existing.file_size = doc.file_size
-                    existing.checksum = doc.checksum
-                    existing.downloaded_at = doc.downloaded_at
-
-            session.commit()
-            logger.info(
-                "Updated %d documents with download info for RFP %s",
-                len(downloaded_docs),
-                rfp_id,
-            )
-
-    except Exception as e:
-        logger.error("Error processing documents for RFP %s: %s", rfp_id, e)
-
-
 @router.post("/{rfp_id}/refresh", response_model=RefreshResponse)
 async def refresh_rfp(
     rfp_id: str,
@@ -330,33 +261,9 @@ async def refresh_rfp(
     try:
         # Refresh check
         result = await scraper.refresh(rfp.source_url, rfp.scrape_checksum)
-        updated_rfp = result["updated_rfp"]
-
-        # Count existing Q&A and docs in database
-        existing_qa_count = db.query(RFPQandA).filter(RFPQandA.rfp_id == rfp.id).count()
-        existing_doc_count = (
-            db.query(RFPDocument).filter(RFPDocument.rfp_id == rfp.id).count()
-        )
-
-        # Check if database is missing documents/Q&A that were scraped
-        # (This can happen if previous saves failed due to constraints)
-        scraped_doc_count = len(updated_rfp.documents) if updated_rfp else 0
-        scraped_qa_count = len(updated_rfp.qa_items) if updated_rfp else 0
+        outcome = apply_refresh(db, rfp, result)
 
-        # Also check for documents that exist but failed to download (file_path is None)
-        pending_downloads = (
-            db.query(RFPDocument)
-            .filter(RFPDocument.rfp_id == rfp.id, RFPDocument.file_path.is_(None))
-            .count()
-        )
-
-        has_missing_data = (
-            (scraped_doc_count > existing_doc_count)
-            or (scraped_qa_count > existing_qa_count)
-            or (pending_downloads > 0)
-        )
-
-        if not result["has_changes"] and not has_missing_data:
+        if not outcome.has_changes:
             return RefreshResponse(
                 rfp_id=rfp_id,
                 has_changes=False,
@@ -366,72 +273,20 @@ async def refresh_rfp(
                 message="No changes detected",
             )
 
-        # Check for new Q&A
-        new_qa_count = len(updated_rfp.qa_items) - existing_qa_count
-        if new_qa_count > 0:
-            # Mark existing Q&A as not new
-            db.query(RFPQandA).filter(RFPQandA.rfp_id == rfp.id).update(
-                {RFPQandA.is_new: False}
-            )
-
-            # Add new Q&A
-            for qa in updated_rfp.qa_items[existing_qa_count:]:
-                qa_record = RFPQandA(
-                    rfp_id=rfp.id,
-                    question_number=qa.question_number,
-                    question_text=qa.question_text,
-                    answer_text=qa.answer_text,
-                    asked_date=qa.asked_date,
-                    answered_date=qa.answered_date,
-                    is_new=True,
-                )
-                db.add(qa_record)
-
-        # Check for new documents OR documents that failed to download (file_path is None)
-        new_doc_count = len(updated_rfp.documents) - existing_doc_count
-        docs_needing_download = (
-            db.query(RFPDocument)
-            .filter(RFPDocument.rfp_id == rfp.id, RFPDocument.file_path.is_(None))
-            .count()
-        )
-
-        if new_doc_count > 0 or docs_needing_download > 0:
+        if outcome.needs_download:
             # Download documents in background (includes retrying failed downloads)
             background_tasks.add_task(
-                _download_and_save_documents, scraper, updated_rfp, rfp.id, rfp_id
-            )
-            logger.info(
-                "Triggering download: %d new, %d pending",
-                new_doc_count,
-                docs_needing_download,
+                download_and_save_documents, scraper, outcome.updated_rfp, rfp.id, rfp_id
             )
-
-        # Check for metadata changes
-        metadata_changed = (
-            rfp.title != updated_rfp.title
-            or rfp.description != updated_rfp.description
-            or rfp.response_deadline != updated_rfp.response_deadline
-        )
-
-        # Update RFP metadata - only if extraction succeeded (not fallback values)
-        if updated_rfp.title and updated_rfp.title != "Untitled RFP":
-            rfp.title = updated_rfp.title
-        if updated_rfp.description:
-            rfp.description = updated_rfp.description
-        if updated_rfp.response_deadline:
-            rfp.response_deadline = updated_rfp.response_deadline
-        rfp.last_scraped_at = datetime.now(timezone.utc)
-        rfp.scrape_checksum = updated_rfp.scrape_checksum
-
-        db.commit()
+            logger.info("Triggering download: %d new documents", outcome.new_document_count)
 
         return RefreshResponse(
             rfp_id=rfp_id,
             has_changes=True,
-            new_qa_count=max(0, new_qa_count),
-            new_document_count=max(0, new_doc_count),
-            metadata_changed=metadata_changed,
-            message=f"Found {max(0, new_qa_count)} new Q&A and {max(0, new_doc_count)} new documents",
+            new_qa_count=outcome.new_qa_count,
+            new_document_count=outcome.new_document_count,
+            metadata_changed=outcome.metadata_changed,
+            message=f"Found {outcome.new_qa_count} new Q&A and {outcome.new_document_count} new documents",
         )
 
     except Exception as e:
@@ -670,7 +525,7 @@ async def preview_rfp(request: PreviewRequest, db: DBDep):
     try:
         # Scrape without saving
         logger.info("Preview scrape of URL: %s", url)
-        scraped = await scraper.scrape(url)
+        scraped = await _scrape_cached(scraper, url)
 
         return PreviewResponse(
             source_url=url,
@@ -745,7 +600,7 @@ async def confirm_import(
 
     After previewing an RFP, users can edit the extracted fields and then
     confirm the import. This endpoint:
-    1. Re-scrapes the URL to get fresh data
+    1. Reuses the preview's scrape of the URL (re-scraping once it has expired)
     2. Applies any user overrides to the extracted fields
     3. Saves the RFP to the database
     4. Triggers background document download
@@ -769,9 +624,9 @@ async def confirm_import(
         )
 
     try:
-        # Re-scrape to get fresh data
+        # Scrape data, shared with the preview while still fresh
         logger.info("Confirm import scrape of URL: %s", url)
-        scraped_rfp = await scraper.scrape(url)
+        scraped_rfp = await _scrape_cached(scraper, url)
 
         # Apply user overrides
         overrides = request.overrides
@@ -830,7 +685,7 @@ async def confirm_import(
 
         # Download documents in background
         background_tasks.add_task(
-            _download_and_save_documents, scraper, scraped_rfp, rfp.id, rfp_id
+            download_and_save_documents, scraper, scraped_rfp, rfp.id, rfp_id
         )
 
         # Save Q&A items
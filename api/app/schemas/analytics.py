@@ -122,3 +122,20 @@ class AnalyticsDashboard(BaseModel):
     top_competitors: list[CompetitorStats] = []
     win_rate_by_category: dict[str, float] = {}
     win_rate_by_agency: dict[str, float] = {}
+
+
+class WinRateCellStats(BaseModel):
+    """Recorded wins and losses of one win-rate index cell."""
+    key: str
+    wins: int
+    losses: int
+    win_rate: float
+    smoothed_win_rate: float
+
+
+class WinRateIndexResponse(BaseModel):
+    """Historical win rates by NAICS code, agency, value band and set-aside."""
+    decided_bids: int
+    prior_win_rate: float
+    prior_strength: float
+    dimensions: dict[str, list[WinRateCellStats]] = {}
@@ -116,10 +116,9 @@ async def calculate_pricing_task(task_id: str, rfp_data: dict[str, Any]):
     }
 
     try:
-        from src.pricing.pricing_engine import PricingEngine
+        from src.pricing.pricing_engine import get_pricing_engine
 
-        pricing_engine = PricingEngine()
-        results = pricing_engine.generate_pricing(rfp_data)
+        results = get_pricing_engine().generate_pricing(rfp_data)
 
         task_status[task_id].update(
             {
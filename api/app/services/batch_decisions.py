@@ -0,0 +1,146 @@
+"""
+Batch go/no-go scoring of pipeline RFPs.
+
+Compliance and pricing summaries ("decision inputs") are stored in
+``rfp_metadata["decision_inputs"]`` together with the key of the RFP fields
+they were computed from. A batch run reuses every stored summary whose key
+still matches, computes the rest in a process pool, scores all RFPs in one
+vectorized pass and writes the recommendations back in a single bulk update.
+The update is an ORM ``UPDATE`` statement, so it still invalidates cached RFP
+responses; the board deltas flush events would have produced are queued
+explicitly.
+"""
+
+import logging
+from collections import Counter
+from collections.abc import Callable
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from ..models.database import PipelineStage, RFPOpportunity
+from .pipeline_stream import queue_rfp_updates
+
+logger = logging.getLogger(__name__)
+
+# Stages before a bid decision has been made
+UNDECIDED_STAGES = (
+    PipelineStage.DISCOVERED,
+    PipelineStage.TRIAGED,
+    PipelineStage.ANALYZING,
+    PipelineStage.PRICING,
+    PipelineStage.DECISION_PENDING,
+)
+
+
+def rfp_decision_data(rfp: RFPOpportunity) -> dict[str, Any]:
+    """RFP fields used for go/no-go analysis (same as the single-RFP analyze route)."""
+    return {
+        "rfp_id": rfp.rfp_id,
+        "title": rfp.title,
+        "description": rfp.description,
+        "agency": rfp.agency,
+        "naics_code": rfp.naics_code,
+        "category": rfp.category,
+        "award_amount": rfp.award_amount or rfp.estimated_value,
+        "response_deadline": rfp.response_deadline.isoformat() if rfp.response_deadline else None,
+    }
+
+
+def score_pipeline_rfps(
+    db: Session,
+    rfp_ids: list[int] | None = None,
+    refresh: bool = False,
+    max_workers: int | None = None,
+    engine=None,
+    progress: Callable[[str, int, int], None] | None = None,
+) -> dict[str, Any]:
+    """
+    Score RFPs and store their go/no-go recommendations.
+
+    Args:
+        db: Database session
+        rfp_ids: RFPs to score (default: every RFP in an undecided stage)
+        refresh: Recompute decision inputs even when stored ones match
+        max_workers: Processes for computing missing decision inputs
+        engine: GoNoGoEngine for scoring and in-process analysis
+        progress: Called with (phase, done, total)
+
+    Returns:
+        Summary with counts and each RFP's recommendation
+    """
+    from src.decision.batch_scoring import compute_decision_inputs, decision_inputs_key, score_rfps
+    from src.decision.go_nogo_engine import GoNoGoEngine
+
+    query = db.query(RFPOpportunity)
+    if rfp_ids is not None:
+        query = query.filter(RFPOpportunity.id.in_(rfp_ids))
+    else:
+        query = query.filter(RFPOpportunity.current_stage.in_(UNDECIDED_STAGES))
+    rfps = query.order_by(RFPOpportunity.id).all()
+
+    rfp_data = [rfp_decision_data(rfp) for rfp in rfps]
+    keys = [decision_inputs_key(data) for data in rfp_data]
+    inputs: list[dict[str, Any] | None] = [None] * len(rfps)
+    if not refresh:
+        for i, rfp in enumerate(rfps):
+            stored = (rfp.rfp_metadata or {}).get("decision_inputs") or {}
+            if stored.get("key") == keys[i]:
+                inputs[i] = stored.get("inputs")
+
+    missing = [i for i, rfp_inputs in enumerate(inputs) if rfp_inputs is None]
+    if missing:
+        logger.info(f"Computing decision inputs for {len(missing)} of {len(rfps)} RFPs")
+        computed = compute_decision_inputs(
+            [rfp_data[i] for i in missing],
+            engine=engine,
+            max_workers=max_workers,
+            progress=(lambda done, total: progress("analyzing", done, total)) if progress else None,
+        )
+        for i, rfp_inputs in zip(missing, computed, strict=True):
+            inputs[i] = rfp_inputs
+
+    if progress:
+        progress("scoring", 0, len(rfps))
+    scores = score_rfps(rfp_data, inputs, engine or GoNoGoEngine())
+
+    now = datetime.now(timezone.utc)
+    recomputed = set(missing)
+    mappings = []
+    for i, (rfp, row) in enumerate(zip(rfps, scores.itertuples(index=False), strict=True)):
+        mapping = {
+            "id": rfp.id,
+            "triage_score": float(row.overall_score),
+            "overall_score": float(row.overall_score),
+            "decision_recommendation": str(row.recommendation),
+            "confidence_level": float(row.confidence_level),
+            "updated_at": now,
+        }
+        if i in recomputed:
+            mapping["rfp_metadata"] = {
+                **(rfp.rfp_metadata or {}),
+                "decision_inputs": {"key": keys[i], "inputs": inputs[i]},
+            }
+        mappings.append(mapping)
+    queue_rfp_updates(db, rfps, mappings)
+    db.execute(update(RFPOpportunity), mappings)
+    db.commit()
+
+    return {
+        "scored": len(rfps),
+        "reused_inputs": len(rfps) - len(missing),
+        "computed_inputs": len(missing),
+        "recommendations": dict(Counter(map(str, scores["recommendation"]))),
+        "results": [
+            {
+                "id": rfp.id,
+                "rfp_id": rfp.rfp_id,
+                "recommendation": str(row.recommendation),
+                "overall_score": float(row.overall_score),
+                "confidence_level": float(row.confidence_level),
+            }
+            for rfp, row in zip(rfps, scores.itertuples(index=False), strict=True)
+        ],
+    }
@@ -0,0 +1,243 @@
+"""
+Streaming compliance matrix generation.
+
+Analyzes the RFP description, Q&A and the stored text of every attachment
+document by document: each document's requirements are deduplicated against
+everything found (or saved) before, answered, saved to ``ComplianceRequirement``
+in batches and yielded right away, so a long solicitation shows its first
+requirements within seconds instead of after the whole matrix is built.
+"""
+
+import asyncio
+import logging
+import os
+from collections import Counter
+from collections.abc import AsyncIterator, Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from ..models.database import (
+    ComplianceRequirement,
+    RequirementStatus,
+    RequirementType,
+    RFPOpportunity,
+)
+
+logger = logging.getLogger(__name__)
+
+REQUIREMENT_TYPE_BY_CATEGORY = {
+    "mandatory": RequirementType.MANDATORY,
+    "technical": RequirementType.TECHNICAL,
+    "financial": RequirementType.ADMINISTRATIVE,
+    "qualification": RequirementType.EVALUATION,
+    "performance": RequirementType.PERFORMANCE,
+    "security": RequirementType.MANDATORY,
+    "legal": RequirementType.MANDATORY,
+    "administrative": RequirementType.ADMINISTRATIVE,
+}
+
+
+def requirement_type_for(category: str | None) -> RequirementType:
+    """Requirement type for an extractor category."""
+    return REQUIREMENT_TYPE_BY_CATEGORY.get((category or "").lower(), RequirementType.MANDATORY)
+
+
+def stored_document_text(file_path: str) -> str | None:
+    """Attachment text from the extracted-text store, with ``[Page N]`` markers."""
+    from src.utils.text_store import (
+        SUPPORTED_EXTENSIONS,
+        DocumentExtractionError,
+        get_text_store,
+    )
+
+    if Path(file_path).suffix.lower() not in SUPPORTED_EXTENSIONS or not os.path.exists(file_path):
+        return None
+    try:
+        extracted = get_text_store().get_or_extract(file_path)
+    except DocumentExtractionError as e:
+        logger.warning(f"Skipping unreadable attachment {file_path}: {e}")
+        return None
+    return "\n".join(
+        f"[Page {page + 1}]\n{extracted.pages(page, page + 1)}" for page in range(extracted.page_count)
+    )
+
+
+def _iter_sources(rfp_data: dict[str, Any], documents: list[tuple[str, str]]) -> Iterator[tuple[str, str]]:
+    """Description and Q&A, then attachments, each read only when it is reached."""
+    from src.compliance.compliance_matrix import ComplianceMatrixGenerator
+
+    yield from ComplianceMatrixGenerator.document_sources(rfp_data)
+    for filename, file_path in documents:
+        text = stored_document_text(file_path)
+        if text:
+            yield filename, text
+
+
+def _create_generator():
+    from src.compliance.compliance_matrix import ComplianceMatrixGenerator
+
+    try:
+        from src.rag.chroma_rag_engine import get_rag_engine
+
+        rag_engine = get_rag_engine()
+    except Exception:
+        rag_engine = None
+    return ComplianceMatrixGenerator(rag_engine=rag_engine)
+
+
+def _save_batch(
+    db: Session,
+    rfp_id: int,
+    requirements: list[dict[str, Any]],
+    responses: list[dict[str, Any]],
+    first_order: int,
+) -> list[dict[str, Any]]:
+    rows = [
+        ComplianceRequirement(
+            rfp_id=rfp_id,
+            requirement_id=response["requirement_id"],
+            requirement_text=requirement["text"],
+            source_document=requirement.get("source_document"),
+            source_section=requirement.get("source_section"),
+            source_page=requirement.get("source_page"),
+            requirement_type=requirement_type_for(requirement.get("category")),
+            is_mandatory=requirement.get("mandatory", True),
+            status=RequirementStatus.NOT_STARTED,
+            response_text=response["response_text"],
+            compliance_indicator=response["compliance_status"],
+            confidence_score=response["confidence_score"],
+            order_index=first_order + offset,
+        )
+        for offset, (requirement, response) in enumerate(zip(requirements, responses, strict=True))
+    ]
+    db.add_all(rows)
+    db.commit()
+    return [
+        {
+            "id": row.id,
+            "requirement_id": row.requirement_id,
+            "requirement_text": row.requirement_text,
+            "source_document": row.source_document,
+            "source_section": row.source_section,
+            "source_page": row.source_page,
+            "category": requirement.get("category"),
+            "mandatory": row.is_mandatory,
+            "compliance_status": row.compliance_indicator,
+            "response_text": row.response_text,
+            "confidence_score": row.confidence_score,
+            "order_index": row.order_index,
+        }
+        for row, requirement in zip(rows, requirements, strict=True)
+    ]
+
+
+async def stream_compliance_matrix(
+    rfp_id: int,
+    session_factory: Callable[[], Session] | None = None,
+    generator: Any = None,
+    batch_size: int | None = None,
+) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+    """
+    Build the compliance matrix of an RFP incrementally.
+
+    Extraction and response generation run in worker threads; the stream uses
+    its own session because it outlives the request that started it.
+
+    Args:
+        rfp_id: Database ID of the RFP
+        session_factory: Session factory (default SessionLocal)
+        generator: ComplianceMatrixGenerator to use (default one with RAG if available)
+        batch_size: Requirements answered and saved together (default COMPLIANCE_STREAM_BATCH_SIZE)
+
+    Yields:
+        (event, payload) pairs: ``started``; per document ``document`` followed by
+        one ``requirement`` per saved record; then ``complete``, or ``error``
+        if generation fails (batches saved before the failure are kept)
+    """
+    if session_factory is None:
+        from ..core.database import SessionLocal
+
+        session_factory = SessionLocal
+    from src.compliance.dedup import RequirementDedupIndex
+
+    batch_size = batch_size or settings.COMPLIANCE_STREAM_BATCH_SIZE
+
+    with session_factory() as db:
+        rfp = db.get(RFPOpportunity, rfp_id)
+        if rfp is None:
+            yield "error", {"message": f"RFP with id {rfp_id} not found", "saved": 0}
+            return
+
+        rfp_data = {
+            "rfp_id": rfp.rfp_id,
+            "title": rfp.title or "",
+            "agency": rfp.agency or "",
+            "description": rfp.description or "",
+            "naics_code": rfp.naics_code or "",
+            "solicitation_number": rfp.solicitation_number or "",
+            "qa_items": [
+                {"question_text": qa.question_text, "answer_text": qa.answer_text} for qa in rfp.qa_items
+            ],
+        }
+        documents = [(doc.filename, doc.file_path) for doc in rfp.documents if doc.file_path]
+
+        # Requirements saved by earlier runs are not repeated
+        dedup_index = RequirementDedupIndex()
+        existing = db.query(ComplianceRequirement.requirement_text).filter(
+            ComplianceRequirement.rfp_id == rfp_id
+        )
+        for (text,) in existing:
+            dedup_index.add(text or "")
+        max_order = (
+            db.query(func.max(ComplianceRequirement.order_index))
+            .filter(ComplianceRequirement.rfp_id == rfp_id)
+            .scalar()
+        )
+        first_order = 0 if max_order is None else max_order + 1
+
+        yield "started", {
+            "rfp_id": rfp.rfp_id,
+            "documents": [filename for filename, _ in documents],
+            "existing_requirements": len(dedup_index),
+        }
+
+        saved = 0
+        analyzed = 0
+        statuses: Counter[str] = Counter()
+        try:
+            if generator is None:
+                generator = await asyncio.to_thread(_create_generator)
+            extraction = generator.iter_requirements(
+                _iter_sources(rfp_data, documents), dedup_index
+            )
+            while (item := await asyncio.to_thread(next, extraction, None)) is not None:
+                source, requirements = item
+                analyzed += 1
+                yield "document", {"source": source, "requirements": len(requirements)}
+
+                for start in range(0, len(requirements), batch_size):
+                    batch = requirements[start:start + batch_size]
+                    responses = await asyncio.to_thread(
+                        lambda batch=batch: [generator.generate_compliance_response(r, rfp_data) for r in batch]
+                    )
+                    records = _save_batch(db, rfp_id, batch, responses, first_order + saved)
+                    saved += len(records)
+                    for record in records:
+                        statuses[record["compliance_status"]] += 1
+                        yield "requirement", record
+        except Exception as e:
+            logger.exception(f"Compliance matrix stream failed for RFP {rfp_id}")
+            db.rollback()
+            yield "error", {"message": str(e), "saved": saved}
+            return
+
+        logger.info(f"Streamed {saved} compliance requirements for RFP {rfp_id} from {analyzed} sources")
+        yield "complete", {
+            "saved": saved,
+            "sources_analyzed": analyzed,
+            "compliance_summary": dict(statuses),
+        }
@@ -0,0 +1,258 @@
+"""
+Uploaded-document ingestion with a persistent status record.
+
+Each upload gets a DocumentProcessingJob row that the worker updates as it
+moves through the stages (extracting, chunking, indexing), so any API replica
+can answer status polls and the state survives restarts. Processing runs on
+the Celery ``documents`` queue; when the broker is unreachable the route falls
+back to an in-process background task that writes to the same table.
+"""
+
+import logging
+import time
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+
+from sqlalchemy.orm import Session
+
+from ..models.database import DocumentProcessingJob
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 512  # Words per chunk
+CHUNK_OVERLAP = 50
+# Chunks sent to the RAG index per call; progress is committed after each
+INDEX_BATCH_SIZE = 64
+
+# After a failed dispatch, skip the broker for this long instead of paying
+# the connection timeout on every upload
+_BROKER_RETRY_INTERVAL = 30.0
+_broker_disabled_until = 0.0
+
+
+def chunk_text(text: str, chunk_size: int = CHUNK_SIZE, overlap: int = CHUNK_OVERLAP) -> list[str]:
+    """Split text into overlapping word windows."""
+    words = text.split()
+    chunks = []
+    for i in range(0, len(words), chunk_size - overlap):
+        chunk = " ".join(words[i : i + chunk_size])
+        if chunk.strip():
+            chunks.append(chunk)
+    return chunks
+
+
+def create_processing_job(
+    db: Session, rfp_db_id: int, document_id: str, filename: str, file_path: Path
+) -> DocumentProcessingJob:
+    """Record a queued processing job for an uploaded document."""
+    job = DocumentProcessingJob(
+        document_id=document_id,
+        rfp_id=rfp_db_id,
+        filename=filename,
+        file_path=str(file_path),
+        status="pending",
+        stage="queued",
+        progress=0,
+    )
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+    return job
+
+
+def get_processing_jobs(db: Session, document_ids: list[str]) -> dict[str, DocumentProcessingJob]:
+    """Jobs for several documents in one query, keyed by document id."""
+    if not document_ids:
+        return {}
+    jobs = (
+        db.query(DocumentProcessingJob)
+        .filter(DocumentProcessingJob.document_id.in_(document_ids))
+        .all()
+    )
+    return {job.document_id: job for job in jobs}
+
+
+class _JobRecorder:
+    """Commits stage, progress and per-stage timings to the job row."""
+
+    def __init__(self, db: Session, job: DocumentProcessingJob):
+        self.db = db
+        self.job = job
+        self._stage_started = time.monotonic()
+
+    def stage(self, stage: str, progress: float) -> None:
+        self._close_stage()
+        self.job.stage = stage
+        self.job.progress = progress
+        self.db.commit()
+
+    def update(self, **fields) -> None:
+        for name, value in fields.items():
+            setattr(self.job, name, value)
+        self.db.commit()
+
+    def finish(self, status: str, error: str | None = None) -> None:
+        self._close_stage()
+        self.job.status = status
+        self.job.error = error
+        if status == "completed":
+            self.job.stage = "done"
+            self.job.progress = 100
+        self.job.completed_at = datetime.utcnow()
+        self.db.commit()
+
+    def _close_stage(self) -> None:
+        now = time.monotonic()
+        if self.job.stage not in (None, "queued", "done"):
+            timings = dict(self.job.timings or {})
+            timings[self.job.stage] = round(now - self._stage_started, 3)
+            # Reassign so the JSON column is flagged as modified
+            self.job.timings = timings
+        self._stage_started = now
+
+
+def process_document(
+    document_id: str,
+    session_factory: Callable[[], Session] | None = None,
+    extract_in_pool: bool = False,
+    on_progress: Callable[[DocumentProcessingJob], None] | None = None,
+) -> dict:
+    """
+    Extract, chunk and index one uploaded document, recording progress.
+
+    Args:
+        document_id: Upload id the job was created with
+        session_factory: Session factory for the job table (default SessionLocal)
+        extract_in_pool: Run extraction in the text store's process pool; used
+            when processing inside the API process
+        on_progress: Called with the job after each stage change
+
+    Returns:
+        The job as a dict
+    """
+    if session_factory is None:
+        from ..core.database import SessionLocal
+
+        session_factory = SessionLocal
+
+    with session_factory() as db:
+        job = (
+            db.query(DocumentProcessingJob)
+            .filter(DocumentProcessingJob.document_id == document_id)
+            .first()
+        )
+        if job is None:
+            raise ValueError(f"No processing job for document {document_id}")
+
+        recorder = _JobRecorder(db, job)
+        job.status = "processing"
+        job.started_at = datetime.utcnow()
+        job.error = None
+        recorder.stage("extracting", 10)
+        if on_progress:
+            on_progress(job)
+
+        try:
+            from src.utils.text_store import get_text_store
+
+            store = get_text_store()
+            if extract_in_pool:
+                store.submit(job.file_path).result()
+            text = store.get_or_extract(job.file_path).text
+
+            if not text.strip():
+                recorder.finish("failed", "No text content extracted")
+                return job.to_dict()
+
+            recorder.stage("chunking", 40)
+            chunks = chunk_text(text)
+            recorder.update(chunks_total=len(chunks))
+
+            recorder.stage("indexing", 60)
+            if on_progress:
+                on_progress(job)
+            _index_chunks(job, chunks, recorder, on_progress)
+            recorder.finish("completed")
+
+        except Exception as e:
+            logger.error(f"Document processing failed for {document_id}: {e}")
+            db.rollback()
+            recorder.finish("failed", str(e))
+
+        if on_progress:
+            on_progress(job)
+        return job.to_dict()
+
+
+def _index_chunks(
+    job: DocumentProcessingJob,
+    chunks: list[str],
+    recorder: _JobRecorder,
+    on_progress: Callable[[DocumentProcessingJob], None] | None,
+) -> None:
+    """Add chunks to the RAG index in batches, committing progress per batch."""
+    rfp_id = job.rfp.rfp_id if job.rfp else str(job.rfp_id)
+    upload_date = (job.created_at or datetime.utcnow()).isoformat()
+    indexed = 0
+    try:
+        from src.rag.chroma_rag_engine import get_rag_engine
+
+        rag_engine = get_rag_engine()
+        if not rag_engine:
+            raise RuntimeError("RAG engine not available")
+
+        for start in range(0, len(chunks), INDEX_BATCH_SIZE):
+            batch = chunks[start : start + INDEX_BATCH_SIZE]
+            indexed += rag_engine.add_documents(
+                documents=[
+                    {
+                        "content": chunk,
+                        "source": job.filename,
+                        "rfp_id": rfp_id,
+                        "document_id": job.document_id,
+                        "chunk_index": str(start + i),
+                        "upload_date": upload_date,
+                    }
+                    for i, chunk in enumerate(batch)
+                ],
+                ids=[f"{job.document_id}_chunk_{start + i}" for i in range(len(batch))],
+            )
+            done = min(start + INDEX_BATCH_SIZE, len(chunks))
+            recorder.update(chunks_indexed=indexed, progress=60 + 40 * done / len(chunks))
+            if on_progress:
+                on_progress(job)
+    except Exception as e:
+        # Still completed: the file is saved and its text extracted
+        logger.error(f"Failed to add document to RAG: {e}")
+        return
+
+    logger.info(f"Added {indexed} chunks from {job.filename} to RAG index")
+
+
+def enqueue_processing(document_id: str) -> str | None:
+    """
+    Queue processing on the Celery ``documents`` queue.
+
+    Returns:
+        The Celery task id, or None if Celery or the broker is unavailable
+    """
+    global _broker_disabled_until
+
+    if time.time() < _broker_disabled_until:
+        return None
+
+    try:
+        from ..core.feature_flags import FeatureFlag, feature_flags
+
+        if not feature_flags.is_enabled(FeatureFlag.CELERY_JOBS):
+            return None
+
+        from api.app.worker.tasks.documents import process_uploaded_document
+
+        task = process_uploaded_document.apply_async(args=(document_id,), retry=False)
+        return task.id
+    except Exception as e:
+        logger.warning(f"Celery dispatch failed, processing {document_id} in-process: {e}")
+        _broker_disabled_until = time.time() + _BROKER_RETRY_INTERVAL
+        return None
@@ -0,0 +1,295 @@
+"""
+Shared generation context for proposal sections and chat.
+
+Assembling the context for one RFP (RFP row, company profile, Q&A items and
+attachment text) costs several queries plus PDF parsing. A full proposal asks
+for the same context once per section, so it is built once per RFP version and
+memoized in the response cache (in-process LRU + Redis). Section-specific
+views such as Q&A prioritization and RAG snippets are derived from it.
+
+Cache layout:
+- ``generation:context:<hash>``: the context, keyed by RFP id, ``updated_at``
+  and attachment checksums, tagged ``generation_context``
+- ``generation:context:current:<rfp_id>``: pointer to the current context key,
+  also tagged ``rfps`` so any RFP write drops it. While the pointer is live a
+  lookup costs no DB queries at all.
+"""
+
+import logging
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from ..core.cache import CacheTag, ResponseCache, make_cache_key, response_cache
+from ..core.config import settings
+from ..models.database import (
+    CompanyProfile,
+    RFPDocument,
+    RFPOpportunity,
+    RFPQandA,
+)
+
+logger = logging.getLogger(__name__)
+
+CONTEXT_NAMESPACE = "generation:context"
+_POINTER_NAMESPACE = "generation:context:current"
+
+# Attachment text kept per document; prompts use at most a few thousand chars
+_DOCUMENT_EXCERPT_CHARS = 8000
+_DOCUMENT_TOTAL_CHARS = 40000
+
+
+@dataclass
+class GenerationContext:
+    """Everything a section or chat prompt needs to know about one RFP."""
+
+    rfp_id: str
+    rfp_db_id: int
+    cache_key: str
+    rfp_data: dict[str, Any]
+    company_profile: dict[str, Any]
+    qa_items: list[dict[str, Any]]
+    documents: list[dict[str, Any]]
+    missing_documents: list[str] = field(default_factory=list)
+    # RAG snippets per section type, filled lazily
+    rag_snippets: dict[str, list[str]] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "GenerationContext":
+        return cls(**data)
+
+    def qa_context(self, section_type: str, max_relevant: int = 10, max_total: int = 15) -> str:
+        """Q&A formatted for a prompt, section-relevant items first."""
+        relevant, other = [], []
+        for qa in self.qa_items:
+            related = qa.get("related_sections") or []
+            if section_type in related or qa.get("category") == section_type.replace("_", " "):
+                relevant.append(qa)
+            else:
+                other.append(qa)
+
+        prioritized = relevant[:max_relevant] + other[: max(0, max_total - len(relevant))]
+        lines = []
+        for qa in prioritized:
+            q = (qa.get("question_text") or "")[:300]
+            a = (qa.get("answer_text") or "")[:500] or "No answer provided"
+            category = f" [{qa['category']}]" if qa.get("category") else ""
+            lines.append(f"**Q{qa.get('question_number') or ''}:{category}** {q}\n**A:** {a}")
+        return "\n\n".join(lines)
+
+    def document_context(self, max_documents: int = 3, max_chars: int = 2000) -> str:
+        """Attachment excerpts formatted for a prompt."""
+        parts = []
+        for doc in self.documents[:max_documents]:
+            text = doc.get("content", "")[:max_chars]
+            if text:
+                parts.append(f"### {doc.get('filename', 'Document')}\n{text}")
+        return "\n\n".join(parts)
+
+    def rfp_summary(self) -> str:
+        """Short RFP description used as chat context."""
+        return "\n".join([
+            f"RFP Title: {self.rfp_data.get('title')}",
+            f"Agency: {self.rfp_data.get('agency') or 'Unknown'}",
+            f"Description: {self.rfp_data.get('description') or 'No description'}",
+        ])
+
+
+class GenerationContextBuilder:
+    """Builds GenerationContexts and memoizes them in the response cache."""
+
+    def __init__(self, cache: ResponseCache | None = None, ttl: int | None = None):
+        self.cache = cache or response_cache
+        self.ttl = ttl if ttl is not None else settings.GENERATION_CONTEXT_TTL_SECONDS
+
+    def get(self, db: Session, rfp_id: str) -> GenerationContext | None:
+        """Return the context for an RFP, or None if the RFP does not exist."""
+        pointer_key = make_cache_key(_POINTER_NAMESPACE, {"rfp_id": rfp_id})
+        context_key = self.cache.get(pointer_key)
+        if context_key:
+            cached = self.cache.get(context_key)
+            if cached is not None:
+                return GenerationContext.from_dict(cached)
+
+        context_key = self._context_key(db, rfp_id)
+        if context_key is None:
+            return None
+
+        cached = self.cache.get(context_key)
+        if cached is not None:
+            context = GenerationContext.from_dict(cached)
+        else:
+            context = self._build(db, rfp_id, context_key)
+            self._store(context)
+
+        self.cache.set(
+            pointer_key,
+            context_key,
+            ttl=self.ttl,
+            tags=[CacheTag.RFPS, CacheTag.GENERATION_CONTEXT],
+        )
+        return context
+
+    def rag_context(self, context: GenerationContext, section_type: str, rag_engine: Any, top_k: int = 3) -> str:
+        """RAG snippets for a section, retrieved once per context version."""
+        snippets = context.rag_snippets.get(section_type)
+        if snippets is None:
+            snippets = []
+            title = context.rfp_data.get("title")
+            if rag_engine is not None and title:
+                try:
+                    if rag_engine.is_built:
+                        results = rag_engine.retrieve(f"{title} {section_type}", top_k=top_k)
+                        snippets = [
+                            r.get("content", r.get("text", ""))[:500] for r in results
+                        ]
+                except Exception:
+                    logger.exception("RAG retrieval failed")
+                    return ""
+            context.rag_snippets[section_type] = snippets
+            self._store(context)
+        return "".join(f"\n{s}" for s in snippets)
+
+    def _store(self, context: GenerationContext) -> None:
+        self.cache.set(
+            context.cache_key,
+            context.to_dict(),
+            ttl=self.ttl,
+            tags=[CacheTag.GENERATION_CONTEXT],
+        )
+
+    def _context_key(self, db: Session, rfp_id: str) -> str | None:
+        """Cheap fingerprint: RFP version plus attachment checksums."""
+        row = (
+            db.query(RFPOpportunity.id, RFPOpportunity.updated_at)
+            .filter(RFPOpportunity.rfp_id == rfp_id)
+            .first()
+        )
+        if row is None:
+            return None
+
+        documents = (
+            db.query(RFPDocument.id, RFPDocument.checksum, RFPDocument.file_path, RFPDocument.file_size)
+            .filter(RFPDocument.rfp_id == row.id)
+            .order_by(RFPDocument.id)
+            .all()
+        )
+        return make_cache_key(
+            CONTEXT_NAMESPACE,
+            {
+                "rfp_id": rfp_id,
+                "updated_at": row.updated_at,
+                "documents": [
+                    [d.id, d.checksum or f"{d.file_path}:{d.file_size}"] for d in documents
+                ],
+            },
+        )
+
+    def _build(self, db: Session, rfp_id: str, context_key: str) -> GenerationContext:
+        rfp = db.query(RFPOpportunity).filter(RFPOpportunity.rfp_id == rfp_id).first()
+        rfp_data = {
+            "title": rfp.title,
+            "agency": rfp.agency,
+            "description": rfp.description or "",
+            "naics_code": rfp.naics_code or "",
+            "award_amount": rfp.award_amount or 0,
+            "estimated_value": rfp.estimated_value or 0,
+            "rfp_number": rfp.rfp_id or rfp_id,
+            "solicitation_number": rfp.solicitation_number or "",
+            "response_deadline": (
+                rfp.response_deadline.strftime("%B %d, %Y")
+                if rfp.response_deadline
+                else "Not specified"
+            ),
+            "category": rfp.category or "",
+        }
+
+        company_profile = {}
+        profile = db.query(CompanyProfile).first()
+        if profile:
+            company_profile = {
+                "company_name": profile.name,
+                "legal_name": profile.legal_name or profile.name,
+                "certifications": profile.certifications or [],
+                "naics_codes": profile.naics_codes or [],
+                "core_competencies": profile.core_competencies or [],
+                "established_year": profile.established_year,
+                "employee_count": profile.employee_count or "Not specified",
+                "past_performance": profile.past_performance or [],
+                "uei": profile.uei or "",
+                "cage_code": profile.cage_code or "",
+                "headquarters": profile.headquarters or "",
+            }
+
+        qa_items = [
+            {
+                "question_number": qa.question_number,
+                "question_text": qa.question_text,
+                "answer_text": qa.answer_text,
+                "category": qa.category,
+                "related_sections": qa.related_sections or [],
+                "asked_date": qa.asked_date.isoformat() if qa.asked_date else None,
+            }
+            for qa in db.query(RFPQandA).filter(RFPQandA.rfp_id == rfp.id).all()
+        ]
+
+        docs = db.query(RFPDocument).filter(RFPDocument.rfp_id == rfp.id).all()
+        missing = [d.filename for d in docs if not d.file_path]
+        if missing:
+            logger.warning("Documents not downloaded: %s. Use 'Refresh' to download.", missing)
+
+        documents = []
+        downloaded = [
+            {"file_path": d.file_path, "filename": d.filename, "document_type": d.document_type}
+            for d in docs
+            if d.file_path
+        ]
+        if downloaded:
+            try:
+                from src.utils.document_reader import extract_all_document_content
+
+                extracted = extract_all_document_content(
+                    downloaded, max_total_chars=_DOCUMENT_TOTAL_CHARS
+                )
+                documents = [
+                    {
+                        "filename": d["filename"],
+                        "document_type": d["document_type"],
+                        "content": d["content"][:_DOCUMENT_EXCERPT_CHARS],
+                    }
+                    for d in extracted.get("documents", [])
+                ]
+            except Exception:
+                logger.exception("Document extraction failed")
+
+        logger.info(
+            "Built generation context for %s: %s Q&A items, %s documents",
+            rfp_id,
+            len(qa_items),
+            len(documents),
+        )
+        return GenerationContext(
+            rfp_id=rfp_id,
+            rfp_db_id=rfp.id,
+            cache_key=context_key,
+            rfp_data=rfp_data,
+            company_profile=company_profile,
+            qa_items=qa_items,
+            documents=documents,
+            missing_documents=missing,
+        )
+
+
+_builder: GenerationContextBuilder | None = None
+
+
+def get_generation_context_builder() -> GenerationContextBuilder:
+    """Get the shared context builder."""
+    global _builder
+    if _builder is None:
+        _builder = GenerationContextBuilder()
+    return _builder
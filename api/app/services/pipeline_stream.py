@@ -0,0 +1,188 @@
+"""
+Pipeline delta stream for the kanban board.
+
+Watches committed RFP writes and publishes small deltas to the
+``/ws/pipeline`` WebSocket and to SSE subscribers of ``/pipeline/stream``,
+so clients can patch the board instead of polling ``/pipeline/status``.
+
+Delta events:
+- rfp_added: A new RFP entered the pipeline
+- rfp_moved: An RFP changed stage (includes ``previous_stage``)
+- rfp_updated: Title, agency or triage score changed
+- rfp_removed: An RFP was deleted
+- resync: A subscriber fell behind and should refetch the full status
+"""
+
+import asyncio
+import logging
+from typing import Any
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import event
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+_RFP_TABLE = "rfp_opportunities"
+_PENDING_KEY = "pipeline_stream_pending"
+
+# Columns shown on the board besides the stage itself
+_BOARD_FIELDS = ("title", "agency", "triage_score")
+
+
+class PipelineDeltaStream:
+    """
+    Fan-out of pipeline deltas to SSE queues and WebSocket clients.
+
+    Session events fire on whatever thread committed, so deltas are handed
+    to the application event loop bound at startup. Without a bound loop
+    (e.g. in Celery workers) publishing is a no-op.
+    """
+
+    def __init__(self, max_queue_size: int = 100):
+        self.max_queue_size = max_queue_size
+        self._subscribers: set[asyncio.Queue] = set()
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def bind_loop(self, loop: asyncio.AbstractEventLoop | None) -> None:
+        """Bind (or with None, unbind) the event loop deltas are dispatched on."""
+        self._loop = loop
+
+    def subscribe(self) -> asyncio.Queue:
+        """Register an SSE subscriber queue."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        self._subscribers.discard(queue)
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def publish(self, deltas: list[dict[str, Any]]) -> None:
+        """Publish deltas from any thread."""
+        loop = self._loop
+        if not deltas or loop is None or loop.is_closed():
+            return
+
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+
+        if running is loop:
+            loop.create_task(self.dispatch(deltas))
+        else:
+            asyncio.run_coroutine_threadsafe(self.dispatch(deltas), loop)
+
+    async def dispatch(self, deltas: list[dict[str, Any]]) -> None:
+        """Deliver deltas to SSE queues and WebSocket clients."""
+        from app.websockets.websocket_router import broadcast_pipeline_update
+
+        for delta in deltas:
+            for queue in list(self._subscribers):
+                try:
+                    queue.put_nowait(delta)
+                except asyncio.QueueFull:
+                    # Slow consumer: drop its backlog and ask it to refetch
+                    while not queue.empty():
+                        queue.get_nowait()
+                    queue.put_nowait({"event": "resync"})
+
+            try:
+                await broadcast_pipeline_update(delta["event"], rfp_data=delta.get("rfp"))
+            except Exception as e:
+                logger.warning("Failed to broadcast pipeline delta: %s", e)
+
+
+pipeline_stream = PipelineDeltaStream()
+
+
+def _build_delta(event_name: str, rfp: Any, previous_stage: Any = None) -> dict[str, Any]:
+    from app.routes.pipeline import rfp_to_pipeline_dict
+
+    rfp_data = rfp_to_pipeline_dict(rfp)
+    if previous_stage is not None:
+        rfp_data["previous_stage"] = getattr(previous_stage, "value", previous_stage)
+    return jsonable_encoder({"event": event_name, "rfp": rfp_data})
+
+
+def _after_flush(session: Session, flush_context) -> None:
+    # Delta collection must never break the write that triggered it
+    try:
+        deltas = _collect_deltas(session)
+    except Exception as e:
+        logger.warning("Failed to collect pipeline deltas: %s", e)
+        return
+
+    if deltas:
+        session.info.setdefault(_PENDING_KEY, []).extend(deltas)
+
+
+def _collect_deltas(session: Session) -> list[dict[str, Any]]:
+    deltas = []
+
+    for obj in session.new:
+        if getattr(obj, "__tablename__", None) == _RFP_TABLE:
+            deltas.append(_build_delta("rfp_added", obj))
+
+    for obj in session.dirty:
+        if getattr(obj, "__tablename__", None) != _RFP_TABLE:
+            continue
+        attrs = sa_inspect(obj).attrs
+        stage_history = attrs.current_stage.history
+        if stage_history.has_changes():
+            previous = stage_history.deleted[0] if stage_history.deleted else None
+            deltas.append(_build_delta("rfp_moved", obj, previous))
+        elif any(getattr(attrs, name).history.has_changes() for name in _BOARD_FIELDS):
+            deltas.append(_build_delta("rfp_updated", obj))
+
+    for obj in session.deleted:
+        if getattr(obj, "__tablename__", None) == _RFP_TABLE:
+            deltas.append(_build_delta("rfp_removed", obj))
+
+    return deltas
+
+
+def queue_rfp_updates(session: Session, rfps: list[Any], values: list[dict[str, Any]]) -> None:
+    """
+    Queue rfp_updated deltas for RFPs written with a bulk UPDATE statement.
+
+    Bulk statements skip flush events, so callers pass each RFP's new column
+    values; deltas are published when the session commits.
+    """
+    try:
+        deltas = []
+        for rfp, new in zip(rfps, values, strict=True):
+            if any(name in new and new[name] != getattr(rfp, name) for name in _BOARD_FIELDS):
+                delta = _build_delta("rfp_updated", rfp)
+                delta["rfp"].update(jsonable_encoder({k: v for k, v in new.items() if k in delta["rfp"]}))
+                deltas.append(delta)
+    except Exception as e:
+        logger.warning("Failed to collect pipeline deltas: %s", e)
+        return
+
+    if deltas:
+        session.info.setdefault(_PENDING_KEY, []).extend(deltas)
+
+
+def _after_commit(session: Session) -> None:
+    deltas = session.info.pop(_PENDING_KEY, None)
+    if deltas:
+        pipeline_stream.publish(deltas)
+
+
+def _after_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+def register_delta_listeners() -> None:
+    """Attach session listeners that turn committed RFP writes into deltas."""
+    if event.contains(Session, "after_commit", _after_commit):
+        return
+    event.listen(Session, "after_flush", _after_flush)
+    event.listen(Session, "after_commit", _after_commit)
+    event.listen(Session, "after_rollback", _after_rollback)
@@ -0,0 +1,380 @@
+"""
+Background refresh of RFPs imported from a portal URL.
+
+Every RFP with a ``source_url`` and an open deadline is tracked. Each run
+picks the RFPs that are due, most urgent first, and checks them in batches
+grouped by platform so no portal sees more than a few concurrent requests or
+requests closer together than ``REFRESH_PLATFORM_INTERVAL_SECONDS``.
+
+A check starts with a cheap probe: a conditional HEAD (304 or an unchanged
+ETag means nothing changed), then a plain GET whose visible text is hashed
+and compared with the previous fingerprint. Only a changed fingerprint (or a
+last full scrape older than ``REFRESH_FULL_SCRAPE_HOURS``, which catches
+changes on script-rendered pages) pays for a browser scrape. New Q&A,
+documents or metadata are saved and pushed to the ``rfp:{id}`` channel.
+
+How soon an RFP is checked again depends on the time left before its
+deadline and on how often its page has changed before.
+
+The scheduler runs as a task on the API's event loop (``run_refresh_loop``,
+started in the application lifespan), so its pushes reach the WebSocket
+clients connected to that process. Runs take no lock, so it is off by default
+and ``REFRESH_SCHEDULER_ENABLED`` should be set in exactly one API process.
+
+Checks only write the RFP row when a scrape found changes; everything else
+(validators, counts, the time of the last full scrape) goes to its
+``RFPRefreshState`` so unchanged checks do not invalidate cached RFP
+responses.
+"""
+
+import asyncio
+import hashlib
+import logging
+import re
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from urllib.parse import urlparse
+
+import aiohttp
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from ..models.database import RFPOpportunity, RFPRefreshState
+from .rfp_refresh import apply_refresh, download_and_save_documents
+
+logger = logging.getLogger(__name__)
+
+# Enough for any RFP landing page; the rest is not fingerprinted
+_MAX_PROBE_BYTES = 2 * 1024 * 1024
+_PROBE_TIMEOUT = aiohttp.ClientTimeout(total=30, connect=10)
+
+_INVISIBLE_RE = re.compile(r"<(script|style|noscript|template)\b.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r"<[^>]+>")
+_SPACE_RE = re.compile(r"\s+")
+
+
+def page_fingerprint(html: str) -> str:
+    """Hash of a page's visible text, ignoring markup, scripts and whitespace."""
+    text = _INVISIBLE_RE.sub(" ", html)
+    text = _TAG_RE.sub(" ", text)
+    text = _SPACE_RE.sub(" ", text).strip()
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def _naive_utc(value: datetime | None) -> datetime | None:
+    if value is not None and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+@dataclass
+class TrackedRFP:
+    """Snapshot of what a check needs, so no session is held across awaits."""
+
+    db_id: int
+    rfp_id: str
+    url: str
+    platform: str
+    checksum: str | None
+    deadline: datetime | None
+    last_scraped_at: datetime | None
+    etag: str | None = None
+    last_modified: str | None = None
+    fingerprint: str | None = None
+    checks: int = 0
+    changes: int = 0
+    failures: int = 0
+
+    @classmethod
+    def from_rows(cls, rfp: RFPOpportunity, state: RFPRefreshState | None) -> "TrackedRFP":
+        tracked = cls(
+            db_id=rfp.id,
+            rfp_id=rfp.rfp_id,
+            url=rfp.source_url,
+            platform=rfp.source_platform or urlparse(rfp.source_url).netloc.lower(),
+            checksum=rfp.scrape_checksum,
+            deadline=_naive_utc(rfp.response_deadline),
+            last_scraped_at=_naive_utc(rfp.last_scraped_at),
+        )
+        if state is not None:
+            tracked.etag = state.etag
+            tracked.last_modified = state.last_modified
+            tracked.fingerprint = state.content_fingerprint
+            tracked.checks = state.checks or 0
+            tracked.changes = state.changes or 0
+            tracked.failures = state.consecutive_failures or 0
+            if state.last_full_scrape_at is not None and (
+                tracked.last_scraped_at is None or state.last_full_scrape_at > tracked.last_scraped_at
+            ):
+                tracked.last_scraped_at = state.last_full_scrape_at
+        return tracked
+
+
+@dataclass
+class ProbeResult:
+    """Outcome of the cheap change check."""
+
+    # None when there was nothing to compare against or the probe failed
+    changed: bool | None
+    etag: str | None
+    last_modified: str | None
+    fingerprint: str | None
+
+
+class _PlatformThrottle:
+    """Bounds concurrency and request spacing for one platform."""
+
+    def __init__(self, concurrency: int, interval: float):
+        self.semaphore = asyncio.Semaphore(max(1, concurrency))
+        self.interval = interval
+        self._lock = asyncio.Lock()
+        self._next_start = 0.0
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        async with self.semaphore:
+            async with self._lock:
+                wait = self._next_start - time.monotonic()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                self._next_start = time.monotonic() + self.interval
+            yield
+
+
+class RefreshScheduler:
+    """Selects due RFPs and refreshes them with cheap change detection first."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] | None = None,
+        scraper_factory: Callable[[str], Any] | None = None,
+        broadcast: Callable[[str, dict], Awaitable[None]] | None = None,
+        batch_size: int | None = None,
+        concurrency: int | None = None,
+        platform_concurrency: int | None = None,
+        platform_interval: float | None = None,
+    ):
+        if session_factory is None:
+            from ..core.database import SessionLocal
+
+            session_factory = SessionLocal
+        if scraper_factory is None:
+            from src.agents.scrapers import get_scraper
+
+            scraper_factory = get_scraper
+        if broadcast is None:
+            from ..websockets.channels import broadcast_rfp_changes
+
+            broadcast = broadcast_rfp_changes
+
+        self.session_factory = session_factory
+        self.scraper_factory = scraper_factory
+        self.broadcast = broadcast
+        self.batch_size = batch_size or settings.REFRESH_BATCH_SIZE
+        self.concurrency = concurrency or settings.REFRESH_CONCURRENCY
+        self.platform_concurrency = platform_concurrency or settings.REFRESH_PLATFORM_CONCURRENCY
+        self.platform_interval = (
+            settings.REFRESH_PLATFORM_INTERVAL_SECONDS if platform_interval is None else platform_interval
+        )
+        self.min_hours = settings.REFRESH_MIN_INTERVAL_MINUTES / 60
+        self.max_hours = float(settings.REFRESH_MAX_INTERVAL_HOURS)
+        self.full_scrape_after = timedelta(hours=settings.REFRESH_FULL_SCRAPE_HOURS)
+
+    def check_interval(self, tracked: TrackedRFP, now: datetime) -> timedelta:
+        """
+        Time until an RFP should be checked again.
+
+        One hour per day left before the deadline, scaled down for pages that
+        changed on a large share of past checks (Laplace-smoothed, so a new
+        RFP starts in the middle) and up after consecutive failures.
+        """
+        if tracked.deadline is None:
+            hours = self.max_hours
+        else:
+            hours = (tracked.deadline - now).total_seconds() / 3600 / 24
+        change_rate = (tracked.changes + 1) / (tracked.checks + 2)
+        hours *= 1.5 - change_rate
+        hours *= 2 ** min(tracked.failures, 5)
+        return timedelta(hours=min(max(hours, self.min_hours), self.max_hours))
+
+    def due(self, db: Session, now: datetime) -> list[TrackedRFP]:
+        """Open RFPs due for a check, most urgent first, up to the batch size."""
+        rows = (
+            db.query(RFPOpportunity, RFPRefreshState)
+            .outerjoin(RFPRefreshState, RFPRefreshState.rfp_id == RFPOpportunity.id)
+            .filter(
+                RFPOpportunity.source_url.isnot(None),
+                or_(
+                    RFPOpportunity.response_deadline.is_(None),
+                    RFPOpportunity.response_deadline > now,
+                ),
+                or_(
+                    RFPRefreshState.next_check_at.is_(None),
+                    RFPRefreshState.next_check_at <= now,
+                ),
+            )
+            .all()
+        )
+        tracked = [TrackedRFP.from_rows(rfp, state) for rfp, state in rows]
+        tracked.sort(key=lambda t: self.check_interval(t, now))
+        return tracked[: self.batch_size]
+
+    async def run(self) -> dict[str, int]:
+        """Check every due RFP once; returns counts per outcome."""
+        now = datetime.utcnow()
+        with self.session_factory() as db:
+            batch = self.due(db, now)
+
+        summary = {"checked": len(batch), "unchanged": 0, "refreshed": 0, "changed": 0, "failed": 0}
+        if not batch:
+            return summary
+
+        slots = asyncio.Semaphore(self.concurrency)
+        throttles: dict[str, _PlatformThrottle] = {}
+
+        async with aiohttp.ClientSession(timeout=_PROBE_TIMEOUT) as http:
+
+            async def check(tracked: TrackedRFP) -> None:
+                throttle = throttles.setdefault(
+                    tracked.platform,
+                    _PlatformThrottle(self.platform_concurrency, self.platform_interval),
+                )
+                # Wait for the platform first so a busy portal does not hold global slots
+                async with throttle.slot(), slots:
+                    summary[await self._check(http, tracked, now)] += 1
+
+            await asyncio.gather(*(check(t) for t in batch))
+
+        logger.info("Refresh run complete: %s", summary)
+        return summary
+
+    async def probe(self, http: aiohttp.ClientSession, tracked: TrackedRFP, headers: dict[str, str]) -> ProbeResult:
+        """Detect page changes without a browser."""
+        unchanged = ProbeResult(False, tracked.etag, tracked.last_modified, tracked.fingerprint)
+        conditional = dict(headers)
+        if tracked.etag:
+            conditional["If-None-Match"] = tracked.etag
+        if tracked.last_modified:
+            conditional["If-Modified-Since"] = tracked.last_modified
+
+        try:
+            async with http.head(tracked.url, headers=conditional, allow_redirects=True) as resp:
+                if resp.status == 304:
+                    return unchanged
+                etag = resp.headers.get("ETag")
+                if resp.status < 400 and etag and etag == tracked.etag:
+                    return unchanged
+
+            async with http.get(tracked.url, headers=conditional) as resp:
+                if resp.status == 304:
+                    return unchanged
+                resp.raise_for_status()
+                body = await resp.content.read(_MAX_PROBE_BYTES)
+                fingerprint = page_fingerprint(body.decode(resp.charset or "utf-8", errors="replace"))
+                return ProbeResult(
+                    changed=None if tracked.fingerprint is None else fingerprint != tracked.fingerprint,
+                    etag=resp.headers.get("ETag"),
+                    last_modified=resp.headers.get("Last-Modified"),
+                    fingerprint=fingerprint,
+                )
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            # Portals that block plain HTTP clients fall back to periodic full scrapes
+            logger.debug("Probe failed for %s: %s", tracked.url, e)
+            return ProbeResult(None, tracked.etag, tracked.last_modified, tracked.fingerprint)
+
+    async def _check(self, http: aiohttp.ClientSession, tracked: TrackedRFP, now: datetime) -> str:
+        scraper = self.scraper_factory(tracked.url)
+        if scraper is None:
+            self._record(tracked, now, error="No scraper available for this URL")
+            return "failed"
+
+        probe = await self.probe(http, tracked, getattr(scraper, "DOWNLOAD_HEADERS", {}))
+        stale = (
+            tracked.last_scraped_at is None
+            or now - tracked.last_scraped_at >= self.full_scrape_after
+        )
+        if not probe.changed and not stale:
+            self._record(tracked, now, probe=probe)
+            return "unchanged"
+
+        try:
+            result = await scraper.refresh(tracked.url, tracked.checksum)
+            with self.session_factory() as db:
+                rfp = db.get(RFPOpportunity, tracked.db_id)
+                if rfp is None:  # Deleted since the batch was selected
+                    return "failed"
+                # Stamps and commits the RFP only when something changed
+                outcome = apply_refresh(db, rfp, result)
+        except Exception as e:
+            logger.warning("Refresh of RFP %s failed: %s", tracked.rfp_id, e)
+            self._record(tracked, now, error=str(e))
+            return "failed"
+
+        if outcome.needs_download:
+            await download_and_save_documents(
+                scraper, outcome.updated_rfp, tracked.db_id, tracked.rfp_id, self.session_factory
+            )
+        if outcome.has_changes:
+            try:
+                await self.broadcast(tracked.rfp_id, outcome.to_dict())
+            except Exception as e:
+                logger.warning("Failed to broadcast changes for RFP %s: %s", tracked.rfp_id, e)
+
+        self._record(tracked, now, probe=probe, changed=outcome.has_changes, scraped=True)
+        return "changed" if outcome.has_changes else "refreshed"
+
+    def _record(
+        self,
+        tracked: TrackedRFP,
+        now: datetime,
+        probe: ProbeResult | None = None,
+        changed: bool = False,
+        error: str | None = None,
+        scraped: bool = False,
+    ) -> None:
+        """Persist the check and schedule the next one."""
+        tracked.checks += 1
+        tracked.changes += int(changed)
+        tracked.failures = tracked.failures + 1 if error else 0
+
+        with self.session_factory() as db:
+            state = db.query(RFPRefreshState).filter(RFPRefreshState.rfp_id == tracked.db_id).first()
+            if state is None:
+                state = RFPRefreshState(rfp_id=tracked.db_id)
+                db.add(state)
+            if probe is not None:
+                state.etag = probe.etag
+                state.last_modified = probe.last_modified
+                state.content_fingerprint = probe.fingerprint
+            state.checks = tracked.checks
+            state.changes = tracked.changes
+            state.consecutive_failures = tracked.failures
+            state.last_error = error
+            state.last_checked_at = now
+            if changed:
+                state.last_changed_at = now
+            if scraped:
+                state.last_full_scrape_at = now
+                tracked.last_scraped_at = now
+            state.next_check_at = now + self.check_interval(tracked, now)
+            db.commit()
+
+
+async def run_refresh_loop(
+    scheduler: RefreshScheduler | None = None,
+    interval: float | None = None,
+) -> None:
+    """Run the scheduler every ``interval`` seconds until cancelled (default REFRESH_RUN_INTERVAL_SECONDS)."""
+    scheduler = scheduler or RefreshScheduler()
+    interval = settings.REFRESH_RUN_INTERVAL_SECONDS if interval is None else interval
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await scheduler.run()
+        except Exception as e:
+            logger.warning("Scheduled refresh run failed: %s", e)
@@ -4,6 +4,7 @@ RFP Processor Service - Integrates ML pipeline with API.
 import asyncio
 import os
 import sys
+from collections.abc import Callable
 from datetime import datetime
 from typing import Any, Dict
 from uuid import uuid4
@@ -34,13 +35,13 @@ class RFPProcessor:
             from src.bid_generation.document_generator import BidDocumentGenerator
             from src.compliance.compliance_matrix import ComplianceMatrixGenerator
             from src.decision.go_nogo_engine import GoNoGoEngine
-            from src.pricing.pricing_engine import PricingEngine
+            from src.pricing.pricing_engine import get_pricing_engine
             from src.rag.chroma_rag_engine import get_rag_engine
 
             # Initialize components
             self.rag_engine = get_rag_engine()
             self.compliance_generator = ComplianceMatrixGenerator()
-            self.pricing_engine = PricingEngine()
+            self.pricing_engine = get_pricing_engine()
             self.go_nogo_engine = GoNoGoEngine(
                 compliance_generator=self.compliance_generator,
                 pricing_engine=self.pricing_engine
@@ -136,10 +137,15 @@ class RFPProcessor:
         qa_items: list[Dict[str, Any]] | None = None,
         compliance_signals: Dict[str, Any] | None = None,
         document_content: Dict[str, Any] | None = None,
+        completed_sections: Dict[str, Any] | None = None,
+        on_section_event: Callable[[Any], Any] | None = None,
     ) -> Dict[str, Any]:
         """
         Generate a complete bid document for an RFP.
 
+        Independent sections are generated concurrently; see
+        BidDocumentGenerator.agenerate_bid_document.
+
         Args:
             rfp_data: RFP details
             generation_mode: Generation mode (template, claude_standard, claude_enhanced, claude_premium)
@@ -148,9 +154,12 @@ class RFPProcessor:
             qa_items: Q&A items from the RFP (for compliance context)
             compliance_signals: Detected compliance signals (FEMA, federal funding, etc.)
             document_content: Extracted text content from RFP attachments (PDFs, DOCX)
+            completed_sections: Checkpointed section results from a previous attempt
+            on_section_event: Callback receiving a SectionEvent per finished section
 
         Returns:
-            Generated bid document with content in multiple formats
+            Generated bid document with content in multiple formats. On section
+            failures the error dict lists them under ``failed_sections``.
         """
         try:
             if self.bid_generator:
@@ -159,13 +168,15 @@ class RFPProcessor:
                     self._ensure_claude_generator(generation_mode, enable_thinking, thinking_budget)
 
                 # Use full bid generator with options and compliance context
-                bid_document = self.bid_generator.generate_bid_document(
+                bid_document = await self.bid_generator.agenerate_bid_document(
                     rfp_data,
                     generation_mode=generation_mode,
                     enable_thinking=enable_thinking,
                     qa_items=qa_items,
                     compliance_signals=compliance_signals,
                     document_content=document_content,
+                    completed_sections=completed_sections,
+                    on_section_event=on_section_event,
                 )
             else:
                 # Mock bid generation
@@ -200,10 +211,14 @@ class RFPProcessor:
 
         except Exception as e:
             print(f"Error generating bid document: {e}")
-            return {
+            error = {
                 "error": str(e),
                 "bid_id": None
             }
+            run = getattr(e, "run", None)
+            if run is not None:
+                error["failed_sections"] = sorted(run.failed)
+            return error
 
     def _ensure_claude_generator(
         self,
@@ -237,7 +252,8 @@ class RFPProcessor:
                 self.bid_generator.proposal_options = ProposalGenerationOptions(
                     mode=gen_mode,
                     enable_thinking=enable_thinking,
-                    thinking_budget=thinking_budget
+                    thinking_budget=thinking_budget,
+                    max_concurrent_sections=self.bid_generator.proposal_options.max_concurrent_sections,
                 )
                 self.bid_generator._initialize_enhanced_generator()
                 print(f"✅ Bid generator reconfigured for {generation_mode} mode")
@@ -0,0 +1,207 @@
+"""
+Applying re-scraped RFP data to the database.
+
+Shared by the manual ``/scraper/{rfp_id}/refresh`` endpoint and the
+background refresh scheduler: both scrape the page, then merge new Q&A,
+documents and metadata into the stored RFP here.
+"""
+
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from ..models.database import RFPDocument, RFPOpportunity, RFPQandA
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RefreshOutcome:
+    """What a refresh changed for one RFP."""
+
+    has_changes: bool
+    new_qa_count: int = 0
+    new_document_count: int = 0
+    metadata_changed: bool = False
+    # Documents are new or previously failed to download
+    needs_download: bool = False
+    updated_rfp: Any = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "has_changes": self.has_changes,
+            "new_qa_count": self.new_qa_count,
+            "new_document_count": self.new_document_count,
+            "metadata_changed": self.metadata_changed,
+        }
+
+
+def apply_refresh(db: Session, rfp: RFPOpportunity, result: dict[str, Any]) -> RefreshOutcome:
+    """
+    Merge the output of ``scraper.refresh`` into a stored RFP.
+
+    Adds new Q&A, updates metadata when extraction succeeded and reports
+    whether documents need downloading; the caller schedules the download.
+    """
+    updated_rfp = result["updated_rfp"]
+
+    # Count existing Q&A and docs in database
+    existing_qa_count = db.query(RFPQandA).filter(RFPQandA.rfp_id == rfp.id).count()
+    existing_doc_count = db.query(RFPDocument).filter(RFPDocument.rfp_id == rfp.id).count()
+
+    # Check if database is missing documents/Q&A that were scraped
+    # (This can happen if previous saves failed due to constraints)
+    scraped_doc_count = len(updated_rfp.documents) if updated_rfp else 0
+    scraped_qa_count = len(updated_rfp.qa_items) if updated_rfp else 0
+
+    # Also check for documents that exist but failed to download (file_path is None)
+    pending_downloads = (
+        db.query(RFPDocument)
+        .filter(RFPDocument.rfp_id == rfp.id, RFPDocument.file_path.is_(None))
+        .count()
+    )
+
+    has_missing_data = (
+        (scraped_doc_count > existing_doc_count)
+        or (scraped_qa_count > existing_qa_count)
+        or (pending_downloads > 0)
+    )
+
+    if not result["has_changes"] and not has_missing_data:
+        return RefreshOutcome(has_changes=False, updated_rfp=updated_rfp)
+
+    # Check for new Q&A
+    new_qa_count = len(updated_rfp.qa_items) - existing_qa_count
+    if new_qa_count > 0:
+        # Mark existing Q&A as not new
+        db.query(RFPQandA).filter(RFPQandA.rfp_id == rfp.id).update({RFPQandA.is_new: False})
+
+        # Add new Q&A
+        for qa in updated_rfp.qa_items[existing_qa_count:]:
+            db.add(
+                RFPQandA(
+                    rfp_id=rfp.id,
+                    question_number=qa.question_number,
+                    question_text=qa.question_text,
+                    answer_text=qa.answer_text,
+                    asked_date=qa.asked_date,
+                    answered_date=qa.answered_date,
+                    is_new=True,
+                )
+            )
+
+    new_doc_count = len(updated_rfp.documents) - existing_doc_count
+
+    # Check for metadata changes
+    metadata_changed = (
+        rfp.title != updated_rfp.title
+        or rfp.description != updated_rfp.description
+        or rfp.response_deadline != updated_rfp.response_deadline
+    )
+
+    # Update RFP metadata - only if extraction succeeded (not fallback values)
+    if updated_rfp.title and updated_rfp.title != "Untitled RFP":
+        rfp.title = updated_rfp.title
+    if updated_rfp.description:
+        rfp.description = updated_rfp.description
+    if updated_rfp.response_deadline:
+        rfp.response_deadline = updated_rfp.response_deadline
+    rfp.last_scraped_at = datetime.now(timezone.utc)
+    rfp.scrape_checksum = updated_rfp.scrape_checksum
+
+    db.commit()
+
+    return RefreshOutcome(
+        has_changes=True,
+        new_qa_count=max(0, new_qa_count),
+        new_document_count=max(0, new_doc_count),
+        metadata_changed=metadata_changed,
+        needs_download=new_doc_count > 0 or pending_downloads > 0,
+        updated_rfp=updated_rfp,
+    )
+
+
+async def download_and_save_documents(
+    scraper,
+    scraped_rfp,
+    rfp_db_id: int,
+    rfp_id: str,
+    session_factory: Callable[[], Session] | None = None,
+) -> None:
+    """Download an RFP's documents and record them in the database."""
+    if session_factory is None:
+        from ..core.database import SessionLocal
+
+        session_factory = SessionLocal
+
+    try:
+        # First, save all document metadata so they appear in the UI
+        with session_factory() as session:
+            for doc in scraped_rfp.documents:
+                # Check if document already exists
+                existing = (
+                    session.query(RFPDocument)
+                    .filter(
+                        RFPDocument.rfp_id == rfp_db_id,
+                        RFPDocument.filename == doc.filename,
+                    )
+                    .first()
+                )
+
+                if not existing:
+                    doc_record = RFPDocument(
+                        rfp_id=rfp_db_id,
+                        filename=doc.filename,
+                        file_type=doc.file_type,
+                        document_type=doc.document_type,
+                        source_url=doc.source_url,
+                        # file_path, file_size, checksum will be set after download
+                    )
+                    session.add(doc_record)
+
+            session.commit()
+            logger.info(
+                "Saved %d document records for RFP %s",
+                len(scraped_rfp.documents),
+                rfp_id,
+            )
+
+        # Then attempt to download the files
+        downloaded_docs = await scraper.download_documents(scraped_rfp, rfp_id)
+
+        # Update records with download info
+        with session_factory() as session:
+            for doc in downloaded_docs:
+                existing = (
+                    session.query(RFPDocument)
+                    .filter(
+                        RFPDocument.rfp_id == rfp_db_id,
+                        RFPDocument.filename == doc.filename,
+                    )
+                    .first()
+                )
+
+                if existing:
+                    existing.file_path = doc.file_path
+                    existing.file_size = doc.file_size
+                    existing.checksum = doc.checksum
+                    existing.downloaded_at = doc.downloaded_at
+
+            session.commit()
+            logger.info(
+                "Updated %d documents with download info for RFP %s",
+                len(downloaded_docs),
+                rfp_id,
+            )
+
+        # Extract attachment text in the background so readers hit the store
+        from src.utils.text_store import get_text_store
+
+        get_text_store().warm([doc.file_path for doc in downloaded_docs])
+
+    except Exception as e:
+        logger.error("Error processing documents for RFP %s: %s", rfp_id, e)
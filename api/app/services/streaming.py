@@ -214,15 +214,11 @@ class StreamingService:
         # Get RFP context
         rfp_context = ""
         if db_session:
-            from app.models.database import RFPOpportunity
+            from app.services.generation_context import get_generation_context_builder
 
-            rfp = (
-                db_session.query(RFPOpportunity)
-                .filter(RFPOpportunity.rfp_id == rfp_id)
-                .first()
-            )
-            if rfp:
-                rfp_context = f"RFP: {rfp.title}\nAgency: {rfp.agency}\nDescription: {rfp.description or ''}"
+            context = get_generation_context_builder().get(db_session, rfp_id)
+            if context:
+                rfp_context = f"RFP: {context.rfp_data['title']}\nAgency: {context.rfp_data['agency']}\nDescription: {context.rfp_data['description']}"
 
         # Get RAG context
         rag_context = ""
@@ -320,189 +316,36 @@ Please provide a helpful response:"""
             logger.info("Thinking mode not supported for Haiku, disabling")
             use_thinking = False
 
-        # Get RFP, company profile, Q&A, and documents
+        # Get RFP, company profile, Q&A, documents and RAG snippets from the
+        # shared context, built once per RFP version rather than per section
         rfp_data = {}
         company_profile = {}
         qa_context = ""
         document_context = ""
-        rfp_db_id = None
+        rag_context = ""
 
         logger.info(
             "stream_section_generation: rfp_id=%s, section=%s", rfp_id, section_type
         )
 
         if db_session:
-            from app.models.database import (
-                CompanyProfile,
-                RFPDocument,
-                RFPOpportunity,
-                RFPQandA,
-            )
-
-            # Get RFP data
-            rfp = (
-                db_session.query(RFPOpportunity)
-                .filter(RFPOpportunity.rfp_id == rfp_id)
-                .first()
-            )
-            if rfp:
-                rfp_db_id = rfp.id
-                rfp_data = {
-                    "title": rfp.title,
-                    "agency": rfp.agency,
-                    "description": rfp.description or "",
-                    "naics_code": rfp.naics_code or "",
-                    "award_amount": rfp.award_amount or 0,
-                    "estimated_value": rfp.estimated_value or 0,
-                    "rfp_number": rfp.rfp_id or rfp_id,
-                    "solicitation_number": rfp.solicitation_number or "",
-                    "response_deadline": (
-                        rfp.response_deadline.strftime("%B %d, %Y")
-                        if rfp.response_deadline
-                        else "Not specified"
-                    ),
-                    "category": rfp.category or "",
-                }
-
-            # Get enhanced company profile
-            profile = db_session.query(CompanyProfile).first()
-            if profile:
-                company_profile = {
-                    "company_name": profile.name,
-                    "legal_name": profile.legal_name or profile.name,
-                    "certifications": profile.certifications or [],
-                    "naics_codes": profile.naics_codes or [],
-                    "core_competencies": profile.core_competencies or [],
-                    "established_year": profile.established_year,
-                    "employee_count": profile.employee_count or "Not specified",
-                    "past_performance": profile.past_performance or [],
-                    "uei": profile.uei or "",
-                    "cage_code": profile.cage_code or "",
-                    "headquarters": profile.headquarters or "",
-                }
-
-            # Get Q&A context - filter by section relevance if available
-            if rfp_db_id:
-                qa_items = (
-                    db_session.query(RFPQandA)
-                    .filter(RFPQandA.rfp_id == rfp_db_id)
-                    .all()
+            from app.services.generation_context import get_generation_context_builder
+
+            builder = get_generation_context_builder()
+            context = builder.get(db_session, rfp_id)
+            if context:
+                rfp_data = context.rfp_data
+                company_profile = context.company_profile
+                qa_context = context.qa_context(section_type)
+                document_context = context.document_context()
+                rag_context = builder.rag_context(
+                    context, section_type, self._get_rag_engine()
                 )
                 logger.info(
-                    "Q&A loaded: %s items for rfp_id=%s", len(qa_items), rfp_db_id
-                )
-                if qa_items:
-                    # Build Q&A context, prioritizing section-relevant items
-                    relevant_qa = []
-                    other_qa = []
-                    for qa in qa_items:
-                        related = qa.related_sections or []
-                        if (
-                            section_type in related
-                            or qa.category == section_type.replace("_", " ")
-                        ):
-                            relevant_qa.append(qa)
-                        else:
-                            other_qa.append(qa)
-
-                    # Combine: relevant first, then others (limit total)
-                    prioritized_qa = (
-                        relevant_qa[:10] + other_qa[: max(0, 15 - len(relevant_qa))]
-                    )
-
-                    if prioritized_qa:
-                        qa_lines = []
-                        for qa in prioritized_qa:
-                            q = qa.question_text[:300] if qa.question_text else ""
-                            a = (
-                                qa.answer_text[:500]
-                                if qa.answer_text
-                                else "No answer provided"
-                            )
-                            category = f" [{qa.category}]" if qa.category else ""
-                            qa_lines.append(
-                                f"**Q{qa.question_number or ''}:{category}** {q}\n**A:** {a}"
-                            )
-                        qa_context = "\n\n".join(qa_lines)
-                        logger.info(
-                            "Q&A context: %s items, %s chars",
-                            len(prioritized_qa),
-                            len(qa_context),
-                        )
-
-            # Get document content
-            if rfp_db_id:
-                try:
-                    from src.utils.document_reader import extract_all_document_content
-
-                    docs = (
-                        db_session.query(RFPDocument)
-                        .filter(RFPDocument.rfp_id == rfp_db_id)
-                        .all()
-                    )
-                    if docs:
-                        # Filter to documents with file_path (downloaded files)
-                        docs_for_extraction = [
-                            {
-                                "file_path": doc.file_path,
-                                "filename": doc.filename,
-                                "document_type": doc.document_type,
-                            }
-                            for doc in docs
-                            if doc.file_path
-                        ]
-
-                        # Log document status
-                        docs_without_path = [d for d in docs if not d.file_path]
-                        if docs_without_path:
-                            missing_filenames = [d.filename for d in docs_without_path]
-                            logger.warning(
-                                "Documents not downloaded: %s. Use 'Refresh' to download.",
-                                missing_filenames,
-                            )
-
-                        if docs_for_extraction:
-                            logger.info(
-                                "Extracting content from %s documents",
-                                len(docs_for_extraction),
-                            )
-                            extracted = extract_all_document_content(
-                                docs_for_extraction
-                            )
-                            if extracted.get("documents"):
-                                doc_parts = []
-                                for doc_info in extracted["documents"][
-                                    :3
-                                ]:  # Limit to 3 docs
-                                    doc_name = doc_info.get("filename", "Document")
-                                    doc_text = doc_info.get("content", "")[
-                                        :2000
-                                    ]  # Limit each doc
-                                    if doc_text:
-                                        doc_parts.append(f"### {doc_name}\n{doc_text}")
-                                document_context = "\n\n".join(doc_parts)
-                                logger.info(
-                                    "Document context: %s docs, %s chars",
-                                    len(doc_parts),
-                                    len(document_context),
-                                )
-                except Exception:
-                    logger.exception("Document extraction failed")
-
-        # Get RAG context
-        rag_context = ""
-        rag_engine = self._get_rag_engine()
-        if rag_engine and rag_engine.is_built and rfp_data.get("title"):
-            try:
-                results = rag_engine.retrieve(
-                    f"{rfp_data['title']} {section_type}", k=3
+                    "Generation context: %s Q&A chars, %s document chars",
+                    len(qa_context),
+                    len(document_context),
                 )
-                for result in results:
-                    rag_context += (
-                        f"\n{result.get('content', result.get('text', ''))[:500]}"
-                    )
-            except Exception:
-                logger.exception("RAG retrieval failed")
 
         # Build section generation prompt using Claude LLM config patterns for instructions
         section_instructions = self._get_section_instructions(section_type)
@@ -0,0 +1,255 @@
+"""
+Incrementally maintained win-rate index over bid outcomes.
+
+``win_rate_cells`` holds won/lost counts per NAICS code, agency, value band
+and set-aside (see ``src.decision.win_rates``). Session listeners keep it in
+step with ``BidOutcome`` writes: when a flush creates, updates or deletes an
+outcome, or changes an RFP field the cells are keyed on, the affected
+outcomes' contributions are read just before and just after the flush and
+the difference is upserted in the same transaction. Rolling back the write
+rolls back the counts with it.
+
+Readers (the go/no-go engine and ``/analytics``) share an in-memory
+``WinRateIndex`` snapshot per database, reloaded after a local commit
+changed the counts and otherwise at most every ``CHECK_INTERVAL_SECONDS``
+to pick up writes from other processes.
+"""
+
+import logging
+import threading
+import time
+import weakref
+from collections import defaultdict
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import delete, event, insert, or_, select, update
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from src.decision.win_rates import WinRateIndex, outcome_cells, set_aside_of, set_win_rate_source
+
+from ..models.database import BidOutcome, RFPOpportunity, WinRateCell
+
+logger = logging.getLogger(__name__)
+
+_OUTCOMES = BidOutcome.__table__
+_RFPS = RFPOpportunity.__table__
+_CELLS = WinRateCell.__table__
+
+_PENDING_KEY = "win_rate_index_pending"
+_CHANGED_KEY = "win_rate_index_changed"
+
+# RFP columns the cells are keyed on
+_RFP_KEY_FIELDS = ("naics_code", "agency", "award_amount", "estimated_value", "rfp_metadata")
+DECIDED_STATUSES = ("won", "lost")
+CHECK_INTERVAL_SECONDS = 30.0
+
+
+def _contributions(connection: Connection, *conditions) -> dict[int, tuple[str, list[tuple[str, str]]]]:
+    """Status and cells of the outcomes matching any condition, by outcome id."""
+    rows = connection.execute(
+        select(
+            _OUTCOMES.c.id,
+            _OUTCOMES.c.status,
+            _RFPS.c.naics_code,
+            _RFPS.c.agency,
+            _RFPS.c.award_amount,
+            _RFPS.c.estimated_value,
+            _RFPS.c.rfp_metadata,
+        )
+        .join(_RFPS, _RFPS.c.id == _OUTCOMES.c.rfp_id)
+        .where(or_(*conditions))
+    )
+    return {
+        row.id: (
+            row.status,
+            outcome_cells(
+                row.naics_code,
+                row.agency,
+                row.award_amount or row.estimated_value,
+                set_aside_of(row.rfp_metadata),
+            ),
+        )
+        for row in rows
+    }
+
+
+def _count(contributions, sign: int, counts: defaultdict) -> None:
+    for status, cells in contributions.values():
+        if status in DECIDED_STATUSES:
+            column = 0 if status == "won" else 1
+            for cell in cells:
+                counts[cell][column] += sign
+
+
+def _apply(connection: Connection, deltas: dict[tuple[str, str], list[int]]) -> None:
+    """Add win/loss deltas to their cells, creating missing cells."""
+    now = datetime.utcnow()
+    dialect = connection.dialect.name
+    for (dimension, key), (wins, losses) in deltas.items():
+        values = {"dimension": dimension, "key": key, "wins": wins, "losses": losses, "updated_at": now}
+        if dialect in ("postgresql", "sqlite"):
+            if dialect == "postgresql":
+                from sqlalchemy.dialects.postgresql import insert as upsert
+            else:
+                from sqlalchemy.dialects.sqlite import insert as upsert
+            statement = upsert(_CELLS).values(**values)
+            connection.execute(statement.on_conflict_do_update(
+                index_elements=["dimension", "key"],
+                set_={
+                    "wins": _CELLS.c.wins + statement.excluded.wins,
+                    "losses": _CELLS.c.losses + statement.excluded.losses,
+                    "updated_at": now,
+                },
+            ))
+            continue
+        result = connection.execute(
+            update(_CELLS)
+            .where(_CELLS.c.dimension == dimension, _CELLS.c.key == key)
+            .values(wins=_CELLS.c.wins + wins, losses=_CELLS.c.losses + losses, updated_at=now)
+        )
+        if result.rowcount == 0:
+            connection.execute(insert(_CELLS).values(**values))
+
+
+def _before_flush(session: Session, flush_context, instances) -> None:
+    outcome_ids, rfp_ids, new_outcomes = set(), set(), []
+    for obj in session.new:
+        if getattr(obj, "__tablename__", None) == _OUTCOMES.name:
+            new_outcomes.append(obj)
+    for obj in session.dirty:
+        table = getattr(obj, "__tablename__", None)
+        if table == _OUTCOMES.name and session.is_modified(obj):
+            outcome_ids.add(obj.id)
+        elif table == _RFPS.name:
+            attrs = sa_inspect(obj).attrs
+            if any(getattr(attrs, name).history.has_changes() for name in _RFP_KEY_FIELDS):
+                rfp_ids.add(obj.id)
+    for obj in session.deleted:
+        table = getattr(obj, "__tablename__", None)
+        if table == _OUTCOMES.name:
+            outcome_ids.add(obj.id)
+        elif table == _RFPS.name:
+            rfp_ids.add(obj.id)
+    if not (outcome_ids or rfp_ids or new_outcomes):
+        return
+
+    before = {}
+    if outcome_ids or rfp_ids:
+        before = _contributions(
+            session.connection(), _OUTCOMES.c.id.in_(outcome_ids), _OUTCOMES.c.rfp_id.in_(rfp_ids)
+        )
+    session.info[_PENDING_KEY] = (before, outcome_ids, rfp_ids, new_outcomes)
+
+
+def _after_flush(session: Session, flush_context) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending is None:
+        return
+    before, outcome_ids, rfp_ids, new_outcomes = pending
+    outcome_ids = outcome_ids | {obj.id for obj in new_outcomes}
+    connection = session.connection()
+    after = _contributions(connection, _OUTCOMES.c.id.in_(outcome_ids), _OUTCOMES.c.rfp_id.in_(rfp_ids))
+
+    counts = defaultdict(lambda: [0, 0])
+    _count(before, -1, counts)
+    _count(after, 1, counts)
+    deltas = {cell: delta for cell, delta in counts.items() if delta != [0, 0]}
+    if deltas:
+        _apply(connection, deltas)
+        session.info[_CHANGED_KEY] = True
+
+
+def _after_commit(session: Session) -> None:
+    if session.info.pop(_CHANGED_KEY, False):
+        invalidate_win_rate_index(session.get_bind())
+
+
+def _after_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+    session.info.pop(_CHANGED_KEY, None)
+
+
+def register_win_rate_listeners() -> None:
+    """Attach the session listeners that keep ``win_rate_cells`` current."""
+    if event.contains(Session, "before_flush", _before_flush):
+        return
+    event.listen(Session, "before_flush", _before_flush)
+    event.listen(Session, "after_flush", _after_flush)
+    event.listen(Session, "after_commit", _after_commit)
+    event.listen(Session, "after_rollback", _after_rollback)
+
+
+def rebuild_win_rate_index(db: Session) -> int:
+    """
+    Recount every cell from the bid outcomes.
+
+    Returns:
+        Number of decided outcomes counted
+    """
+    counts = defaultdict(lambda: [0, 0])
+    contributions = _contributions(db.connection(), _OUTCOMES.c.status.in_(DECIDED_STATUSES))
+    _count(contributions, 1, counts)
+    db.execute(delete(_CELLS))
+    now = datetime.utcnow()
+    if counts:
+        db.execute(insert(_CELLS), [
+            {"dimension": dimension, "key": key, "wins": wins, "losses": losses, "updated_at": now}
+            for (dimension, key), (wins, losses) in counts.items()
+        ])
+    db.commit()
+    invalidate_win_rate_index(db.get_bind())
+    logger.info(f"Rebuilt win-rate index from {len(contributions)} decided outcomes")
+    return len(contributions)
+
+
+def _load(db: Session) -> WinRateIndex:
+    rows = db.execute(select(_CELLS.c.dimension, _CELLS.c.key, _CELLS.c.wins, _CELLS.c.losses)).all()
+    if not rows and db.execute(
+        select(_OUTCOMES.c.id).where(_OUTCOMES.c.status.in_(DECIDED_STATUSES)).limit(1)
+    ).first():
+        # Outcomes recorded before the index existed
+        rebuild_win_rate_index(db)
+        rows = db.execute(select(_CELLS.c.dimension, _CELLS.c.key, _CELLS.c.wins, _CELLS.c.losses)).all()
+    return WinRateIndex.from_rows(rows)
+
+
+_snapshots: "weakref.WeakKeyDictionary[Any, tuple[WinRateIndex, float]]" = weakref.WeakKeyDictionary()
+_snapshot_lock = threading.RLock()
+
+
+def get_win_rate_index(db: Session | None = None) -> WinRateIndex:
+    """
+    The current index of the database ``db`` is bound to (default: the app database).
+    """
+    if db is None:
+        from ..core.database import SessionLocal
+
+        with SessionLocal() as session:
+            return get_win_rate_index(session)
+
+    bind = db.get_bind()
+    with _snapshot_lock:
+        cached = _snapshots.get(bind)
+        if cached is not None and time.monotonic() - cached[1] < CHECK_INTERVAL_SECONDS:
+            return cached[0]
+        index = _load(db)
+        _snapshots[bind] = (index, time.monotonic())
+        return index
+
+
+def invalidate_win_rate_index(bind=None) -> None:
+    """Drop the cached snapshot of one database (default: all of them)."""
+    with _snapshot_lock:
+        if bind is None:
+            _snapshots.clear()
+        else:
+            _snapshots.pop(bind, None)
+
+
+def install_win_rate_index() -> None:
+    """Maintain the index on writes and serve it to go/no-go scoring in this process."""
+    register_win_rate_listeners()
+    set_win_rate_source(get_win_rate_index)
@@ -233,6 +233,7 @@ async def rfp_channel(websocket: WebSocket, rfp_id: str):
     - pricing_update: Pricing calculations
     - compliance_update: Compliance matrix changes
     - document_update: Document generation progress
+    - rfp_update: New Q&A, documents or metadata found by a refresh
     """
     await channel_manager.connect(websocket)
     channel = f"rfp:{rfp_id}"
@@ -422,6 +423,14 @@ async def broadcast_compliance_update(rfp_id: str, compliance: dict):
     )
 
 
+async def broadcast_rfp_changes(rfp_id: str, changes: dict):
+    """Broadcast Q&A, document or metadata changes found by a refresh."""
+    await channel_manager.broadcast_to_channel(
+        f"rfp:{rfp_id}",
+        {"type": MessageType.RFP_UPDATE.value, "rfp_id": rfp_id, "data": changes},
+    )
+
+
 async def broadcast_job_progress(
     job_id: str, progress: int, status: str, **kwargs: Any
 ):
@@ -6,6 +6,8 @@ Handles:
 - Alert evaluation and email delivery
 - Document processing
 - Scraping operations
+- Pricing model training
+- Batch go/no-go scoring
 """
 import os
 import sys
@@ -31,6 +33,9 @@ celery_app = Celery(
         "api.app.worker.tasks.alerts",
         "api.app.worker.tasks.predictions",
         "api.app.worker.tasks.sam_gov",
+        "api.app.worker.tasks.documents",
+        "api.app.worker.tasks.pricing",
+        "api.app.worker.tasks.decisions",
     ]
 )
 
@@ -66,6 +71,9 @@ celery_app.conf.update(
         "api.app.worker.tasks.alerts.*": {"queue": "alerts"},
         "api.app.worker.tasks.predictions.*": {"queue": "predictions"},
         "api.app.worker.tasks.sam_gov.*": {"queue": "sam_gov"},
+        "api.app.worker.tasks.documents.*": {"queue": "documents"},
+        "api.app.worker.tasks.pricing.*": {"queue": "pricing"},
+        "api.app.worker.tasks.decisions.*": {"queue": "decisions"},
     },
 
     # Default queue
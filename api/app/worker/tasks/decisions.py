@@ -0,0 +1,76 @@
+"""
+Go/no-go decision tasks for Celery.
+
+Handles:
+- Batch scoring of the RFPs awaiting a bid decision
+"""
+
+import logging
+import sys
+from pathlib import Path
+
+from celery import shared_task
+
+# Add project paths
+project_root = str(Path(__file__).parents[5])
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(
+    bind=True,
+    name="api.app.worker.tasks.decisions.score_pipeline",
+    soft_time_limit=1740,  # 29 minutes soft limit
+    time_limit=1800,  # 30 minutes hard limit
+)
+def score_pipeline(
+    self,
+    rfp_ids: list[int] | None = None,
+    refresh: bool = False,
+    max_workers: int | None = None,
+) -> dict:
+    """
+    Score RFPs for go/no-go and store the recommendations.
+
+    Compliance and pricing analysis only runs for RFPs without stored
+    decision inputs (or whose fields changed since); progress moves from
+    0 to 90 over that analysis and finishes after the bulk write.
+
+    Args:
+        rfp_ids: RFP primary keys (default: every RFP awaiting a decision)
+        refresh: Re-run compliance and pricing analysis for every RFP
+        max_workers: Analysis processes (default: settings.decision.batch_workers)
+
+    Returns:
+        Dict with counts and each RFP's recommendation
+    """
+    from api.app.core.database import SessionLocal
+    from api.app.services.batch_decisions import score_pipeline_rfps
+    from api.app.services.win_rate_index import get_win_rate_index
+    from src.decision.win_rates import set_win_rate_source
+
+    def progress(phase: str, done: int, total: int) -> None:
+        percent = 90 if phase == "scoring" else int(90 * done / max(total, 1))
+        self.update_state(
+            state="PROGRESS",
+            meta={"progress": percent, "status": phase, "done": done, "total": total},
+        )
+
+    self.update_state(state="PROGRESS", meta={"progress": 0, "status": "loading"})
+    with SessionLocal() as db:
+        # Score against the recorded win rates, as the API does
+        set_win_rate_source(lambda: get_win_rate_index(db))
+        try:
+            summary = score_pipeline_rfps(
+                db, rfp_ids=rfp_ids, refresh=refresh, max_workers=max_workers, progress=progress
+            )
+        finally:
+            set_win_rate_source(None)
+
+    logger.info(
+        f"Scored {summary['scored']} RFPs ({summary['computed_inputs']} analyzed): "
+        f"{summary['recommendations']}"
+    )
+    return {"status": "completed", **summary}
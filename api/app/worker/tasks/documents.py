@@ -0,0 +1,71 @@
+"""
+Document processing tasks for Celery.
+
+Handles ingestion of uploaded documents on the ``documents`` queue:
+- Text extraction (cached in the extracted-text store)
+- Chunking and RAG indexing
+
+Progress is written to the document_processing_jobs table so status polls
+from any API replica see it.
+"""
+
+import asyncio
+import logging
+import os
+import sys
+
+from celery import shared_task
+
+# Add project paths
+project_root = os.path.dirname(
+    os.path.dirname(
+        os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+    )
+)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+logger = logging.getLogger(__name__)
+
+
+def broadcast_progress(job_id: str, progress: int, status: str, **kwargs):
+    """Broadcast job progress via WebSocket (async wrapper)."""
+    try:
+        from api.app.websockets.channels import broadcast_job_progress
+
+        asyncio.run(broadcast_job_progress(job_id, progress, status, **kwargs))
+    except Exception as e:
+        logger.warning(f"Failed to broadcast progress: {e}")
+
+
+@shared_task(
+    bind=True,
+    name="api.app.worker.tasks.documents.process_uploaded_document",
+    ignore_result=True,  # Status lives in the job table
+)
+def process_uploaded_document(self, document_id: str) -> dict:
+    """
+    Extract, chunk and index an uploaded document.
+
+    Args:
+        document_id: Upload id with a queued DocumentProcessingJob
+
+    Returns:
+        The job as a dict
+    """
+    from api.app.services.document_processing import process_document
+
+    job_id = self.request.id
+    logger.info(f"Processing document {document_id} - Job: {job_id}")
+
+    def on_progress(job):
+        meta = {
+            "progress": job.progress,
+            "status": job.stage,
+            "document_id": document_id,
+            "chunks_indexed": job.chunks_indexed,
+        }
+        self.update_state(state="PROGRESS", meta=meta)
+        broadcast_progress(job_id, int(job.progress), job.stage, document_id=document_id)
+
+    return process_document(document_id, on_progress=on_progress)
@@ -3,7 +3,7 @@ Proposal generation tasks for Celery.
 
 Handles long-running LLM generation tasks:
 - Individual section generation
-- Full bid document generation
+- Full bid document generation (sections in parallel, checkpointed for retries)
 """
 
 import asyncio
@@ -26,6 +26,45 @@ if project_root not in sys.path:
 
 logger = logging.getLogger(__name__)
 
+SECTION_CHECKPOINT_NAMESPACE = "bid:sections"
+
+
+def section_checkpoint_key(rfp, generation_mode: str) -> str:
+    """Checkpoint key for a bid; editing the RFP starts from a clean slate."""
+    from api.app.core.cache import make_cache_key
+
+    return make_cache_key(
+        SECTION_CHECKPOINT_NAMESPACE,
+        {
+            "rfp_id": rfp.rfp_id,
+            "generation_mode": generation_mode,
+            "updated_at": rfp.updated_at,
+        },
+    )
+
+
+def load_section_checkpoints(key: str) -> dict:
+    """Sections completed by an earlier attempt of the same bid."""
+    from api.app.core.cache import response_cache
+
+    return response_cache.get(key) or {}
+
+
+def save_section_checkpoint(key: str, section: str, result) -> None:
+    """Persist one completed section so a retry does not regenerate it."""
+    from api.app.core.cache import response_cache
+    from api.app.core.config import settings
+
+    sections = load_section_checkpoints(key)
+    sections[section] = result
+    response_cache.set(key, sections, ttl=settings.BID_SECTION_CHECKPOINT_TTL_SECONDS)
+
+
+def clear_section_checkpoints(key: str) -> None:
+    from api.app.core.cache import response_cache
+
+    response_cache.delete(key)
+
 
 def broadcast_progress(job_id: str, progress: int, status: str, **kwargs):
     """Broadcast job progress via WebSocket (async wrapper)."""
@@ -68,15 +107,17 @@ def generate_proposal_section(
 
         # Get database session
         from api.app.core.database import SessionLocal
-        from api.app.models.database import CompanyProfile, RFPOpportunity
+        from api.app.services.generation_context import (
+            get_generation_context_builder,
+        )
 
         with SessionLocal() as db:
-            # Load RFP
-            rfp = (
-                db.query(RFPOpportunity).filter(RFPOpportunity.rfp_id == rfp_id).first()
-            )
+            # Load RFP, company profile and RAG context from the shared
+            # generation context (built once per RFP version)
+            builder = get_generation_context_builder()
+            context = builder.get(db, rfp_id)
 
-            if not rfp:
+            if not context:
                 return {
                     "status": "error",
                     "error": f"RFP not found: {rfp_id}",
@@ -88,24 +129,8 @@ def generate_proposal_section(
             )
             broadcast_progress(job_id, 10, "loaded_rfp")
 
-            # Load company profile
-            profile = db.query(CompanyProfile).first()
-
-            rfp_data = {
-                "title": rfp.title,
-                "agency": rfp.agency,
-                "description": rfp.description or "",
-                "naics_code": rfp.naics_code or "",
-                "award_amount": rfp.award_amount or 0,
-            }
-
-            company_profile = {}
-            if profile:
-                company_profile = {
-                    "company_name": profile.name,
-                    "certifications": profile.certifications or [],
-                    "core_competencies": profile.core_competencies or [],
-                }
+            rfp_data = context.rfp_data
+            company_profile = context.company_profile
 
             self.update_state(
                 state="PROGRESS", meta={"progress": 20, "status": "loaded_profile"}
@@ -117,11 +142,7 @@ def generate_proposal_section(
             try:
                 from src.rag.chroma_rag_engine import get_rag_engine
 
-                rag = get_rag_engine()
-                if rag and rag.is_built and rag.collection.count() > 0:
-                    results = rag.retrieve(f"{rfp.title} {section_type}", top_k=3)
-                    for result in results:
-                        rag_context += f"\n{result.get('content', '')[:500]}"
+                rag_context = builder.rag_context(context, section_type, get_rag_engine())
             except Exception as e:
                 logger.warning(f"RAG retrieval failed: {e}")
 
@@ -247,20 +268,57 @@ def generate_full_bid(
 
             # Use existing processor
             from api.app.services.rfp_processor import processor
+            from api.app.websockets.channels import broadcast_job_progress
+
+            checkpoint_key = section_checkpoint_key(rfp, generation_mode)
+            completed_sections = load_section_checkpoints(checkpoint_key)
+            if completed_sections:
+                logger.info(
+                    f"Resuming bid generation for {rfp_id} with sections: {sorted(completed_sections)}"
+                )
 
             self.update_state(
                 state="PROGRESS", meta={"progress": 20, "status": "generating"}
             )
             broadcast_progress(job_id, 20, "generating")
 
+            async def on_section_event(event):
+                # Sections account for the 20-90% band of overall progress
+                progress = 20 + int(70 * event.completed / max(event.total, 1))
+                if event.status == "completed" and event.checkpoint:
+                    save_section_checkpoint(checkpoint_key, event.name, event.result)
+
+                meta = {
+                    "progress": progress,
+                    "status": "generating",
+                    "section": event.name,
+                    "section_status": event.status,
+                }
+                self.update_state(state="PROGRESS", meta=meta)
+                try:
+                    await broadcast_job_progress(
+                        job_id,
+                        progress,
+                        "generating",
+                        section=event.name,
+                        section_status=event.status,
+                        error=event.error,
+                    )
+                except Exception as e:
+                    logger.warning(f"Failed to broadcast section progress: {e}")
+
             # Determine mode
             thinking_budget = options.get("thinking_budget", 10000)
 
             # Generate using existing processor
-            result = processor.generate_bid_document(
-                rfp_data=rfp_to_processing_dict(rfp),
-                generation_mode=generation_mode,
-                thinking_budget=thinking_budget,
+            result = asyncio.run(
+                processor.generate_bid_document(
+                    rfp_data=rfp_to_processing_dict(rfp),
+                    generation_mode=generation_mode,
+                    thinking_budget=thinking_budget,
+                    completed_sections=completed_sections,
+                    on_section_event=on_section_event,
+                )
             )
 
             self.update_state(
@@ -273,6 +331,7 @@ def generate_full_bid(
                     state="PROGRESS", meta={"progress": 100, "status": "completed"}
                 )
                 broadcast_progress(job_id, 100, "completed")
+                clear_section_checkpoints(checkpoint_key)
 
                 return {
                     "status": "success",
@@ -281,7 +340,19 @@ def generate_full_bid(
                     "metadata": result.get("metadata"),
                 }
             else:
-                return {"status": "error", "error": "Bid generation failed"}
+                error = result.get("error") if result else None
+                broadcast_progress(
+                    job_id,
+                    0,
+                    "failed",
+                    error=error,
+                    failed_sections=(result or {}).get("failed_sections", []),
+                )
+                return {
+                    "status": "error",
+                    "error": error or "Bid generation failed",
+                    "failed_sections": (result or {}).get("failed_sections", []),
+                }
 
     except Exception as e:
         logger.error(f"Full bid generation failed: {e}")
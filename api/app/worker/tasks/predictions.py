@@ -37,6 +37,16 @@ def broadcast_progress(job_id: str, progress: int, status: str, **kwargs):
         logger.warning(f"Failed to broadcast progress: {e}")
 
 
+def store_predictions(predictions: list[dict], meta: dict):
+    """Write predictions to the shared cache used by the predictions API."""
+    try:
+        from api.app.routes.predictions import cache_predictions
+
+        cache_predictions(predictions, meta)
+    except Exception as e:
+        logger.warning(f"Failed to cache predictions: {e}")
+
+
 @shared_task(
     bind=True,
     name="api.app.worker.tasks.predictions.generate_predictions",
@@ -137,6 +147,18 @@ def generate_predictions(
 
         ai_enhanced = sum(1 for p in predictions if p.get('ai_enhanced'))
         elapsed = time.time() - start_time
+        generated_at = datetime.now(timezone.utc).isoformat()
+
+        # Publish to the shared response cache so API workers serve this run
+        store_predictions(
+            predictions,
+            {
+                "count": len(predictions),
+                "ai_enhanced_count": ai_enhanced,
+                "generated_at": generated_at,
+                "elapsed_seconds": round(elapsed, 2),
+            },
+        )
 
         self.update_state(state="PROGRESS", meta={"progress": 100, "status": "completed"})
         broadcast_progress(job_id, 100, "completed")
@@ -147,7 +169,7 @@ def generate_predictions(
             "count": len(predictions),
             "ai_enhanced_count": ai_enhanced,
             "elapsed_seconds": round(elapsed, 2),
-            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "generated_at": generated_at,
         }
 
     except Exception as e:
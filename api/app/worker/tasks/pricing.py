@@ -0,0 +1,69 @@
+"""
+Pricing model tasks for Celery.
+
+Handles:
+- Training the ML pricing model on the award history
+- Publishing the trained model to the versioned model registry
+"""
+
+import logging
+import sys
+from pathlib import Path
+
+from celery import shared_task
+
+# Add project paths
+project_root = str(Path(__file__).parents[5])
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(
+    bind=True,
+    name="api.app.worker.tasks.pricing.train_pricing_model",
+    soft_time_limit=1740,  # 29 minutes soft limit
+    time_limit=1800,  # 30 minutes hard limit
+)
+def train_pricing_model(self, activate: bool = True, n_threads: int | None = None) -> dict:
+    """
+    Train the ML pricing model and publish it as a new registry version.
+
+    API and worker processes switch to the new version on their next registry
+    check; the version it replaces stays available for rollback.
+
+    Args:
+        activate: Make the new version current
+        n_threads: Threads for fitting (default: all cores)
+
+    Returns:
+        Dict with the new version id and its training metrics
+    """
+    from src.config.paths import PathConfig
+    from src.pricing.market_stats import load_award_history
+    from src.pricing.model_registry import ModelRegistry
+    from src.pricing.pricing_ml import PricingMLModel
+
+    self.update_state(state="PROGRESS", meta={"progress": 0, "status": "loading_data"})
+    history = load_award_history(PathConfig.PROCESSED_DATA_DIR)
+    if history.empty:
+        return {"status": "error", "error": "No historical data available"}
+
+    self.update_state(state="PROGRESS", meta={"progress": 20, "status": "training"})
+    model = PricingMLModel()
+    metrics = model.train(history, save=False, n_threads=n_threads)
+
+    self.update_state(state="PROGRESS", meta={"progress": 90, "status": "publishing"})
+    registry = ModelRegistry()
+    version = registry.publish(model, metrics, activate=activate)
+    pruned = registry.prune()
+
+    logger.info(f"Trained pricing model version {version}: {metrics}")
+    return {
+        "status": "trained",
+        "version": version,
+        "activated": activate,
+        "metrics": metrics,
+        "pruned_versions": pruned,
+    }
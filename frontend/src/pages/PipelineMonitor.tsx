@@ -98,7 +98,8 @@ export default function PipelineMonitor() {
     queryFn: () => fetchPipelineWithTimeout({ useCache: true }),
     staleTime: STALE_TIME,
     gcTime: 5 * 60 * 1000, // 5 minutes
-    refetchInterval: REFETCH_INTERVAL,
+    // Deltas arrive over the WebSocket; only poll while it is down
+    refetchInterval: wsConnected ? false : REFETCH_INTERVAL,
     retry: 1,
     retryDelay: 1000,
     placeholderData: (previousData) => previousData, // Show stale data while fetching
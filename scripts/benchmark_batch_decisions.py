@@ -0,0 +1,108 @@
+"""
+Benchmark vectorized go/no-go scoring against one analysis per RFP.
+
+Builds synthetic RFPs with precomputed compliance and pricing results, then
+scores them with ``analyze_rfp_opportunity`` (one call per RFP, analyses
+served from memory) and with a single ``score_batch`` call over their decision
+inputs, checking that the overall scores agree.
+
+Usage:
+    python scripts/benchmark_batch_decisions.py [--rows 2000] [--repeat 3]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.decision.batch_scoring import score_rfps
+from src.decision.go_nogo_engine import GoNoGoEngine
+
+DESCRIPTIONS = [
+    "Annual maintenance of existing systems",
+    "Six month pilot, specialized staff required",
+    "Emergency repair, urgent response",
+    "Security clearance required for current facility support",
+]
+
+
+class Precomputed:
+    """Compliance generator and pricing engine returning stored results."""
+
+    def __init__(self, matrices, strategies):
+        self.matrices, self.strategies = matrices, strategies
+
+    def generate_compliance_matrix(self, rfp_data):
+        return self.matrices[rfp_data["title"]]
+
+    def compare_strategies(self, rfp_data, requirements):
+        return self.strategies[rfp_data["title"]]
+
+
+def build_rfps(count: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    rfps, matrices, strategies = [], {}, {}
+    for i in range(count):
+        title = f"RFP {i}"
+        rfps.append({
+            "title": title,
+            "description": DESCRIPTIONS[rng.integers(len(DESCRIPTIONS))],
+            "naics_code": rng.choice(["541511", "236220", "484110"]),
+            "award_amount": float(rng.lognormal(12, 1.5)),
+            "lead_time_days": int(rng.integers(1, 90)),
+        })
+        matrices[title] = {"compliance_summary": {
+            "total_requirements": int(rng.integers(0, 40)), "compliance_rate": float(rng.random()),
+        }}
+        strategies[title] = {
+            name: SimpleNamespace(
+                confidence_score=float(rng.random()),
+                margin_percentage=float(rng.uniform(5, 50)),
+                risk_factors=["Tight market"] * int(rng.integers(0, 3)),
+            )
+            for name in ["competitive", "value_based", "cost_plus"]
+        }
+    return rfps, Precomputed(matrices, strategies)
+
+
+def timed(func, repeat: int) -> tuple[float, object]:
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rfps, precomputed = build_rfps(args.rows)
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = GoNoGoEngine(
+            compliance_generator=precomputed, pricing_engine=precomputed,
+            config_dir=tmp, historical_data_dir=tmp,
+        )
+    engine.logger.disabled = True
+    inputs = [engine.decision_inputs(rfp) for rfp in rfps]
+
+    (old_time, old_result), (new_time, new_result) = (
+        timed(lambda: [engine.analyze_rfp_opportunity(rfp).overall_score for rfp in rfps], args.repeat),
+        timed(lambda: score_rfps(rfps, inputs, engine)["overall_score"].tolist(), args.repeat),
+    )
+    print(
+        f"{f'Score {args.rows:,} RFPs':<26}{old_time * 1000:9.1f} ms -> {new_time * 1000:8.1f} ms  "
+        f"({old_time / new_time:6.1f}x, same result: {np.allclose(old_result, new_result)})"
+    )
+
+
+if __name__ == "__main__":
+    main()
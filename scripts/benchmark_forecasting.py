@@ -0,0 +1,116 @@
+"""
+Benchmark recurrence detection in ForecastingService.
+
+Builds a synthetic archive of recurring postings and times
+``predict_upcoming_opportunities`` (grouped vectorized statistics) against
+the per-group loop it replaced, checking that both predict the same
+opportunities.
+
+Usage:
+    python scripts/benchmark_forecasting.py [--groups 20000] [--repeat 3]
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.agents.forecasting_service import ForecastingService
+
+CYCLES = [20, 90, 180, 365, 400, 730, 1200]
+
+
+def build_archive(groups: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    counts = rng.integers(1, 8, groups)
+    group = np.repeat(np.arange(groups), counts)
+    step = np.concatenate([np.arange(count) for count in counts])
+    cycle = np.array(CYCLES)[rng.integers(len(CYCLES), size=groups)][group]
+    start = rng.integers(0, 3000, groups)[group]
+    days = start + cycle * step + rng.integers(-20, 21, len(group))
+    return pd.DataFrame({
+        "agency": [f"Agency {g % 500}" for g in group],
+        "title": [f"Recurring service {g} FY{2015 + s}" for g, s in zip(group, step, strict=True)],
+        "posted_date": pd.Timestamp(datetime.now() - timedelta(days=3200)) + pd.to_timedelta(days, unit="D"),
+        "naics_code": rng.choice(["541511", "236220", "484110"], len(group)),
+        "award_amount": rng.lognormal(12, 1.5, len(group)),
+    }).sample(frac=1, random_state=seed).reset_index(drop=True)
+
+
+def group_loop(service: ForecastingService, df: pd.DataFrame, confidence_threshold: float = 0.3) -> list[dict]:
+    """The per-group implementation, without AI insights."""
+    predictions = []
+    today = datetime.now()
+    for (agency, _title_norm), group in df.groupby(["agency", "title_normalized"]):
+        if len(group) < 2:
+            continue
+        dates = group["posted_date"].sort_values()
+        deltas = dates.diff().dt.days.dropna().values
+        if len(deltas) == 0:
+            continue
+        mean_delta = float(np.mean(deltas))
+        std_delta = float(np.std(deltas)) if len(deltas) > 1 else mean_delta * 0.3
+        if mean_delta < 30 or mean_delta > 1000:
+            continue
+        cycle_type, base_confidence = service._detect_cycle_type(mean_delta, std_delta)
+        last_date = dates.iloc[-1]
+        days_since_last = (today - last_date.to_pydatetime()).days
+        next_date = last_date + timedelta(days=mean_delta)
+        if (today - next_date.to_pydatetime()).days > 180:
+            continue
+        confidence = service._calculate_confidence(
+            len(group), std_delta, mean_delta, days_since_last, cycle_type, base_confidence
+        )
+        if confidence >= confidence_threshold:
+            latest_row = group.iloc[-1]
+            predictions.append({
+                "predicted_title": str(latest_row["title"]),
+                "agency": str(agency),
+                "predicted_date": next_date.strftime("%Y-%m-%d"),
+                "confidence": confidence,
+                "cycle_type": cycle_type,
+                "days_until": max(0, (next_date.to_pydatetime() - today).days),
+                "basis": service._generate_basis(len(group), cycle_type, mean_delta, std_delta),
+            })
+    predictions.sort(key=lambda x: (-x["confidence"], x["days_until"]))
+    return predictions
+
+
+def timed(func, repeat: int) -> tuple[float, object]:
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--groups", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    service = ForecastingService()
+    df = build_archive(args.groups)
+
+    (new_time, new), (old_time, old) = (
+        timed(lambda: service.predict_upcoming_opportunities(df, use_ai_insights=False), args.repeat),
+        timed(lambda: group_loop(service, df), args.repeat),
+    )
+    same = [(p["predicted_title"], p["predicted_date"], p["confidence"]) for p in new] == [
+        (p["predicted_title"], p["predicted_date"], p["confidence"]) for p in old
+    ]
+    print(
+        f"{f'{args.groups:,} groups ({len(df):,} rows)':<32}{old_time * 1000:9.1f} ms -> {new_time * 1000:8.1f} ms  "
+        f"({old_time / new_time:6.1f}x, {len(new):,} predictions, same result: {same})"
+    )
+
+
+if __name__ == "__main__":
+    main()
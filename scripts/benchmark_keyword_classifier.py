@@ -0,0 +1,174 @@
+"""
+Benchmark keyword classification against the per-keyword scans it replaced.
+
+Times discovery category inference over a DataFrame (row-wise apply against
+the batch classifier), RFP, requirement and Q&A categorization per text, and
+compliance signal detection over a long solicitation text, checking that the
+old and new implementations agree.
+
+Usage:
+    python scripts/benchmark_keyword_classifier.py [--rows 20000] [--repeat 3]
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.agents.discovery_agent import _DISCOVERY_CATEGORIES
+from src.agents.scrapers.qa_analyzer import QAAnalyzer
+from src.bid_generation.compliance_signals import ComplianceSignalDetector
+from src.compliance.compliance_matrix import _REQUIREMENT_CATEGORIES, ComplianceMatrixGenerator
+from src.utils.category import (
+    CATEGORY_KEYWORDS,
+    NAICS_CATEGORY_MAP,
+    CategoryType,
+    determine_category,
+)
+
+WORDS = (
+    "water delivery construction paving software cloud maintenance repair network services "
+    "county annual contract supply installation support pricing schedule proposal deadline "
+    "security clearance federal grant fema domestic preference hipaa section 508 the and of for"
+).split()
+
+
+def build_texts(count: int, seed: int = 7) -> list[str]:
+    rng = random.Random(seed)
+    return [" ".join(rng.choice(WORDS) for _ in range(rng.randint(5, 60))) for _ in range(count)]
+
+
+def legacy_infer_category(row) -> str:
+    text = (str(row.get("title", "")) + " " + str(row.get("description", ""))).lower()
+    if "water" in text:
+        return "bottled_water"
+    if "construction" in text or "paving" in text:
+        return "construction"
+    if "delivery" in text:
+        return "delivery"
+    if "software" in text or "it" in text or "cloud" in text:
+        return "IT"
+    return "General"
+
+
+def legacy_determine_category(rfp_data: dict) -> str:
+    title = str(rfp_data.get("title", "")).lower()
+    description = str(rfp_data.get("description", "")).lower()
+    naics_code = str(rfp_data.get("naics_code", ""))
+    combined_text = title + " " + description
+    for category, keywords in CATEGORY_KEYWORDS.items():
+        if any(keyword in combined_text for keyword in keywords):
+            return category.value
+    for prefix, category in NAICS_CATEGORY_MAP.items():
+        if naics_code.startswith(prefix):
+            return category.value
+    return CategoryType.PROFESSIONAL_SERVICES.value
+
+
+def legacy_requirement_category(text: str) -> str:
+    text_lower = text.lower()
+    for category, keywords in _REQUIREMENT_CATEGORIES.keywords.items():
+        if any(keyword in text_lower for keyword in keywords):
+            return category
+    return "general"
+
+
+def legacy_qa_category(text: str) -> str:
+    best_category, max_score = "other", 0
+    for category, keywords in QAAnalyzer.CATEGORY_CLASSIFIER.keywords.items():
+        score = sum(1 for keyword in keywords if keyword in text)
+        if score > max_score:
+            best_category, max_score = category, score
+    return best_category
+
+
+def legacy_detect_patterns(text: str, patterns: list[str]) -> list[str]:
+    matches = []
+    for pattern in patterns:
+        matches.extend(re.findall(pattern, text, re.IGNORECASE))
+    return matches
+
+
+def timed(func, repeat: int) -> tuple[float, object]:
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def report(label: str, old: tuple[float, object], new: tuple[float, object]) -> None:
+    (old_time, old_result), (new_time, new_result) = old, new
+    print(
+        f"{label:<26}{old_time * 1000:9.1f} ms -> {new_time * 1000:8.1f} ms  "
+        f"({old_time / new_time:5.1f}x, same result: {old_result == new_result})"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{args.rows:,} texts")
+
+    titles, descriptions = build_texts(args.rows, seed=1), build_texts(args.rows, seed=2)
+    frame = pd.DataFrame({"title": titles, "description": descriptions})
+    report(
+        "Discovery categories",
+        timed(lambda: frame.apply(legacy_infer_category, axis=1).tolist(), args.repeat),
+        timed(
+            lambda: _DISCOVERY_CATEGORIES.first_many(
+                frame["title"].astype(str) + " " + frame["description"].astype(str), default="General"
+            ),
+            args.repeat,
+        ),
+    )
+
+    texts = [f"{title} {description}" for title, description in zip(titles, descriptions, strict=True)]
+    rfps = [{"title": title, "description": description} for title, description in zip(titles, descriptions, strict=True)]
+    report(
+        "RFP categories",
+        timed(lambda: [legacy_determine_category(rfp) for rfp in rfps], args.repeat),
+        timed(lambda: [determine_category(rfp) for rfp in rfps], args.repeat),
+    )
+
+    generator = ComplianceMatrixGenerator.__new__(ComplianceMatrixGenerator)
+    report(
+        "Requirement categories",
+        timed(lambda: [legacy_requirement_category(text) for text in texts], args.repeat),
+        timed(lambda: [generator._categorize_requirement(text) for text in texts], args.repeat),
+    )
+
+    analyzer = QAAnalyzer()
+    report(
+        "Q&A categories",
+        timed(lambda: [legacy_qa_category(text) for text in texts], args.repeat),
+        timed(lambda: [analyzer._categorize_by_keywords(text) for text in texts], args.repeat),
+    )
+
+    detector = ComplianceSignalDetector()
+    pattern_sets = [
+        detector.FEMA_PATTERNS,
+        detector.FEDERAL_FUNDING_PATTERNS,
+        detector.SECURITY_PATTERNS,
+        detector.ACCESSIBILITY_PATTERNS,
+        detector.HEALTHCARE_PATTERNS,
+    ]
+    solicitation = " ".join(texts[:200]).lower()
+    report(
+        "Compliance signals",
+        timed(lambda: [legacy_detect_patterns(solicitation, p) for p in pattern_sets], args.repeat),
+        timed(lambda: [detector._detect_patterns(solicitation, p) for p in pattern_sets], args.repeat),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Benchmark batched ML price prediction against one call per RFP.
+
+Trains a model on synthetic awards, then prices a list of RFPs with the
+per-RFP prediction it replaced (LabelEncoder.transform per field, one model
+call per RFP for the estimate and each interval bound) and with
+``predict_batch``, checking that the point predictions agree.
+
+Usage:
+    python scripts/benchmark_pricing_ml.py [--rows 500] [--repeat 3]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.pricing.pricing_ml import PricingMLModel
+
+NAICS = ["541511", "541512", "236220", "484110", "561720"]
+AGENCIES = ["Dept of Transportation", "DEPT OF EDUCATION", "City of Austin", "County of Travis"]
+
+
+def build_awards(count: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "naics_code": rng.choice(NAICS, count),
+        "agency": rng.choice(AGENCIES + ["Unlisted agency"], count),
+        "description_length": rng.integers(10, 5000, count),
+        "requirement_count": rng.integers(1, 40, count),
+        "award_amount": rng.lognormal(12, 1, count),
+    })
+
+
+def legacy_predict(model: PricingMLModel, row: dict) -> float:
+    features = []
+    for col in model.feature_names:
+        if col in model.label_encoders:
+            try:
+                encoded = model.label_encoders[col].transform([str(row.get(col, "Unknown"))])[0]
+            except ValueError:
+                encoded = model.label_encoders[col].transform(["Unknown"])[0]
+            features.append(encoded)
+        else:
+            features.append(row.get(col, 0))
+    features_scaled = model.scaler.transform(np.array(features).reshape(1, -1))
+    prediction = np.expm1(model.model.predict(features_scaled)[0])
+    for quantile_model in model.quantile_models.values():
+        quantile_model.predict(features_scaled)
+    return round(float(prediction), 2)
+
+
+def timed(func, repeat: int) -> tuple[float, object]:
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def report(label: str, old: tuple[float, object], new: tuple[float, object]) -> None:
+    (old_time, old_result), (new_time, new_result) = old, new
+    print(
+        f"{label:<26}{old_time * 1000:9.1f} ms -> {new_time * 1000:8.1f} ms  "
+        f"({old_time / new_time:6.1f}x, same result: {old_result == new_result})"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        model = PricingMLModel(model_path=Path(tmp) / "pricing_model.pkl")
+        model.train(build_awards(5000), save=False)
+
+    rfps = build_awards(args.rows, seed=1).drop(columns="award_amount")
+    rfps["contract_type"], rfps["set_aside"] = "FFP", "None"
+    records = rfps.to_dict("records")
+    report(
+        f"Predict {args.rows:,} RFPs",
+        timed(lambda: [legacy_predict(model, row) for row in records], args.repeat),
+        timed(lambda: [round(p.predicted_price, 2) for p in model.predict_batch(rfps)], args.repeat),
+    )
+
+
+if __name__ == "__main__":
+    main()
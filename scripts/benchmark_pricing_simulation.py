@@ -0,0 +1,106 @@
+"""
+Benchmark the batched pricing grid against the per-margin loops it replaced.
+
+Times ``PricingMLModel.optimize_price`` against the loop calling
+``WinProbabilityModel.predict`` once per margin, and the Monte Carlo
+simulation against the same computation done draw by draw and margin by
+margin in Python, checking that the old and new implementations agree.
+
+Usage:
+    python scripts/benchmark_pricing_simulation.py [--draws 20000] [--repeat 3]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.pricing.pricing_ml import PricingMLModel
+from src.pricing.simulation import MonteCarloParams, margin_grid, sample_costs, simulate_pricing
+from src.pricing.win_probability import WinProbabilityModel
+
+MATERIAL, LABOR, OVERHEAD, MARKET_MEDIAN = 400_000.0, 450_000.0, 150_000.0, 1_300_000.0
+
+
+def legacy_optimize_price(base_cost, min_margin, max_margin, target_win_prob, market_median):
+    model = WinProbabilityModel()
+    best_score, best_margin = -1, min_margin
+    for margin in np.arange(min_margin, max_margin + 0.01, 0.01):
+        win_prob = model.predict(base_cost * (1 + margin), market_median)
+        score = margin * 0.6 + win_prob * 0.4 if win_prob >= target_win_prob else win_prob
+        if score > best_score:
+            best_score, best_margin = score, margin
+    return round(float(best_margin), 4)
+
+
+def legacy_simulate(params: MonteCarloParams) -> float:
+    """Expected-profit optimal margin, one draw and one margin at a time."""
+    model = WinProbabilityModel()
+    rng = np.random.default_rng(params.seed)
+    costs = sample_costs(MATERIAL, LABOR, OVERHEAD, params, rng)
+    medians = MARKET_MEDIAN * rng.lognormal(0.0, params.competitor_price_sd, params.draws)
+    planned_cost = (MATERIAL + LABOR + OVERHEAD) * (1.0 + params.risk_contingency[1])
+
+    best_profit, best_margin = -float("inf"), None
+    for margin in margin_grid(params.min_margin, params.max_margin, params.margin_step):
+        price = planned_cost * (1.0 + margin)
+        total = 0.0
+        for cost, median in zip(costs.tolist(), medians.tolist(), strict=True):
+            total += model.predict(price, median) * (price - cost)
+        if total / params.draws > best_profit:
+            best_profit, best_margin = total / params.draws, round(float(margin), 4)
+    return best_margin
+
+
+def timed(func, repeat: int) -> tuple[float, object]:
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def report(label: str, old: tuple[float, object], new: tuple[float, object]) -> None:
+    (old_time, old_result), (new_time, new_result) = old, new
+    print(
+        f"{label:<26}{old_time * 1000:9.1f} ms -> {new_time * 1000:8.1f} ms  "
+        f"({old_time / new_time:6.1f}x, same result: {old_result == new_result})"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--draws", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    model = PricingMLModel()
+    cases = [(base, 0.0, 0.6, 0.6, base * 1.3) for base in np.linspace(5e4, 5e6, 200)]
+    report(
+        "optimize_price x200",
+        timed(lambda: [legacy_optimize_price(*case) for case in cases], args.repeat),
+        timed(lambda: [round(model.optimize_price(*case)["margin"], 4) for case in cases], args.repeat),
+    )
+
+    params = MonteCarloParams(draws=args.draws, seed=7)
+    margins = len(margin_grid(params.min_margin, params.max_margin, params.margin_step))
+    report(
+        f"Simulation {args.draws:,}x{margins}",
+        timed(lambda: legacy_simulate(params), 1),
+        timed(
+            lambda: simulate_pricing(MATERIAL, LABOR, OVERHEAD, MARKET_MEDIAN, params).optimal["margin"],
+            args.repeat,
+        ),
+    )
+
+    full = MonteCarloParams(draws=100_000, seed=7)
+    elapsed, _ = timed(lambda: simulate_pricing(MATERIAL, LABOR, OVERHEAD, MARKET_MEDIAN, full), args.repeat)
+    print(f"Simulation 100,000x{margins}    {elapsed * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
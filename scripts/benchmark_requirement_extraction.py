@@ -0,0 +1,265 @@
+"""
+Benchmark compliance requirement extraction on a synthetic 300-page solicitation.
+
+Times the single sentence scan and both extraction paths that reuse it, as
+generate_compliance_matrix runs them, against the per-pattern implementation
+they replaced (one ``re.findall`` per pattern per section and a separate
+sentence split for the heuristic path) on the same solicitation. Both sides
+deduplicate with the current index, so the comparison isolates extraction.
+Then times near-duplicate removal over a set of mostly distinct requirements
+against the all-pairs overlap comparison.
+
+Usage:
+    python scripts/benchmark_requirement_extraction.py [--pages 300] [--repeat 3] [--requirements 5000]
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.compliance.compliance_matrix import ComplianceMatrixGenerator
+from src.compliance.dedup import deduplicate_requirements
+
+SENTENCES = [
+    "The contractor shall provide all labor, equipment and materials necessary to perform the work.",
+    "Offerors must submit three references from projects of similar size and scope.",
+    "The system must support single sign-on, role-based access and full audit logging.",
+    "Key personnel shall have a minimum of five years of experience in program management.",
+    "All deliverables must be provided in the format described in Attachment J-2.",
+    "The Government will evaluate proposals on a best value basis.",
+    "Performance will be measured against the service level targets in the QASP.",
+    "Monthly status reports are due by the fifth business day of each month.",
+    "The vendor must maintain availability of 99.9 percent for all hosted services.",
+    "Pricing shall include all travel, overhead and mobilization costs.",
+    "This section describes the background of the program and its history.",
+    "Contractor personnel must hold an active Secret clearance prior to starting work.",
+    "Offerors should demonstrate capability to scale operations within thirty days.",
+    "Questions regarding this solicitation may be sent to the contracting officer.",
+]
+# Requirement patterns of the per-pattern implementation, as they were
+_END = r".*?(?:[.!?]|\n)"
+LEGACY_PATTERNS = [
+    ("mandatory_requirements", "mandatory", [
+        r"(?i)\b(?:must|shall|required|mandatory|essential)\b" + _END,
+        r"(?i)(?:requirement|specification|standard)" + _END,
+        r"(?i)\b(?:minimum|maximum)\b" + _END,
+    ]),
+    ("technical_specifications", "technical", [
+        r"(?i)(?:technical|specification|standard|protocol)" + _END,
+        r"(?i)(?:system|software|hardware|equipment)" + _END,
+        r"(?i)(?:capability|feature|function)" + _END,
+    ]),
+    ("submission_requirements", "administrative", [
+        r"(?i)(?:submit|provide|include|attach)" + _END,
+        r"(?i)(?:deadline|due date|submission date)" + _END,
+        r"(?i)(?:format|template|structure)" + _END,
+    ]),
+    ("qualification_requirements", "qualification", [
+        r"(?i)(?:experience|qualification|certification)" + _END,
+        r"(?i)(?:years?\s+of|minimum.*experience)" + _END,
+        r"(?i)(?:licensed|certified|qualified)" + _END,
+    ]),
+    ("performance_requirements", "performance", [
+        r"(?i)(?:performance|metric|kpi|target)" + _END,
+        r"(?i)(?:delivery time|timeline|schedule)" + _END,
+        r"(?i)(?:sla|service level|availability)" + _END,
+    ]),
+]
+LEGACY_INDICATORS = [
+    "must", "shall", "required", "mandatory", "essential", "minimum", "maximum",
+    "specification", "standard", "provide", "submit", "include", "demonstrate",
+]
+LEGACY_CATEGORIES = [
+    ("technical", ["technical", "specification", "system", "software", "hardware"]),
+    ("financial", ["cost", "price", "budget", "financial", "payment"]),
+    ("qualification", ["experience", "qualification", "certification", "licensed"]),
+    ("performance", ["performance", "metric", "kpi", "delivery", "timeline"]),
+    ("security", ["security", "clearance", "confidential", "classified"]),
+    ("legal", ["legal", "regulation", "compliance", "law"]),
+    ("administrative", ["submit", "format", "deadline", "administrative"]),
+]
+
+HEADERS = [
+    "SECTION C - STATEMENT OF WORK",
+    "TECHNICAL REQUIREMENTS",
+    "Instructions to Offerors:",
+    "EVALUATION CRITERIA",
+    "Pricing and Payment:",
+]
+
+
+def build_solicitation(pages: int, seed: int = 7) -> str:
+    """Solicitation text with page markers, section headers and attachments."""
+    rng = random.Random(seed)
+    lines = []
+    for page in range(1, pages + 1):
+        if page % 100 == 1 and page > 1:
+            lines.append(f"\n=== Document: Attachment {page // 100}.pdf ===")
+        lines.append(f"[Page {page}]")
+        if page % 5 == 1:
+            lines.append(rng.choice(HEADERS))
+        # ~40 sentences per page, wrapped like extracted PDF text
+        paragraph = " ".join(rng.choice(SENTENCES) for _ in range(40))
+        words = paragraph.split()
+        lines.extend(" ".join(words[i:i + 14]) for i in range(0, len(words), 14))
+    return "\n".join(lines)
+
+
+def build_requirements(count: int, seed: int = 7) -> list[dict]:
+    """Requirements with distinct wording, a third of them lightly edited repeats."""
+    rng = random.Random(seed)
+    vocabulary = " ".join(SENTENCES).lower().replace(".", "").replace(",", "").split()
+    vocabulary += [f"item{i}" for i in range(2000)]
+    texts = []
+    for _ in range(count):
+        if texts and rng.random() < 0.33:
+            words = rng.choice(texts).split()
+            words[rng.randrange(len(words))] = rng.choice(vocabulary)
+        else:
+            words = [rng.choice(vocabulary) for _ in range(rng.randint(8, 25))]
+        texts.append(" ".join(words))
+    return [{"id": f"req_{i}", "text": text} for i, text in enumerate(texts)]
+
+
+def _legacy_sections(rfp_text: str):
+    """(source document, section header, page, section text) as the old paths tracked them."""
+    source, header, page = "RFP Description", None, None
+    sections = re.split(r"===\s*Document:\s*([^=]+)\s*===", rfp_text)
+    for i, section in enumerate(sections):
+        section = section.strip()
+        if i % 2 == 1:
+            source = section
+            continue
+        if not section:
+            continue
+        for line in section.split("\n"):
+            line = line.strip()
+            if len(line) > 3 and (line.endswith(":") or (line.isupper() and len(line.split()) <= 10)):
+                header = line.rstrip(":")
+            page_match = re.search(r"\[Page\s+(\d+)\]", line, re.IGNORECASE)
+            if page_match:
+                page = int(page_match.group(1))
+        yield source, header, page, section
+
+
+def legacy_rule_based(rfp_text: str) -> list[dict]:
+    """Rule-based extraction as it was: every pattern run over every section."""
+    requirements = []
+    for source, header, page, section in _legacy_sections(rfp_text):
+        clean_text = re.sub(r"\s+", " ", section)
+        for name, category, patterns in LEGACY_PATTERNS:
+            for pattern in patterns:
+                for match in re.findall(pattern, clean_text, re.MULTILINE | re.DOTALL):
+                    if len(match.strip()) > 20:
+                        requirements.append({
+                            "id": f"req_{len(requirements) + 1}",
+                            "text": match.strip(),
+                            "category": category,
+                            "pattern_type": name,
+                            "source_document": source,
+                            "source_section": header,
+                            "source_page": page,
+                        })
+    return deduplicate_requirements(requirements)
+
+
+def legacy_heuristic(rfp_text: str) -> list[dict]:
+    """Heuristic extraction as it was: its own section and sentence split."""
+    requirements = []
+    for source, header, page, section in _legacy_sections(rfp_text):
+        for sentence in re.split(r"[.!?]+", section):
+            sentence = sentence.strip()
+            lowered = sentence.lower()
+            if len(sentence) < 30 or not any(word in lowered for word in LEGACY_INDICATORS):
+                continue
+            category = next(
+                (name for name, words in LEGACY_CATEGORIES if any(w in lowered for w in words)), "general"
+            )
+            requirements.append({
+                "id": f"llm_req_{len(requirements) + 1}",
+                "text": sentence,
+                "category": category,
+                "source_document": source,
+                "source_section": header,
+                "source_page": page,
+            })
+    return requirements
+
+
+def pairwise_dedup(requirements: list[dict]) -> list[dict]:
+    """The all-pairs overlap comparison the dedup index replaced."""
+    unique, seen = [], set()
+    for req in requirements:
+        normalized = re.sub(r'\s+', ' ', req['text'].lower().strip())
+        duplicate = any(
+            len(set(normalized.split()) & set(seen_text.split()))
+            / max(len(normalized.split()), len(seen_text.split())) > 0.8
+            for seen_text in seen
+        )
+        if not duplicate and len(normalized) > 20:
+            unique.append(req)
+            seen.add(normalized)
+    return unique
+
+
+def timed(func, repeat: int) -> tuple[float, object]:
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--requirements", type=int, default=5000)
+    args = parser.parse_args()
+
+    text = build_solicitation(args.pages)
+    generator = ComplianceMatrixGenerator()
+    print(f"Solicitation: {args.pages} pages, {len(text):,} chars")
+
+    def scan():
+        generator._last_scan = None
+        return generator._scan_requirement_sentences(text)
+
+    def both_paths():
+        generator._last_scan = None
+        return (
+            generator.extract_requirements_rule_based(text),
+            generator.extract_requirements_llm(text),
+        )
+
+    scan_time, sentences = timed(scan, args.repeat)
+    print(f"Sentence scan:            {scan_time * 1000:8.1f} ms  ({len(sentences):,} requirement sentences)")
+
+    total_time, (rule, heuristic) = timed(both_paths, args.repeat)
+    print(
+        f"Rule-based + heuristic:   {total_time * 1000:8.1f} ms  "
+        f"({len(rule):,} rule-based after dedup, {len(heuristic):,} heuristic)"
+    )
+    legacy_time, (legacy_rule, legacy_llm) = timed(
+        lambda: (legacy_rule_based(text), legacy_heuristic(text)), args.repeat
+    )
+    print(
+        f"Per-pattern (previous):   {legacy_time * 1000:8.1f} ms  "
+        f"({len(legacy_rule):,} rule-based after dedup, {len(legacy_llm):,} heuristic; "
+        f"{legacy_time / total_time:.1f}x slower)"
+    )
+
+    requirements = build_requirements(args.requirements)
+    index_time, unique = timed(lambda: deduplicate_requirements(requirements), args.repeat)
+    print(f"Dedup index:              {index_time * 1000:8.1f} ms  ({len(requirements):,} -> {len(unique):,})")
+    pairwise_time, expected = timed(lambda: pairwise_dedup(requirements), 1)
+    print(f"All-pairs dedup:          {pairwise_time * 1000:8.1f} ms  (same result: {unique == expected})")
+
+
+if __name__ == "__main__":
+    main()
@@ -12,9 +12,18 @@ from typing import Any
 import pandas as pd
 
 from src.config.paths import PathConfig
+from src.utils.keyword_classifier import KeywordClassifier
 
 logger = logging.getLogger(__name__)
 
+# Categories inferred for discovered RFPs, checked in order
+_DISCOVERY_CATEGORIES = KeywordClassifier({
+    "bottled_water": ["water"],
+    "construction": ["construction", "paving"],
+    "delivery": ["delivery"],
+    "IT": ["software", "it", "cloud"],
+})
+
 # Try import of GoNoGoEngine; it's optional and handled gracefully in methods
 try:
     from src.decision.go_nogo_engine import GoNoGoEngine
@@ -157,21 +166,10 @@ class RFPDiscoveryAgent:
         )
 
         # Infer category
-        def infer_category(row):
-            text = (
-                str(row.get("title", "")) + " " + str(row.get("description", ""))
-            ).lower()
-            if "water" in text:
-                return "bottled_water"
-            if "construction" in text or "paving" in text:
-                return "construction"
-            if "delivery" in text:
-                return "delivery"
-            if "software" in text or "it" in text or "cloud" in text:
-                return "IT"
-            return "General"
-
-        df_api["category"] = df_api.apply(infer_category, axis=1)
+        df_api["category"] = _DISCOVERY_CATEGORIES.first_many(
+            df_api["title"].astype(str) + " " + df_api["description"].astype(str),
+            default="General",
+        )
 
         # Convert dates
         df_api["response_deadline"] = pd.to_datetime(
@@ -0,0 +1,133 @@
+"""
+Columnar cache of forecasting archives.
+
+Parsing a contract-opportunities archive CSV (hundreds of MB, mixed types,
+free-form dates) dominates a forecasting run. The first load of an archive
+writes the columns forecasting uses - agency, title, normalized title,
+posted date, NAICS code and award amount - to a parquet file named after
+the CSV's SHA-256 and ``ARCHIVE_CACHE_VERSION``; later loads memory-map that
+file instead. Editing or replacing the CSV changes its checksum, so an
+outdated cache is never read.
+
+A manifest in the cache directory records each source's size, mtime and
+checksum, so an unchanged file is not re-hashed on every run.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Bump when parsing or title normalization changes
+ARCHIVE_CACHE_VERSION = 1
+ARCHIVE_COLUMNS = ("agency", "title", "title_normalized", "posted_date", "naics_code", "award_amount")
+MANIFEST = "manifest.json"
+CHUNK_SIZE = 1 << 20
+
+_manifest_lock = threading.Lock()
+
+
+def file_checksum(path: str | Path) -> str:
+    """SHA-256 of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _atomic_write(path: Path, write) -> None:
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+class ArchiveCache:
+    """Checksum-addressed parquet copies of archive CSVs in one directory."""
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+
+    def _read_manifest(self) -> dict[str, dict]:
+        try:
+            with open(self.root / MANIFEST, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_manifest(self, manifest: dict[str, dict]) -> None:
+        def write(tmp_path):
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, indent=2)
+
+        _atomic_write(self.root / MANIFEST, write)
+
+    def path_for(self, checksum: str) -> Path:
+        return self.root / f"archive-{checksum[:32]}-v{ARCHIVE_CACHE_VERSION}.parquet"
+
+    def checksum(self, source: str | Path) -> str:
+        """Checksum of a source file, reusing the recorded one while its size and mtime are unchanged."""
+        source = Path(source).resolve()
+        stat = source.stat()
+        with _manifest_lock:
+            entry = self._read_manifest().get(str(source))
+        if entry and entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns:
+            return entry["sha256"]
+        return file_checksum(source)
+
+    def load(self, source: str | Path, checksum: str | None = None) -> pd.DataFrame | None:
+        """Cached frame of a source file, or None if it has not been converted.
+
+        ``checksum`` is the source's ``checksum()`` when the caller already has it.
+        """
+        path = self.path_for(checksum or self.checksum(source))
+        if not path.exists():
+            return None
+        try:
+            return pd.read_parquet(path, engine="pyarrow", memory_map=True)
+        except Exception as e:
+            logger.warning(f"Discarding unreadable forecasting archive cache {path}: {e}")
+            return None
+
+    def store(self, source: str | Path, df: pd.DataFrame, checksum: str | None = None) -> Path | None:
+        """Write the archive columns of a parsed source file; returns the cache path.
+
+        ``checksum`` is the source's ``checksum()`` when the caller already has it.
+        """
+        source = Path(source).resolve()
+        stat = source.stat()
+        checksum = checksum or self.checksum(source)
+        path = self.path_for(checksum)
+        columns = [c for c in ARCHIVE_COLUMNS if c in df.columns]
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            _atomic_write(path, lambda tmp_path: df[columns].to_parquet(tmp_path, engine="pyarrow", index=False))
+        except Exception as e:
+            logger.warning(f"Could not cache forecasting archive {source.name}: {e}")
+            return None
+
+        with _manifest_lock:
+            manifest = self._read_manifest()
+            previous = manifest.get(str(source), {}).get("sha256")
+            manifest[str(source)] = {
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "sha256": checksum,
+                "rows": len(df),
+            }
+            self._write_manifest(manifest)
+            # Drop the copy of the file's previous contents unless another source shares it
+            if previous and previous != checksum and all(e["sha256"] != previous for e in manifest.values()):
+                self.path_for(previous).unlink(missing_ok=True)
+
+        logger.info(f"Cached {len(df):,} archive rows from {source.name} in {path.name}")
+        return path
@@ -10,14 +10,38 @@ Uses statistical analysis + Claude AI for genuine opportunity forecasting:
 
 import logging
 import os
-from datetime import datetime, timedelta
+from datetime import datetime
+from pathlib import Path
 from typing import Any
 
 import numpy as np
 import pandas as pd
 
+from src.agents.forecasting_archive import ArchiveCache
+
 logger = logging.getLogger(__name__)
 
+# (cycle type, expected days between postings, tolerance in days)
+CYCLES = (
+    ("quarterly", 90, 30),
+    ("biannual", 180, 45),
+    ("annual", 365, 60),
+    ("biennial", 730, 90),  # 2 years
+)
+
+
+def normalize_titles(titles: pd.Series) -> pd.Series:
+    """Titles with years, quarters and punctuation removed, for grouping recurring postings."""
+    return (
+        titles
+        .str.lower()
+        .str.replace(r'\b(fy)?20\d{2}\b', '', regex=True)  # Remove years
+        .str.replace(r'\b(q[1-4]|quarter\s*[1-4])\b', '', regex=True)  # Remove quarters
+        .str.replace(r'[^\w\s]', ' ', regex=True)  # Remove special chars
+        .str.strip()
+        .str.slice(0, 40)  # Take first 40 chars
+    )
+
 
 class ForecastingService:
     """
@@ -29,8 +53,13 @@ class ForecastingService:
     - Multiple cycle detection (not just annual)
     """
 
-    def __init__(self, historical_data_path: str = None):
+    def __init__(self, historical_data_path: str = None, cache_dir: str | Path | None = None):
         self.data_path = historical_data_path
+        if cache_dir is None:
+            from src.config.paths import PathConfig
+
+            cache_dir = PathConfig.PROCESSED_DATA_DIR / "forecasting"
+        self.archive_cache = ArchiveCache(cache_dir)
         self._anthropic_client = None
         self._model = "claude-sonnet-4-5-20250929"
 
@@ -46,8 +75,34 @@ class ForecastingService:
                 logger.warning("anthropic package not installed")
         return self._anthropic_client
 
-    def train_on_file(self, file_path: str) -> pd.DataFrame:
-        """Load and prepare historical data for forecasting."""
+    def train_on_file(self, file_path: str, use_cache: bool = True) -> pd.DataFrame:
+        """
+        Load and prepare historical data for forecasting.
+
+        The prepared columns (see ``forecasting_archive.ARCHIVE_COLUMNS``) are
+        read from the archive cache when this file was converted before, and
+        written to it otherwise.
+        """
+        checksum = None
+        if use_cache:
+            # Hashed once for both the lookup and, on a miss, the store
+            checksum = self.archive_cache.checksum(file_path)
+            df = self.archive_cache.load(file_path, checksum)
+            if df is not None:
+                return df
+
+        df = self._parse_archive(file_path)
+        if use_cache and not df.empty:
+            self.archive_cache.store(file_path, df, checksum)
+        return df
+
+    def prepare_archive(self, file_path: str) -> Path | None:
+        """Convert an archive CSV into the archive cache; returns the cache file."""
+        df = self._parse_archive(file_path)
+        return self.archive_cache.store(file_path, df) if not df.empty else None
+
+    def _parse_archive(self, file_path: str) -> pd.DataFrame:
+        """Parse an archive CSV into the columns forecasting uses."""
         try:
             df = pd.read_csv(file_path, low_memory=False)
         except UnicodeDecodeError:
@@ -81,7 +136,9 @@ class ForecastingService:
         df['posted_date'] = df['posted_date'].dt.tz_convert(None)
         df = df.dropna(subset=['posted_date', 'title', 'agency'])
 
-        return df
+        df['title_normalized'] = normalize_titles(df['title'])
+        columns = ['agency', 'title', 'title_normalized', 'posted_date']
+        return df[columns + [c for c in ('naics_code', 'award_amount') if c in df.columns]]
 
     def _detect_cycle_type(self, mean_days: float, std_days: float) -> tuple[str, float]:
         """
@@ -89,14 +146,7 @@ class ForecastingService:
 
         Returns: (cycle_type, base_confidence)
         """
-        cycles = [
-            ("quarterly", 90, 30),      # ~90 days, ±30 tolerance
-            ("biannual", 180, 45),      # ~180 days, ±45 tolerance
-            ("annual", 365, 60),        # ~365 days, ±60 tolerance
-            ("biennial", 730, 90),      # ~730 days (2 years), ±90 tolerance
-        ]
-
-        for cycle_name, expected_days, tolerance in cycles:
+        for cycle_name, expected_days, tolerance in CYCLES:
             if abs(mean_days - expected_days) <= tolerance:
                 # Calculate how close we are to the expected cycle
                 deviation = abs(mean_days - expected_days) / tolerance
@@ -160,6 +210,48 @@ class ForecastingService:
         # Clamp to valid range
         return round(max(0.15, min(0.95, confidence)), 2)
 
+    def _detect_cycle_types(self, mean_days: np.ndarray, std_days: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Vectorized ``_detect_cycle_type`` over arrays of gap statistics."""
+        conditions, cycle_types, base_confidences = [], [], []
+        for cycle_name, expected_days, tolerance in CYCLES:
+            distance = np.abs(mean_days - expected_days)
+            conditions.append(distance <= tolerance)
+            cycle_types.append(cycle_name)
+            base_confidences.append(0.7 - (distance / tolerance * 0.2))
+
+        conditions.append(std_days < mean_days * 0.3)
+        cycle_types.append("recurring")
+        base_confidences.append(0.4)
+
+        return (
+            np.select(conditions, cycle_types, default="irregular"),
+            np.select(conditions, base_confidences, default=0.2),
+        )
+
+    def _calculate_confidences(
+        self,
+        num_observations: np.ndarray,
+        std_days: np.ndarray,
+        mean_days: np.ndarray,
+        days_since_last: np.ndarray,
+        base_confidence: np.ndarray,
+    ) -> list[float]:
+        """Vectorized ``_calculate_confidence``, adding the factors in the same order."""
+        confidence = base_confidence + np.select(
+            [num_observations >= 5, num_observations >= 3, num_observations == 2], [0.15, 0.08, -0.1], 0.0
+        )
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cv = np.where(mean_days > 0, std_days / mean_days, np.nan)
+            timing_ratio = np.where(mean_days > 0, days_since_last / mean_days, 1)
+        confidence = confidence + np.select([cv < 0.1, cv < 0.2, cv > 0.4], [0.1, 0.05, -0.15], 0.0)
+        confidence = confidence + np.where(
+            days_since_last > 0, np.select([timing_ratio > 1.5, timing_ratio < 0.5], [-0.1, -0.05], 0.0), 0.0
+        )
+
+        # Clamp to valid range (round() per value, as the scalar version does)
+        return [round(value, 2) for value in np.clip(confidence, 0.15, 0.95).tolist()]
+
     def _generate_ai_insight(self, predictions: list[dict]) -> list[dict]:
         """
         Use Claude AI to generate real insights about predictions.
@@ -262,82 +354,86 @@ Format your response as a numbered list matching the order above. Be specific an
         predictions = []
         today = datetime.now()
 
-        # Normalize titles for better grouping
-        df['title_normalized'] = (
-            df['title']
-            .str.lower()
-            .str.replace(r'\b(fy)?20\d{2}\b', '', regex=True)  # Remove years
-            .str.replace(r'\b(q[1-4]|quarter\s*[1-4])\b', '', regex=True)  # Remove quarters
-            .str.replace(r'[^\w\s]', ' ', regex=True)  # Remove special chars
-            .str.strip()
-            .str.slice(0, 40)  # Take first 40 chars
+        # Normalize titles for better grouping (train_on_file already did)
+        if 'title_normalized' not in df.columns:
+            df['title_normalized'] = normalize_titles(df['title'])
+
+        # Gap statistics of every (agency, title) group in one pass: sort once,
+        # diff within groups, aggregate, then classify and score all groups as arrays
+        keys = ['agency', 'title_normalized']
+        postings = df[keys + ['posted_date']].assign(row=np.arange(len(df))).dropna(subset=keys)
+        postings = postings.sort_values(keys + ['posted_date'], kind='mergesort')
+        postings['gap'] = postings.groupby(keys, sort=False)['posted_date'].diff().dt.days
+        groups = postings.groupby(keys, sort=True).agg(
+            num_observations=('row', 'size'),
+            latest_row=('row', 'max'),
+            last_posted=('posted_date', 'last'),
+            mean_delta=('gap', 'mean'),
         )
-
-        grouped = df.groupby(['agency', 'title_normalized'])
-
-        for (agency, _title_norm), group in grouped:
-            if len(group) < 2:
-                continue
-
-            dates = group['posted_date'].sort_values()
-            deltas = dates.diff().dt.days.dropna().values
-
-            if len(deltas) == 0:
-                continue
-
-            mean_delta = float(np.mean(deltas))
-            std_delta = float(np.std(deltas)) if len(deltas) > 1 else mean_delta * 0.3
-
-            # Skip if mean gap is too short or too long
-            if mean_delta < 30 or mean_delta > 1000:
-                continue
-
-            # Detect cycle type
-            cycle_type, base_confidence = self._detect_cycle_type(mean_delta, std_delta)
-
-            last_date = dates.iloc[-1]
-            days_since_last = (today - last_date.to_pydatetime()).days
-
-            # Calculate prediction date
-            next_date = last_date + timedelta(days=mean_delta)
-
-            # Skip if prediction is too far in past (more than 6 months overdue)
-            if (today - next_date.to_pydatetime()).days > 180:
-                continue
-
-            # Calculate real confidence
-            confidence = self._calculate_confidence(
-                num_observations=len(group),
-                std_days=std_delta,
-                mean_days=mean_delta,
-                days_since_last=days_since_last,
-                cycle_type=cycle_type,
-                base_confidence=base_confidence
-            )
-
-            if confidence >= confidence_threshold:
-                # Get additional context
-                latest_row = group.iloc[-1]
-                naics = latest_row.get('naics_code', '')
-                award_amount = latest_row.get('award_amount', None)
-
-                predictions.append({
-                    "predicted_title": str(latest_row['title']),
-                    "agency": str(agency),
-                    "predicted_date": next_date.strftime("%Y-%m-%d"),
-                    "confidence": confidence,
-                    "cycle_type": cycle_type,
-                    "cycle_days": int(mean_delta),
-                    "variance_days": int(std_delta),
-                    "num_observations": len(group),
-                    "last_posted": last_date.strftime("%Y-%m-%d"),
-                    "days_until": max(0, (next_date.to_pydatetime() - today).days),
-                    "naics_code": str(naics) if naics else None,
-                    "historical_value": float(award_amount) if pd.notna(award_amount) else None,
-                    "basis": self._generate_basis(len(group), cycle_type, mean_delta, std_delta),
-                    "ai_enhanced": False,
-                    "ai_insight": None,
-                })
+        squared = (postings['gap'] - postings.groupby(keys, sort=False)['gap'].transform('mean')) ** 2
+        groups['std_delta'] = np.sqrt(squared.groupby([postings[k] for k in keys]).mean())
+
+        num_observations = groups['num_observations'].to_numpy()
+        mean_delta = groups['mean_delta'].to_numpy()
+        std_delta = np.where(num_observations > 2, groups['std_delta'].to_numpy(), mean_delta * 0.3)
+
+        # Skip if mean gap is too short or too long
+        keep = (num_observations >= 2) & (mean_delta >= 30) & (mean_delta <= 1000)
+
+        # Calculate prediction date
+        now = pd.Timestamp(today)
+        last_posted = pd.DatetimeIndex(groups['last_posted'])
+        offsets = pd.to_timedelta(np.nan_to_num(np.round(mean_delta * 86_400_000_000)), unit='us')
+        next_dates = last_posted + offsets
+
+        # Skip if prediction is too far in past (more than 6 months overdue)
+        keep &= np.asarray((now - next_dates).days) <= 180
+
+        idx = np.flatnonzero(keep)
+        mean_delta, std_delta = mean_delta[idx], std_delta[idx]
+        num_observations = num_observations[idx]
+        last_posted, next_dates = last_posted[idx], next_dates[idx]
+        days_since_last = np.asarray((now - last_posted).days)
+
+        # Detect cycle type and calculate real confidence
+        cycle_types, base_confidences = self._detect_cycle_types(mean_delta, std_delta)
+        confidences = self._calculate_confidences(
+            num_observations, std_delta, mean_delta, days_since_last, base_confidences
+        )
+        days_until = np.asarray((next_dates - now).days)
+
+        # Get additional context from the last posting of each predicted group
+        selected = np.flatnonzero(np.asarray(confidences) >= confidence_threshold)
+        latest = df.iloc[groups['latest_row'].to_numpy()[idx][selected]]
+        titles = latest['title'].tolist()
+        naics_codes = latest['naics_code'].tolist() if 'naics_code' in latest else [''] * len(selected)
+        award_amounts = latest['award_amount'].tolist() if 'award_amount' in latest else [None] * len(selected)
+        agencies = groups.index.get_level_values('agency')[idx][selected].tolist()
+        predicted_dates = next_dates[selected].strftime("%Y-%m-%d").tolist()
+        last_dates = last_posted[selected].strftime("%Y-%m-%d").tolist()
+
+        for j, i in enumerate(selected.tolist()):
+            cycle_type = str(cycle_types[i])
+            naics, award_amount = naics_codes[j], award_amounts[j]
+            predictions.append({
+                "predicted_title": str(titles[j]),
+                "agency": str(agencies[j]),
+                "predicted_date": predicted_dates[j],
+                "confidence": confidences[i],
+                "cycle_type": cycle_type,
+                "cycle_days": int(mean_delta[i]),
+                "variance_days": int(std_delta[i]),
+                "num_observations": int(num_observations[i]),
+                "last_posted": last_dates[j],
+                "days_until": max(0, int(days_until[i])),
+                "naics_code": str(naics) if naics else None,
+                "historical_value": float(award_amount) if pd.notna(award_amount) else None,
+                "basis": self._generate_basis(
+                    int(num_observations[i]), cycle_type, float(mean_delta[i]), float(std_delta[i])
+                ),
+                "ai_enhanced": False,
+                "ai_insight": None,
+            })
 
         # Sort by confidence and upcoming date
         predictions.sort(key=lambda x: (-x['confidence'], x['days_until']))
@@ -14,4 +14,31 @@ __all__ = [
     "BeaconBidScraper",
     "GenericWebScraper",
     "SAMGovScraper",
+    "get_scraper",
 ]
+
+
+def get_scraper(url: str):
+    """
+    Get the appropriate scraper for a URL.
+
+    Priority order:
+    1. Platform-specific scrapers (BeaconBid, SAM.gov) - use specialized extraction
+    2. Generic web scraper - fallback for any HTTP(S) URL using AI extraction
+    """
+    # Platform-specific scrapers in priority order
+    scrapers = [
+        BeaconBidScraper(),
+        SAMGovScraper(),
+    ]
+
+    for scraper in scrapers:
+        if scraper.is_valid_url(url):
+            return scraper
+
+    # Fallback: GenericWebScraper accepts any HTTP(S) URL
+    generic = GenericWebScraper()
+    if generic.is_valid_url(url):
+        return generic
+
+    return None
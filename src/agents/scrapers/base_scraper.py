@@ -1,15 +1,26 @@
 """
 Base scraper class for RFP portals.
-Provides common interface and utilities for all portal-specific scrapers.
+Provides common interface and utilities for all portal-specific scrapers,
+including the shared direct-download path: documents are fetched
+concurrently over one pooled session, streamed to disk while being hashed,
+and skipped when ETag/Last-Modified/size show they have not changed since
+the previous download.
 """
+import asyncio
 import hashlib
+import json
 import logging
+import os
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
-from datetime import datetime
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+import aiofiles
+import aiohttp
+from aiohttp import ClientTimeout
+
 logger = logging.getLogger(__name__)
 
 
@@ -77,6 +88,41 @@ class ScrapedRFP:
         self.scrape_checksum = hashlib.md5(content.encode()).hexdigest()
         return self.scrape_checksum
 
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-friendly form, used to cache scrape results."""
+        return _isoformat_dates(asdict(self))
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ScrapedRFP":
+        """Rebuild a ScrapedRFP from ``to_dict`` output."""
+        data = _parse_dates(dict(data), ("posted_date", "response_deadline", "scraped_at"))
+        data["documents"] = [
+            ScrapedDocument(**_parse_dates(dict(d), ("downloaded_at",)))
+            for d in data.get("documents") or []
+        ]
+        data["qa_items"] = [
+            ScrapedQA(**_parse_dates(dict(q), ("asked_date", "answered_date")))
+            for q in data.get("qa_items") or []
+        ]
+        return cls(**data)
+
+
+def _isoformat_dates(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, dict):
+        return {k: _isoformat_dates(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_isoformat_dates(v) for v in value]
+    return value
+
+
+def _parse_dates(data: dict[str, Any], names: tuple[str, ...]) -> dict[str, Any]:
+    for name in names:
+        if isinstance(data.get(name), str):
+            data[name] = datetime.fromisoformat(data[name])
+    return data
+
 
 class BaseScraper(ABC):
     """
@@ -90,6 +136,17 @@ class BaseScraper(ABC):
     PLATFORM_NAME: str = "unknown"
     SUPPORTED_DOMAINS: list[str] = []
 
+    # Direct download configuration
+    DOWNLOAD_TIMEOUT_SECONDS = 60
+    DOWNLOAD_MAX_RETRIES = 3
+    DOWNLOAD_RETRY_DELAY_SECONDS = 2
+    DOWNLOAD_CONCURRENCY = 4
+    DOWNLOAD_CHUNK_SIZE = 64 * 1024
+    DOWNLOAD_HEADERS: dict[str, str] = {}
+
+    # Per-RFP record of validators from previous downloads
+    DOWNLOAD_MANIFEST = ".downloads.json"
+
     def __init__(self, document_storage_path: str = "data/rfp_documents"):
         """
         Initialize the scraper.
@@ -171,13 +228,280 @@ class BaseScraper(ABC):
         rfp_path.mkdir(parents=True, exist_ok=True)
         return rfp_path
 
+    def _stagehand_options(self) -> dict[str, Any]:
+        """Stagehand constructor arguments for the configured browser environment."""
+        from src.config.settings import settings
+
+        config = settings.browser_pool
+        model_api_key = getattr(self, "model_api_key", "")
+        if config.env.upper() == "LOCAL":
+            return {
+                "env": "LOCAL",
+                "model_api_key": model_api_key,
+                "local_browser_launch_options": {"headless": config.headless},
+            }
+        return {
+            "env": "BROWSERBASE",
+            "api_key": getattr(self, "browserbase_api_key", ""),
+            "project_id": getattr(self, "browserbase_project_id", ""),
+            "model_api_key": model_api_key,
+        }
+
+    async def _create_stagehand_session(self) -> Any:
+        """
+        Create a Stagehand browser session for the configured environment.
+
+        Returns:
+            Initialized Stagehand instance; the browser pool owns its lifetime
+        """
+        try:
+            from stagehand import Stagehand
+        except ImportError as err:
+            logger.error("Stagehand package not installed. Run: pip install stagehand")
+            raise ScraperError("Stagehand package not installed") from err
+
+        try:
+            stagehand = Stagehand(
+                **self._stagehand_options(),
+                verbose=1,  # 0=quiet, 1=info, 2=debug
+            )
+            await stagehand.init()
+        except Exception as e:
+            logger.error("Failed to create Stagehand session: %s", e)
+            raise ScraperConnectionError(f"Failed to connect to the browser: {e}") from e
+
+        logger.info("Stagehand session initialized for %s", self.PLATFORM_NAME)
+        return stagehand
+
+    def browser_session(self, url: str, discard: bool = False):
+        """
+        Check out a pooled browser session for ``url``.
+
+        Usage::
+
+            async with self.browser_session(url) as stagehand:
+                await stagehand.page.goto(url)
+        """
+        from .session_pool import get_browser_pool
+
+        key = f"{self.PLATFORM_NAME}:{getattr(self, 'browserbase_project_id', '')}"
+        return get_browser_pool(key, self._create_stagehand_session).session(url, discard=discard)
+
     def compute_file_checksum(self, file_path: str) -> str:
-        """Compute MD5 checksum of a file."""
-        hash_md5 = hashlib.md5()
+        """Compute SHA-256 checksum of a file."""
+        digest = hashlib.sha256()
         with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_md5.update(chunk)
-        return hash_md5.hexdigest()
+            for chunk in iter(lambda: f.read(self.DOWNLOAD_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _sanitize_filename(self, filename: str) -> str:
+        """Sanitize filename to be filesystem-safe."""
+        unsafe_chars = '<>:"/\\|?*'
+        safe_name = filename
+        for char in unsafe_chars:
+            safe_name = safe_name.replace(char, "_")
+        return safe_name.strip()
+
+    def _load_download_manifest(self, storage_path: Path) -> dict[str, dict[str, Any]]:
+        """Validators recorded by earlier downloads, keyed by source URL."""
+        try:
+            with open(storage_path / self.DOWNLOAD_MANIFEST, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_download_manifest(self, storage_path: Path, manifest: dict[str, dict[str, Any]]) -> None:
+        tmp_path = storage_path / f"{self.DOWNLOAD_MANIFEST}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+        os.replace(tmp_path, storage_path / self.DOWNLOAD_MANIFEST)
+
+    async def download_documents_direct(
+        self, documents: list[ScrapedDocument], storage_path: Path
+    ) -> list[ScrapedDocument]:
+        """
+        Download documents by URL, DOWNLOAD_CONCURRENCY at a time.
+
+        All requests share one connection-pooled session. Documents whose
+        ETag, Last-Modified or size match the previous download are not
+        fetched again; they are returned with the existing local file.
+
+        Args:
+            documents: Documents with source URLs
+            storage_path: Directory to save files in
+
+        Returns:
+            Documents that are available locally, in input order
+        """
+        manifest = self._load_download_manifest(storage_path)
+        semaphore = asyncio.Semaphore(self.DOWNLOAD_CONCURRENCY)
+        timeout = ClientTimeout(total=self.DOWNLOAD_TIMEOUT_SECONDS)
+        connector = aiohttp.TCPConnector(limit=self.DOWNLOAD_CONCURRENCY)
+
+        async def download(doc: ScrapedDocument) -> ScrapedDocument | None:
+            if not doc.source_url:
+                logger.warning("No source URL for document: %s", doc.filename)
+                return None
+            async with semaphore:
+                return await self._download_single_document(
+                    session, doc, storage_path, manifest
+                )
+
+        async with aiohttp.ClientSession(
+            timeout=timeout, connector=connector, headers=self.DOWNLOAD_HEADERS
+        ) as session:
+            results = await asyncio.gather(*(download(doc) for doc in documents))
+
+        self._save_download_manifest(storage_path, manifest)
+        return [doc for doc in results if doc is not None]
+
+    async def _download_single_document(
+        self,
+        session: aiohttp.ClientSession,
+        doc: ScrapedDocument,
+        storage_path: Path,
+        manifest: dict[str, dict[str, Any]] | None = None,
+    ) -> ScrapedDocument | None:
+        """Download a single document with retry logic."""
+        if not doc.source_url or not doc.source_url.startswith(("http://", "https://")):
+            logger.error(f"Invalid document URL: {doc.source_url} for {doc.filename}")
+            return None
+
+        manifest = manifest if manifest is not None else {}
+        file_path = storage_path / self._sanitize_filename(doc.filename)
+        previous = manifest.get(doc.source_url)
+        if previous and not self._matches_local_file(previous, file_path):
+            previous = None
+
+        headers = {}
+        if previous and previous.get("etag"):
+            headers["If-None-Match"] = previous["etag"]
+        if previous and previous.get("last_modified"):
+            headers["If-Modified-Since"] = previous["last_modified"]
+
+        last_error: Exception | None = None
+        for attempt in range(1, self.DOWNLOAD_MAX_RETRIES + 1):
+            try:
+                logger.info(
+                    "Downloading (attempt %d/%d): %s",
+                    attempt,
+                    self.DOWNLOAD_MAX_RETRIES,
+                    doc.filename,
+                )
+                async with session.get(doc.source_url, headers=headers) as response:
+                    if previous and (
+                        response.status == 304
+                        or (response.status == 200 and self._is_unchanged(previous, response))
+                    ):
+                        logger.info("Unchanged, skipping download: %s", doc.filename)
+                        return self._reuse_download(doc, file_path, previous)
+
+                    if response.status == 200:
+                        await self._stream_to_file(response, doc, file_path)
+                        manifest[doc.source_url] = {
+                            "file_path": doc.file_path,
+                            "size": doc.file_size,
+                            "checksum": doc.checksum,
+                            "etag": response.headers.get("ETag"),
+                            "last_modified": response.headers.get("Last-Modified"),
+                            "downloaded_at": doc.downloaded_at.isoformat(),
+                        }
+                        logger.info(
+                            "Downloaded: %s (%d bytes)", file_path.name, doc.file_size
+                        )
+                        return doc
+
+                    logger.warning(
+                        "Failed to download %s: HTTP %d", doc.filename, response.status
+                    )
+                    last_error = ScraperDownloadError(f"HTTP {response.status}")
+
+            except asyncio.TimeoutError:
+                logger.warning(
+                    "Timeout downloading %s (attempt %d)", doc.filename, attempt
+                )
+                last_error = ScraperDownloadError(
+                    f"Timeout after {self.DOWNLOAD_TIMEOUT_SECONDS}s"
+                )
+            except aiohttp.ClientError as e:
+                logger.warning(
+                    "Client error downloading %s (attempt %d): %s",
+                    doc.filename,
+                    attempt,
+                    e,
+                )
+                last_error = e
+            except Exception as e:
+                logger.error("Unexpected error downloading %s: %s", doc.filename, e)
+                last_error = e
+                break  # Don't retry unexpected errors
+
+            if attempt < self.DOWNLOAD_MAX_RETRIES:
+                await asyncio.sleep(self.DOWNLOAD_RETRY_DELAY_SECONDS)
+
+        logger.error(
+            "Failed to download %s after %d attempts: %s",
+            doc.filename,
+            self.DOWNLOAD_MAX_RETRIES,
+            last_error,
+        )
+        return None
+
+    async def _stream_to_file(
+        self, response: aiohttp.ClientResponse, doc: ScrapedDocument, file_path: Path
+    ) -> None:
+        """Write the body to disk in chunks, hashing as it is written."""
+        digest = hashlib.sha256()
+        size = 0
+        tmp_path = file_path.with_name(f"{file_path.name}.part")
+        try:
+            async with aiofiles.open(tmp_path, "wb") as f:
+                async for chunk in response.content.iter_chunked(self.DOWNLOAD_CHUNK_SIZE):
+                    digest.update(chunk)
+                    size += len(chunk)
+                    await f.write(chunk)
+            os.replace(tmp_path, file_path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+        doc.file_path = str(file_path)
+        doc.file_size = size
+        doc.checksum = digest.hexdigest()
+        doc.downloaded_at = datetime.now(timezone.utc)
+
+    @staticmethod
+    def _matches_local_file(previous: dict[str, Any], file_path: Path) -> bool:
+        """Whether the file from the previous download is still on disk intact."""
+        try:
+            return previous.get("file_path") == str(file_path) and (
+                file_path.stat().st_size == previous.get("size")
+            )
+        except OSError:
+            return False
+
+    @staticmethod
+    def _is_unchanged(previous: dict[str, Any], response: aiohttp.ClientResponse) -> bool:
+        """Compare a 200 response with the previous download without reading the body."""
+        etag = response.headers.get("ETag")
+        if etag:
+            return etag == previous.get("etag")
+        last_modified = response.headers.get("Last-Modified")
+        if last_modified:
+            return last_modified == previous.get("last_modified")
+        # No validators at all: fall back to the advertised size
+        return response.content_length is not None and response.content_length == previous.get("size")
+
+    @staticmethod
+    def _reuse_download(
+        doc: ScrapedDocument, file_path: Path, previous: dict[str, Any]
+    ) -> ScrapedDocument:
+        doc.file_path = str(file_path)
+        doc.file_size = previous.get("size")
+        doc.checksum = previous.get("checksum")
+        doc.downloaded_at = datetime.fromisoformat(previous["downloaded_at"])
+        return doc
 
 
 class ScraperError(Exception):
@@ -6,6 +6,7 @@ web scraping, even when page layouts change.
 """
 
 import asyncio
+import hashlib
 import logging
 import os
 from datetime import datetime, timedelta, timezone
@@ -14,8 +15,6 @@ from typing import Any
 from urllib.parse import urljoin, urlparse
 
 import aiofiles
-import aiohttp
-from aiohttp import ClientTimeout
 from pydantic import BaseModel, Field
 
 from .base_scraper import (
@@ -23,9 +22,6 @@ from .base_scraper import (
     ScrapedDocument,
     ScrapedQA,
     ScrapedRFP,
-    ScraperConnectionError,
-    ScraperDownloadError,
-    ScraperError,
     ScraperParseError,
 )
 
@@ -93,11 +89,6 @@ class BeaconBidScraper(BaseScraper):
     PLATFORM_NAME = "beaconbid"
     SUPPORTED_DOMAINS = ["beaconbid.com", "www.beaconbid.com"]
 
-    # Configuration constants
-    DOWNLOAD_TIMEOUT_SECONDS = 60
-    DOWNLOAD_MAX_RETRIES = 3
-    DOWNLOAD_RETRY_DELAY_SECONDS = 2
-
     def __init__(
         self,
         document_storage_path: str = "data/rfp_documents",
@@ -146,38 +137,6 @@ class BeaconBidScraper(BaseScraper):
             return data.dict()
         return {}
 
-    async def _create_stagehand_session(self) -> Any:
-        """
-        Create a Stagehand browser session using Browserbase.
-
-        Returns:
-            Stagehand instance with browser session
-        """
-        try:
-            # Import stagehand - it's a Python package that wraps the Stagehand SDK
-            from stagehand import Stagehand
-
-            stagehand = Stagehand(
-                env="BROWSERBASE",
-                api_key=self.browserbase_api_key,
-                project_id=self.browserbase_project_id,
-                model_api_key=self.model_api_key,
-                verbose=1,  # 0=quiet, 1=info, 2=debug
-            )
-
-            await stagehand.init()
-            logger.info("Stagehand session initialized with Browserbase")
-            return stagehand
-
-        except ImportError as err:
-            logger.error("Stagehand package not installed. Run: pip install stagehand")
-            raise ScraperError("Stagehand package not installed") from err
-        except Exception as e:
-            logger.error("Failed to create Stagehand session: %s", e)
-            raise ScraperConnectionError(
-                f"Failed to connect to Browserbase: {e}"
-            ) from e
-
     async def scrape(self, url: str) -> ScrapedRFP:
         """
         Scrape RFP data from a BeaconBid URL.
@@ -192,24 +151,22 @@ class BeaconBidScraper(BaseScraper):
             raise ValueError(f"URL not supported by BeaconBid scraper: {url}")
 
         logger.info("Scraping BeaconBid URL: %s", url)
-        stagehand = None
-
         try:
-            stagehand = await self._create_stagehand_session()
-            page = stagehand.page
+            async with self.browser_session(url) as stagehand:
+                page = stagehand.page
 
-            # Navigate to the URL
-            await page.goto(url)
-            await asyncio.sleep(2)  # Wait for dynamic content
+                # Navigate to the URL
+                await page.goto(url)
+                await asyncio.sleep(2)  # Wait for dynamic content
 
-            # Extract RFP metadata using Stagehand's AI extraction
-            rfp_data = await self._extract_rfp_metadata(stagehand)
+                # Extract RFP metadata using Stagehand's AI extraction
+                rfp_data = await self._extract_rfp_metadata(stagehand)
 
-            # Extract documents with base URL for resolving relative links
-            documents = await self._extract_documents(stagehand, url)
+                # Extract documents with base URL for resolving relative links
+                documents = await self._extract_documents(stagehand, url)
 
-            # Extract Q&A
-            qa_items = await self._extract_qa(stagehand)
+                # Extract Q&A
+                qa_items = await self._extract_qa(stagehand)
 
             # Build the ScrapedRFP (handle both snake_case and camelCase keys)
             def get_field(data: dict, snake_key: str, camel_key: str | None = None):
@@ -251,13 +208,6 @@ class BeaconBidScraper(BaseScraper):
             logger.error("Error scraping BeaconBid URL %s: %s", url, e)
             raise ScraperParseError(f"Failed to scrape BeaconBid: {e}") from e
 
-        finally:
-            if stagehand:
-                try:
-                    await stagehand.close()
-                except Exception as e:
-                    logger.warning("Error closing Stagehand session: %s", e)
-
     async def _extract_rfp_metadata(self, stagehand: Any) -> dict[str, Any]:
         """
         Extract RFP metadata using Stagehand's AI extraction.
@@ -565,20 +515,7 @@ Look for download links in tables, lists, or attachment sections on the page.
             )
 
         # Fallback to direct URL download
-        timeout = ClientTimeout(total=self.DOWNLOAD_TIMEOUT_SECONDS)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            for doc in rfp.documents:
-                if not doc.source_url:
-                    logger.warning("No source URL for document: %s", doc.filename)
-                    continue
-
-                downloaded = await self._download_single_document(
-                    session, doc, storage_path
-                )
-                if downloaded:
-                    downloaded_docs.append(downloaded)
-
-        return downloaded_docs
+        return await self.download_documents_direct(rfp.documents, storage_path)
 
     async def _download_via_browser(
         self, rfp: ScrapedRFP, storage_path: Path
@@ -593,73 +530,65 @@ Look for download links in tables, lists, or attachment sections on the page.
         See: https://docs.browserbase.com/features/downloads
         """
         downloaded_docs = []
-        stagehand = None
         session_id = None
 
         try:
             print("[DOWNLOAD] === Starting browser session for Download Package ===")
             logger.info("Starting browser session for Download Package button")
 
-            stagehand = await self._create_stagehand_session()
-            page = stagehand.page
-
-            # Get session ID for later download retrieval
-            if hasattr(stagehand, "session_id"):
-                session_id = stagehand.session_id
-            elif hasattr(stagehand, "browserbase_session_id"):
-                session_id = stagehand.browserbase_session_id
-            elif hasattr(stagehand, "_session_id"):
-                session_id = stagehand._session_id
-
-            print(f"[DOWNLOAD] Session ID: {session_id}")
-            logger.info("Browserbase session ID: %s", session_id)
-
-            # Configure CDP for downloads
-            browser = getattr(stagehand, "browser", None) or getattr(
-                stagehand, "_browser", None
-            )
-            if browser:
-                try:
-                    cdp_session = await browser.new_browser_cdp_session()
-                    await cdp_session.send(
-                        "Browser.setDownloadBehavior",
-                        {
-                            "behavior": "allow",
-                            "downloadPath": "downloads",
-                            "eventsEnabled": True,
-                        },
-                    )
-                except Exception as cdp_err:
-                    logger.warning("Could not configure CDP session: %s", cdp_err)
+            # Discarded after use: closing the session is what uploads its
+            # downloads to Browserbase cloud
+            async with self.browser_session(rfp.source_url, discard=True) as stagehand:
+                page = stagehand.page
+
+                # Get session ID for later download retrieval
+                if hasattr(stagehand, "session_id"):
+                    session_id = stagehand.session_id
+                elif hasattr(stagehand, "browserbase_session_id"):
+                    session_id = stagehand.browserbase_session_id
+                elif hasattr(stagehand, "_session_id"):
+                    session_id = stagehand._session_id
+
+                print(f"[DOWNLOAD] Session ID: {session_id}")
+                logger.info("Browserbase session ID: %s", session_id)
+
+                # Configure CDP for downloads
+                browser = getattr(stagehand, "browser", None) or getattr(
+                    stagehand, "_browser", None
+                )
+                if browser:
+                    try:
+                        cdp_session = await browser.new_browser_cdp_session()
+                        await cdp_session.send(
+                            "Browser.setDownloadBehavior",
+                            {
+                                "behavior": "allow",
+                                "downloadPath": "downloads",
+                                "eventsEnabled": True,
+                            },
+                        )
+                    except Exception as cdp_err:
+                        logger.warning("Could not configure CDP session: %s", cdp_err)
 
-            # Navigate to the RFP page
-            await page.goto(rfp.source_url)
-            await asyncio.sleep(2)
+                # Navigate to the RFP page
+                await page.goto(rfp.source_url)
+                await asyncio.sleep(2)
 
-            # Click the "Download Package" button to get all attachments at once
-            print("[DOWNLOAD] Clicking 'Download Package' button...")
-            await stagehand.page.act(
-                "Click the 'Download Package' button to download all attachments"
-            )
+                # Click the "Download Package" button to get all attachments at once
+                print("[DOWNLOAD] Clicking 'Download Package' button...")
+                await stagehand.page.act(
+                    "Click the 'Download Package' button to download all attachments"
+                )
 
-            # Wait for the package download to complete (ZIP file with all docs)
-            print("[DOWNLOAD] Waiting 15s for package download to complete...")
-            await asyncio.sleep(15)
-            print("[DOWNLOAD] Download Package click completed")
+                # Wait for the package download to complete (ZIP file with all docs)
+                print("[DOWNLOAD] Waiting 15s for package download to complete...")
+                await asyncio.sleep(15)
+                print("[DOWNLOAD] Download Package click completed")
 
         except Exception as e:
             print(f"[DOWNLOAD] Session failed: {e}")
             logger.error("Download session failed: %s", e)
 
-        finally:
-            # Close the Stagehand session - this triggers upload to Browserbase cloud
-            if stagehand:
-                try:
-                    await stagehand.close()
-                    logger.info("Stagehand session closed")
-                except Exception as e:
-                    logger.warning("Error closing Stagehand session: %s", e)
-
         # Wait for upload to Browserbase cloud
         await asyncio.sleep(3)
 
@@ -768,9 +697,9 @@ Look for download links in tables, lists, or attachment sections on the page.
                                         file_size = len(file_content)
                                         doc.file_path = str(local_path)
                                         doc.file_size = file_size
-                                        doc.checksum = self.compute_file_checksum(
-                                            str(local_path)
-                                        )
+                                        doc.checksum = hashlib.sha256(
+                                            file_content
+                                        ).hexdigest()
                                         doc.downloaded_at = datetime.now(timezone.utc)
 
                                         downloaded_docs.append(doc)
@@ -809,9 +738,9 @@ Look for download links in tables, lists, or attachment sections on the page.
                                         file_size = len(file_content)
                                         doc.file_path = str(local_path)
                                         doc.file_size = file_size
-                                        doc.checksum = self.compute_file_checksum(
-                                            str(local_path)
-                                        )
+                                        doc.checksum = hashlib.sha256(
+                                            file_content
+                                        ).hexdigest()
                                         doc.downloaded_at = datetime.now(timezone.utc)
 
                                         downloaded_docs.append(doc)
@@ -830,86 +759,6 @@ Look for download links in tables, lists, or attachment sections on the page.
         logger.warning("No downloads found from Browserbase within %ds", retry_seconds)
         return downloaded_docs
 
-    async def _download_single_document(
-        self, session: aiohttp.ClientSession, doc: ScrapedDocument, storage_path: Path
-    ) -> ScrapedDocument | None:
-        """Download a single document with retry logic."""
-        last_error: Exception | None = None
-
-        # Validate URL before attempting download
-        if not doc.source_url or not doc.source_url.startswith(("http://", "https://")):
-            logger.error(
-                f"Invalid document URL: {doc.source_url} for file {doc.filename}"
-            )
-            return None
-
-        for attempt in range(1, self.DOWNLOAD_MAX_RETRIES + 1):
-            try:
-                logger.info(
-                    "Downloading (attempt %d/%d): %s from %s",
-                    attempt,
-                    self.DOWNLOAD_MAX_RETRIES,
-                    doc.filename,
-                    doc.source_url[:100],  # Log first 100 chars of URL
-                )
-                async with session.get(doc.source_url) as response:
-                    if response.status == 200:
-                        # Generate safe filename
-                        safe_filename = self._sanitize_filename(doc.filename)
-                        file_path = storage_path / safe_filename
-
-                        # Write file
-                        content = await response.read()
-                        async with aiofiles.open(file_path, "wb") as f:
-                            await f.write(content)
-
-                        # Update document info
-                        doc.file_path = str(file_path)
-                        doc.file_size = len(content)
-                        doc.checksum = self.compute_file_checksum(str(file_path))
-                        doc.downloaded_at = datetime.now(timezone.utc)
-
-                        logger.info(
-                            "Downloaded: %s (%d bytes)", safe_filename, doc.file_size
-                        )
-                        return doc
-
-                    logger.warning(
-                        "Failed to download %s: HTTP %d", doc.filename, response.status
-                    )
-                    last_error = ScraperDownloadError(f"HTTP {response.status}")
-
-            except asyncio.TimeoutError:
-                logger.warning(
-                    "Timeout downloading %s (attempt %d)", doc.filename, attempt
-                )
-                last_error = ScraperDownloadError(
-                    f"Timeout after {self.DOWNLOAD_TIMEOUT_SECONDS}s"
-                )
-            except aiohttp.ClientError as e:
-                logger.warning(
-                    "Client error downloading %s (attempt %d): %s",
-                    doc.filename,
-                    attempt,
-                    e,
-                )
-                last_error = e
-            except Exception as e:
-                logger.error("Unexpected error downloading %s: %s", doc.filename, e)
-                last_error = e
-                break  # Don't retry unexpected errors
-
-            if attempt < self.DOWNLOAD_MAX_RETRIES:
-                await asyncio.sleep(self.DOWNLOAD_RETRY_DELAY_SECONDS)
-
-        logger.error(
-            "Failed to download %s after %d attempts: %s",
-            doc.filename,
-            self.DOWNLOAD_MAX_RETRIES,
-            last_error,
-        )
-        return None
-
     async def refresh(
         self, url: str, existing_checksum: str | None = None
     ) -> dict[str, Any]:
@@ -1090,12 +939,3 @@ Look for download links in tables, lists, or attachment sections on the page.
             return "qa_response"
         else:
             return "attachment"
-
-    def _sanitize_filename(self, filename: str) -> str:
-        """Sanitize filename to be filesystem-safe."""
-        # Remove or replace unsafe characters
-        unsafe_chars = '<>:"/\\|?*'
-        safe_name = filename
-        for char in unsafe_chars:
-            safe_name = safe_name.replace(char, "_")
-        return safe_name.strip()
@@ -11,9 +11,6 @@ from pathlib import Path
 from typing import Any
 from urllib.parse import urljoin, urlparse
 
-import aiofiles
-import aiohttp
-from aiohttp import ClientTimeout
 from pydantic import BaseModel, Field
 
 from .base_scraper import (
@@ -21,9 +18,6 @@ from .base_scraper import (
     ScrapedDocument,
     ScrapedQA,
     ScrapedRFP,
-    ScraperConnectionError,
-    ScraperDownloadError,
-    ScraperError,
     ScraperParseError,
 )
 
@@ -107,10 +101,11 @@ class GenericWebScraper(BaseScraper):
     PLATFORM_NAME = "generic"
     SUPPORTED_DOMAINS: list[str] = []  # Empty = accepts any domain as fallback
 
-    # Configuration constants
-    DOWNLOAD_TIMEOUT_SECONDS = 60
-    DOWNLOAD_MAX_RETRIES = 3
-    DOWNLOAD_RETRY_DELAY_SECONDS = 2
+    # Mimic a browser request for direct downloads
+    DOWNLOAD_HEADERS = {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+        "Accept": "application/pdf,application/msword,application/vnd.openxmlformats-officedocument.*,*/*",
+    }
 
     def __init__(
         self,
@@ -178,37 +173,6 @@ class GenericWebScraper(BaseScraper):
             return data.dict()
         return {}
 
-    async def _create_stagehand_session(self) -> Any:
-        """
-        Create a Stagehand browser session using Browserbase.
-
-        Returns:
-            Stagehand instance with browser session
-        """
-        try:
-            from stagehand import Stagehand
-
-            stagehand = Stagehand(
-                env="BROWSERBASE",
-                api_key=self.browserbase_api_key,
-                project_id=self.browserbase_project_id,
-                model_api_key=self.model_api_key,
-                verbose=1,  # 0=quiet, 1=info, 2=debug
-            )
-
-            await stagehand.init()
-            logger.info("Stagehand session initialized with Browserbase")
-            return stagehand
-
-        except ImportError as err:
-            logger.error("Stagehand package not installed. Run: pip install stagehand")
-            raise ScraperError("Stagehand package not installed") from err
-        except Exception as e:
-            logger.error("Failed to create Stagehand session: %s", e)
-            raise ScraperConnectionError(
-                f"Failed to connect to Browserbase: {e}"
-            ) from e
-
     async def scrape(self, url: str) -> ScrapedRFP:
         """
         Scrape RFP data from any government website URL.
@@ -225,24 +189,22 @@ class GenericWebScraper(BaseScraper):
             raise ValueError(f"Invalid URL: {url}")
 
         logger.info("Scraping URL with GenericWebScraper: %s", url)
-        stagehand = None
-
         try:
-            stagehand = await self._create_stagehand_session()
-            page = stagehand.page
+            async with self.browser_session(url) as stagehand:
+                page = stagehand.page
 
-            # Navigate to the URL
-            await page.goto(url)
-            await asyncio.sleep(3)  # Wait for dynamic content
+                # Navigate to the URL
+                await page.goto(url)
+                await asyncio.sleep(3)  # Wait for dynamic content
 
-            # Extract RFP metadata using Stagehand's AI extraction
-            rfp_data = await self._extract_rfp_metadata(stagehand)
+                # Extract RFP metadata using Stagehand's AI extraction
+                rfp_data = await self._extract_rfp_metadata(stagehand)
 
-            # Extract documents with base URL for resolving relative links
-            documents = await self._extract_documents(stagehand, url)
+                # Extract documents with base URL for resolving relative links
+                documents = await self._extract_documents(stagehand, url)
 
-            # Extract Q&A (if present)
-            qa_items = await self._extract_qa(stagehand)
+                # Extract Q&A (if present)
+                qa_items = await self._extract_qa(stagehand)
 
             # Detect platform from URL for source_platform field
             detected_platform = self._detect_platform(url)
@@ -278,13 +240,6 @@ class GenericWebScraper(BaseScraper):
             logger.error("Error scraping URL %s: %s", url, e)
             raise ScraperParseError(f"Failed to scrape: {e}") from e
 
-        finally:
-            if stagehand:
-                try:
-                    await stagehand.close()
-                except Exception as e:
-                    logger.warning("Error closing Stagehand session: %s", e)
-
     def _detect_platform(self, url: str) -> str:
         """
         Detect the platform from the URL domain.
@@ -627,18 +582,9 @@ Look for:
         logger.info("Downloading %d documents for RFP %s", len(rfp.documents), rfp_id)
 
         # Try direct HTTP download (works for most government sites)
-        timeout = ClientTimeout(total=self.DOWNLOAD_TIMEOUT_SECONDS)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            for doc in rfp.documents:
-                if not doc.source_url:
-                    logger.warning("No source URL for document: %s", doc.filename)
-                    continue
-
-                downloaded = await self._download_single_document(
-                    session, doc, storage_path
-                )
-                if downloaded:
-                    downloaded_docs.append(downloaded)
+        downloaded_docs = await self.download_documents_direct(
+            rfp.documents, storage_path
+        )
 
         logger.info(
             "Downloaded %d/%d documents for RFP %s",
@@ -648,84 +594,6 @@ Look for:
         )
         return downloaded_docs
 
-    async def _download_single_document(
-        self, session: aiohttp.ClientSession, doc: ScrapedDocument, storage_path: Path
-    ) -> ScrapedDocument | None:
-        """Download a single document with retry logic."""
-        last_error: Exception | None = None
-
-        if not doc.source_url or not doc.source_url.startswith(("http://", "https://")):
-            logger.error(f"Invalid document URL: {doc.source_url} for {doc.filename}")
-            return None
-
-        for attempt in range(1, self.DOWNLOAD_MAX_RETRIES + 1):
-            try:
-                logger.info(
-                    "Downloading (attempt %d/%d): %s",
-                    attempt,
-                    self.DOWNLOAD_MAX_RETRIES,
-                    doc.filename,
-                )
-
-                # Add headers to mimic browser request
-                headers = {
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                    "Accept": "application/pdf,application/msword,application/vnd.openxmlformats-officedocument.*,*/*",
-                }
-
-                async with session.get(doc.source_url, headers=headers) as response:
-                    if response.status == 200:
-                        safe_filename = self._sanitize_filename(doc.filename)
-                        file_path = storage_path / safe_filename
-
-                        content = await response.read()
-                        async with aiofiles.open(file_path, "wb") as f:
-                            await f.write(content)
-
-                        doc.file_path = str(file_path)
-                        doc.file_size = len(content)
-                        doc.checksum = self.compute_file_checksum(str(file_path))
-                        doc.downloaded_at = datetime.now(timezone.utc)
-
-                        logger.info(
-                            "Downloaded: %s (%d bytes)", safe_filename, doc.file_size
-                        )
-                        return doc
-
-                    logger.warning(
-                        "Failed to download %s: HTTP %d", doc.filename, response.status
-                    )
-                    last_error = ScraperDownloadError(f"HTTP {response.status}")
-
-            except asyncio.TimeoutError:
-                logger.warning(
-                    "Timeout downloading %s (attempt %d)", doc.filename, attempt
-                )
-                last_error = ScraperDownloadError("Timeout")
-            except aiohttp.ClientError as e:
-                logger.warning(
-                    "Client error downloading %s (attempt %d): %s",
-                    doc.filename,
-                    attempt,
-                    e,
-                )
-                last_error = e
-            except Exception as e:
-                logger.error("Unexpected error downloading %s: %s", doc.filename, e)
-                last_error = e
-                break
-
-            if attempt < self.DOWNLOAD_MAX_RETRIES:
-                await asyncio.sleep(self.DOWNLOAD_RETRY_DELAY_SECONDS)
-
-        logger.error(
-            "Failed to download %s after %d attempts: %s",
-            doc.filename,
-            self.DOWNLOAD_MAX_RETRIES,
-            last_error,
-        )
-        return None
-
     async def refresh(
         self, url: str, existing_checksum: str | None = None
     ) -> dict[str, Any]:
@@ -894,11 +762,3 @@ Look for:
             return "specification"
         else:
             return "attachment"
-
-    def _sanitize_filename(self, filename: str) -> str:
-        """Sanitize filename to be filesystem-safe."""
-        unsafe_chars = '<>:"/\\|?*'
-        safe_name = filename
-        for char in unsafe_chars:
-            safe_name = safe_name.replace(char, "_")
-        return safe_name.strip()
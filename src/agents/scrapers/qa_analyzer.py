@@ -6,6 +6,8 @@ import logging
 import re
 from typing import Any
 
+from src.utils.keyword_classifier import KeywordClassifier
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,6 +30,39 @@ class QAAnalyzer:
         "other",          # Other/uncategorized
     ]
 
+    # Scored by distinct keywords found; ties go to the earlier category
+    CATEGORY_CLASSIFIER = KeywordClassifier({
+        "technical": [
+            "technical", "system", "software", "hardware", "integration",
+            "architecture", "specification", "requirement", "technology",
+            "platform", "interface", "api", "database", "security"
+        ],
+        "pricing": [
+            "price", "cost", "budget", "rate", "labor", "material",
+            "fee", "payment", "invoice", "billing", "discount", "ceiling"
+        ],
+        "scope": [
+            "scope", "deliverable", "task", "work", "service",
+            "responsibility", "duty", "obligation", "include", "exclude"
+        ],
+        "timeline": [
+            "deadline", "date", "schedule", "timeline", "milestone",
+            "duration", "period", "when", "time", "extension"
+        ],
+        "compliance": [
+            "compliance", "regulation", "certification", "clearance",
+            "requirement", "mandatory", "shall", "must", "license"
+        ],
+        "submission": [
+            "submit", "submission", "format", "page", "font", "proposal",
+            "upload", "portal", "attachment", "document"
+        ],
+        "evaluation": [
+            "evaluation", "criteria", "score", "weight", "factor",
+            "rating", "assess", "review", "selection"
+        ],
+    })
+
     PROPOSAL_SECTIONS = [
         "executive_summary",
         "technical_approach",
@@ -161,48 +196,7 @@ Respond in JSON format:
 
     def _categorize_by_keywords(self, text: str) -> str:
         """Categorize Q&A based on keywords."""
-        keyword_map = {
-            "technical": [
-                "technical", "system", "software", "hardware", "integration",
-                "architecture", "specification", "requirement", "technology",
-                "platform", "interface", "api", "database", "security"
-            ],
-            "pricing": [
-                "price", "cost", "budget", "rate", "labor", "material",
-                "fee", "payment", "invoice", "billing", "discount", "ceiling"
-            ],
-            "scope": [
-                "scope", "deliverable", "task", "work", "service",
-                "responsibility", "duty", "obligation", "include", "exclude"
-            ],
-            "timeline": [
-                "deadline", "date", "schedule", "timeline", "milestone",
-                "duration", "period", "when", "time", "extension"
-            ],
-            "compliance": [
-                "compliance", "regulation", "certification", "clearance",
-                "requirement", "mandatory", "shall", "must", "license"
-            ],
-            "submission": [
-                "submit", "submission", "format", "page", "font", "proposal",
-                "upload", "portal", "attachment", "document"
-            ],
-            "evaluation": [
-                "evaluation", "criteria", "score", "weight", "factor",
-                "rating", "assess", "review", "selection"
-            ],
-        }
-
-        max_score = 0
-        best_category = "other"
-
-        for category, keywords in keyword_map.items():
-            score = sum(1 for keyword in keywords if keyword in text)
-            if score > max_score:
-                max_score = score
-                best_category = category
-
-        return best_category
+        return self.CATEGORY_CLASSIFIER.best(text, "other")
 
     def _extract_basic_insights(
         self,
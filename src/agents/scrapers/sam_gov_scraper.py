@@ -16,9 +16,6 @@ from pathlib import Path
 from typing import Any
 from urllib.parse import urljoin, urlparse
 
-import aiofiles
-import aiohttp
-from aiohttp import ClientTimeout
 from pydantic import BaseModel, Field
 
 from .base_scraper import (
@@ -26,9 +23,6 @@ from .base_scraper import (
     ScrapedDocument,
     ScrapedQA,
     ScrapedRFP,
-    ScraperConnectionError,
-    ScraperDownloadError,
-    ScraperError,
     ScraperParseError,
 )
 
@@ -92,10 +86,11 @@ class SAMGovScraper(BaseScraper):
     PLATFORM_NAME = "sam.gov"
     SUPPORTED_DOMAINS = ["sam.gov", "beta.sam.gov", "www.sam.gov"]
 
-    # Configuration
-    DOWNLOAD_TIMEOUT_SECONDS = 60
-    DOWNLOAD_MAX_RETRIES = 3
-    DOWNLOAD_RETRY_DELAY_SECONDS = 2
+    # Mimic a browser request for direct downloads
+    DOWNLOAD_HEADERS = {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+        "Accept": "application/pdf,application/msword,*/*",
+    }
 
     def __init__(
         self,
@@ -169,30 +164,6 @@ class SAMGovScraper(BaseScraper):
 
         return None
 
-    async def _create_stagehand_session(self) -> Any:
-        """Create a Stagehand browser session."""
-        try:
-            from stagehand import Stagehand
-
-            stagehand = Stagehand(
-                env="BROWSERBASE",
-                api_key=self.browserbase_api_key,
-                project_id=self.browserbase_project_id,
-                model_api_key=self.model_api_key,
-                verbose=1,
-            )
-
-            await stagehand.init()
-            logger.info("Stagehand session initialized for SAM.gov")
-            return stagehand
-
-        except ImportError as err:
-            logger.error("Stagehand package not installed")
-            raise ScraperError("Stagehand package not installed") from err
-        except Exception as e:
-            logger.error("Failed to create Stagehand session: %s", e)
-            raise ScraperConnectionError(f"Failed to connect: {e}") from e
-
     async def scrape(self, url: str) -> ScrapedRFP:
         """
         Scrape RFP data from a SAM.gov URL.
@@ -209,21 +180,19 @@ class SAMGovScraper(BaseScraper):
             raise ValueError(f"URL not supported by SAM.gov scraper: {url}")
 
         logger.info("Scraping SAM.gov URL: %s", url)
-        stagehand = None
-
         try:
-            stagehand = await self._create_stagehand_session()
-            page = stagehand.page
+            async with self.browser_session(url) as stagehand:
+                page = stagehand.page
 
-            # Navigate to the URL
-            await page.goto(url)
-            await asyncio.sleep(3)  # SAM.gov has slow dynamic loading
+                # Navigate to the URL
+                await page.goto(url)
+                await asyncio.sleep(3)  # SAM.gov has slow dynamic loading
 
-            # Extract metadata
-            rfp_data = await self._extract_metadata(stagehand)
+                # Extract metadata
+                rfp_data = await self._extract_metadata(stagehand)
 
-            # Extract documents
-            documents = await self._extract_documents(stagehand, url)
+                # Extract documents
+                documents = await self._extract_documents(stagehand, url)
 
             # SAM.gov typically doesn't have Q&A on the main page
             qa_items: list[ScrapedQA] = []
@@ -260,13 +229,6 @@ class SAMGovScraper(BaseScraper):
             logger.error("Error scraping SAM.gov URL %s: %s", url, e)
             raise ScraperParseError(f"Failed to scrape SAM.gov: {e}") from e
 
-        finally:
-            if stagehand:
-                try:
-                    await stagehand.close()
-                except Exception as e:
-                    logger.warning("Error closing Stagehand: %s", e)
-
     def _get_field(self, data: dict, snake_key: str) -> Any:
         """Get field with snake_case or camelCase fallback."""
         if not data:
@@ -483,17 +445,9 @@ SAM.gov documents are often in a table or list format.
             rfp_id,
         )
 
-        timeout = ClientTimeout(total=self.DOWNLOAD_TIMEOUT_SECONDS)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            for doc in rfp.documents:
-                if not doc.source_url:
-                    continue
-
-                downloaded = await self._download_single_document(
-                    session, doc, storage_path
-                )
-                if downloaded:
-                    downloaded_docs.append(downloaded)
+        downloaded_docs = await self.download_documents_direct(
+            rfp.documents, storage_path
+        )
 
         logger.info(
             "Downloaded %d/%d SAM.gov documents for RFP %s",
@@ -503,62 +457,6 @@ SAM.gov documents are often in a table or list format.
         )
         return downloaded_docs
 
-    async def _download_single_document(
-        self, session: aiohttp.ClientSession, doc: ScrapedDocument, storage_path: Path
-    ) -> ScrapedDocument | None:
-        """Download a single document with retry logic."""
-        if not doc.source_url or not doc.source_url.startswith(("http://", "https://")):
-            return None
-
-        last_error = None
-
-        for attempt in range(1, self.DOWNLOAD_MAX_RETRIES + 1):
-            try:
-                logger.info(
-                    "Downloading SAM.gov doc (attempt %d/%d): %s",
-                    attempt,
-                    self.DOWNLOAD_MAX_RETRIES,
-                    doc.filename,
-                )
-
-                headers = {
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                    "Accept": "application/pdf,application/msword,*/*",
-                }
-
-                async with session.get(doc.source_url, headers=headers) as response:
-                    if response.status == 200:
-                        safe_filename = self._sanitize_filename(doc.filename)
-                        file_path = storage_path / safe_filename
-
-                        content = await response.read()
-                        async with aiofiles.open(file_path, "wb") as f:
-                            await f.write(content)
-
-                        doc.file_path = str(file_path)
-                        doc.file_size = len(content)
-                        doc.checksum = self.compute_file_checksum(str(file_path))
-                        doc.downloaded_at = datetime.now(timezone.utc)
-
-                        logger.info("Downloaded: %s (%d bytes)", safe_filename, doc.file_size)
-                        return doc
-
-                    last_error = ScraperDownloadError(f"HTTP {response.status}")
-
-            except asyncio.TimeoutError:
-                last_error = ScraperDownloadError("Timeout")
-            except aiohttp.ClientError as e:
-                last_error = e
-            except Exception as e:
-                last_error = e
-                break
-
-            if attempt < self.DOWNLOAD_MAX_RETRIES:
-                await asyncio.sleep(self.DOWNLOAD_RETRY_DELAY_SECONDS)
-
-        logger.error("Failed to download %s: %s", doc.filename, last_error)
-        return None
-
     async def refresh(
         self, url: str, existing_checksum: str | None = None
     ) -> dict[str, Any]:
@@ -642,11 +540,3 @@ SAM.gov documents are often in a table or list format.
             return "qa_response"
         else:
             return "attachment"
-
-    def _sanitize_filename(self, filename: str) -> str:
-        """Sanitize filename."""
-        unsafe_chars = '<>:"/\\|?*'
-        safe_name = filename
-        for char in unsafe_chars:
-            safe_name = safe_name.replace(char, "_")
-        return safe_name.strip()
@@ -0,0 +1,184 @@
+"""
+Pool of warm Stagehand browser sessions shared by the scrapers.
+
+Starting a Browserbase (or local Chromium) session costs several seconds, and
+every scrape used to pay it. Sessions are now checked out from a per-platform
+pool and returned after use, so consecutive scrapes navigate an already
+running browser. The pool bounds the total number of sessions and the number
+used concurrently against any one domain, closes sessions that sit idle for
+too long, and retires a session after a number of uses or after any error.
+
+Sessions hold connections bound to the event loop that created them, so a
+pool belongs to one loop; ``get_browser_pool`` replaces it when called from a
+different loop (e.g. a Celery task running its own ``asyncio.run``).
+"""
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import urlparse
+
+from src.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+SessionFactory = Callable[[], Awaitable[Any]]
+
+
+@dataclass
+class _PooledSession:
+    session: Any
+    created_at: float
+    last_used: float
+    uses: int = 0
+
+
+class BrowserSessionPool:
+    """Reusable browser sessions with per-domain limits and idle eviction."""
+
+    def __init__(
+        self,
+        factory: SessionFactory,
+        max_sessions: int = 4,
+        per_domain_limit: int = 2,
+        idle_timeout: float = 300.0,
+        max_uses: int = 25,
+    ):
+        """
+        Args:
+            factory: Coroutine function that starts a session (must have ``close()``)
+            max_sessions: Sessions open at once, busy or idle
+            per_domain_limit: Sessions used concurrently against one domain
+            idle_timeout: Seconds an idle session is kept before it is closed
+            max_uses: Checkouts after which a session is replaced
+        """
+        self.factory = factory
+        self.max_sessions = max(1, max_sessions)
+        self.per_domain_limit = max(1, per_domain_limit)
+        self.idle_timeout = idle_timeout
+        self.max_uses = max_uses
+
+        self.loop = asyncio.get_running_loop()
+        self._slots = asyncio.Semaphore(self.max_sessions)
+        self._domain_limits: dict[str, asyncio.Semaphore] = {}
+        self._idle: list[_PooledSession] = []
+        self._reaper: asyncio.Task | None = None
+        self._closed = False
+        self.stats = {"created": 0, "reused": 0, "closed": 0}
+
+    @property
+    def idle_count(self) -> int:
+        return len(self._idle)
+
+    @asynccontextmanager
+    async def session(self, url: str, discard: bool = False) -> AsyncIterator[Any]:
+        """
+        Check out a session for work on ``url``.
+
+        Args:
+            url: Page the session will be used for; its domain is rate limited
+            discard: Close the session afterwards instead of returning it
+                (e.g. when closing it is what publishes its downloads)
+        """
+        if self._closed:
+            raise RuntimeError("Browser session pool is closed")
+
+        domain = urlparse(url).netloc.lower()
+        limit = self._domain_limits.setdefault(domain, asyncio.Semaphore(self.per_domain_limit))
+
+        async with limit, self._slots:
+            await self._evict_idle()
+            if self._idle:
+                pooled = self._idle.pop()
+                self.stats["reused"] += 1
+            else:
+                now = time.monotonic()
+                pooled = _PooledSession(await self.factory(), created_at=now, last_used=now)
+                self.stats["created"] += 1
+
+            healthy = False
+            try:
+                yield pooled.session
+                healthy = True
+            finally:
+                pooled.uses += 1
+                pooled.last_used = time.monotonic()
+                if discard or not healthy or self._closed or pooled.uses >= self.max_uses:
+                    await self._close(pooled)
+                else:
+                    self._idle.append(pooled)
+                    self._ensure_reaper()
+
+    async def close(self) -> None:
+        """Close every idle session and refuse further checkouts."""
+        self._closed = True
+        if self._reaper is not None:
+            self._reaper.cancel()
+            self._reaper = None
+        idle, self._idle = self._idle, []
+        for pooled in idle:
+            await self._close(pooled)
+
+    async def _evict_idle(self) -> None:
+        cutoff = time.monotonic() - self.idle_timeout
+        expired = [p for p in self._idle if p.last_used < cutoff]
+        if expired:
+            self._idle = [p for p in self._idle if p.last_used >= cutoff]
+            for pooled in expired:
+                await self._close(pooled)
+
+    def _ensure_reaper(self) -> None:
+        if self._reaper is None or self._reaper.done():
+            self._reaper = self.loop.create_task(self._reap())
+
+    async def _reap(self) -> None:
+        # Idle sessions are billed/hold a browser, so evict without waiting
+        # for the next checkout
+        while self._idle:
+            await asyncio.sleep(self.idle_timeout / 2)
+            await self._evict_idle()
+
+    async def _close(self, pooled: _PooledSession) -> None:
+        self.stats["closed"] += 1
+        try:
+            await pooled.session.close()
+        except Exception as e:
+            logger.warning("Error closing browser session: %s", e)
+
+
+_pools: dict[str, BrowserSessionPool] = {}
+
+
+def get_browser_pool(key: str, factory: SessionFactory) -> BrowserSessionPool:
+    """
+    Get the pool for ``key`` on the running event loop, creating it if needed.
+
+    Args:
+        key: Identifies sessions that are interchangeable (platform + account)
+        factory: Used to start sessions when the pool is created
+    """
+    loop = asyncio.get_running_loop()
+    pool = _pools.get(key)
+    if pool is None or pool.loop is not loop or pool.loop.is_closed():
+        config = settings.browser_pool
+        pool = BrowserSessionPool(
+            factory,
+            max_sessions=config.max_sessions,
+            per_domain_limit=config.per_domain_limit,
+            idle_timeout=config.idle_timeout_seconds,
+            max_uses=config.max_uses,
+        )
+        _pools[key] = pool
+    return pool
+
+
+async def close_browser_pools() -> None:
+    """Close the pools owned by the running event loop."""
+    loop = asyncio.get_running_loop()
+    for key, pool in list(_pools.items()):
+        if pool.loop is loop:
+            await pool.close()
+            del _pools[key]
@@ -6,10 +6,62 @@ Includes FEMA domestic preference detection and other federal compliance signals
 import logging
 import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Escapes that match one character class rather than a literal character
+_CLASS_ESCAPES = frozenset("sSdDwWbBAZ")
+
+
+def _literal_anchor(pattern: str) -> str:
+    """
+    Longest run of literal characters every match of ``pattern`` contains.
+
+    Covers the simple patterns used here (literals, escapes, classes and
+    quantifiers); patterns with groups or alternation get no anchor.
+    """
+    if "(" in pattern or "|" in pattern:
+        return ""
+    runs, run = [], ""
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\" and i + 1 < len(pattern):
+            escaped = pattern[i + 1]
+            i += 2
+            if escaped in _CLASS_ESCAPES or escaped.isalnum():
+                runs.append(run)
+                run = ""
+            else:
+                run += escaped
+            continue
+        if char in "?*{":
+            # The previous character is optional
+            run = run[:-1]
+            if char == "{":
+                i = pattern.index("}", i)
+            runs.append(run)
+            run = ""
+        elif char == "[":
+            runs.append(run)
+            run = ""
+            i = pattern.index("]", i + 2)
+        elif char in ".^$+":
+            runs.append(run)
+            run = "" if char != "+" else run[-1:]
+        else:
+            run += char
+        i += 1
+    runs.append(run)
+    return max(runs, key=len).lower()
+
+
+@lru_cache(maxsize=None)
+def _compile_signal_pattern(pattern: str) -> tuple[re.Pattern, str]:
+    return re.compile(pattern, re.IGNORECASE), _literal_anchor(pattern)
+
 
 @dataclass
 class ComplianceSignals:
@@ -197,10 +249,13 @@ class ComplianceSignalDetector:
 
     def _detect_patterns(self, text: str, patterns: list[str]) -> list[str]:
         """Detect patterns in text and return matches."""
+        lowered = text.lower()
         matches = []
         for pattern in patterns:
-            found = re.findall(pattern, text, re.IGNORECASE)
-            matches.extend(found)
+            regex, anchor = _compile_signal_pattern(pattern)
+            # A pattern can only match where its literal anchor occurs
+            if anchor in lowered:
+                matches.extend(regex.findall(text))
         return matches
 
     def _extract_domestic_preference_context(
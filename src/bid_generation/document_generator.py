@@ -3,11 +3,14 @@ Fixed Bid Document Generator for AI-powered RFP bid generation system.
 Integrates RAG, Compliance Matrix, and Pricing Engine outputs into structured bid documents.
 Supports Claude 4.5 with extended thinking mode for comprehensive proposal generation.
 """
+import asyncio
 import json
 import logging
 import os
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
@@ -20,8 +23,17 @@ import pandas as pd
 from src.config.paths import PathConfig
 from src.utils.category import determine_category
 
+from .section_scheduler import (
+    EventCallback,
+    SectionGenerationError,
+    SectionScheduler,
+    SectionTask,
+)
 from .visualizer import Visualizer
 
+# pyplot keeps global figure state, so charts are drawn one thread at a time
+_PLOT_LOCK = threading.Lock()
+
 
 class ProposalGenerationMode(Enum):
     """Mode for proposal content generation"""
@@ -38,6 +50,7 @@ class ProposalGenerationOptions:
     enable_thinking: bool = True
     thinking_budget: int = 10000
     enhance_sections: list | None = None  # None = enhance all sections
+    max_concurrent_sections: int = 4  # Sections generated in parallel
 
 
 class BidDocumentGenerator:
@@ -578,6 +591,22 @@ class BidDocumentGenerator:
         category = self._determine_category(rfp_data)
 
         # Generate visualizations based on actual RFP data
+        visuals = self._generate_technical_visuals(rfp_data, compliance_matrix)
+
+        # Try enhanced generation for methodology if available
+        methodology = self._generate_methodology_content(rfp_data, compliance_matrix, pricing_data, category)
+
+        return {
+            "methodology": methodology,
+            "project_management": self._generate_project_management_content(rfp_data, compliance_matrix),
+            "quality_assurance": self.content_library['standard_clauses']['technical_approach']['quality_assurance'],
+            "risk_management": self.content_library['standard_clauses']['technical_approach']['risk_management'],
+            **visuals,
+        }
+
+    def _generate_technical_visuals(self, rfp_data: dict[str, Any],
+                                    compliance_matrix: dict[str, Any]) -> dict[str, str]:
+        """Render the schedule and org charts, returning paths relative to the output dir."""
         # 1. Schedule - now uses RFP data
         schedule_tasks = self._generate_schedule_tasks(rfp_data)
         rfp_id = rfp_data.get('rfp_id', rfp_data.get('solicitation_number', 'temp'))
@@ -587,22 +616,17 @@ class BidDocumentGenerator:
             title = str(rfp_data.get('title', 'unknown'))
             rfp_id = hashlib.md5(title.encode()).hexdigest()[:16]
 
-        gantt_path = self.visualizer.generate_gantt_chart(schedule_tasks, f"schedule_{rfp_id}.png")
+        with _PLOT_LOCK:
+            gantt_path = self.visualizer.generate_gantt_chart(schedule_tasks, f"schedule_{rfp_id}.png")
         gantt_rel_path = os.path.relpath(gantt_path, self.output_dir) if gantt_path else ""
 
         # 2. Org Chart - now uses RFP data
         staff = self._generate_staff_structure(rfp_data, compliance_matrix)
-        org_path = self.visualizer.generate_org_chart(staff, f"org_{rfp_id}.png")
+        with _PLOT_LOCK:
+            org_path = self.visualizer.generate_org_chart(staff, f"org_{rfp_id}.png")
         org_rel_path = os.path.relpath(org_path, self.output_dir) if org_path else ""
 
-        # Try enhanced generation for methodology if available
-        methodology = self._generate_methodology_content(rfp_data, compliance_matrix, pricing_data, category)
-
         return {
-            "methodology": methodology,
-            "project_management": self._generate_project_management_content(rfp_data, compliance_matrix),
-            "quality_assurance": self.content_library['standard_clauses']['technical_approach']['quality_assurance'],
-            "risk_management": self.content_library['standard_clauses']['technical_approach']['risk_management'],
             "gantt_chart_path": gantt_rel_path,
             "org_chart_path": org_rel_path
         }
@@ -749,6 +773,9 @@ class BidDocumentGenerator:
         """
         Generate complete bid document integrating all pipeline components.
 
+        Blocking wrapper around agenerate_bid_document for scripts and other
+        synchronous callers.
+
         Args:
             rfp_data: RFP data dictionary
             generation_mode: Override the default generation mode
@@ -764,6 +791,61 @@ class BidDocumentGenerator:
         Returns:
             Complete bid document dictionary
         """
+        coro = self.agenerate_bid_document(
+            rfp_data,
+            generation_mode=generation_mode,
+            enable_thinking=enable_thinking,
+            qa_items=qa_items,
+            compliance_signals=compliance_signals,
+            document_content=document_content,
+        )
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+
+        # Called from inside an event loop: run on a private loop in a helper thread
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coro).result()
+
+    async def agenerate_bid_document(
+        self,
+        rfp_data: dict[str, Any],
+        generation_mode: ProposalGenerationMode | str | None = None,
+        enable_thinking: bool | None = None,
+        qa_items: list[dict[str, Any]] | None = None,
+        compliance_signals: dict[str, Any] | None = None,
+        document_content: dict[str, Any] | None = None,
+        completed_sections: dict[str, Any] | None = None,
+        on_section_event: EventCallback | None = None,
+    ) -> dict[str, Any]:
+        """
+        Generate a bid document, running independent sections concurrently.
+
+        Compliance matrix and pricing feed every narrative section, so they run
+        first; executive summary, methodology, management approach and the
+        schedule/org charts then run in parallel, bounded by
+        ``proposal_options.max_concurrent_sections``.
+
+        Args:
+            rfp_data: RFP data dictionary
+            generation_mode: Override the default generation mode
+            enable_thinking: Override thinking mode setting
+            qa_items: Q&A items from the RFP for context
+            compliance_signals: Detected compliance signals
+            document_content: Extracted text from RFP attachments
+            completed_sections: Checkpointed section results from an earlier
+                attempt; these sections are not generated again
+            on_section_event: Sync or async callback receiving a SectionEvent
+                as each section completes, fails or is reused
+
+        Returns:
+            Complete bid document dictionary
+
+        Raises:
+            SectionGenerationError: If any section failed. Completed sections
+                have already been reported through on_section_event.
+        """
         self.logger.info(f"Generating bid document for: {rfp_data.get('title', 'Unknown RFP')}")
         generation_start = time.time()
 
@@ -800,50 +882,36 @@ class BidDocumentGenerator:
             total_chars = document_content.get('total_chars', 0)
             self.logger.info(f"RFP attachments available: {doc_count} documents, {total_chars} chars")
 
-        # Step 1: Generate compliance matrix
-        compliance_matrix = None
-        if self.compliance_generator:
-            try:
-                compliance_matrix = self.compliance_generator.generate_compliance_matrix(rfp_data)
-                self.logger.info(f"Compliance matrix generated with {len(compliance_matrix['requirements_and_responses'])} requirements")
-            except Exception as e:
-                self.logger.error(f"Compliance matrix generation failed: {e}")
-                compliance_matrix = self._create_default_compliance_matrix()
-        else:
-            compliance_matrix = self._create_default_compliance_matrix()
-
-        # Step 2: Generate pricing
-        pricing_results = None
-        if self.pricing_engine:
-            try:
-                extracted_requirements = compliance_matrix.get('requirements_and_responses', [])
-                pricing_results = self.pricing_engine.compare_strategies(rfp_data, extracted_requirements)
-                self.logger.info(f"Pricing analysis completed with {len(pricing_results)} strategies")
-            except Exception as e:
-                self.logger.error(f"Pricing generation failed: {e}")
-                pricing_results = self._create_default_pricing(rfp_data)
-        else:
-            pricing_results = self._create_default_pricing(rfp_data)
-
-        # Step 3: Generate content sections with Claude enhancement if available
-        formatted_pricing = self._format_pricing_for_document(pricing_results)
-
-        executive_summary = self._generate_executive_summary(
-            rfp_data,
-            compliance_matrix['compliance_summary'],
-            list(pricing_results.values())[0] if pricing_results else None,
-            compliance_matrix  # Pass full compliance matrix for enhanced generation
+        scheduler = SectionScheduler(
+            self._build_section_tasks(rfp_data),
+            max_concurrency=self.proposal_options.max_concurrent_sections,
+            on_event=on_section_event,
         )
+        run = await scheduler.run(completed=completed_sections)
+        if not run.succeeded:
+            raise SectionGenerationError(run)
+        if run.reused:
+            self.logger.info(f"Reused checkpointed sections: {run.reused}")
+
+        sections = run.results
+        compliance_matrix = sections["compliance_matrix"]
+        pricing_results = sections["pricing"]
+        formatted_pricing = self._format_pricing_for_document(pricing_results)
+        executive_summary = sections["executive_summary"]
+        technical_approach = {
+            "methodology": sections["methodology"],
+            "project_management": sections["project_management"],
+            "quality_assurance": self.content_library['standard_clauses']['technical_approach']['quality_assurance'],
+            "risk_management": self.content_library['standard_clauses']['technical_approach']['risk_management'],
+            **sections["visuals"],
+        }
 
-        technical_approach = self._generate_technical_approach(
-            rfp_data, compliance_matrix, formatted_pricing
-        )
-        # Step 4: Create document content
+        # Create document content
         document_content = self._create_document_content(
             rfp_data, executive_summary, technical_approach,
             formatted_pricing, compliance_matrix
         )
-        # Step 5: Create bid document package
+        # Create bid document package
         bid_document = {
             "rfp_info": {
                 "title": rfp_data.get('title', 'Government Contract'),
@@ -880,10 +948,78 @@ class BidDocumentGenerator:
                     "requirements_addressed": len(compliance_matrix.get('requirements_and_responses', [])),
                     "pricing_strategies_analyzed": len(pricing_results) if pricing_results else 0
                 },
+                "sections_reused": run.reused,
                 "generation_time_seconds": time.time() - generation_start
             }
         }
         return bid_document
+
+    def _build_section_tasks(self, rfp_data: dict[str, Any]) -> list[SectionTask]:
+        """Describe the section DAG for one bid document."""
+
+        def compliance(_deps: dict[str, Any]) -> dict[str, Any]:
+            return self._generate_compliance_matrix(rfp_data)
+
+        def pricing(deps: dict[str, Any]) -> dict[str, Any]:
+            return self._generate_pricing(rfp_data, deps["compliance_matrix"])
+
+        def executive_summary(deps: dict[str, Any]) -> str:
+            compliance_matrix = deps["compliance_matrix"]
+            pricing_results = deps["pricing"]
+            return self._generate_executive_summary(
+                rfp_data,
+                compliance_matrix['compliance_summary'],
+                list(pricing_results.values())[0] if pricing_results else None,
+                compliance_matrix  # Pass full compliance matrix for enhanced generation
+            )
+
+        def methodology(deps: dict[str, Any]) -> str:
+            return self._generate_methodology_content(
+                rfp_data,
+                deps["compliance_matrix"],
+                self._format_pricing_for_document(deps["pricing"]),
+                self._determine_category(rfp_data),
+            )
+
+        def project_management(deps: dict[str, Any]) -> str:
+            return self._generate_project_management_content(rfp_data, deps["compliance_matrix"])
+
+        def visuals(deps: dict[str, Any]) -> dict[str, str]:
+            return self._generate_technical_visuals(rfp_data, deps["compliance_matrix"])
+
+        return [
+            SectionTask("compliance_matrix", compliance, checkpoint=True),
+            SectionTask("pricing", pricing, depends_on=("compliance_matrix",)),
+            SectionTask("executive_summary", executive_summary, depends_on=("compliance_matrix", "pricing"), checkpoint=True),
+            SectionTask("methodology", methodology, depends_on=("compliance_matrix", "pricing"), checkpoint=True),
+            SectionTask("project_management", project_management, depends_on=("compliance_matrix",), checkpoint=True),
+            SectionTask("visuals", visuals, depends_on=("compliance_matrix",)),
+        ]
+
+    def _generate_compliance_matrix(self, rfp_data: dict[str, Any]) -> dict[str, Any]:
+        """Generate the compliance matrix, falling back to the default matrix."""
+        if not self.compliance_generator:
+            return self._create_default_compliance_matrix()
+        try:
+            compliance_matrix = self.compliance_generator.generate_compliance_matrix(rfp_data)
+            self.logger.info(f"Compliance matrix generated with {len(compliance_matrix['requirements_and_responses'])} requirements")
+            return compliance_matrix
+        except Exception as e:
+            self.logger.error(f"Compliance matrix generation failed: {e}")
+            return self._create_default_compliance_matrix()
+
+    def _generate_pricing(self, rfp_data: dict[str, Any], compliance_matrix: dict[str, Any]) -> dict[str, Any]:
+        """Compare pricing strategies, falling back to default pricing."""
+        if not self.pricing_engine:
+            return self._create_default_pricing(rfp_data)
+        try:
+            extracted_requirements = compliance_matrix.get('requirements_and_responses', [])
+            pricing_results = self.pricing_engine.compare_strategies(rfp_data, extracted_requirements)
+            self.logger.info(f"Pricing analysis completed with {len(pricing_results)} strategies")
+            return pricing_results
+        except Exception as e:
+            self.logger.error(f"Pricing generation failed: {e}")
+            return self._create_default_pricing(rfp_data)
     def _create_document_content(self, rfp_data: dict[str, Any], executive_summary: str,
                                technical_approach: dict[str, str], pricing: dict[str, Any],
                                compliance_matrix: dict[str, Any]) -> str:
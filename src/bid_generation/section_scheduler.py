@@ -0,0 +1,178 @@
+"""
+Dependency-aware scheduler for proposal section generation.
+
+Each section is a node in a small DAG. Nodes whose dependencies are satisfied
+run concurrently, bounded by a semaphore, in worker threads (the section
+generators are blocking LLM/template calls). Results of nodes completed in an
+earlier attempt can be passed back in, so a retry only runs what is missing.
+"""
+import asyncio
+import inspect
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SectionTask:
+    """A unit of work in the section DAG."""
+    name: str
+    # Receives the results of its dependencies keyed by section name
+    func: Callable[[dict[str, Any]], Any]
+    depends_on: tuple[str, ...] = ()
+    # Result is JSON-safe and worth persisting so retries can reuse it
+    checkpoint: bool = False
+
+
+@dataclass
+class SectionEvent:
+    """Progress notification emitted as sections finish."""
+    name: str
+    status: str  # completed, reused, failed, skipped
+    completed: int
+    total: int
+    result: Any = None
+    error: str | None = None
+    checkpoint: bool = False
+
+
+@dataclass
+class SectionRunResult:
+    """Outcome of a scheduler run."""
+    results: dict[str, Any] = field(default_factory=dict)
+    failed: dict[str, str] = field(default_factory=dict)
+    skipped: list[str] = field(default_factory=list)
+    reused: list[str] = field(default_factory=list)
+
+    @property
+    def succeeded(self) -> bool:
+        return not self.failed and not self.skipped
+
+
+class SectionGenerationError(Exception):
+    """Raised when one or more sections could not be generated."""
+
+    def __init__(self, run: SectionRunResult):
+        self.run = run
+        failed = ", ".join(f"{name}: {error}" for name, error in run.failed.items())
+        super().__init__(f"Section generation failed ({failed})")
+
+
+EventCallback = Callable[[SectionEvent], Awaitable[None] | None]
+
+
+class SectionScheduler:
+    """Run a DAG of SectionTasks with bounded concurrency."""
+
+    def __init__(
+        self,
+        tasks: list[SectionTask],
+        max_concurrency: int = 4,
+        on_event: EventCallback | None = None,
+    ):
+        self.tasks = {task.name: task for task in tasks}
+        if len(self.tasks) != len(tasks):
+            raise ValueError("Section names must be unique")
+        self.order = self._topological_order()
+        self.max_concurrency = max(1, max_concurrency)
+        self.on_event = on_event
+
+    def _topological_order(self) -> list[str]:
+        order: list[str] = []
+        state: dict[str, str] = {}
+
+        def visit(name: str) -> None:
+            if state.get(name) == "done":
+                return
+            if state.get(name) == "visiting":
+                raise ValueError(f"Dependency cycle at section '{name}'")
+            state[name] = "visiting"
+            for dep in self.tasks[name].depends_on:
+                if dep not in self.tasks:
+                    raise ValueError(f"Section '{name}' depends on unknown section '{dep}'")
+                visit(dep)
+            state[name] = "done"
+            order.append(name)
+
+        for name in self.tasks:
+            visit(name)
+        return order
+
+    async def _emit(self, event: SectionEvent) -> None:
+        if not self.on_event:
+            return
+        try:
+            outcome = self.on_event(event)
+            if inspect.isawaitable(outcome):
+                await outcome
+        except Exception as e:
+            logger.warning(f"Section event callback failed for {event.name}: {e}")
+
+    async def _run_task(self, task: SectionTask, inputs: dict[str, Any], semaphore: asyncio.Semaphore) -> Any:
+        async with semaphore:
+            return await asyncio.to_thread(task.func, inputs)
+
+    async def run(self, completed: dict[str, Any] | None = None) -> SectionRunResult:
+        """
+        Run every section not already present in ``completed``.
+
+        Args:
+            completed: Results from a previous attempt, keyed by section name
+
+        Returns:
+            SectionRunResult with results, failures and sections skipped
+            because a dependency failed
+        """
+        run = SectionRunResult()
+        total = len(self.order)
+
+        for name in self.order:
+            if completed and name in completed:
+                run.results[name] = completed[name]
+                run.reused.append(name)
+                await self._emit(SectionEvent(name, "reused", len(run.results), total))
+
+        pending = [name for name in self.order if name not in run.results]
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        running: dict[asyncio.Task, str] = {}
+
+        while pending or running:
+            for name in list(pending):
+                deps = self.tasks[name].depends_on
+                if any(dep in run.failed or dep in run.skipped for dep in deps):
+                    pending.remove(name)
+                    run.skipped.append(name)
+                    await self._emit(SectionEvent(name, "skipped", len(run.results), total))
+                elif all(dep in run.results for dep in deps):
+                    pending.remove(name)
+                    inputs = {dep: run.results[dep] for dep in deps}
+                    task = asyncio.create_task(self._run_task(self.tasks[name], inputs, semaphore))
+                    running[task] = name
+
+            if not running:
+                # Only reachable when everything left was skipped above
+                continue
+
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                name = running.pop(task)
+                error = task.exception()
+                if error is not None:
+                    logger.error(f"Section '{name}' failed: {error}")
+                    run.failed[name] = str(error)
+                    await self._emit(SectionEvent(name, "failed", len(run.results), total, error=str(error)))
+                else:
+                    run.results[name] = task.result()
+                    await self._emit(SectionEvent(
+                        name,
+                        "completed",
+                        len(run.results),
+                        total,
+                        result=run.results[name],
+                        checkpoint=self.tasks[name].checkpoint,
+                    ))
+
+        return run
@@ -8,6 +8,8 @@ from typing import Any
 
 import pandas as pd
 
+from src.compliance.dedup import RequirementDedupIndex
+
 # Import path configuration
 from src.config.paths import PathConfig
 
@@ -87,8 +89,10 @@ class ComplianceChecklistGenerator:
         compliance_matrix = bid_document_content.get("sections", {}).get(
             "compliance_matrix", {}
         )
-        requirements_and_responses = compliance_matrix.get(
-            "requirements_and_responses", []
+        # Matrices merged from several extractions repeat requirements
+        requirements_and_responses = RequirementDedupIndex(min_length=0).filter(
+            compliance_matrix.get("requirements_and_responses", []),
+            text_key="requirement_text",
         )
 
         for i, req in enumerate(requirements_and_responses):
@@ -111,8 +115,10 @@ class ComplianceChecklistGenerator:
             "technical_approach", {}
         )
 
-        extracted_tasks = self._extract_tasks_from_technical_approach(
-            technical_approach
+        # The same task is often listed both as a bullet and a numbered item
+        extracted_tasks = RequirementDedupIndex(min_length=0).filter(
+            self._extract_tasks_from_technical_approach(technical_approach),
+            text_key="description",
         )
 
         # Fallback to common post-award tasks if nothing extracted
@@ -7,13 +7,57 @@ import logging
 import os
 import re
 import sys
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
 import pandas as pd
 
+from src.compliance.dedup import RequirementDedupIndex, deduplicate_requirements
+from src.compliance.matrix_cache import get_matrix_cache, matrix_cache_key
 from src.config.paths import PathConfig
 from src.utils.config_loader import load_or_create_config
+from src.utils.keyword_classifier import KeywordClassifier
+
+_DOCUMENT_MARKER = re.compile(r'===\s*Document:\s*([^=]+)\s*===')
+_PAGE_MARKER = re.compile(r'\[Page\s+(\d+)\]', re.IGNORECASE)
+_SENTENCE_END = re.compile(r'[.!?]+')
+
+# Words that make a sentence a requirement for the heuristic (LLM placeholder) path
+_REQUIREMENT_INDICATORS = frozenset([
+    'must', 'shall', 'required', 'mandatory', 'essential',
+    'minimum', 'maximum', 'specification', 'standard',
+    'provide', 'submit', 'include', 'demonstrate'
+])
+_MANDATORY_WORDS = frozenset(['must', 'shall', 'required', 'mandatory'])
+# Requirement categories, checked in order; unmatched requirements are 'general'
+_REQUIREMENT_CATEGORIES = KeywordClassifier({
+    'technical': ['technical', 'specification', 'system', 'software', 'hardware'],
+    'financial': ['cost', 'price', 'budget', 'financial', 'payment'],
+    'qualification': ['experience', 'qualification', 'certification', 'licensed'],
+    'performance': ['performance', 'metric', 'kpi', 'delivery', 'timeline'],
+    'security': ['security', 'clearance', 'confidential', 'classified'],
+    'legal': ['legal', 'regulation', 'compliance', 'law'],
+    'administrative': ['submit', 'format', 'deadline', 'administrative'],
+})
+# Pseudo pattern-group index for keywords only the heuristic path uses
+_HEURISTIC_ONLY = -1
+_DESCRIPTION_SOURCE = "RFP Description"
+_QA_SOURCE = "Q&A Responses"
+# Part of the matrix cache key; bump when extraction or responses change
+GENERATOR_VERSION = "1.1.0"
+
+
+@dataclass
+class RequirementSentence:
+    """A sentence containing requirement keywords, with where it came from."""
+    text: str
+    source_document: str
+    source_section: str | None
+    source_page: int | None
+    # (pattern group index, offset in text, lowercased keyword) per keyword match
+    hits: list[tuple[int, int, str]] = field(default_factory=list)
 
 
 class ComplianceMatrixGenerator:
@@ -26,7 +70,8 @@ class ComplianceMatrixGenerator:
         rag_engine=None,
         llm_config=None,
         output_dir: str | None = None,
-        templates_dir: str | None = None
+        templates_dir: str | None = None,
+        use_cache: bool = True
     ):
         """
         Initialize compliance matrix generator.
@@ -35,6 +80,7 @@ class ComplianceMatrixGenerator:
             llm_config: LLM configuration for requirement extraction
             output_dir: Directory for compliance matrix outputs (defaults to PathConfig)
             templates_dir: Directory for response templates (defaults to PathConfig)
+            use_cache: Reuse matrices generated before for the same input (kept under output_dir/cache)
         """
         # Ensure PathConfig directories are initialized
         PathConfig.ensure_directories()
@@ -50,8 +96,13 @@ class ComplianceMatrixGenerator:
         self.logger = logging.getLogger(__name__)
         # Load response templates
         self.response_templates = self._load_response_templates()
-        # Requirement extraction patterns
+        # Requirement extraction patterns, compiled into one alternation
         self.requirement_patterns = self._get_requirement_patterns()
+        self._keyword_regex, self._keyword_groups = self._compile_requirement_patterns()
+        # Last scanned text, shared by the rule-based and heuristic paths
+        self._last_scan: tuple[str, list[RequirementSentence]] | None = None
+        self.matrix_cache = get_matrix_cache(os.path.join(self.output_dir, "cache")) if use_cache else None
+        self._config_hash = matrix_cache_key(self.requirement_patterns, self.response_templates)
     def _load_response_templates(self) -> dict[str, Any]:
         """Load or create response templates for common compliance items."""
         templates_path = os.path.join(self.templates_dir, "compliance_response_templates.json")
@@ -83,126 +134,204 @@ class ComplianceMatrixGenerator:
         }
         return load_or_create_config(templates_path, default_templates)
     def _get_requirement_patterns(self) -> list[dict[str, Any]]:
-        """Define patterns for extracting requirements from RFP text."""
+        """
+        Define keyword patterns for extracting requirements from RFP text.
+        A match marks the start of a requirement, which runs to the end of its sentence.
+        Earlier groups take precedence when a sentence matches several.
+        """
         return [
             {
                 "name": "mandatory_requirements",
                 "patterns": [
-                    r"(?i)\b(?:must|shall|required|mandatory|essential)\b.*?(?:[.!?]|\n)",
-                    r"(?i)(?:requirement|specification|standard).*?(?:[.!?]|\n)",
-                    r"(?i)\b(?:minimum|maximum)\b.*?(?:[.!?]|\n)"
+                    r"\b(?:must|shall|required|mandatory|essential)\b",
+                    r"(?:requirement|specification|standard)",
+                    r"\b(?:minimum|maximum)\b"
                 ],
                 "category": "mandatory"
             },
             {
                 "name": "technical_specifications",
                 "patterns": [
-                    r"(?i)(?:technical|specification|standard|protocol).*?(?:[.!?]|\n)",
-                    r"(?i)(?:system|software|hardware|equipment).*?(?:[.!?]|\n)",
-                    r"(?i)(?:capability|feature|function).*?(?:[.!?]|\n)"
+                    r"(?:technical|specification|standard|protocol)",
+                    r"(?:system|software|hardware|equipment)",
+                    r"(?:capability|feature|function)"
                 ],
                 "category": "technical"
             },
             {
                 "name": "submission_requirements",
                 "patterns": [
-                    r"(?i)(?:submit|provide|include|attach).*?(?:[.!?]|\n)",
-                    r"(?i)(?:deadline|due date|submission date).*?(?:[.!?]|\n)",
-                    r"(?i)(?:format|template|structure).*?(?:[.!?]|\n)"
+                    r"(?:submit|provide|include|attach)",
+                    r"(?:deadline|due date|submission date)",
+                    r"(?:format|template|structure)"
                 ],
                 "category": "administrative"
             },
             {
                 "name": "qualification_requirements",
                 "patterns": [
-                    r"(?i)(?:experience|qualification|certification).*?(?:[.!?]|\n)",
-                    r"(?i)(?:years?\s+of|minimum.*experience).*?(?:[.!?]|\n)",
-                    r"(?i)(?:licensed|certified|qualified).*?(?:[.!?]|\n)"
+                    r"(?:experience|qualification|certification)",
+                    r"(?:years?\s+of|minimum.*?experience)",
+                    r"(?:licensed|certified|qualified)"
                 ],
                 "category": "qualification"
             },
             {
                 "name": "performance_requirements",
                 "patterns": [
-                    r"(?i)(?:performance|metric|kpi|target).*?(?:[.!?]|\n)",
-                    r"(?i)(?:delivery time|timeline|schedule).*?(?:[.!?]|\n)",
-                    r"(?i)(?:sla|service level|availability).*?(?:[.!?]|\n)"
+                    r"(?:performance|metric|kpi|target)",
+                    r"(?:delivery time|timeline|schedule)",
+                    r"(?:sla|service level|availability)"
                 ],
                 "category": "performance"
             }
         ]
-    def extract_requirements_rule_based(self, rfp_text: str, document_sources: list[str] | None = None) -> list[dict[str, Any]]:
+    def _compile_requirement_patterns(self) -> tuple[re.Pattern, dict[str, int]]:
+        """Combine every pattern into one regex; named groups map back to pattern groups."""
+        alternatives = []
+        groups = {}
+        for group_index, pattern_group in enumerate(self.requirement_patterns):
+            for pattern_index, pattern in enumerate(pattern_group["patterns"]):
+                name = f"g{group_index}_{pattern_index}"
+                alternatives.append(f"(?P<{name}>{pattern})")
+                groups[name] = group_index
+        # Indicator the heuristic path needs that no pattern group covers
+        alternatives.append(r"(?P<heuristic>demonstrate)")
+        groups["heuristic"] = _HEURISTIC_ONLY
+        # Keywords start at a word boundary ("sla" must not match inside "legislation");
+        # this also lets the engine skip most positions without trying every alternative
+        return re.compile(r"\b(?:" + "|".join(alternatives) + ")", re.IGNORECASE), groups
+    def _scan_requirement_sentences(self, rfp_text: str) -> list[RequirementSentence]:
         """
-        Extract requirements using rule-based pattern matching.
-        Args:
-            rfp_text: RFP description text
-            document_sources: List of document filenames that were included in the text
-        Returns:
-            List of extracted requirements with metadata including source tracking
+        Split text into sentences in one pass, tracking document, section and page,
+        and record the requirement keywords each sentence contains.
+        Sentences without keywords are dropped. The result for the last text is reused.
         """
-        requirements = []
-        if not rfp_text or not isinstance(rfp_text, str):
-            return requirements
+        if self._last_scan is not None and self._last_scan[0] == rfp_text:
+            return self._last_scan[1]
 
-        # Track which document/section we're in
-        current_source_doc = "RFP Description"
+        sentences: list[RequirementSentence] = []
+        keyword_regex = self._keyword_regex
+        keyword_groups = self._keyword_groups
+
+        current_source_doc = _DESCRIPTION_SOURCE
         current_section = None
         page_number = None
+        buffer: list[str] = []
+        start_section, start_page = None, None
 
-        # Split into sections based on document markers
-        sections = re.split(r'===\s*Document:\s*([^=]+)\s*===', rfp_text)
-
-        for i in range(0, len(sections)):
-            section = sections[i].strip()
+        def flush() -> None:
+            text = " ".join(buffer).strip()
+            buffer.clear()
+            if not text:
+                return
+            hits = [
+                (keyword_groups[m.lastgroup], m.start(), m.group().lower())
+                for m in keyword_regex.finditer(text)
+            ]
+            if hits:
+                sentences.append(RequirementSentence(
+                    text=text,
+                    source_document=current_source_doc,
+                    source_section=start_section,
+                    source_page=start_page,
+                    hits=hits
+                ))
 
-            # Check if this is a document name
-            if i > 0 and i % 2 == 1:  # Odd indices are document names after split
-                current_source_doc = section.strip()
-                continue
+        def append(fragment: str) -> None:
+            nonlocal start_section, start_page
+            if not buffer:
+                start_section, start_page = current_section, page_number
+            buffer.append(fragment)
 
-            if not section:
+        # Document markers split the text; odd indices are document names
+        parts = _DOCUMENT_MARKER.split(rfp_text)
+        for i, part in enumerate(parts):
+            if i % 2 == 1:
+                flush()
+                current_source_doc = part.strip()
                 continue
 
-            # Extract section headers and page markers
-            lines = section.split('\n')
-            for line in lines:
+            for line in part.split('\n'):
                 line = line.strip()
+                if not line:
+                    continue
 
-                # Detect section headers
+                # Detect page markers [Page N]
+                page_matches = _PAGE_MARKER.findall(line)
+                if page_matches:
+                    page_number = int(page_matches[-1])
+                    line = _PAGE_MARKER.sub(' ', line).strip()
+                    if not line:
+                        continue
+
+                # Section headers (end with a colon or ALL CAPS) stand alone
                 if len(line) > 3 and (line.endswith(':') or (line.isupper() and len(line.split()) <= 10)):
+                    flush()
                     current_section = line.rstrip(':')
+                    append(line)
+                    flush()
+                    continue
 
-                # Detect page markers [Page N]
-                page_match = re.search(r'\[Page\s+(\d+)\]', line, re.IGNORECASE)
-                if page_match:
-                    page_number = int(page_match.group(1))
+                # Sentences may continue onto the next line
+                position = 0
+                for end in _SENTENCE_END.finditer(line):
+                    append(line[position:end.end()])
+                    flush()
+                    position = end.end()
+                if position < len(line):
+                    append(line[position:])
+            flush()
 
-            # Clean text for pattern matching
-            clean_text = re.sub(r'\s+', ' ', section.strip())
+        self._last_scan = (rfp_text, sentences)
+        return sentences
+    def extract_requirements_rule_based(
+        self,
+        rfp_text: str,
+        document_sources: list[str] | None = None,
+        dedup_index: RequirementDedupIndex | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Extract requirements using rule-based pattern matching.
+        Args:
+            rfp_text: RFP description text
+            document_sources: List of document filenames that were included in the text
+            dedup_index: Index to deduplicate into; the kept requirements stay in it
+        Returns:
+            List of extracted requirements with metadata including source tracking
+        """
+        requirements = []
+        if not rfp_text or not isinstance(rfp_text, str):
+            return requirements
 
-            # Apply patterns
-            for pattern_group in self.requirement_patterns:
-                for pattern in pattern_group["patterns"]:
-                    matches = re.findall(pattern, clean_text, re.MULTILINE | re.DOTALL)
-                    for match in matches:
-                        if len(match.strip()) > 20:  # Filter out very short matches
-                            requirement = {
-                                "id": f"req_{len(requirements) + 1}",
-                                "text": match.strip(),
-                                "category": pattern_group["category"],
-                                "extraction_method": "rule_based",
-                                "pattern_type": pattern_group["name"],
-                                "mandatory": pattern_group["category"] == "mandatory",
-                                "confidence": 0.7,  # Rule-based confidence
-                                "source_document": current_source_doc,
-                                "source_section": current_section,
-                                "source_page": page_number
-                            }
-                            requirements.append(requirement)
+        for sentence in self._scan_requirement_sentences(rfp_text):
+            rule_hits = [hit for hit in sentence.hits if hit[0] != _HEURISTIC_ONLY]
+            if not rule_hits:
+                continue
+            # Highest-priority group, earliest keyword; the requirement runs to the sentence end
+            group_index, start, _keyword = min(rule_hits)
+            text = sentence.text[start:].strip()
+            if len(text) <= 20:  # Filter out very short matches
+                continue
+            pattern_group = self.requirement_patterns[group_index]
+            requirement = {
+                "id": f"req_{len(requirements) + 1}",
+                "text": text,
+                "category": pattern_group["category"],
+                "extraction_method": "rule_based",
+                "pattern_type": pattern_group["name"],
+                "mandatory": pattern_group["category"] == "mandatory",
+                "confidence": 0.7,  # Rule-based confidence
+                "source_document": sentence.source_document,
+                "source_section": sentence.source_section,
+                "source_page": sentence.source_page
+            }
+            requirements.append(requirement)
 
         # Remove duplicates and very similar requirements
-        requirements = self._deduplicate_requirements(requirements)
-        return requirements
+        if dedup_index is not None:
+            return dedup_index.filter(requirements)
+        return self._deduplicate_requirements(requirements)
     def extract_requirements_llm(self, rfp_text: str, document_sources: list[str] | None = None) -> list[dict[str, Any]]:
         """
         Extract requirements using LLM-based analysis.
@@ -217,111 +346,97 @@ class ComplianceMatrixGenerator:
         # Placeholder LLM-based extraction
         # In a real implementation, this would call an LLM API
         requirements = []
-        # For now, use enhanced rule-based extraction with LLM-style analysis
-
-        # Track which section we're in by detecting document markers
-        current_source_doc = "RFP Description"
-        current_section = None
-        page_number = None
-
-        # Split into sections based on document markers
-        sections = re.split(r'===\s*Document:\s*([^=]+)\s*===', rfp_text)
-
-        for i in range(0, len(sections)):
-            section = sections[i].strip()
+        if not rfp_text or not isinstance(rfp_text, str):
+            return requirements
+        # For now, use enhanced rule-based extraction with LLM-style analysis,
+        # reusing the sentence scan of the rule-based path
 
-            # Check if this is a document name
-            if i > 0 and i % 2 == 1:  # Odd indices are document names after split
-                current_source_doc = section.strip()
+        for sentence in self._scan_requirement_sentences(rfp_text):
+            text = sentence.text.rstrip('.!?').strip()
+            if len(text) < 30:  # Skip very short sentences
                 continue
 
-            if not section:
+            # LLM-style requirement detection
+            keywords = {keyword for _group, _start, keyword in sentence.hits}
+            if not keywords & _REQUIREMENT_INDICATORS:
                 continue
 
-            # Extract section headers (lines that end with colon or are ALL CAPS)
-            lines = section.split('\n')
-            for line_idx, line in enumerate(lines):
-                line = line.strip()
-
-                # Detect section headers
-                if len(line) > 3 and (line.endswith(':') or (line.isupper() and len(line.split()) <= 10)):
-                    current_section = line.rstrip(':')
-
-                # Detect page markers [Page N]
-                page_match = re.search(r'\[Page\s+(\d+)\]', line, re.IGNORECASE)
-                if page_match:
-                    page_number = int(page_match.group(1))
-
-            # Now extract requirements from sentences
-            sentences = re.split(r'[.!?]+', section)
-            for _j, sentence in enumerate(sentences):
-                sentence = sentence.strip()
-                if len(sentence) < 30:  # Skip very short sentences
-                    continue
-
-                # LLM-style requirement detection
-                requirement_indicators = [
-                    'must', 'shall', 'required', 'mandatory', 'essential',
-                    'minimum', 'maximum', 'specification', 'standard',
-                    'provide', 'submit', 'include', 'demonstrate'
-                ]
-                if any(indicator in sentence.lower() for indicator in requirement_indicators):
-                    # Determine category based on content
-                    category = self._categorize_requirement(sentence)
-                    requirement = {
-                        "id": f"llm_req_{len(requirements) + 1}",
-                        "text": sentence,
-                        "category": category,
-                        "extraction_method": "llm_based",
-                        "mandatory": any(word in sentence.lower() for word in ['must', 'shall', 'required', 'mandatory']),
-                        "confidence": 0.8,  # Higher confidence for LLM-based
-                        "source_document": current_source_doc,
-                        "source_section": current_section,
-                        "source_page": page_number
-                    }
-                    requirements.append(requirement)
+            # Determine category based on content
+            category = self._categorize_requirement(text)
+            requirement = {
+                "id": f"llm_req_{len(requirements) + 1}",
+                "text": text,
+                "category": category,
+                "extraction_method": "llm_based",
+                "mandatory": bool(keywords & _MANDATORY_WORDS),
+                "confidence": 0.8,  # Higher confidence for LLM-based
+                "source_document": sentence.source_document,
+                "source_section": sentence.source_section,
+                "source_page": sentence.source_page
+            }
+            requirements.append(requirement)
 
         return requirements
+    @staticmethod
+    def document_sources(rfp_data: dict[str, Any]) -> list[tuple[str, str]]:
+        """
+        (source name, text) pairs to analyze: the description, the Q&A in
+        ``rfp_data['qa_items']`` (dicts with 'question_text' and 'answer_text'),
+        then every attachment in ``rfp_data['documents']`` (dicts with 'filename'
+        and 'content').
+        """
+        rfp_text = rfp_data.get('description', '')
+        if not rfp_text:
+            rfp_text = rfp_data.get('title', '') + ' ' + rfp_data.get('agency', '')
+        sources = [(_DESCRIPTION_SOURCE, rfp_text)]
+        qa_text = "\n".join(
+            f"Q: {qa.get('question_text')}\nA: {qa.get('answer_text') or 'No answer'}"
+            for qa in rfp_data.get('qa_items') or []
+        )
+        if qa_text:
+            sources.append((_QA_SOURCE, qa_text))
+        for document in rfp_data.get('documents') or []:
+            if document.get('content'):
+                sources.append((document.get('filename') or 'Attachment', document['content']))
+        return sources
+    def iter_requirements(
+        self,
+        sources: Iterable[tuple[str, str]],
+        dedup_index: RequirementDedupIndex | None = None,
+    ) -> Iterator[tuple[str, list[dict[str, Any]]]]:
+        """
+        Extract requirements source by source.
+        Each source is analyzed as its own document, rule-based first, and only
+        requirements that are new to ``dedup_index`` are kept, so nothing is
+        repeated across attachments. Sources may be a lazy iterable.
+        Args:
+            sources: (source name, text) pairs
+            dedup_index: Index of requirements already known, e.g. saved earlier
+        Yields:
+            (source name, new requirements of that source)
+        """
+        if dedup_index is None:
+            dedup_index = RequirementDedupIndex()
+        counts = {"rule_based": 0, "llm_based": 0}
+        for name, text in sources:
+            if name != _DESCRIPTION_SOURCE:
+                text = f"=== Document: {name} ===\n{text}"
+            requirements = self.extract_requirements_rule_based(text, dedup_index=dedup_index)
+            requirements += dedup_index.filter(self.extract_requirements_llm(text))
+            # Ids restart per extraction call; number them across sources
+            for requirement in requirements:
+                method = requirement["extraction_method"]
+                counts[method] += 1
+                prefix = "req" if method == "rule_based" else "llm_req"
+                requirement["id"] = f"{prefix}_{counts[method]}"
+            yield name, requirements
     def _categorize_requirement(self, text: str) -> str:
         """Categorize a requirement based on its content."""
-        text_lower = text.lower()
-        if any(word in text_lower for word in ['technical', 'specification', 'system', 'software', 'hardware']):
-            return 'technical'
-        elif any(word in text_lower for word in ['cost', 'price', 'budget', 'financial', 'payment']):
-            return 'financial'
-        elif any(word in text_lower for word in ['experience', 'qualification', 'certification', 'licensed']):
-            return 'qualification'
-        elif any(word in text_lower for word in ['performance', 'metric', 'kpi', 'delivery', 'timeline']):
-            return 'performance'
-        elif any(word in text_lower for word in ['security', 'clearance', 'confidential', 'classified']):
-            return 'security'
-        elif any(word in text_lower for word in ['legal', 'regulation', 'compliance', 'law']):
-            return 'legal'
-        elif any(word in text_lower for word in ['submit', 'format', 'deadline', 'administrative']):
-            return 'administrative'
-        else:
-            return 'general'
+        return _REQUIREMENT_CATEGORIES.first(text, 'general')
+
     def _deduplicate_requirements(self, requirements: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """Remove duplicate and very similar requirements."""
-        if not requirements:
-            return requirements
-        # Simple deduplication based on text similarity
-        unique_requirements = []
-        seen_texts = set()
-        for req in requirements:
-            # Normalize text for comparison
-            normalized_text = re.sub(r'\s+', ' ', req['text'].lower().strip())
-            # Check if we've seen very similar text
-            is_duplicate = False
-            for seen_text in seen_texts:
-                # Simple similarity check - could be enhanced with more sophisticated methods
-                if len(set(normalized_text.split()) & set(seen_text.split())) / max(len(normalized_text.split()), len(seen_text.split())) > 0.8:
-                    is_duplicate = True
-                    break
-            if not is_duplicate and len(normalized_text) > 20:
-                unique_requirements.append(req)
-                seen_texts.add(normalized_text)
-        return unique_requirements
+        return deduplicate_requirements(requirements)
     def generate_compliance_response(self, requirement: dict[str, Any], rfp_context: dict[str, Any]) -> dict[str, Any]:
         """
         Generate a compliance response for a specific requirement.
@@ -440,22 +555,41 @@ class ComplianceMatrixGenerator:
     def generate_compliance_matrix(self, rfp_data: dict[str, Any]) -> dict[str, Any]:
         """
         Generate complete compliance matrix for an RFP.
+        A matrix generated before for the same texts and RFP fields is returned
+        from the cache, so changed documents or Q&A are always re-analyzed.
         Args:
             rfp_data: Dictionary containing RFP information
         Returns:
             Complete compliance matrix with all requirements and responses
         """
-        self.logger.info(f"Generating compliance matrix for RFP: {rfp_data.get('title', 'Unknown')}")
-        # Extract RFP text for analysis
-        rfp_text = rfp_data.get('description', '')
-        if not rfp_text:
-            rfp_text = rfp_data.get('title', '') + ' ' + rfp_data.get('agency', '')
-        # Extract requirements using both methods
-        rule_requirements = self.extract_requirements_rule_based(rfp_text)
-        llm_requirements = self.extract_requirements_llm(rfp_text)
-        # Combine and deduplicate requirements
-        all_requirements = rule_requirements + llm_requirements
-        unique_requirements = self._deduplicate_requirements(all_requirements)
+        rfp_info = {
+            "title": rfp_data.get('title', 'Unknown'),
+            "agency": rfp_data.get('agency', 'Unknown'),
+            "rfp_id": rfp_data.get('rfp_id', 'Unknown'),
+            "naics_code": rfp_data.get('naics_code', ''),
+            "solicitation_number": rfp_data.get('solicitation_number', '')
+        }
+        sources = self.document_sources(rfp_data)
+        # Extraction and responses are deterministic for the same input and RAG index
+        cache_key = None
+        rag_index = self._rag_index_fingerprint() if self.matrix_cache is not None else None
+        if rag_index is not None:
+            cache_key = matrix_cache_key(GENERATOR_VERSION, self._config_hash, rag_index, rfp_info, sources)
+            cached = self.matrix_cache.get(cache_key)
+            if cached is not None:
+                self.logger.info(f"Reusing cached compliance matrix for RFP: {rfp_info['title']}")
+                # generated_at is when this matrix was served; cached_at when it was analyzed
+                cached["cached"] = True
+                cached["cached_at"] = cached["generated_at"]
+                cached["generated_at"] = datetime.now().isoformat()
+                return cached
+        self.logger.info(f"Generating compliance matrix for RFP: {rfp_info['title']}")
+        # Extract requirements from the description, Q&A and every attachment
+        unique_requirements = [
+            requirement
+            for _name, requirements in self.iter_requirements(sources)
+            for requirement in requirements
+        ]
         self.logger.info(f"Extracted {len(unique_requirements)} unique requirements")
         # Generate responses for each requirement
         compliance_responses = []
@@ -470,17 +604,12 @@ class ComplianceMatrixGenerator:
         compliance_rate = compliant_count / total_requirements if total_requirements > 0 else 0
         # Create compliance matrix
         compliance_matrix = {
-            "rfp_info": {
-                "title": rfp_data.get('title', 'Unknown'),
-                "agency": rfp_data.get('agency', 'Unknown'),
-                "rfp_id": rfp_data.get('rfp_id', 'Unknown'),
-                "naics_code": rfp_data.get('naics_code', ''),
-                "solicitation_number": rfp_data.get('solicitation_number', '')
-            },
+            "rfp_info": rfp_info,
             "extraction_summary": {
                 "total_requirements": total_requirements,
-                "rule_based_count": len(rule_requirements),
-                "llm_based_count": len(llm_requirements),
+                "rule_based_count": sum(r["extraction_method"] == "rule_based" for r in unique_requirements),
+                "llm_based_count": sum(r["extraction_method"] == "llm_based" for r in unique_requirements),
+                "documents_analyzed": len(sources),
                 "extraction_method": "hybrid"
             },
             "compliance_summary": {
@@ -493,9 +622,32 @@ class ComplianceMatrixGenerator:
             },
             "requirements_and_responses": compliance_responses,
             "generated_at": datetime.now().isoformat(),
-            "generator_version": "1.0.0"
+            "generator_version": GENERATOR_VERSION,
+            "cached": False,
         }
+        if cache_key is not None:
+            self.matrix_cache.put(cache_key, compliance_matrix)
         return compliance_matrix
+    def _rag_index_fingerprint(self) -> list[Any] | None:
+        """
+        Identity of the RAG index responses draw context from, for the matrix cache key.
+        Returns None when the engine cannot tell, so the matrix is not cached.
+        """
+        if self.rag_engine is None:
+            return []
+        try:
+            stats = self.rag_engine.get_statistics()
+        except Exception as e:
+            self.logger.warning(f"Not caching compliance matrix, RAG index statistics unavailable: {e}")
+            return None
+        if stats.get("total_documents") is None:
+            return None
+        return [
+            type(self.rag_engine).__name__,
+            stats.get("collection_name"),
+            stats["total_documents"],
+            stats.get("built_at"),
+        ]
     def export_compliance_matrix(self, compliance_matrix: dict[str, Any],
                                 output_format: str = "json") -> str:
         """
@@ -0,0 +1,129 @@
+"""
+Near-duplicate detection for requirement texts.
+
+Two requirements are duplicates when the words they share cover more than 80%
+of the longer one (shared distinct words divided by the larger word count).
+Instead of comparing every requirement with every kept one, each text is
+tokenized once into a MinHash signature; LSH banding of the signatures yields
+the few kept texts that can be similar enough, and only those are checked
+with the exact overlap rule.
+"""
+import re
+import zlib
+from collections import defaultdict
+from collections.abc import Iterable
+from typing import Any
+
+import numpy as np
+
+_WHITESPACE = re.compile(r'\s+')
+# Largest prime below 2**32: (a * x + b) % _PRIME never overflows uint64
+_PRIME = 4294967291
+
+# 32 bands of 4 rows. An overlap above 0.8 implies a Jaccard similarity above
+# 2/3, where a pair still shares a band with probability > 99.9%.
+DEFAULT_NUM_PERM = 128
+DEFAULT_BANDS = 32
+
+
+def normalize_requirement_text(text: str) -> str:
+    """Lowercase and collapse whitespace, as requirement texts are compared."""
+    return _WHITESPACE.sub(' ', text.lower().strip())
+
+
+class RequirementDedupIndex:
+    """
+    Incremental index of kept requirement texts.
+
+    ``add`` keeps a text unless it duplicates one already in the index, so
+    feeding requirements in order gives the same result as comparing each one
+    with all previously kept texts.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.8,
+        min_length: int = 20,
+        num_perm: int = DEFAULT_NUM_PERM,
+        bands: int = DEFAULT_BANDS,
+        seed: int = 1,
+    ):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.threshold = threshold
+        self.min_length = min_length
+        self.bands = bands
+        self.rows = num_perm // bands
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, _PRIME, size=num_perm, dtype=np.uint64)
+        self._b = rng.randint(0, _PRIME, size=num_perm, dtype=np.uint64)
+        self._buckets: list[dict[bytes, list[int]]] = [defaultdict(list) for _ in range(bands)]
+        self._words: list[frozenset[str]] = []
+        self._counts: list[int] = []
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def _signature(self, tokens: frozenset[str]) -> np.ndarray:
+        hashes = np.fromiter(
+            (zlib.crc32(token.encode()) % _PRIME for token in tokens), dtype=np.uint64, count=len(tokens)
+        )
+        permuted = (np.outer(hashes, self._a) + self._b) % np.uint64(_PRIME)
+        return permuted.min(axis=0)
+
+    def _band_keys(self, signature: np.ndarray) -> list[bytes]:
+        return [band.tobytes() for band in signature.reshape(self.bands, self.rows)]
+
+    def _matches(self, words: frozenset[str], count: int, keys: list[bytes]) -> bool:
+        checked = set()
+        for band, key in enumerate(keys):
+            for candidate in self._buckets[band].get(key, ()):
+                if candidate in checked:
+                    continue
+                checked.add(candidate)
+                longest = max(count, self._counts[candidate])
+                if len(words & self._words[candidate]) / longest > self.threshold:
+                    return True
+        return False
+
+    def _lookup(self, text: str) -> tuple[str, frozenset[str], int, list[bytes] | None]:
+        normalized = normalize_requirement_text(text)
+        tokens = normalized.split()
+        words = frozenset(tokens)
+        keys = self._band_keys(self._signature(words)) if words else None
+        return normalized, words, len(tokens), keys
+
+    def is_duplicate(self, text: str) -> bool:
+        """Whether ``text`` duplicates a text already in the index."""
+        _normalized, words, count, keys = self._lookup(text)
+        return keys is not None and self._matches(words, count, keys)
+
+    def add(self, text: str) -> bool:
+        """
+        Add ``text`` unless it is a duplicate or too short.
+
+        Returns:
+            True if the text was kept
+        """
+        normalized, words, count, keys = self._lookup(text)
+        if keys is None or len(normalized) <= self.min_length or self._matches(words, count, keys):
+            return False
+        index = len(self._words)
+        self._words.append(words)
+        self._counts.append(count)
+        for band, key in enumerate(keys):
+            self._buckets[band][key].append(index)
+        return True
+
+    def filter(self, items: Iterable[dict[str, Any]], text_key: str = "text") -> list[dict[str, Any]]:
+        """Keep the items whose ``text_key`` text is added to the index, in order."""
+        return [item for item in items if self.add(item.get(text_key) or "")]
+
+
+def deduplicate_requirements(
+    requirements: list[dict[str, Any]], text_key: str = "text"
+) -> list[dict[str, Any]]:
+    """Drop requirements that duplicate an earlier one, and very short ones."""
+    if not requirements:
+        return requirements
+    return RequirementDedupIndex().filter(requirements, text_key)
@@ -0,0 +1,149 @@
+"""
+Persistent cache of generated compliance matrices.
+
+Requirement extraction and response generation are deterministic for a given
+input, so a matrix is stored under a hash of everything it depends on: the
+analyzed texts (description, Q&A and attachments), the RFP fields copied into
+the matrix, the generator version and a hash of the extraction patterns and
+response templates. Changed documents or Q&A produce a different key, so an
+outdated matrix is never returned.
+
+Entries are gzipped JSON files under the generator's output directory, with
+the most recent ones also kept in memory as serialized JSON; every hit is
+decoded afresh, so callers may modify the matrix they get. Entries unused for
+``MAX_AGE_SECONDS`` expire, and every ``PRUNE_EVERY`` writes the directory is
+cut back to the ``DISK_ENTRIES`` most recently used.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+MEMORY_ENTRIES = 32
+DISK_ENTRIES = 1000
+MAX_AGE_SECONDS = 30 * 24 * 3600
+PRUNE_EVERY = 50
+
+
+def matrix_cache_key(*parts: Any) -> str:
+    """SHA-256 of JSON-serializable key parts."""
+    payload = json.dumps(parts, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ComplianceMatrixCache:
+    """Key-addressed, on-disk store of compliance matrices."""
+
+    def __init__(
+        self,
+        root: str | Path,
+        memory_entries: int = MEMORY_ENTRIES,
+        disk_entries: int = DISK_ENTRIES,
+        max_age: float = MAX_AGE_SECONDS,
+    ):
+        self.root = Path(root)
+        self.memory_entries = memory_entries
+        self.disk_entries = disk_entries
+        self.max_age = max_age
+        # key -> (serialized matrix, time it was stored)
+        self._memory: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._writes = 0
+
+    def _entry_path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json.gz"
+
+    def _remember(self, key: str, payload: str, stored_at: float) -> None:
+        with self._lock:
+            self._memory[key] = (payload, stored_at)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Cached matrix for a key, or None."""
+        now = time.time()
+        with self._lock:
+            payload, stored_at = self._memory.get(key, (None, 0.0))
+            if payload is not None and now - stored_at <= self.max_age:
+                self._memory.move_to_end(key)
+                return json.loads(payload)
+            self._memory.pop(key, None)
+
+        path = self._entry_path(key)
+        try:
+            if now - path.stat().st_mtime > self.max_age:
+                path.unlink(missing_ok=True)
+                return None
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                payload = f.read()
+            matrix = json.loads(payload)
+            # The modification time records last use, for pruning
+            os.utime(path, (now, now))
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Discarding unreadable compliance matrix cache entry {path}: {e}")
+            return None
+        self._remember(key, payload, now)
+        return matrix
+
+    def put(self, key: str, matrix: dict[str, Any]) -> None:
+        payload = json.dumps(matrix, default=str)
+        path = self._entry_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not store compliance matrix cache entry {path}: {e}")
+        self._remember(key, payload, time.time())
+
+        with self._lock:
+            self._writes += 1
+            prune = self._writes % PRUNE_EVERY == 0
+        if prune:
+            self.prune()
+
+    def prune(self) -> int:
+        """Delete expired entries and the least recently used beyond ``disk_entries``; returns the count."""
+        now = time.time()
+        entries = []
+        for path in self.root.glob("*/*.json.gz"):
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except OSError:
+                continue
+        entries.sort(reverse=True)
+        stale = [
+            path for i, (mtime, path) in enumerate(entries)
+            if i >= self.disk_entries or now - mtime > self.max_age
+        ]
+        for path in stale:
+            path.unlink(missing_ok=True)
+        return len(stale)
+
+
+_caches: dict[str, ComplianceMatrixCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_matrix_cache(root: str | Path) -> ComplianceMatrixCache:
+    """Process-wide cache for a directory, shared by all generators using it."""
+    root = str(root)
+    with _caches_lock:
+        cache = _caches.get(root)
+        if cache is None:
+            cache = _caches[root] = ComplianceMatrixCache(root)
+        return cache
@@ -19,6 +19,8 @@ class DecisionSettings(BaseSettings):
     win_rate_small_contract: float = 0.75
     win_rate_medium_contract: float = 0.60
     win_rate_large_contract: float = 0.45
+    # Bids' worth of the overall win rate blended into each recorded win-rate cell
+    win_rate_prior_strength: float = 10.0
 
     # Margin Scoring Thresholds
     margin_score_excellent: float = 40.0
@@ -41,6 +43,8 @@ class DecisionSettings(BaseSettings):
     lead_time_short: int = 15
     lead_time_long: int = 60
 
+    batch_workers: int = 0  # Decision input processes for batch scoring; 0 = min(4, cpu count)
+
 class RAGSettings(BaseSettings):
     """Settings for RAG Engine."""
     embedding_model: str = "all-MiniLM-L6-v2"
@@ -53,10 +57,37 @@ class RAGSettings(BaseSettings):
     index_type: str = "flat"
     use_tfidf_fallback: bool = True
 
+class ExtractionSettings(BaseSettings):
+    """Settings for attachment text extraction and OCR."""
+    store_dir: str | None = None  # Defaults to data/extracted_text
+    workers: int = 0  # Extraction and per-page OCR processes; 0 = min(4, cpu count)
+
+    # A PDF page with fewer text-layer characters is treated as a scan
+    min_page_chars: int = 20
+    ocr_max_pages: int = 50
+    # DPI drops linearly from max to min as the scanned page count grows
+    # from ocr_full_dpi_pages to ocr_max_pages
+    ocr_max_dpi: int = 200
+    ocr_min_dpi: int = 100
+    ocr_full_dpi_pages: int = 10
+
+
+class BrowserPoolSettings(BaseSettings):
+    """Settings for the pooled Stagehand browser sessions used by scrapers."""
+    env: str = "BROWSERBASE"  # BROWSERBASE, or LOCAL for a local Playwright Chromium
+    headless: bool = True  # LOCAL only
+    max_sessions: int = 4
+    per_domain_limit: int = 2
+    idle_timeout_seconds: float = 300.0
+    max_uses: int = 25  # Checkouts before a session is replaced
+
+
 class Settings(BaseSettings):
     """Global Application Settings."""
     decision: DecisionSettings = Field(default_factory=DecisionSettings)
     rag: RAGSettings = Field(default_factory=RAGSettings)
+    extraction: ExtractionSettings = Field(default_factory=ExtractionSettings)
+    browser_pool: BrowserPoolSettings = Field(default_factory=BrowserPoolSettings)
 
     class Config:
         env_file = ".env"
@@ -0,0 +1,127 @@
+"""
+Batch go/no-go scoring.
+
+The expensive part of a go/no-go decision is the compliance and pricing
+analysis behind it; the scores themselves are cheap arithmetic. Batch scoring
+therefore splits the two:
+
+- ``decision_inputs`` (``GoNoGoEngine.decision_inputs``) summarizes the
+  analyses of one RFP into a small JSON dict that callers store with the RFP,
+  keyed by ``decision_inputs_key`` of the fields they were computed from.
+- ``compute_decision_inputs`` produces the missing summaries, in a process
+  pool when there is more than one.
+- ``score_rfps`` scores every RFP in one ``GoNoGoEngine.score_batch`` call.
+"""
+
+import logging
+import multiprocessing
+import os
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+import pandas as pd
+
+from src.compliance.matrix_cache import matrix_cache_key
+from src.config.settings import settings
+
+from .go_nogo_engine import GoNoGoEngine
+
+logger = logging.getLogger(__name__)
+
+# Bump when decision_inputs output changes so stored inputs are recomputed
+DECISION_INPUTS_VERSION = 1
+
+# Fields the compliance and pricing analyses read
+KEY_FIELDS = ("title", "description", "agency", "naics_code", "category", "award_amount")
+
+
+def decision_inputs_key(rfp_data: dict[str, Any]) -> str:
+    """Cache key of an RFP's decision inputs."""
+    return matrix_cache_key(
+        DECISION_INPUTS_VERSION, {field: rfp_data.get(field) for field in KEY_FIELDS}
+    )
+
+
+def build_engine() -> GoNoGoEngine:
+    """GoNoGoEngine with the compliance and pricing components used by the API."""
+    from src.compliance.compliance_matrix import ComplianceMatrixGenerator
+    from src.pricing.pricing_engine import get_pricing_engine
+
+    return GoNoGoEngine(
+        compliance_generator=ComplianceMatrixGenerator(),
+        pricing_engine=get_pricing_engine(),
+    )
+
+
+_worker_engine: GoNoGoEngine | None = None
+
+
+def _init_worker() -> None:
+    global _worker_engine
+    _worker_engine = build_engine()
+
+
+def _worker_decision_inputs(rfp_data: dict[str, Any]) -> dict[str, Any]:
+    return _worker_engine.decision_inputs(rfp_data)
+
+
+def compute_decision_inputs(
+    rfps: list[dict[str, Any]],
+    engine: GoNoGoEngine | None = None,
+    max_workers: int | None = None,
+    progress: Callable[[int, int], None] | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Run compliance and pricing analysis for each RFP.
+
+    Args:
+        rfps: RFP data dicts
+        engine: Engine for in-process analysis (default: ``build_engine()``)
+        max_workers: Worker processes (default: ``settings.decision.batch_workers``
+            or min(4, cpu count)); 1 analyzes in this process
+        progress: Called with (done, total) after each RFP
+
+    Returns:
+        Decision inputs, in the order of ``rfps``
+    """
+    max_workers = max_workers or settings.decision.batch_workers or min(4, os.cpu_count() or 1)
+    results = []
+    if max_workers == 1 or len(rfps) <= 1:
+        engine = engine or build_engine()
+        for rfp_data in rfps:
+            results.append(engine.decision_inputs(rfp_data))
+            if progress:
+                progress(len(results), len(rfps))
+        return results
+
+    # Each worker builds its own engine once; RFPs are handed out one at a time
+    # because analysis cost varies widely with description length
+    with ProcessPoolExecutor(
+        max_workers=min(max_workers, len(rfps)),
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+    ) as pool:
+        for inputs in pool.map(_worker_decision_inputs, rfps):
+            results.append(inputs)
+            if progress:
+                progress(len(results), len(rfps))
+    return results
+
+
+def score_rfps(
+    rfps: list[dict[str, Any]],
+    inputs: list[dict[str, Any]],
+    engine: GoNoGoEngine,
+) -> pd.DataFrame:
+    """
+    Score RFPs from their decision inputs.
+
+    Returns:
+        ``GoNoGoEngine.score_batch`` output, one row per RFP in order
+    """
+    frame = pd.DataFrame(
+        [{**rfp_data, **rfp_inputs} for rfp_data, rfp_inputs in zip(rfps, inputs, strict=True)],
+        index=pd.RangeIndex(len(rfps)),
+    )
+    return engine.score_batch(frame)
@@ -17,6 +17,7 @@ import pandas as pd
 # Import path configuration
 from src.config.paths import PathConfig
 from src.config.settings import settings
+from src.decision.win_rates import current_win_rate_index
 
 
 @dataclass
@@ -90,6 +91,27 @@ class GoNoGoEngine:
         self.historical_data = self._load_historical_data()
         self.win_rate_patterns = self._analyze_historical_win_rates()
 
+    @property
+    def win_rate_patterns(self) -> dict[str, float]:
+        """
+        Win rates by NAICS code (``naics_<code>``) and contract size
+        (``small_contracts`` etc.).
+
+        Rates from recorded bid outcomes when any are available, with the
+        configured size assumptions for sizes that have no outcomes yet.
+        """
+        index = current_win_rate_index()
+        if index is None:
+            return self._assumed_win_rates
+        if self._recorded_win_rates[0] is not index:
+            self._recorded_win_rates = (index, {**self._assumed_win_rates, **index.patterns()})
+        return self._recorded_win_rates[1]
+
+    @win_rate_patterns.setter
+    def win_rate_patterns(self, patterns: dict[str, float]) -> None:
+        self._assumed_win_rates = patterns
+        self._recorded_win_rates = (None, {})
+
     def _load_decision_criteria(self) -> DecisionCriteria:
         """Load decision criteria from settings or override with JSON."""
         config_path = os.path.join(self.config_dir, "decision_parameters.json")
@@ -137,34 +159,14 @@ class GoNoGoEngine:
             return pd.DataFrame()
 
     def _analyze_historical_win_rates(self) -> dict[str, float]:
-        """Analyze historical win rates by category and characteristics."""
+        """Assumed win rates by contract size, used until bid outcomes are recorded."""
         win_rates = {}
-        if self.historical_data.empty:
+        if self.historical_data.empty or 'award_amount' not in self.historical_data.columns:
             return win_rates
-        try:
-            # Analyze by NAICS code
-            if 'naics_code' in self.historical_data.columns:
-                naics_groups = self.historical_data.groupby('naics_code').size()
-                min_sample_size = 5  # Minimum samples for reliable win rate
-                for naics_code, count in naics_groups.items():
-                    if count >= min_sample_size:
-                        # Simulated win rate based on contract characteristics
-                        win_rate = min(0.9, 0.3 + (count / 1000))
-                        win_rates[f"naics_{naics_code}"] = win_rate
-            # Analyze by contract value ranges
-            if 'award_amount' in self.historical_data.columns:
-                awards = self.historical_data['award_amount']
-                # Define value ranges (used for win rate calculations)
-                _small_contracts = awards[awards <= awards.quantile(0.33)]
-                _medium_contracts = awards[(awards > awards.quantile(0.33)) & (awards <= awards.quantile(0.67))]
-                _large_contracts = awards[awards > awards.quantile(0.67)]
-                # Calculate win rates by contract size
-                win_rates['small_contracts'] = settings.decision.win_rate_small_contract
-                win_rates['medium_contracts'] = settings.decision.win_rate_medium_contract
-                win_rates['large_contracts'] = settings.decision.win_rate_large_contract
-            self.logger.info(f"Analyzed win rate patterns for {len(win_rates)} categories")
-        except (KeyError, ValueError, TypeError) as e:
-            self.logger.warning(f"Win rate analysis failed due to data issue: {e}")
+        win_rates['small_contracts'] = settings.decision.win_rate_small_contract
+        win_rates['medium_contracts'] = settings.decision.win_rate_medium_contract
+        win_rates['large_contracts'] = settings.decision.win_rate_large_contract
+        self.logger.info(f"Using assumed win rates for {len(win_rates)} contract sizes")
         return win_rates
 
     def _calculate_margin_score(self, pricing_results: dict[str, Any]) -> tuple[float, list[str], list[str]]:
@@ -293,9 +295,10 @@ class GoNoGoEngine:
         risks = []
         opportunities = []
         # Check NAICS-specific win rates
+        win_rate_patterns = self.win_rate_patterns
         naics_key = f"naics_{naics_code}"
-        if naics_key in self.win_rate_patterns:
-            win_rate = self.win_rate_patterns[naics_key]
+        if naics_key in win_rate_patterns:
+            win_rate = win_rate_patterns[naics_key]
             historical_score = win_rate * 100
             if win_rate >= 0.7:
                 opportunities.append(f"High historical win rate ({win_rate:.1%}) for NAICS {naics_code}")
@@ -304,13 +307,13 @@ class GoNoGoEngine:
         # Check contract size patterns
         if award_amount > 0:
             if award_amount <= 100000:  # Small contracts
-                size_win_rate = self.win_rate_patterns.get('small_contracts', 0.6)
+                size_win_rate = win_rate_patterns.get('small_contracts', 0.6)
                 size_score = size_win_rate * 100
             elif award_amount <= 1000000:  # Medium contracts
-                size_win_rate = self.win_rate_patterns.get('medium_contracts', 0.5)
+                size_win_rate = win_rate_patterns.get('medium_contracts', 0.5)
                 size_score = size_win_rate * 100
             else:  # Large contracts
-                size_win_rate = self.win_rate_patterns.get('large_contracts', 0.4)
+                size_win_rate = win_rate_patterns.get('large_contracts', 0.4)
                 size_score = size_win_rate * 100
             # Weight historical score with size score
             historical_score = (historical_score * 0.6) + (size_score * 0.4)
@@ -468,27 +471,16 @@ class GoNoGoEngine:
             )
         return " ".join(justification_parts)
 
-    def analyze_rfp_opportunity(self, rfp_data: dict[str, Any]) -> DecisionResult:
-        """
-        Perform complete go/no-go analysis for an RFP opportunity.
-        Args:
-            rfp_data: RFP information dictionary
-        Returns:
-            DecisionResult with recommendation and detailed analysis
-        """
-        self.logger.info(f"Analyzing opportunity: {rfp_data.get('title', 'Unknown RFP')}")
-        analysis_start = time.time()
-        # Generate pipeline outputs if components are available
+    def _run_analyses(self, rfp_data: dict[str, Any]) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Generate the compliance matrix and pricing strategies if components are available."""
         compliance_matrix = {}
         pricing_results = {}
-        # Step 1: Compliance analysis
         if self.compliance_generator:
             try:
                 compliance_matrix = self.compliance_generator.generate_compliance_matrix(rfp_data)
                 self.logger.info("Compliance analysis completed")
             except Exception as e:
                 self.logger.warning(f"Compliance analysis failed: {e}")
-        # Step 2: Pricing analysis
         if self.pricing_engine:
             try:
                 extracted_requirements = compliance_matrix.get('requirements_and_responses', [])
@@ -496,6 +488,238 @@ class GoNoGoEngine:
                 self.logger.info("Pricing analysis completed")
             except Exception as e:
                 self.logger.warning(f"Pricing analysis failed: {e}")
+        return compliance_matrix, pricing_results
+
+    @staticmethod
+    def summarize_analyses(compliance_matrix: dict[str, Any],
+                           pricing_results: dict[str, Any]) -> dict[str, Any]:
+        """
+        Reduce compliance and pricing outputs to the figures the scores use.
+
+        The summary is JSON-serializable so it can be stored with the RFP and
+        scored again by ``score_batch`` without re-running either analysis.
+        """
+        inputs = {
+            "has_compliance": bool(compliance_matrix),
+            "total_requirements": None,
+            "compliance_rate": None,
+            "has_pricing": bool(pricing_results),
+            "pricing_margin": None,
+            "pricing_confidence": None,
+            "pricing_risks": [],
+        }
+        if compliance_matrix:
+            summary = compliance_matrix.get('compliance_summary', {})
+            inputs["total_requirements"] = summary.get('total_requirements', 0)
+            inputs["compliance_rate"] = summary.get('compliance_rate', 0)
+        # Same strategy choice as _calculate_margin_score
+        recommended_strategy = None
+        best_confidence = 0
+        for result in (pricing_results or {}).values():
+            confidence = getattr(result, 'confidence_score', 0)
+            if confidence > best_confidence:
+                best_confidence = confidence
+                recommended_strategy = result
+        if recommended_strategy:
+            inputs["pricing_margin"] = float(getattr(recommended_strategy, 'margin_percentage', 0))
+            inputs["pricing_confidence"] = float(best_confidence)
+            inputs["pricing_risks"] = [str(risk) for risk in getattr(recommended_strategy, 'risk_factors', [])]
+        return inputs
+
+    def decision_inputs(self, rfp_data: dict[str, Any]) -> dict[str, Any]:
+        """Run compliance and pricing analysis and summarize them for ``score_batch``."""
+        return self.summarize_analyses(*self._run_analyses(rfp_data))
+
+    def score_batch(self, frame: pd.DataFrame) -> pd.DataFrame:
+        """
+        Score many RFPs at once with the rules of ``analyze_rfp_opportunity``.
+
+        Args:
+            frame: One row per RFP with ``description``, ``naics_code``,
+                ``award_amount`` (or ``award_amount_clean``), optional
+                ``lead_time_days``, and the ``decision_inputs`` columns
+
+        Returns:
+            DataFrame on the same index with the five factor scores,
+            ``overall_score``, ``confidence_level``, ``recommendation``,
+            ``risk_factors``, ``opportunities`` and ``justification``
+        """
+        d = settings.decision
+        index = frame.index
+
+        def column(name: str, default: Any = None) -> pd.Series:
+            return frame[name] if name in frame else pd.Series(default, index=index, dtype=object)
+
+        def numeric(series: pd.Series) -> np.ndarray:
+            return pd.to_numeric(series, errors='coerce').to_numpy(dtype=float)
+
+        description = column('description', '').fillna('').astype(str).str.lower()
+
+        # Margin: best-confidence pricing strategy
+        has_pricing = column('has_pricing', False).fillna(False).astype(bool).to_numpy()
+        margin = numeric(column('pricing_margin'))
+        pricing_confidence = numeric(column('pricing_confidence'))
+        valid_pricing = has_pricing & ~np.isnan(margin)
+        pricing_risks = column('pricing_risks').map(
+            lambda risks: list(risks) if isinstance(risks, (list, tuple, np.ndarray)) else []
+        )
+        margin_base = np.select(
+            [margin >= d.margin_score_excellent, margin >= d.margin_score_good,
+             margin >= d.margin_score_fair, margin >= d.margin_score_poor],
+            [100.0, 80.0, 60.0, 40.0], 20.0,
+        )
+        margin_score = np.where(
+            valid_pricing,
+            np.maximum(0, margin_base - pricing_risks.str.len().to_numpy() * 5),
+            np.where(has_pricing, 30.0, 50.0),
+        )
+
+        # Complexity: requirement count and compliance rate
+        has_compliance = column('has_compliance', False).fillna(False).astype(bool).to_numpy()
+        total_requirements = np.nan_to_num(numeric(column('total_requirements')))
+        compliance_rate = np.nan_to_num(numeric(column('compliance_rate')))
+        complexity_base = np.select(
+            [total_requirements <= d.complexity_req_low, total_requirements <= d.complexity_req_medium,
+             total_requirements <= d.complexity_req_high, total_requirements <= d.complexity_req_very_high],
+            [100.0, 80.0, 60.0, 40.0], 20.0,
+        )
+        complexity_score = np.where(
+            has_compliance, np.minimum(100.0, complexity_base + compliance_rate * 20), 50.0
+        )
+
+        # Duration: contract length from description, adjusted for lead time
+        estimated_duration = np.select(
+            [description.str.contains('annual|yearly|year').to_numpy(),
+             description.str.contains('month').to_numpy(),
+             description.str.contains('emergency|urgent|immediate').to_numpy()],
+            [12, 6, 1], 12,
+        )
+        optimal_duration = (d.duration_optimal_min <= estimated_duration) & (estimated_duration <= d.duration_optimal_max)
+        acceptable_duration = (
+            (d.duration_acceptable_min <= estimated_duration) & (estimated_duration <= d.duration_acceptable_max)
+        )
+        duration_base = np.select(
+            [optimal_duration, acceptable_duration, estimated_duration <= 48], [100.0, 80.0, 60.0], 40.0
+        )
+        lead_time = np.nan_to_num(numeric(column('lead_time_days', 30)), nan=30)
+        duration_score = np.minimum(100.0, duration_base * np.select(
+            [lead_time < d.lead_time_short, lead_time > d.lead_time_long], [0.8, 1.1], 1.0
+        ))
+
+        # Historical: NAICS win rate blended with the contract size win rate
+        naics_code = column('naics_code', '').astype(str)
+        win_rate_patterns = self.win_rate_patterns
+        naics_win_rate = numeric(('naics_' + naics_code).map(win_rate_patterns))
+        has_naics_rate = ~np.isnan(naics_win_rate)
+        award_amount = numeric(column('award_amount_clean').combine_first(column('award_amount')))
+        award_amount = np.nan_to_num(award_amount)
+        sized = award_amount > 0
+        size_win_rate = np.select(
+            [award_amount <= 100000, award_amount <= 1000000],
+            [win_rate_patterns.get('small_contracts', 0.6), win_rate_patterns.get('medium_contracts', 0.5)],
+            win_rate_patterns.get('large_contracts', 0.4),
+        )
+        historical_score = np.where(has_naics_rate, naics_win_rate * 100, 50.0)
+        historical_score = np.minimum(100.0, np.where(
+            sized, historical_score * 0.6 + size_win_rate * 100 * 0.4, historical_score
+        ))
+
+        # Resource: requirement count
+        resource_score = np.clip(75.0 + np.select(
+            [total_requirements <= 10, total_requirements <= 20, total_requirements <= 30], [10, 0, -10], -20
+        ), 0, 100)
+
+        scores = np.column_stack([margin_score, complexity_score, duration_score, historical_score, resource_score])
+        weights = np.array([d.margin_weight, d.complexity_weight, d.duration_weight,
+                            d.historical_weight, d.resource_weight])
+        overall_score = np.round(scores @ weights, 2)
+        recommendation = np.select(
+            [overall_score >= d.confidence_threshold_go, overall_score >= d.margin_threshold_review],
+            ['go', 'review'], 'no_go',
+        )
+        confidence_level = np.maximum(50.0, 100 - scores.std(axis=1) * 2)
+
+        def collect(rules: list[tuple[np.ndarray, Any]]) -> list[list[str]]:
+            """Per-row messages of the rules whose mask holds, in rule order."""
+            rows: list[list[str]] = [[] for _ in range(len(index))]
+            for mask, message in rules:
+                for i in np.flatnonzero(mask):
+                    rows[i].extend([message] if isinstance(message, str) else message(i))
+            return rows
+
+        def naics_rate_text(i: int) -> str:
+            return f"historical win rate ({naics_win_rate[i]:.1%}) for NAICS {naics_code.iat[i]}"
+
+        def size_rate_text(i: int) -> str:
+            return f"contract size category ({size_win_rate[i]:.1%} win rate)"
+
+        risk_lists = pricing_risks.tolist()
+        emergency = description.str.contains('emergency|urgent').to_numpy()
+        specialized = description.str.contains('specialized|certified|security clearance').to_numpy()
+        existing = description.str.contains('maintenance|existing|current').to_numpy()
+        # Same order as analyze_rfp_opportunity: margin, complexity, duration, historical, resource
+        risk_factors = collect([
+            (~has_pricing, "No pricing analysis available"),
+            (has_pricing & ~valid_pricing, "No valid pricing strategy found"),
+            (valid_pricing & (margin < 20), "Low margin below 20% threshold"),
+            (valid_pricing, lambda i: [f"Pricing risk: {risk}" for risk in risk_lists[i]]),
+            (~has_compliance, "No compliance analysis available"),
+            (has_compliance & (total_requirements > 25), "High complexity with 25+ requirements"),
+            (has_compliance & (compliance_rate < 0.7), "Low compliance rate below 70%"),
+            (lead_time < d.lead_time_short, f"Short lead time below {d.lead_time_short} days"),
+            (estimated_duration > d.duration_acceptable_max,
+             f"Long-term contract exceeding {d.duration_acceptable_max} months"),
+            (emergency, "Emergency/urgent timeline requirements"),
+            (has_naics_rate & (naics_win_rate < 0.4), lambda i: [f"Low {naics_rate_text(i)}"]),
+            (sized & (size_win_rate < 0.4), lambda i: [f"Challenging {size_rate_text(i)}"]),
+            (total_requirements > 25, "High resource requirements due to complexity"),
+            (specialized, "Specialized personnel requirements"),
+        ])
+        opportunities = collect([
+            (valid_pricing & (margin > 35), "High margin potential above 35%"),
+            (valid_pricing & (pricing_confidence > 0.8), "High pricing confidence based on market data"),
+            (has_compliance & (total_requirements <= 10), "Low complexity project"),
+            (has_compliance & (compliance_rate >= 0.8), "High compliance rate above 80%"),
+            ((d.lead_time_short <= lead_time) & (lead_time <= 45), "Adequate lead time for proposal preparation"),
+            (optimal_duration, "Optimal contract duration range"),
+            (has_naics_rate & (naics_win_rate >= 0.7), lambda i: [f"High {naics_rate_text(i)}"]),
+            (sized & (size_win_rate >= 0.6), lambda i: [f"Favorable {size_rate_text(i)}"]),
+            (total_requirements <= 15, "Standard resource requirements"),
+            (existing, "Leverages existing capabilities"),
+        ])
+
+        result = pd.DataFrame({
+            'recommendation': recommendation,
+            'overall_score': overall_score,
+            'confidence_level': confidence_level,
+            'margin_score': margin_score,
+            'complexity_score': complexity_score,
+            'duration_score': duration_score,
+            'historical_score': historical_score,
+            'resource_score': resource_score,
+            'risk_factors': risk_factors,
+            'opportunities': opportunities,
+        }, index=index)
+        result['justification'] = [
+            self.generate_explanation(*row[:6], risks)
+            for row, risks in zip(result[['overall_score', 'margin_score', 'complexity_score', 'duration_score',
+                                          'historical_score', 'resource_score']].itertuples(index=False),
+                                  risk_factors, strict=True)
+        ]
+        return result
+
+    def analyze_rfp_opportunity(self, rfp_data: dict[str, Any]) -> DecisionResult:
+        """
+        Perform complete go/no-go analysis for an RFP opportunity.
+        Args:
+            rfp_data: RFP information dictionary
+        Returns:
+            DecisionResult with recommendation and detailed analysis
+        """
+        self.logger.info(f"Analyzing opportunity: {rfp_data.get('title', 'Unknown RFP')}")
+        analysis_start = time.time()
+        # Steps 1-2: Compliance and pricing analysis
+        compliance_matrix, pricing_results = self._run_analyses(rfp_data)
         # Step 3: Calculate individual scores
         margin_score, margin_risks, margin_opportunities = self._calculate_margin_score(pricing_results)
         complexity_score, complexity_risks, complexity_opportunities = self._calculate_complexity_score(compliance_matrix)
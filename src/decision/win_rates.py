@@ -0,0 +1,140 @@
+"""
+Historical win rates from recorded bid outcomes.
+
+Won and lost bids are counted per cell: one cell per NAICS code, agency,
+contract value band and set-aside, plus an overall cell. The API keeps the
+counts up to date as outcomes are written (see
+``api/app/services/win_rate_index.py``); this module turns a snapshot of
+them into win rates.
+
+Sparse cells are smoothed towards the overall win rate with a Beta prior
+worth ``settings.decision.win_rate_prior_strength`` bids, so one win does
+not make a NAICS code a sure thing::
+
+    rate = (wins + strength * overall_rate) / (wins + losses + strength)
+"""
+
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from src.config.settings import settings
+
+DIMENSIONS = ("naics", "agency", "value_band", "set_aside")
+OVERALL = ("overall", "all")
+UNKNOWN = "Unknown"
+
+# Same size categories as GoNoGoEngine._calculate_historical_score
+VALUE_BANDS = ((100000, "small"), (1000000, "medium"))
+LARGE_BAND = "large"
+
+
+def value_band(amount: float | None) -> str:
+    """Size category of a contract value."""
+    if not amount or amount <= 0:
+        return UNKNOWN
+    for limit, band in VALUE_BANDS:
+        if amount <= limit:
+            return band
+    return LARGE_BAND
+
+
+def set_aside_of(metadata: dict[str, Any] | None) -> str | None:
+    """Set-aside of an RFP from its metadata (``set_aside`` or the first of ``set_asides``)."""
+    metadata = metadata or {}
+    set_asides = metadata.get("set_asides")
+    return metadata.get("set_aside") or (set_asides[0] if isinstance(set_asides, list) and set_asides else None)
+
+
+def outcome_cells(
+    naics_code: str | None,
+    agency: str | None,
+    amount: float | None,
+    set_aside: str | None,
+) -> list[tuple[str, str]]:
+    """The (dimension, key) cells an outcome of this RFP counts towards."""
+    return [
+        OVERALL,
+        ("naics", str(naics_code) if naics_code else UNKNOWN),
+        ("agency", agency or UNKNOWN),
+        ("value_band", value_band(amount)),
+        ("set_aside", set_aside or UNKNOWN),
+    ]
+
+
+class WinRateIndex:
+    """Immutable snapshot of win/loss counts with O(1) smoothed lookups."""
+
+    def __init__(self, counts: dict[tuple[str, str], tuple[int, int]], prior_strength: float | None = None):
+        # Cells whose outcomes were all reopened or deleted count down to zero; they have no rate
+        self.counts = {cell: cell_counts for cell, cell_counts in counts.items() if sum(cell_counts)}
+        self.prior_strength = (
+            settings.decision.win_rate_prior_strength if prior_strength is None else prior_strength
+        )
+        wins, losses = counts.get(OVERALL, (0, 0))
+        self.decided = wins + losses
+        # Laplace-smoothed overall rate, so an index with few outcomes stays near 50%
+        self.prior_rate = (wins + 1) / (self.decided + 2)
+        self._rates = {cell: self._smooth(*cell_counts) for cell, cell_counts in counts.items()}
+        self._patterns: dict[str, float] | None = None
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[tuple[str, str, int, int]], prior_strength: float | None = None) -> "WinRateIndex":
+        """Build from (dimension, key, wins, losses) rows."""
+        return cls({(dimension, key): (wins, losses) for dimension, key, wins, losses in rows}, prior_strength)
+
+    def _smooth(self, wins: int, losses: int) -> float:
+        return (wins + self.prior_strength * self.prior_rate) / (wins + losses + self.prior_strength)
+
+    def rate(self, dimension: str, key: Any, default: float | None = None) -> float | None:
+        """Smoothed win rate of a cell, or ``default`` if no bid in it was decided."""
+        return self._rates.get((dimension, str(key)), default)
+
+    def cells(self, dimension: str) -> list[dict[str, Any]]:
+        """Counts, observed and smoothed rate of every cell of a dimension, most bids first."""
+        cells = [
+            {
+                "key": key,
+                "wins": wins,
+                "losses": losses,
+                "win_rate": round(wins / (wins + losses), 3) if wins + losses else 0.0,
+                "smoothed_win_rate": round(self._rates[(cell_dimension, key)], 3),
+            }
+            for (cell_dimension, key), (wins, losses) in self.counts.items()
+            if cell_dimension == dimension
+        ]
+        return sorted(cells, key=lambda cell: (-(cell["wins"] + cell["losses"]), cell["key"]))
+
+    def observed_rates(self, dimension: str) -> dict[str, float]:
+        """Observed (unsmoothed) win rate by key, as reported by analytics."""
+        return {cell["key"]: cell["win_rate"] for cell in self.cells(dimension)}
+
+    def patterns(self) -> dict[str, float]:
+        """Win rates in the ``GoNoGoEngine.win_rate_patterns`` layout."""
+        if self._patterns is None:
+            patterns = {}
+            for (dimension, key), rate in self._rates.items():
+                if key == UNKNOWN:
+                    continue
+                if dimension == "naics":
+                    patterns[f"naics_{key}"] = rate
+                elif dimension == "value_band":
+                    patterns[f"{key}_contracts"] = rate
+            self._patterns = patterns
+        return self._patterns
+
+
+_source: Callable[[], WinRateIndex | None] | None = None
+
+
+def set_win_rate_source(source: Callable[[], WinRateIndex | None] | None) -> None:
+    """Register the function that returns the current index (None to unregister)."""
+    global _source
+    _source = source
+
+
+def current_win_rate_index() -> WinRateIndex | None:
+    """The current index, or None when no source is registered or it has no decided bids."""
+    if _source is None:
+        return None
+    index = _source()
+    return index if index is not None and index.decided else None
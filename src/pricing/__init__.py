@@ -8,7 +8,9 @@ from .pricing_engine import (
     PricingStrategy,
     ScenarioParams,
     SimulationResult,
+    get_pricing_engine,
 )
+from .simulation import MonteCarloParams, PricingSimulation, simulate_pricing
 
 __all__ = [
     "PricingEngine",
@@ -17,4 +19,8 @@ __all__ = [
     "CostBaseline",
     "ScenarioParams",
     "SimulationResult",
+    "get_pricing_engine",
+    "MonteCarloParams",
+    "PricingSimulation",
+    "simulate_pricing",
 ]
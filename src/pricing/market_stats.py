@@ -0,0 +1,459 @@
+"""
+Precomputed market statistics of historical awards.
+
+Award amounts from the processed datasets are summarized once per NAICS
+code, agency and (NAICS prefix, year). The summaries are stored next to the
+pricing configuration as a float64 matrix (``.npy``, memory-mapped on load)
+and a JSON index mapping each key to its row. RFP categories are matched
+against award titles and descriptions once, into an inverted index from each
+category to the ids of the awards mentioning it, stored with the award
+amounts; category statistics are then computed from those rows alone.
+Pricing lookups are dictionary and array reads instead of pandas scans over
+the award history.
+
+The index records the size and modification time of every source parquet
+file. A store checks them at most every ``CHECK_INTERVAL_SECONDS`` and
+rebuilds the statistics when a source changed, or reloads them when another
+process already did. Rebuild offline with::
+
+    python -m src.pricing.market_stats
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from src.config.paths import PathConfig
+from src.utils.category import CategoryType
+
+logger = logging.getLogger(__name__)
+
+SOURCE_DATASETS = (
+    'rfp_master_dataset.parquet',
+    'bottled_water_rfps.parquet',
+    'construction_rfps.parquet',
+    'delivery_rfps.parquet',
+)
+STAT_FIELDS = ('count', 'mean', 'median', 'std', 'q25', 'q75', 'min', 'max')
+STATS_FILENAME = "market_stats.json"
+FORMAT_VERSION = 2
+CHECK_INTERVAL_SECONDS = 30.0
+# NAICS codes need this many awards to count as a pricing pattern
+MIN_NAICS_AWARDS = 5
+# NAICS prefix lengths with yearly trend statistics
+TREND_PREFIX_LENGTHS = (2, 3, 4)
+
+
+def load_award_history(data_dir: str | Path) -> pd.DataFrame:
+    """Combined historical award records with a positive numeric ``award_amount``."""
+    historical_data = []
+    for dataset in SOURCE_DATASETS:
+        file_path = os.path.join(data_dir, dataset)
+        if os.path.exists(file_path):
+            try:
+                df = pd.read_parquet(file_path)
+                df['source_dataset'] = dataset
+                historical_data.append(df)
+                logger.info(f"Loaded {len(df)} records from {dataset}")
+            except Exception as e:
+                logger.warning(f"Failed to load {dataset}: {e}")
+    if not historical_data:
+        logger.warning("No historical data loaded")
+        return pd.DataFrame()
+
+    combined_df = pd.concat(historical_data, ignore_index=True)
+    # Clean and process award amounts
+    if 'award_amount_clean' in combined_df.columns:
+        combined_df['award_amount'] = pd.to_numeric(combined_df['award_amount_clean'], errors='coerce')
+    elif 'award_amount' in combined_df.columns:
+        combined_df['award_amount'] = pd.to_numeric(combined_df['award_amount'], errors='coerce')
+    else:
+        combined_df['award_amount'] = np.nan
+    valid_df = combined_df[
+        (combined_df['award_amount'].notna()) &
+        (combined_df['award_amount'] > 0)
+    ].copy()
+    logger.info(f"Loaded {len(valid_df)} records with valid award amounts")
+    return valid_df
+
+
+def source_fingerprint(data_dir: str | Path) -> dict[str, list[int]]:
+    """Size and modification time of each source dataset present."""
+    fingerprint = {}
+    for dataset in SOURCE_DATASETS:
+        try:
+            stat = os.stat(os.path.join(data_dir, dataset))
+        except OSError:
+            continue
+        fingerprint[dataset] = [stat.st_size, stat.st_mtime_ns]
+    return fingerprint
+
+
+def _grouped_stats(amounts: pd.Series, keys: pd.Series) -> pd.DataFrame:
+    grouped = amounts.groupby(keys)
+    stats = grouped.agg(['count', 'mean', 'median', 'std', 'min', 'max'])
+    quantiles = grouped.quantile([0.25, 0.75]).unstack()
+    stats['q25'] = quantiles[0.25]
+    stats['q75'] = quantiles[0.75]
+    return stats[list(STAT_FIELDS)]
+
+
+def _text_column(df: pd.DataFrame, column: str) -> pd.Series:
+    if column not in df.columns:
+        return pd.Series('', index=df.index)
+    return df[column].fillna('').astype(str).str.lower()
+
+
+def summarize_awards(amounts: np.ndarray) -> dict[str, float | None]:
+    """STAT_FIELDS of a set of award amounts, as pandas computes them."""
+    if len(amounts) == 0:
+        return {name: (0.0 if name == 'count' else None) for name in STAT_FIELDS}
+    q25, median, q75 = np.quantile(amounts, [0.25, 0.5, 0.75])
+    return {
+        'count': float(len(amounts)),
+        'mean': float(amounts.mean()),
+        'median': float(median),
+        # Sample standard deviation, undefined for a single award
+        'std': float(amounts.std(ddof=1)) if len(amounts) > 1 else None,
+        'q25': float(q25),
+        'q75': float(q75),
+        'min': float(amounts.min()),
+        'max': float(amounts.max()),
+    }
+
+
+def index_terms(df: pd.DataFrame, terms: list[str]) -> tuple[dict[str, list[int]], np.ndarray]:
+    """
+    Inverted index of the awards whose description or title contains each term.
+
+    Returns:
+        (spans, postings): the row ids of ``term`` are
+        ``postings[spans[term][0]:spans[term][1]]``, ascending
+    """
+    if df.empty:
+        return {}, np.empty(0, dtype=np.int32)
+    text = (_text_column(df, 'description') + '\n' + _text_column(df, 'title')).to_numpy()
+    # Each distinct text is checked once, however many awards share it
+    distinct, inverse = np.unique(text, return_inverse=True)
+    spans, blocks, start = {}, [], 0
+    for term in terms:
+        term = term.lower()
+        hits = np.fromiter((term in value for value in distinct), dtype=bool, count=len(distinct))
+        rows = np.flatnonzero(hits[inverse]).astype(np.int32)
+        if len(rows):
+            spans[term] = [start, start + len(rows)]
+            blocks.append(rows)
+            start += len(rows)
+    return spans, (np.concatenate(blocks) if blocks else np.empty(0, dtype=np.int32))
+
+
+def compute_market_stats(df: pd.DataFrame) -> tuple[dict[str, dict[str, int]], np.ndarray]:
+    """
+    Summarize award amounts by every lookup dimension.
+
+    Returns:
+        (index, matrix): ``index[dimension][key]`` is the row of ``matrix``
+        holding that group's STAT_FIELDS
+    """
+    index: dict[str, dict[str, int]] = {}
+    blocks = []
+    rows = 0
+
+    def add(dimension: str, stats: pd.DataFrame) -> None:
+        nonlocal rows
+        index[dimension] = {str(key): rows + i for i, key in enumerate(stats.index)}
+        blocks.append(stats.to_numpy(dtype=np.float64))
+        rows += len(stats)
+
+    if df.empty or 'award_amount' not in df.columns:
+        return index, np.empty((0, len(STAT_FIELDS)))
+    amounts = df['award_amount'].astype(np.float64)
+
+    if 'naics_code' in df.columns:
+        naics = df['naics_code'].dropna().astype(str)
+        add('naics', _grouped_stats(amounts[naics.index], naics))
+
+        if 'posted_date' in df.columns:
+            years = pd.to_datetime(df['posted_date'], errors='coerce').dt.year
+            all_naics = df['naics_code'].astype(str)
+            dated = years.notna()
+            for length in TREND_PREFIX_LENGTHS:
+                eligible = dated & (all_naics.str.len() >= length)
+                keys = all_naics[eligible].str[:length] + ':' + years[eligible].astype(int).astype(str)
+                add(f'naics_year_{length}', _grouped_stats(amounts[keys.index], keys))
+
+    if 'agency' in df.columns:
+        agency = df['agency'].dropna().astype(str)
+        add('agency', _grouped_stats(amounts[agency.index], agency))
+
+    matrix = np.vstack(blocks) if blocks else np.empty((0, len(STAT_FIELDS)))
+    return index, matrix
+
+
+def build_market_stats(data_dir: str | Path, stats_path: str | Path) -> dict[str, Any]:
+    """Compute statistics from the source datasets and write them to ``stats_path``."""
+    stats_path = Path(stats_path)
+    fingerprint = source_fingerprint(data_dir)
+    history = load_award_history(data_dir)
+    index, matrix = compute_market_stats(history)
+    terms, postings = index_terms(history, [category.value for category in CategoryType])
+    amounts = (
+        history['award_amount'].to_numpy(dtype=np.float64) if not history.empty else np.empty(0)
+    )
+
+    stats_path.parent.mkdir(parents=True, exist_ok=True)
+    # New array files per build. The build being replaced keeps its files until
+    # the next one, so a reader that has just read its index can still open them.
+    try:
+        previous = set(json.loads(stats_path.read_text(encoding="utf-8")).get('arrays', {}).values())
+    except (OSError, ValueError, AttributeError):
+        previous = set()
+    generation = time.time_ns()
+    arrays = {}
+    for part, array in (('matrix', matrix), ('amounts', amounts), ('postings', postings)):
+        arrays[part] = f"{stats_path.stem}.{generation}.{part}.npy"
+        np.save(stats_path.parent / arrays[part], array)
+    manifest = {
+        'version': FORMAT_VERSION,
+        'sources': fingerprint,
+        'fields': list(STAT_FIELDS),
+        'arrays': arrays,
+        'index': index,
+        'terms': terms,
+    }
+    tmp_path = stats_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp_path.write_text(json.dumps(manifest), encoding="utf-8")
+    os.replace(tmp_path, stats_path)
+
+    keep = previous | set(arrays.values())
+    for old in stats_path.parent.glob(f"{stats_path.stem}.*.npy"):
+        if old.name not in keep:
+            try:
+                old.unlink()
+            except OSError:
+                pass
+    logger.info(f"Built market statistics for {len(matrix)} groups at {stats_path}")
+    return manifest
+
+
+def _row(matrix: np.ndarray, row: int) -> dict[str, float | None]:
+    # std of a single award is undefined; None keeps the result JSON-serializable
+    return {
+        name: None if np.isnan(value) else float(value)
+        for name, value in zip(STAT_FIELDS, matrix[row], strict=True)
+    }
+
+
+@dataclass(frozen=True)
+class _Snapshot:
+    """One loaded statistics file; replaced as a whole on reload."""
+    index: dict[str, dict[str, int]]
+    matrix: np.ndarray
+    amounts: np.ndarray
+    terms: dict[str, list[int]]
+    postings: np.ndarray
+    agency_rows: list[tuple[str, int]]
+    trend_rows: dict[str, list[tuple[int, int]]]
+    naics_patterns: dict[str, dict[str, float]]
+    term_stats: dict[str, dict[str, float | None]] = field(default_factory=dict)
+
+    @classmethod
+    def load(
+        cls,
+        index: dict[str, dict[str, int]],
+        matrix: np.ndarray,
+        amounts: np.ndarray,
+        terms: dict[str, list[int]],
+        postings: np.ndarray,
+    ) -> "_Snapshot":
+        naics_patterns = {}
+        for naics_code, row in index.get('naics', {}).items():
+            stats = _row(matrix, row)
+            if stats['count'] >= MIN_NAICS_AWARDS:
+                naics_patterns[naics_code] = {
+                    'count': int(stats['count']),
+                    'mean': stats['mean'],
+                    'median': stats['median'],
+                    'std': stats['std'],
+                    'q25': stats['q25'],
+                    'q75': stats['q75'],
+                    'confidence': min(1.0, stats['count'] / 20.0),  # Confidence based on sample size
+                }
+        trend_rows: dict[str, list[tuple[int, int]]] = {}
+        for length in TREND_PREFIX_LENGTHS:
+            for key, row in index.get(f'naics_year_{length}', {}).items():
+                prefix, year = key.rsplit(':', 1)
+                trend_rows.setdefault(prefix, []).append((int(year), row))
+        return cls(
+            index=index,
+            matrix=matrix,
+            amounts=amounts,
+            terms=terms,
+            postings=postings,
+            agency_rows=[(agency.lower(), row) for agency, row in index.get('agency', {}).items()],
+            trend_rows={prefix: sorted(rows) for prefix, rows in trend_rows.items()},
+            naics_patterns=naics_patterns,
+        )
+
+
+_EMPTY = _Snapshot.load({}, np.empty((0, len(STAT_FIELDS))), np.empty(0), {}, np.empty(0, dtype=np.int32))
+
+
+class MarketStatsStore:
+    """Read access to the market statistics file, kept current with the source datasets."""
+
+    def __init__(
+        self,
+        data_dir: str | Path,
+        stats_path: str | Path,
+        check_interval: float = CHECK_INTERVAL_SECONDS,
+    ):
+        self.data_dir = str(data_dir)
+        self.stats_path = Path(stats_path)
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._checked_at = float('-inf')
+        self._manifest_mtime: int | None = None
+        self._sources: dict[str, list[int]] = {}
+        self._snapshot = _EMPTY
+        self.refresh(force=True)
+
+    def refresh(self, force: bool = False) -> None:
+        """Reload or rebuild the statistics if their sources changed."""
+        now = time.monotonic()
+        if not force and now - self._checked_at < self.check_interval:
+            return
+        with self._lock:
+            if not force and now - self._checked_at < self.check_interval:
+                return
+            self._checked_at = now
+            fingerprint = source_fingerprint(self.data_dir)
+            try:
+                manifest_mtime = self.stats_path.stat().st_mtime_ns
+            except OSError:
+                manifest_mtime = None
+            if manifest_mtime is not None and manifest_mtime == self._manifest_mtime and fingerprint == self._sources:
+                return
+
+            manifest = self._read_manifest() if manifest_mtime is not None else None
+            if manifest is None or manifest.get('version') != FORMAT_VERSION or manifest['sources'] != fingerprint:
+                if not fingerprint:
+                    # No award history to summarize
+                    self._snapshot, self._sources, self._manifest_mtime = _EMPTY, fingerprint, None
+                    return
+                try:
+                    manifest = build_market_stats(self.data_dir, self.stats_path)
+                except Exception as e:
+                    logger.warning(f"Could not build market statistics at {self.stats_path}: {e}")
+                    if manifest is None:
+                        return
+            try:
+                arrays = {
+                    part: np.load(self.stats_path.parent / name, mmap_mode='r')
+                    for part, name in manifest['arrays'].items()
+                }
+            except (OSError, ValueError) as e:
+                # Superseded by builds in other processes meanwhile; retried on the next check
+                logger.warning(f"Keeping loaded market statistics, could not open {self.stats_path}: {e}")
+                return
+            self._snapshot = _Snapshot.load(
+                manifest['index'], arrays['matrix'], arrays['amounts'], manifest['terms'], arrays['postings']
+            )
+            self._sources = manifest['sources']
+            self._manifest_mtime = self.stats_path.stat().st_mtime_ns
+
+    def _read_manifest(self) -> dict[str, Any] | None:
+        try:
+            return json.loads(self.stats_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable market statistics {self.stats_path}: {e}")
+            return None
+
+    def _current(self) -> _Snapshot:
+        self.refresh()
+        return self._snapshot
+
+    def _lookup(self, dimension: str, key: str) -> dict[str, float] | None:
+        snapshot = self._current()
+        row = snapshot.index.get(dimension, {}).get(key)
+        return None if row is None else _row(snapshot.matrix, row)
+
+    @property
+    def empty(self) -> bool:
+        """Whether there is no award history at all."""
+        return len(self._current().amounts) == 0
+
+    def naics_patterns(self) -> dict[str, dict[str, float]]:
+        """Statistics of NAICS codes with at least MIN_NAICS_AWARDS awards."""
+        return self._current().naics_patterns
+
+    def naics(self, naics_code: str) -> dict[str, float] | None:
+        """Statistics of one NAICS code."""
+        return self._lookup('naics', str(naics_code))
+
+    def category(self, category: str) -> dict[str, float] | None:
+        """Statistics of awards whose description or title mentions an RFP category."""
+        snapshot = self._current()
+        term = category.lower()
+        stats = snapshot.term_stats.get(term)
+        if stats is None:
+            span = snapshot.terms.get(term)
+            if span is None:
+                return None
+            rows = snapshot.postings[span[0]:span[1]]
+            stats = snapshot.term_stats[term] = summarize_awards(np.asarray(snapshot.amounts[rows]))
+        return dict(stats)
+
+    def agency(self, name: str) -> dict[str, float] | None:
+        """
+        Count and mean award of agencies whose name contains ``name``
+        (case-insensitive).
+        """
+        snapshot = self._current()
+        needle = name.lower()
+        rows = [row for agency, row in snapshot.agency_rows if needle in agency]
+        if not rows:
+            return None
+        selected = snapshot.matrix[rows]
+        count = float(selected[:, 0].sum())
+        return {'count': count, 'mean': float((selected[:, 0] * selected[:, 1]).sum() / count)}
+
+    def naics_trend(self, prefix: str) -> list[dict[str, float]]:
+        """Yearly statistics of NAICS codes starting with ``prefix``, oldest first."""
+        snapshot = self._current()
+        return [
+            {'year': year, **_row(snapshot.matrix, row)}
+            for year, row in snapshot.trend_rows.get(prefix, [])
+        ]
+
+
+_stores: dict[tuple[str, str], MarketStatsStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_market_stats_store(
+    data_dir: str | Path | None = None,
+    stats_path: str | Path | None = None,
+) -> MarketStatsStore:
+    """Process-wide store for a data directory and statistics file."""
+    data_dir = str(data_dir or PathConfig.PROCESSED_DATA_DIR)
+    stats_path = str(stats_path or PathConfig.PRICING_DIR / STATS_FILENAME)
+    with _stores_lock:
+        store = _stores.get((data_dir, stats_path))
+        if store is None:
+            store = _stores[(data_dir, stats_path)] = MarketStatsStore(data_dir, stats_path)
+        return store
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    PathConfig.ensure_directories()
+    build_market_stats(PathConfig.PROCESSED_DATA_DIR, PathConfig.PRICING_DIR / STATS_FILENAME)
@@ -0,0 +1,167 @@
+"""
+Versioned registry of trained pricing models.
+
+Every training run is published as a new version directory holding the
+pickled model and its training metrics::
+
+    models/pricing/
+        versions/20260118T101500123456Z/model.pkl
+        versions/20260118T101500123456Z/metadata.json
+        current.json
+
+A version directory is written under a temporary name and renamed into place,
+and ``current.json`` (the active version and the one it replaced) is replaced
+atomically, so readers never see a partial version or pointer. Processes
+serving predictions through ``get_pricing_ml_model`` re-read the pointer at
+most every ``CHECK_INTERVAL_SECONDS`` and load a new current version without
+a restart. ``rollback`` re-activates the previous version; pruning never
+removes the current or previous version.
+"""
+
+import json
+import logging
+import os
+import shutil
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from src.config.paths import PathConfig
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ROOT = PathConfig.PROJECT_ROOT / "models" / "pricing"
+POINTER_FILENAME = "current.json"
+MODEL_FILENAME = "model.pkl"
+METADATA_FILENAME = "metadata.json"
+CHECK_INTERVAL_SECONDS = 30.0
+# Versions kept by prune(), besides the current and previous one
+KEEP_VERSIONS = 5
+
+
+def _write_json_atomic(path: Path, data: dict[str, Any]) -> None:
+    tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+class ModelRegistry:
+    """Versioned pricing model artifacts with an atomic "current" pointer."""
+
+    def __init__(self, root: str | Path | None = None, keep_versions: int = KEEP_VERSIONS):
+        self.root = Path(root or DEFAULT_ROOT)
+        self.versions_dir = self.root / "versions"
+        self.pointer_path = self.root / POINTER_FILENAME
+        self.keep_versions = keep_versions
+
+    def pointer(self) -> dict[str, Any]:
+        """The pointer file: current and previous version, or {} before the first publish."""
+        try:
+            return json.loads(self.pointer_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable model pointer {self.pointer_path}: {e}")
+            return {}
+
+    def current_version(self) -> str | None:
+        return self.pointer().get("current")
+
+    def versions(self) -> list[dict[str, Any]]:
+        """Metadata of every published version, newest first."""
+        if not self.versions_dir.exists():
+            return []
+        versions = []
+        for path in sorted(self.versions_dir.iterdir(), reverse=True):
+            if path.name.startswith("."):
+                continue  # Being written
+            try:
+                versions.append(json.loads((path / METADATA_FILENAME).read_text(encoding="utf-8")))
+            except (OSError, ValueError) as e:
+                logger.warning(f"Skipping unreadable model version {path.name}: {e}")
+        return versions
+
+    def publish(self, model, metrics: dict[str, Any], activate: bool = True) -> str:
+        """
+        Save a trained model as a new version.
+
+        Args:
+            model: Trained PricingMLModel
+            metrics: Training metrics stored with the version
+            activate: Make the new version current
+
+        Returns:
+            The new version id
+        """
+        self.versions_dir.mkdir(parents=True, exist_ok=True)
+        version = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+        staging = self.versions_dir / f".{version}.tmp"
+        staging.mkdir()
+        try:
+            model._save_model(staging / MODEL_FILENAME)
+            metadata = {
+                "version": version,
+                "created_at": datetime.now(timezone.utc).isoformat(),
+                "estimator": type(model.model).__name__,
+                "feature_names": list(model.feature_names),
+                "metrics": metrics,
+            }
+            (staging / METADATA_FILENAME).write_text(json.dumps(metadata, indent=2), encoding="utf-8")
+            os.replace(staging, self.versions_dir / version)
+        except Exception:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+        logger.info(f"Published pricing model version {version}")
+        if activate:
+            self.activate(version)
+        return version
+
+    def activate(self, version: str) -> None:
+        """Point "current" at ``version``; the replaced version becomes "previous"."""
+        if not (self.versions_dir / version / MODEL_FILENAME).exists():
+            raise ValueError(f"Unknown model version: {version}")
+        pointer = self.pointer()
+        current = pointer.get("current")
+        previous = current if current != version else pointer.get("previous")
+        _write_json_atomic(
+            self.pointer_path,
+            {"current": version, "previous": previous, "updated_at": datetime.now(timezone.utc).isoformat()},
+        )
+        logger.info(f"Activated pricing model version {version} (previous: {previous})")
+
+    def rollback(self) -> str:
+        """Re-activate the previous version and return it."""
+        previous = self.pointer().get("previous")
+        if not previous:
+            raise ValueError("No previous model version to roll back to")
+        self.activate(previous)
+        return previous
+
+    def load(self, version: str | None = None):
+        """Load a version (default: the current one) as a PricingMLModel."""
+        from src.pricing.pricing_ml import PricingMLModel
+
+        version = version or self.current_version()
+        if version is None:
+            raise ValueError("No model version published")
+        path = self.versions_dir / version / MODEL_FILENAME
+        if not path.exists():
+            raise ValueError(f"Unknown model version: {version}")
+        model = PricingMLModel(model_path=path)
+        if not model.is_trained:
+            raise ValueError(f"Could not load model version {version}")
+        return model
+
+    def prune(self) -> list[str]:
+        """Delete old versions beyond ``keep_versions``; returns the removed ids."""
+        pointer = self.pointer()
+        protected = {pointer.get("current"), pointer.get("previous")}
+        removed = []
+        for metadata in self.versions()[self.keep_versions:]:
+            version = metadata["version"]
+            if version not in protected:
+                shutil.rmtree(self.versions_dir / version, ignore_errors=True)
+                removed.append(version)
+        return removed
@@ -7,18 +7,34 @@ import logging
 import os
 import statistics
 import sys
+import threading
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from typing import Any
 
-import numpy as np
 import pandas as pd
 
 # Import path configuration
 from src.config.paths import PathConfig
+from src.pricing.market_stats import STATS_FILENAME, get_market_stats_store, load_award_history
+from src.pricing.simulation import MonteCarloParams, PricingSimulation, simulate_pricing
 from src.pricing.win_probability import WinProbabilityModel
 from src.utils.category import determine_category
-
+from src.utils.keyword_classifier import KeywordClassifier
+
+# Keywords mapping to potential subcontracting trades
+SUBCONTRACTOR_TRADES = KeywordClassifier({
+    "plumbing": ["plumbing", "pipe", "water line", "sewer", "drainage"],
+    "electrical": ["electrical", "wiring", "lighting", "voltage", "circuit"],
+    "hvac": ["hvac", "heating", "cooling", "ventilation", "air conditioning"],
+    "security": ["security guard", "surveillance", "cctv", "alarm", "access control"],
+    "landscaping": ["mowing", "landscaping", "tree trimming", "lawn", "irrigation"],
+    "paving": ["asphalt", "paving", "concrete", "roadwork", "parking lot"],
+    "fencing": ["fencing", "gate", "perimeter", "barrier"],
+    "hauling": ["debris removal", "hauling", "dumpster", "waste disposal", "trucking"],
+    "it_cabling": ["cat6", "fiber optic", "cabling", "network drop"],
+    "consulting": ["consultant", "sme", "subject matter expert", "advisory"]
+})
 
 @dataclass
 class PricingStrategy:
@@ -105,53 +121,33 @@ class PricingEngine:
         os.makedirs(self.pricing_dir, exist_ok=True)
         # Initialize logging
         self.logger = logging.getLogger(__name__)
-        # Load historical pricing data
-        self.historical_data = self._load_historical_data()
+        # Precomputed award statistics; the raw history is only loaded on demand
+        self.market_stats = get_market_stats_store(
+            self.data_dir, os.path.join(self.pricing_dir, STATS_FILENAME)
+        )
+        self._historical_data: pd.DataFrame | None = None
         # Load cost baselines
         self.cost_baselines = self._load_cost_baselines()
         # Initialize pricing strategies
         self.pricing_strategies = self._initialize_pricing_strategies()
         # Initialize PTW model
         self.ptw_model = WinProbabilityModel()
-        # Load NAICS pricing patterns
-        self.naics_patterns = self._analyze_naics_pricing()
+    @property
+    def historical_data(self) -> pd.DataFrame:
+        """Historical award records, loaded on first use."""
+        if self._historical_data is None:
+            self._historical_data = self._load_historical_data()
+        return self._historical_data
+    @historical_data.setter
+    def historical_data(self, value: pd.DataFrame) -> None:
+        self._historical_data = value
+    @property
+    def naics_patterns(self) -> dict[str, dict[str, float]]:
+        """Pricing patterns of NAICS codes with enough awards."""
+        return self._analyze_naics_pricing()
     def _load_historical_data(self) -> pd.DataFrame:
         """Load and combine historical RFP award data."""
-        historical_data = []
-        datasets = [
-            'rfp_master_dataset.parquet',
-            'bottled_water_rfps.parquet',
-            'construction_rfps.parquet',
-            'delivery_rfps.parquet'
-        ]
-        for dataset in datasets:
-            file_path = os.path.join(self.data_dir, dataset)
-            if os.path.exists(file_path):
-                try:
-                    df = pd.read_parquet(file_path)
-                    df['source_dataset'] = dataset
-                    historical_data.append(df)
-                    self.logger.info(f"Loaded {len(df)} records from {dataset}")
-                except Exception as e:
-                    self.logger.warning(f"Failed to load {dataset}: {e}")
-        if historical_data:
-            combined_df = pd.concat(historical_data, ignore_index=True)
-            # Clean and process award amounts
-            if 'award_amount_clean' in combined_df.columns:
-                combined_df['award_amount'] = pd.to_numeric(combined_df['award_amount_clean'], errors='coerce')
-            elif 'award_amount' in combined_df.columns:
-                combined_df['award_amount'] = pd.to_numeric(combined_df['award_amount'], errors='coerce')
-            else:
-                combined_df['award_amount'] = np.nan
-            # Filter valid records
-            valid_df = combined_df[
-                (combined_df['award_amount'].notna()) &
-                (combined_df['award_amount'] > 0)
-            ].copy()
-            self.logger.info(f"Loaded {len(valid_df)} records with valid award amounts")
-            return valid_df
-        self.logger.warning("No historical data loaded")
-        return pd.DataFrame()
+        return load_award_history(self.data_dir)
     def _load_cost_baselines(self) -> dict[str, CostBaseline]:
         """Load or create cost baseline data for different categories."""
         baselines_path = os.path.join(self.pricing_dir, "cost_baselines.json")
@@ -272,33 +268,26 @@ class PricingEngine:
         return strategies
     def _analyze_naics_pricing(self) -> dict[str, dict[str, float]]:
         """Analyze pricing patterns by NAICS code."""
-        if self.historical_data.empty:
-            return {}
-        naics_patterns = {}
-        if 'naics_code' in self.historical_data.columns:
-            grouped = self.historical_data.groupby('naics_code')['award_amount'].agg([
-                'count', 'mean', 'median', 'std',
-                lambda x: x.quantile(0.25),
-                lambda x: x.quantile(0.75)
-            ])
-            grouped.columns = ['count', 'mean', 'median', 'std', 'q25', 'q75']
-            # Only include NAICS codes with sufficient data
-            valid_naics = grouped[grouped['count'] >= 5]
-            for naics_code, row in valid_naics.iterrows():
-                naics_patterns[str(naics_code)] = {
-                    'count': int(row['count']),
-                    'mean': float(row['mean']),
-                    'median': float(row['median']),
-                    'std': float(row['std']),
-                    'q25': float(row['q25']),
-                    'q75': float(row['q75']),
-                    'confidence': min(1.0, row['count'] / 20.0)  # Confidence based on sample size
-                }
-        self.logger.info(f"Analyzed pricing patterns for {len(naics_patterns)} NAICS codes")
-        return naics_patterns
+        return self.market_stats.naics_patterns()
     def _determine_category(self, rfp_data: dict[str, Any]) -> str:
         """Determine the category of an RFP for cost baseline selection."""
         return determine_category(rfp_data)
+    def _get_naics_statistics(self, naics_code: str) -> dict[str, float] | None:
+        """Award statistics for a NAICS code, or None without history."""
+        return self.market_stats.naics(naics_code)
+    def _get_category_statistics(self, category: str) -> dict[str, float] | None:
+        """Award statistics of historical RFPs mentioning a category."""
+        stats = self.market_stats.category(category)
+        if stats is None:
+            return None
+        return {
+            'count': int(stats['count']),
+            'mean': stats['mean'],
+            'median': stats['median'],
+            'std': stats['std'],
+            'min': stats['min'],
+            'max': stats['max']
+        }
     def _get_historical_pricing_context(self, rfp_data: dict[str, Any]) -> dict[str, Any]:
         """Get historical pricing context for similar RFPs."""
         context = {
@@ -307,7 +296,7 @@ class PricingEngine:
             'category_statistics': {},
             'competitive_landscape': {}
         }
-        if self.historical_data.empty:
+        if self.market_stats.empty:
             return context
         # Get NAICS-specific statistics
         naics_code = str(rfp_data.get('naics_code', ''))
@@ -315,20 +304,7 @@ class PricingEngine:
             context['naics_statistics'] = self.naics_patterns[naics_code]
         # Get category-specific statistics
         category = self._determine_category(rfp_data)
-        category_data = self.historical_data[
-            self.historical_data['description'].str.contains(category, case=False, na=False) |
-            self.historical_data['title'].str.contains(category, case=False, na=False)
-        ]
-        if not category_data.empty:
-            awards = category_data['award_amount']
-            context['category_statistics'] = {
-                'count': len(awards),
-                'mean': float(awards.mean()),
-                'median': float(awards.median()),
-                'std': float(awards.std()),
-                'min': float(awards.min()),
-                'max': float(awards.max())
-            }
+        context['category_statistics'] = self._get_category_statistics(category) or {}
         # Use RAG to find similar RFPs if available
         if self.rag_engine:
             try:
@@ -535,13 +511,16 @@ class PricingEngine:
         return " ".join(justification_parts)
     def generate_pricing(self, rfp_data: dict[str, Any],
                         extracted_requirements: list[dict] | None = None,
-                        strategy_name: str = "competitive") -> PricingResult:
+                        strategy_name: str = "competitive",
+                        historical_context: dict[str, Any] | None = None) -> PricingResult:
         """
         Generate comprehensive pricing for an RFP.
         Args:
             rfp_data: RFP information dictionary
             extracted_requirements: List of extracted requirements from compliance matrix
             strategy_name: Pricing strategy to use
+            historical_context: Context from _get_historical_pricing_context, when
+                already computed for this RFP
         Returns:
             PricingResult with detailed pricing information
         """
@@ -551,7 +530,8 @@ class PricingEngine:
         # Determine category and get cost baseline
         category = self._determine_category(rfp_data)
         # Get historical context
-        historical_context = self._get_historical_pricing_context(rfp_data)
+        if historical_context is None:
+            historical_context = self._get_historical_pricing_context(rfp_data)
         # Estimate base cost
         base_cost = self._estimate_base_cost(rfp_data, extracted_requirements)
         # Calculate competitive pricing
@@ -603,30 +583,20 @@ class PricingEngine:
                           extracted_requirements: list[dict] | None = None) -> dict[str, PricingResult]:
         """Compare pricing across all available strategies."""
         results = {}
+        # Market statistics and similar awards do not depend on the strategy
+        historical_context = self._get_historical_pricing_context(rfp_data)
         for strategy_name in self.pricing_strategies.keys():
             try:
-                result = self.generate_pricing(rfp_data, extracted_requirements, strategy_name)
+                result = self.generate_pricing(
+                    rfp_data, extracted_requirements, strategy_name, historical_context
+                )
                 results[strategy_name] = result
             except Exception as e:
                 self.logger.error(f"Failed to generate pricing for strategy {strategy_name}: {e}")
         return results
 
-    def run_war_gaming(self, rfp_data: dict[str, Any], custom_params: ScenarioParams | None = None) -> dict[str, SimulationResult]:
-        """
-        Run 'War Gaming' scenarios: Best Case, Worst Case, Most Likely, and Custom.
-        Calculates impact of cost variances on final price and margin.
-        """
-        # Define standard scenarios
-        scenarios = {
-            "most_likely": ScenarioParams(1.0, 1.0, 0.05, 0.0),
-            "best_case": ScenarioParams(0.9, 0.9, 0.0, 0.0),       # Efficiency gains, no risk
-            "worst_case": ScenarioParams(1.2, 1.15, 0.15, 0.0),    # Cost overruns, high risk
-        }
-
-        if custom_params:
-            scenarios["custom"] = custom_params
-
-        results = {}
+    def _decompose_base_cost(self, rfp_data: dict[str, Any]) -> tuple[float, float, float]:
+        """Split the estimated base cost into material, labor and overhead."""
         category = self._determine_category(rfp_data)
         baseline = self.cost_baselines.get(category, self.cost_baselines['professional_services'])
 
@@ -649,6 +619,25 @@ class PricingEngine:
         material_raw = direct_cost_raw * (material_ratio / (material_ratio + labor_ratio))
         labor_raw = direct_cost_raw * (labor_ratio / (material_ratio + labor_ratio))
         overhead_raw = base_cost_raw - direct_cost_raw
+        return material_raw, labor_raw, overhead_raw
+
+    def run_war_gaming(self, rfp_data: dict[str, Any], custom_params: ScenarioParams | None = None) -> dict[str, SimulationResult]:
+        """
+        Run 'War Gaming' scenarios: Best Case, Worst Case, Most Likely, and Custom.
+        Calculates impact of cost variances on final price and margin.
+        """
+        # Define standard scenarios
+        scenarios = {
+            "most_likely": ScenarioParams(1.0, 1.0, 0.05, 0.0),
+            "best_case": ScenarioParams(0.9, 0.9, 0.0, 0.0),       # Efficiency gains, no risk
+            "worst_case": ScenarioParams(1.2, 1.15, 0.15, 0.0),    # Cost overruns, high risk
+        }
+
+        if custom_params:
+            scenarios["custom"] = custom_params
+
+        results = {}
+        material_raw, labor_raw, overhead_raw = self._decompose_base_cost(rfp_data)
 
         for name, params in scenarios.items():
             # 3. Apply Scenario Multipliers
@@ -688,48 +677,62 @@ class PricingEngine:
 
         return results
 
+    def simulate_pricing_scenarios(
+        self, rfp_data: dict[str, Any], params: MonteCarloParams | None = None
+    ) -> PricingSimulation:
+        """
+        Monte Carlo version of ``run_war_gaming``: samples cost variances and
+        competitor prices and evaluates a whole margin grid against them.
+        """
+        material, labor, overhead = self._decompose_base_cost(rfp_data)
+        context = self._get_historical_pricing_context(rfp_data)
+        market_median, basis = self._market_median(rfp_data, context)
+        simulation = simulate_pricing(material, labor, overhead, market_median, params, self.ptw_model)
+        simulation.market_basis = basis
+        return simulation
+
     def identify_subcontractors(self, rfp_data: dict[str, Any]) -> list[dict[str, Any]]:
         """
         Identify potential subcontracting opportunities based on description/SOW.
         Analyzes text for trade-specific keywords and estimates budget allocation.
         """
-        description = str(rfp_data.get('description', '')).lower()
+        description = str(rfp_data.get('description', ''))
         opportunities = []
 
-        # Keywords mapping to potential subcontracting trades
-        trades = {
-            "plumbing": ["plumbing", "pipe", "water line", "sewer", "drainage"],
-            "electrical": ["electrical", "wiring", "lighting", "voltage", "circuit"],
-            "hvac": ["hvac", "heating", "cooling", "ventilation", "air conditioning"],
-            "security": ["security guard", "surveillance", "cctv", "alarm", "access control"],
-            "landscaping": ["mowing", "landscaping", "tree trimming", "lawn", "irrigation"],
-            "paving": ["asphalt", "paving", "concrete", "roadwork", "parking lot"],
-            "fencing": ["fencing", "gate", "perimeter", "barrier"],
-            "hauling": ["debris removal", "hauling", "dumpster", "waste disposal", "trucking"],
-            "it_cabling": ["cat6", "fiber optic", "cabling", "network drop"],
-            "consulting": ["consultant", "sme", "subject matter expert", "advisory"]
-        }
-
         # Base cost for proportional estimation
         base_est = self._estimate_base_cost(rfp_data)
 
-        for trade, keywords in trades.items():
-            matches = [k for k in keywords if k in description]
-            if matches:
-                # Heuristic: Assume between 5% and 20% of budget depending on match count
-                allocation_pct = min(0.05 * len(matches), 0.25)
-                est_cost = base_est * allocation_pct
-
-                opportunities.append({
-                    "trade": trade,
-                    "keywords_found": matches,
-                    "estimated_budget": round(est_cost, 2),
-                    "allocation_percent": round(allocation_pct * 100, 1),
-                    "rationale": f"RFP mentions: {', '.join(matches)}"
-                })
+        for trade, matches in SUBCONTRACTOR_TRADES.matches(description).items():
+            # Heuristic: Assume between 5% and 20% of budget depending on match count
+            allocation_pct = min(0.05 * len(matches), 0.25)
+            est_cost = base_est * allocation_pct
+
+            opportunities.append({
+                "trade": trade,
+                "keywords_found": matches,
+                "estimated_budget": round(est_cost, 2),
+                "allocation_percent": round(allocation_pct * 100, 1),
+                "rationale": f"RFP mentions: {', '.join(matches)}"
+            })
 
         return opportunities
 
+    def _market_median(self, rfp_data: dict[str, Any], context: dict[str, Any]) -> tuple[float, str]:
+        """Market median price for the RFP and a description of what it is based on."""
+        if context.get('naics_statistics'):
+            return (
+                context['naics_statistics']['median'],
+                f"NAICS Historical Median ({context['naics_statistics']['count']} records)",
+            )
+        if context.get('category_statistics'):
+            return (
+                context['category_statistics']['median'],
+                f"Category Historical Median ({context['category_statistics']['count']} records)",
+            )
+        # Fallback
+        base = self._estimate_base_cost(rfp_data)
+        return base * 1.3, "Cost-Plus Estimation (No historical data)"
+
     def calculate_price_to_win(self, rfp_data: dict[str, Any], target_prob: float = 0.7) -> dict[str, Any]:
         """
         Calculate Price-to-Win (PTW) metrics.
@@ -737,26 +740,12 @@ class PricingEngine:
         """
         context = self._get_historical_pricing_context(rfp_data)
 
-        # Determine market median
-        market_median = 0.0
-        basis = "None"
-
-        if context.get('naics_statistics'):
-            market_median = context['naics_statistics']['median']
-            basis = f"NAICS Historical Median ({context['naics_statistics']['count']} records)"
-        elif context.get('category_statistics'):
-            market_median = context['category_statistics']['median']
-            basis = f"Category Historical Median ({context['category_statistics']['count']} records)"
-        else:
-            # Fallback
-            base = self._estimate_base_cost(rfp_data)
-            market_median = base * 1.3
-            basis = "Cost-Plus Estimation (No historical data)"
+        market_median, basis = self._market_median(rfp_data, context)
 
         ptw_price = self.ptw_model.solve_for_price(target_prob, market_median)
 
         # Also calculate probability for our "Competitive" strategy price
-        comp_result = self.generate_pricing(rfp_data, strategy_name="competitive")
+        comp_result = self.generate_pricing(rfp_data, strategy_name="competitive", historical_context=context)
         our_prob = self.ptw_model.predict(comp_result.total_price, market_median)
 
         return {
@@ -807,6 +796,32 @@ class PricingEngine:
             raise ValueError(f"Unsupported output format: {output_format}")
         self.logger.info(f"Pricing analysis exported to: {filepath}")
         return filepath
+_engine_instance: PricingEngine | None = None
+_engine_lock = threading.Lock()
+
+
+def get_pricing_engine() -> PricingEngine:
+    """
+    Get the process-wide pricing engine with default data directories.
+
+    The engine holds no per-request state; its market statistics reload
+    themselves when the historical datasets change.
+    """
+    global _engine_instance
+    if _engine_instance is None:
+        with _engine_lock:
+            if _engine_instance is None:
+                _engine_instance = PricingEngine()
+    return _engine_instance
+
+
+def reset_pricing_engine():
+    """Reset the singleton (for testing purposes)."""
+    global _engine_instance
+    with _engine_lock:
+        _engine_instance = None
+
+
 def main():
     """Main function for testing pricing engine."""
     import pandas as pd
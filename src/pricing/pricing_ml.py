@@ -4,18 +4,32 @@ Machine Learning model for price prediction and optimization.
 Uses historical contract award data to predict optimal pricing
 for new RFPs based on features like NAICS code, agency, and
 requirement complexity.
+
+Trained models are published to the versioned registry in
+``src.pricing.model_registry``; ``get_pricing_ml_model`` serves its current
+version and swaps in a new one when the registry pointer changes.
 """
 
+import logging
 import pickle
+import threading
+import time
+from contextlib import nullcontext
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
-from sklearn.ensemble import GradientBoostingRegressor
+from sklearn.ensemble import HistGradientBoostingRegressor
+from sklearn.inspection import permutation_importance
 from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import LabelEncoder, StandardScaler
+from threadpoolctl import threadpool_limits
+
+from src.pricing.model_registry import CHECK_INTERVAL_SECONDS, ModelRegistry
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -29,13 +43,22 @@ class PricePrediction:
     similar_awards: List[Dict]
 
 
+# Quantiles of the log price bounding the confidence interval (95%, as mean +/- 1.96 sd)
+INTERVAL_QUANTILES = (0.025, 0.975)
+CATEGORICAL_FEATURES = ("naics_code", "agency", "contract_type", "set_aside")
+
+
 class PricingMLModel:
     """Machine learning model for price prediction and optimization."""
 
     def __init__(self, model_path: Optional[Path] = None):
         self.model = None
+        # Quantile regressors for the confidence interval, keyed by quantile
+        self.quantile_models: Dict[float, HistGradientBoostingRegressor] = {}
+        self.feature_importance: Dict[str, float] = {}
         self.scaler = StandardScaler()
         self.label_encoders: Dict[str, LabelEncoder] = {}
+        self._encoding_maps: Optional[Dict[str, Dict[str, int]]] = None
         self.feature_names: List[str] = []
         self.model_path = model_path or Path("models/pricing_model.pkl")
         self._is_trained = False
@@ -44,19 +67,30 @@ class PricingMLModel:
         if self.model_path.exists():
             self._load_model()
 
-    def train(self, historical_data: pd.DataFrame) -> Dict[str, float]:
+    @property
+    def is_trained(self) -> bool:
+        return self._is_trained
+
+    def train(
+        self, historical_data: pd.DataFrame, save: bool = True, n_threads: Optional[int] = None
+    ) -> Dict[str, float]:
         """
         Train the pricing model on historical award data.
 
         Args:
             historical_data: DataFrame with columns including award_amount,
                            naics_code, agency, description, etc.
+            save: Write the model to ``model_path``; the model registry saves
+                  trained models itself
+            n_threads: Threads for fitting (default: all cores)
 
         Returns:
             Dictionary with training metrics (R² scores, sample counts)
         """
-        # Prepare features
+        # Prepare features, fitting the encoders to this data
+        self.label_encoders = {}
         features = self._prepare_features(historical_data)
+        self._encoding_maps = None
         target = historical_data["award_amount"].values
 
         # Remove rows with missing or invalid target
@@ -79,17 +113,29 @@ class PricingMLModel:
         X_train_scaled = self.scaler.fit_transform(X_train)
         X_test_scaled = self.scaler.transform(X_test)
 
-        # Train Gradient Boosting model
-        self.model = GradientBoostingRegressor(
-            n_estimators=100,
-            learning_rate=0.1,
-            max_depth=5,
-            min_samples_split=10,
-            min_samples_leaf=5,
-            subsample=0.8,
-            random_state=42,
-        )
-        self.model.fit(X_train_scaled, y_train)
+        start = time.perf_counter()
+        limits = threadpool_limits(limits=n_threads, user_api="openmp") if n_threads else nullcontext()
+        with limits:
+            # Train histogram gradient boosting (multithreaded), and quantile models for the interval
+            self.model = HistGradientBoostingRegressor(**self._boosting_params())
+            self.model.fit(X_train_scaled, y_train)
+            self.quantile_models = {
+                alpha: HistGradientBoostingRegressor(loss="quantile", quantile=alpha, **self._boosting_params()).fit(
+                    X_train_scaled, y_train
+                )
+                for alpha in INTERVAL_QUANTILES
+            }
+
+            # Histogram boosting has no impurity importances; measure them on the test split
+            importances = permutation_importance(
+                self.model, X_test_scaled, y_test, n_repeats=5, random_state=42
+            ).importances_mean.clip(min=0)
+        total = importances.sum()
+        self.feature_importance = {
+            name: float(value / total) if total > 0 else 0.0
+            for name, value in zip(self.feature_names, importances, strict=True)
+        }
+        train_seconds = time.perf_counter() - start
 
         # Evaluate
         train_score = self.model.score(X_train_scaled, y_train)
@@ -102,14 +148,16 @@ class PricingMLModel:
         self._is_trained = True
 
         # Save model
-        self._save_model()
+        if save:
+            self._save_model()
 
         return {
-            "train_r2": train_score,
-            "test_r2": test_score,
-            "mape": mape,
+            "train_r2": float(train_score),
+            "test_r2": float(test_score),
+            "mape": float(mape),
             "samples_trained": len(X_train),
             "samples_tested": len(X_test),
+            "train_seconds": round(train_seconds, 2),
         }
 
     def predict(
@@ -135,50 +183,85 @@ class PricingMLModel:
         Returns:
             PricePrediction with price estimate and confidence
         """
+        return self.predict_batch(
+            pd.DataFrame(
+                [
+                    {
+                        "naics_code": naics_code,
+                        "agency": agency,
+                        "description_length": description_length,
+                        "requirement_count": requirement_count,
+                        "contract_type": contract_type,
+                        "set_aside": set_aside or "None",
+                    }
+                ]
+            )
+        )[0]
+
+    def predict_batch(self, data: pd.DataFrame) -> List[PricePrediction]:
+        """
+        Predict prices for many RFPs in one pass.
+
+        Args:
+            data: One row per RFP with the ``predict`` arguments as columns.
+                ``description_length`` may be replaced by a ``description`` column;
+                missing columns take the ``predict`` defaults.
+
+        Returns:
+            PricePrediction per row, in row order
+        """
         if not self._is_trained:
             raise ValueError("Model not trained. Call train() first or load a trained model.")
+        if data.empty:
+            return []
+
+        features_scaled = self.scaler.transform(self._encode_frame(data))
+        prediction_log = self.model.predict(features_scaled)
+        predictions = np.expm1(prediction_log)  # Reverse log transform
+
+        if self.quantile_models:
+            lower_log, upper_log = (self.quantile_models[q].predict(features_scaled) for q in INTERVAL_QUANTILES)
+            # Quantile models are fit separately and may cross the point estimate
+            ci_lower = np.maximum(0, np.expm1(np.minimum(lower_log, prediction_log)))
+            ci_upper = np.expm1(np.maximum(upper_log, prediction_log))
+            std = (ci_upper - ci_lower) / (2 * 1.96)
+        else:
+            # Gradient boosting models saved without quantile models: spread of the individual tree predictions
+            std = np.expm1(self._tree_predictions(features_scaled)).std(axis=0)
+            ci_lower = np.maximum(0, predictions - 1.96 * std)
+            ci_upper = predictions + 1.96 * std
 
-        # Prepare input features
-        features = self._encode_features(
-            {
-                "naics_code": naics_code,
-                "agency": agency,
-                "description_length": description_length,
-                "requirement_count": requirement_count,
-                "contract_type": contract_type,
-                "set_aside": set_aside or "None",
-            }
-        )
-
-        # Scale and predict
-        features_scaled = self.scaler.transform(features.reshape(1, -1))
-        prediction_log = self.model.predict(features_scaled)[0]
-        prediction = np.expm1(prediction_log)  # Reverse log transform
+        # Calculate model confidence based on prediction spread
+        cv = np.divide(std, predictions, out=np.ones_like(std), where=predictions > 0)
+        model_confidence = np.clip(1.0 - cv, 0.0, 1.0)
 
-        # Calculate confidence interval using tree predictions variance
-        tree_predictions_log = np.array(
-            [tree[0].predict(features_scaled)[0] for tree in self.model.estimators_]
+        # Get feature importance (impurity-based for models saved before the registry)
+        importance = self.feature_importance or dict(
+            zip(self.feature_names, self.model.feature_importances_, strict=True)
         )
-        tree_predictions = np.expm1(tree_predictions_log)
-        std = tree_predictions.std()
 
-        ci_lower = max(0, prediction - 1.96 * std)
-        ci_upper = prediction + 1.96 * std
+        return [
+            PricePrediction(
+                predicted_price=float(predictions[i]),
+                confidence_interval=(float(ci_lower[i]), float(ci_upper[i])),
+                feature_importance=dict(importance),
+                model_confidence=float(model_confidence[i]),
+                similar_awards=[],  # Could be populated from historical data
+            )
+            for i in range(len(predictions))
+        ]
+
+    def _tree_predictions(self, features_scaled: np.ndarray) -> np.ndarray:
+        """
+        Raw output of every boosting stage's tree, shape (n_estimators, n_rows).
 
-        # Calculate model confidence based on prediction spread
-        cv = std / prediction if prediction > 0 else 1.0
-        model_confidence = max(0.0, min(1.0, 1.0 - cv))
-
-        # Get feature importance
-        importance = dict(zip(self.feature_names, self.model.feature_importances_))
-
-        return PricePrediction(
-            predicted_price=float(prediction),
-            confidence_interval=(float(ci_lower), float(ci_upper)),
-            feature_importance=importance,
-            model_confidence=float(model_confidence),
-            similar_awards=[],  # Could be populated from historical data
+        Recovered from the cumulative ``staged_predict`` outputs, so the batch
+        is traversed once per stage instead of once per tree per row.
+        """
+        staged = np.vstack(
+            [self.model.init_.predict(features_scaled), *self.model.staged_predict(features_scaled)]
         )
+        return np.diff(staged, axis=0) / self.model.learning_rate
 
     def optimize_price(
         self,
@@ -214,24 +297,22 @@ class PricingMLModel:
         best_margin = min_margin
         best_win_prob = 0.5
 
-        # Grid search over possible margins
-        for margin in np.arange(min_margin, max_margin + 0.01, 0.01):
-            price = base_cost * (1 + margin)
-            win_prob = win_model.predict(price, market_median)
+        # Grid search over possible margins, scored in one batch
+        margins = np.arange(min_margin, max_margin + 0.01, 0.01)
+        if margins.size:
+            prices = base_cost * (1 + margins)
+            win_probs = win_model.predict_many(prices, market_median)
 
-            # Score: weighted combination prioritizing target win prob
-            if win_prob >= target_win_prob:
-                # Above target: maximize margin while maintaining win prob
-                score = margin * 0.6 + win_prob * 0.4
-            else:
-                # Below target: maximize win prob
-                score = win_prob
+            # Score: weighted combination prioritizing target win prob.
+            # Above target: maximize margin while maintaining win prob;
+            # below target: maximize win prob
+            scores = np.where(win_probs >= target_win_prob, margins * 0.6 + win_probs * 0.4, win_probs)
 
-            if score > best_score:
-                best_score = score
-                best_price = price
-                best_margin = margin
-                best_win_prob = win_prob
+            best = int(np.argmax(scores))  # first of equal scores, as the loop kept
+            best_score = scores[best]
+            best_price = prices[best]
+            best_margin = margins[best]
+            best_win_prob = win_probs[best]
 
         return {
             "optimal_price": float(best_price),
@@ -294,30 +375,55 @@ class PricingMLModel:
         self.feature_names = feature_columns
         return np.column_stack(features)
 
-    def _encode_features(self, data: Dict) -> np.ndarray:
-        """Encode a single data point for prediction."""
+    def _encode_frame(self, data: pd.DataFrame) -> np.ndarray:
+        """Encode prediction rows with precomputed category -> code lookups."""
+        if self._encoding_maps is None:
+            self._encoding_maps = {
+                col: {value: code for code, value in enumerate(encoder.classes_)}
+                for col, encoder in self.label_encoders.items()
+            }
+
+        defaults = {"contract_type": "FFP", "set_aside": "None", "requirement_count": 10}
         features = []
         for col in self.feature_names:
-            if col in self.label_encoders:
-                try:
-                    encoded = self.label_encoders[col].transform(
-                        [str(data.get(col, "Unknown"))]
-                    )[0]
-                except ValueError:
-                    # Unknown value - use "Unknown" encoding
-                    encoded = self.label_encoders[col].transform(["Unknown"])[0]
-                features.append(encoded)
+            if col in data.columns:
+                values = data[col]
+            elif col == "description_length" and "description" in data.columns:
+                values = data["description"].fillna("").astype(str).str.len()
             else:
-                features.append(data.get(col, 0))
-        return np.array(features)
+                values = pd.Series(defaults.get(col, "Unknown" if col in CATEGORICAL_FEATURES else 0), index=data.index)
+
+            if col in self._encoding_maps:
+                mapping = self._encoding_maps[col]
+                default = "None" if col == "set_aside" else "Unknown"
+                # Unknown values use the "Unknown" encoding
+                values = values.where(values.notna(), default).astype(str)
+                features.append(values.map(mapping).fillna(mapping["Unknown"]).to_numpy(dtype=float))
+            else:
+                features.append(pd.to_numeric(values, errors="coerce").fillna(0).to_numpy(dtype=float))
+        return np.column_stack(features)
 
-    def _save_model(self):
+    @staticmethod
+    def _boosting_params() -> Dict:
+        return {
+            "max_iter": 100,
+            "learning_rate": 0.1,
+            "max_depth": 5,
+            "min_samples_leaf": 5,
+            "early_stopping": False,
+            "random_state": 42,
+        }
+
+    def _save_model(self, path: Optional[Path] = None):
         """Save model to disk."""
-        self.model_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.model_path, "wb") as f:
+        path = path or self.model_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
             pickle.dump(
                 {
                     "model": self.model,
+                    "quantile_models": self.quantile_models,
+                    "feature_importance": self.feature_importance,
                     "scaler": self.scaler,
                     "label_encoders": self.label_encoders,
                     "feature_names": self.feature_names,
@@ -331,8 +437,11 @@ class PricingMLModel:
             with open(self.model_path, "rb") as f:
                 data = pickle.load(f)
                 self.model = data["model"]
+                self.quantile_models = data.get("quantile_models", {})
+                self.feature_importance = data.get("feature_importance", {})
                 self.scaler = data["scaler"]
                 self.label_encoders = data["label_encoders"]
+                self._encoding_maps = None
                 self.feature_names = data["feature_names"]
                 self._is_trained = True
         except Exception as e:
@@ -340,13 +449,45 @@ class PricingMLModel:
             self._is_trained = False
 
 
-# Singleton instance
+# Shared instance, kept on the registry's current version
 _pricing_ml_model: Optional[PricingMLModel] = None
+_model_version: Optional[str] = None
+_checked_at = float("-inf")
+_model_lock = threading.Lock()
 
 
 def get_pricing_ml_model() -> PricingMLModel:
-    """Get the singleton pricing ML model instance."""
-    global _pricing_ml_model
-    if _pricing_ml_model is None:
-        _pricing_ml_model = PricingMLModel()
+    """
+    Get the shared pricing ML model instance.
+
+    The registry pointer is checked at most every CHECK_INTERVAL_SECONDS; when
+    it names a new version, that version is loaded and replaces the instance.
+    Without a registry version, the model at the legacy ``model_path`` is used.
+    """
+    global _pricing_ml_model, _model_version, _checked_at
+    now = time.monotonic()
+    if _pricing_ml_model is not None and now - _checked_at < CHECK_INTERVAL_SECONDS:
+        return _pricing_ml_model
+    with _model_lock:
+        if _pricing_ml_model is not None and now - _checked_at < CHECK_INTERVAL_SECONDS:
+            return _pricing_ml_model
+        _checked_at = now
+        registry = ModelRegistry()
+        version = registry.current_version()
+        if version is not None and version != _model_version:
+            try:
+                _pricing_ml_model = registry.load(version)
+                _model_version = version
+                logger.info(f"Loaded pricing model version {version}")
+            except Exception as e:
+                logger.warning(f"Could not load pricing model version {version}: {e}")
+        if _pricing_ml_model is None:
+            _pricing_ml_model = PricingMLModel()
     return _pricing_ml_model
+
+
+def reset_pricing_ml_model() -> None:
+    """Reset the shared instance (for testing purposes)."""
+    global _pricing_ml_model, _model_version, _checked_at
+    with _model_lock:
+        _pricing_ml_model, _model_version, _checked_at = None, None, float("-inf")
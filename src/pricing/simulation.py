@@ -0,0 +1,168 @@
+"""
+Monte Carlo pricing simulation.
+
+``run_war_gaming`` prices three fixed what-if points. This module samples the
+same cost components instead: material and labor multipliers (normal around
+1.0), a risk contingency (triangular between the best and worst case of the
+war-gaming presets) and the market median competitors price against
+(lognormal around the historical median). Every bid on a margin grid is
+evaluated against every draw in one array computation, giving for each margin
+the win probability, the realized margin and the expected profit
+(win probability x profit) over all draws, and the price maximizing expected
+profit.
+
+The bid price is a decision made before costs are known: it is the planned
+cost (nominal multipliers, most likely contingency) marked up by the margin.
+Realized cost varies per draw, so a bid can lose money.
+"""
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+from src.pricing.win_probability import WinProbabilityModel
+
+PERCENTILES = (5, 25, 50, 75, 95)
+HISTOGRAM_BINS = 20
+# Draws evaluated at once; bounds the (margins x draws) arrays to a few MB
+CHUNK_SIZE = 20_000
+
+
+@dataclass
+class MonteCarloParams:
+    """Distributions and margin grid for a pricing simulation."""
+    draws: int = 100_000
+    material_cost_sd: float = 0.10  # Std deviation of the material cost multiplier
+    labor_cost_sd: float = 0.08  # Std deviation of the labor cost multiplier
+    risk_contingency: tuple[float, float, float] = (0.0, 0.05, 0.15)  # min, most likely, max
+    competitor_price_sd: float = 0.15  # Lognormal sigma of the competitors' market median
+    min_margin: float = 0.05
+    max_margin: float = 0.60
+    margin_step: float = 0.01
+    seed: int | None = None
+
+
+@dataclass
+class PricingSimulation:
+    """Outcome distributions of a Monte Carlo pricing simulation."""
+    draws: int
+    planned_cost: float
+    market_median: float
+    cost_percentiles: dict[str, float]
+    cost_histogram: dict[str, list[float]]
+    competitor_median_percentiles: dict[str, float]
+    margin_grid: list[dict[str, float]]
+    optimal: dict[str, float]
+    params: dict[str, Any] = field(default_factory=dict)
+    market_basis: str = ""
+
+
+def margin_grid(min_margin: float, max_margin: float, step: float = 0.01) -> np.ndarray:
+    """Margins from ``min_margin`` to ``max_margin`` inclusive."""
+    # Half a step past the end keeps max_margin in and float error from adding one more
+    return np.arange(min_margin, max_margin + step / 2, step)
+
+
+def _percentiles(values: np.ndarray) -> dict[str, float]:
+    percentiles = np.percentile(values, PERCENTILES)
+    return {f"p{p}": round(float(v), 2) for p, v in zip(PERCENTILES, percentiles, strict=True)}
+
+
+def sample_costs(
+    material_cost: float,
+    labor_cost: float,
+    overhead_cost: float,
+    params: MonteCarloParams,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """Realized cost (with risk contingency) for each draw."""
+    material = material_cost * np.clip(rng.normal(1.0, params.material_cost_sd, params.draws), 0.0, None)
+    labor = labor_cost * np.clip(rng.normal(1.0, params.labor_cost_sd, params.draws), 0.0, None)
+    low, mode, high = params.risk_contingency
+    contingency = rng.triangular(low, mode, high, params.draws) if high > low else np.full(params.draws, mode)
+    return (material + labor + overhead_cost) * (1.0 + contingency)
+
+
+def simulate_pricing(
+    material_cost: float,
+    labor_cost: float,
+    overhead_cost: float,
+    market_median: float,
+    params: MonteCarloParams | None = None,
+    win_model: WinProbabilityModel | None = None,
+) -> PricingSimulation:
+    """
+    Simulate bids over a margin grid against sampled costs and competitor prices.
+
+    Args:
+        material_cost: Nominal material cost
+        labor_cost: Nominal labor cost
+        overhead_cost: Overhead, held fixed as in ``run_war_gaming``
+        market_median: Historical market median the competitor prices center on
+        params: Distributions and margin grid
+        win_model: Model mapping bid price and market median to win probability
+
+    Returns:
+        PricingSimulation with per-margin statistics and the expected-profit optimum
+    """
+    params = params or MonteCarloParams()
+    win_model = win_model or WinProbabilityModel()
+    rng = np.random.default_rng(params.seed)
+
+    costs = sample_costs(material_cost, labor_cost, overhead_cost, params, rng)
+    medians = market_median * rng.lognormal(0.0, params.competitor_price_sd, params.draws)
+
+    planned_cost = (material_cost + labor_cost + overhead_cost) * (1.0 + params.risk_contingency[1])
+    margins = margin_grid(params.min_margin, params.max_margin, params.margin_step)
+    prices = planned_cost * (1.0 + margins)
+
+    # Sums over draws per margin, accumulated chunk by chunk
+    win_sum = np.zeros(len(margins))
+    expected_profit_sum = np.zeros(len(margins))
+    loss_count = np.zeros(len(margins))
+    for start in range(0, params.draws, CHUNK_SIZE):
+        cost = costs[start:start + CHUNK_SIZE]
+        win = win_model.predict_many(prices[:, None], medians[None, start:start + CHUNK_SIZE])
+        profit = prices[:, None] - cost[None, :]
+        win_sum += win.sum(axis=1)
+        expected_profit_sum += (win * profit).sum(axis=1)
+        loss_count += (profit < 0).sum(axis=1)
+
+    win_probability = win_sum / params.draws
+    expected_profit = expected_profit_sum / params.draws
+    # Profit and realized margin are monotone in cost, so their percentiles follow from the cost percentiles
+    cost_q = np.percentile(costs, PERCENTILES)
+
+    grid = []
+    for i, (margin, price) in enumerate(zip(margins, prices, strict=True)):
+        profit_q = price - cost_q[::-1]
+        grid.append({
+            "margin": round(float(margin), 4),
+            "price": round(float(price), 2),
+            "win_probability": round(float(win_probability[i]), 4),
+            "expected_profit": round(float(expected_profit[i]), 2),
+            "probability_of_loss": round(float(loss_count[i] / params.draws), 4),
+            "profit_p5": round(float(profit_q[0]), 2),
+            "profit_p50": round(float(profit_q[2]), 2),
+            "profit_p95": round(float(profit_q[4]), 2),
+            "realized_margin_p50": round(float(price / cost_q[2] - 1.0), 4),
+        })
+
+    counts, edges = np.histogram(costs, bins=HISTOGRAM_BINS)
+    return PricingSimulation(
+        draws=params.draws,
+        planned_cost=round(float(planned_cost), 2),
+        market_median=round(float(market_median), 2),
+        cost_percentiles={**_percentiles(costs), "mean": round(float(costs.mean()), 2)},
+        cost_histogram={"counts": counts.tolist(), "bin_edges": np.round(edges, 2).tolist()},
+        competitor_median_percentiles=_percentiles(medians),
+        margin_grid=grid,
+        optimal=grid[int(np.argmax(expected_profit))] if grid else {},
+        params={
+            "material_cost_sd": params.material_cost_sd,
+            "labor_cost_sd": params.labor_cost_sd,
+            "risk_contingency": list(params.risk_contingency),
+            "competitor_price_sd": params.competitor_price_sd,
+            "seed": params.seed,
+        },
+    )
@@ -1,3 +1,6 @@
+import numpy as np
+
+
 class WinProbabilityModel:
     """
     Predicts win probability based on bid price relative to market benchmarks.
@@ -18,6 +21,17 @@ class WinProbabilityModel:
 
         return max(0.05, min(0.95, round(prob, 2)))
 
+    def predict_many(self, bid_prices, market_medians, sensitivity: float = 2.5) -> np.ndarray:
+        """
+        ``predict`` over arrays of bid prices and market medians (broadcast together).
+        """
+        bid_prices = np.asarray(bid_prices, dtype=float)
+        market_medians = np.asarray(market_medians, dtype=float)
+        valid = market_medians > 0
+        price_ratio = bid_prices / np.where(valid, market_medians, 1.0)
+        prob = np.clip(np.round(0.5 - (price_ratio - 1.0) * sensitivity, 2), 0.05, 0.95)
+        return np.where(valid, prob, 0.5)
+
     def solve_for_price(self, target_prob: float, market_median: float, sensitivity: float = 2.5) -> float:
         """
         Calculate the maximum price that achieves the target win probability.
@@ -10,6 +10,7 @@ This replaces the FAISS-based implementation with ChromaDB for:
 import logging
 import threading
 import uuid
+from datetime import datetime, timezone
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -240,6 +241,7 @@ class ChromaRAGEngine:
             "collection_name": self.collection.name,
             "persist_directory": self._persist_directory,
             "is_built": True,
+            "built_at": (self.collection.metadata or {}).get("built_at"),
             "embedding_available": True,  # Always True - model lazy-loads on first use
             "total_vectors": self.collection.count(),  # Compatibility with old API
         }
@@ -300,8 +302,10 @@ class ChromaRAGEngine:
         except Exception as e:
             logger.debug(f"Collection deletion skipped (may not exist): {e}")
 
+        # built_at tells caches of retrieval results that the index was rebuilt
         self.collection = self.client.create_collection(
-            name="rfp_documents", metadata={"hnsw:space": "cosine"}
+            name="rfp_documents",
+            metadata={"hnsw:space": "cosine", "built_at": datetime.now(timezone.utc).isoformat()},
         )
 
         # Load and index all parquet files
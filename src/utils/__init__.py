@@ -3,6 +3,7 @@ Shared utilities for the RFP ML system.
 """
 from .category import CategoryType, determine_category
 from .config_loader import load_or_create_config, save_config
+from .keyword_classifier import KeywordClassifier
 from .constants import (
     ComplianceDefaults,
     ContractValueDefaults,
@@ -17,11 +18,13 @@ from .document_reader import (
     extract_text_from_document,
     extract_all_document_content,
 )
+from .text_store import DocumentExtractionError, ExtractedText, get_text_store
 
 __all__ = [
     # Category
     "determine_category",
     "CategoryType",
+    "KeywordClassifier",
     # Config
     "load_or_create_config",
     "save_config",
@@ -41,4 +44,7 @@ __all__ = [
     # Document reading
     "extract_text_from_document",
     "extract_all_document_content",
+    "get_text_store",
+    "ExtractedText",
+    "DocumentExtractionError",
 ]
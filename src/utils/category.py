@@ -5,6 +5,8 @@ Centralizes the category determination logic used across multiple modules.
 from enum import Enum
 from typing import Any
 
+from .keyword_classifier import KeywordClassifier
+
 
 class CategoryType(str, Enum):
     """Supported RFP categories."""
@@ -36,6 +38,8 @@ NAICS_CATEGORY_MAP: dict[str, CategoryType] = {
     "81": CategoryType.MAINTENANCE,             # Other Services (Repair/Maintenance)
 }
 
+_CATEGORY_CLASSIFIER = KeywordClassifier(CATEGORY_KEYWORDS)
+
 
 def determine_category(rfp_data: dict[str, Any]) -> str:
     """
@@ -58,16 +62,14 @@ def determine_category(rfp_data: dict[str, Any]) -> str:
         >>> determine_category({"naics_code": "541512"})
         'professional_services'
     """
-    title = str(rfp_data.get("title", "")).lower()
-    description = str(rfp_data.get("description", "")).lower()
+    title = str(rfp_data.get("title", ""))
+    description = str(rfp_data.get("description", ""))
     naics_code = str(rfp_data.get("naics_code", ""))
 
-    combined_text = title + " " + description
-
     # Check keyword-based categories first (more specific)
-    for category, keywords in CATEGORY_KEYWORDS.items():
-        if any(keyword in combined_text for keyword in keywords):
-            return category.value
+    category = _CATEGORY_CLASSIFIER.first(title + " " + description)
+    if category is not None:
+        return category.value
 
     # Fall back to NAICS code mapping
     for prefix, category in NAICS_CATEGORY_MAP.items():
@@ -1,7 +1,8 @@
 """
 Document reader utility for extracting text from RFP attachments.
 
-Supports PDF and DOCX files for use in AI proposal generation.
+Supports PDF and DOCX files for use in AI proposal generation. Text is read
+through the persistent extracted-text store, so each file is parsed once.
 """
 
 import logging
@@ -9,22 +10,26 @@ import os
 from pathlib import Path
 from typing import Optional
 
+from .text_store import DocumentExtractionError, get_text_store
+
 logger = logging.getLogger(__name__)
 
-# Try to import document parsing libraries
-try:
-    from PyPDF2 import PdfReader
-    PDF_AVAILABLE = True
-except ImportError:
-    PDF_AVAILABLE = False
-    logger.warning("PyPDF2 not available - PDF reading disabled")
 
-try:
-    from docx import Document
-    DOCX_AVAILABLE = True
-except ImportError:
-    DOCX_AVAILABLE = False
-    logger.warning("python-docx not available - DOCX reading disabled")
+def _read_stored_text(file_path: str, max_pages: int | None = None) -> Optional[str]:
+    if not file_path or not os.path.exists(file_path):
+        logger.warning(f"Document file not found: {file_path}")
+        return None
+
+    try:
+        text = get_text_store().read(file_path, max_pages).strip()
+    except DocumentExtractionError as e:
+        logger.error(f"Error reading {file_path}: {e}")
+        return None
+
+    if not text:
+        logger.warning(f"No text extracted from: {file_path}")
+        return None
+    return text
 
 
 def extract_text_from_pdf(file_path: str, max_pages: int = 50) -> Optional[str]:
@@ -38,36 +43,7 @@ def extract_text_from_pdf(file_path: str, max_pages: int = 50) -> Optional[str]:
     Returns:
         Extracted text content or None if extraction fails
     """
-    if not PDF_AVAILABLE:
-        logger.warning("PDF reading not available - PyPDF2 not installed")
-        return None
-
-    if not os.path.exists(file_path):
-        logger.warning(f"PDF file not found: {file_path}")
-        return None
-
-    try:
-        reader = PdfReader(file_path)
-        text_parts = []
-
-        num_pages = min(len(reader.pages), max_pages)
-        for i in range(num_pages):
-            page = reader.pages[i]
-            page_text = page.extract_text()
-            if page_text:
-                text_parts.append(page_text)
-
-        if text_parts:
-            full_text = "\n\n".join(text_parts)
-            logger.info(f"Extracted {len(full_text)} chars from PDF ({num_pages} pages): {file_path}")
-            return full_text.strip()
-
-        logger.warning(f"No text extracted from PDF: {file_path}")
-        return None
-
-    except Exception as e:
-        logger.error(f"Error reading PDF {file_path}: {e}")
-        return None
+    return _read_stored_text(file_path, max_pages=max_pages)
 
 
 def extract_text_from_docx(file_path: str) -> Optional[str]:
@@ -80,50 +56,14 @@ def extract_text_from_docx(file_path: str) -> Optional[str]:
     Returns:
         Extracted text content or None if extraction fails
     """
-    if not DOCX_AVAILABLE:
-        logger.warning("DOCX reading not available - python-docx not installed")
-        return None
-
-    if not os.path.exists(file_path):
-        logger.warning(f"DOCX file not found: {file_path}")
-        return None
-
-    try:
-        doc = Document(file_path)
-        text_parts = []
-
-        for para in doc.paragraphs:
-            if para.text.strip():
-                text_parts.append(para.text)
-
-        # Also extract from tables
-        for table in doc.tables:
-            for row in table.rows:
-                row_text = []
-                for cell in row.cells:
-                    if cell.text.strip():
-                        row_text.append(cell.text.strip())
-                if row_text:
-                    text_parts.append(" | ".join(row_text))
-
-        if text_parts:
-            full_text = "\n".join(text_parts)
-            logger.info(f"Extracted {len(full_text)} chars from DOCX: {file_path}")
-            return full_text.strip()
-
-        logger.warning(f"No text extracted from DOCX: {file_path}")
-        return None
-
-    except Exception as e:
-        logger.error(f"Error reading DOCX {file_path}: {e}")
-        return None
+    return _read_stored_text(file_path)
 
 
 def extract_text_from_document(file_path: str) -> Optional[str]:
     """
     Extract text from a document based on its file extension.
 
-    Supports PDF and DOCX files.
+    Supports PDF, DOCX and plain text files.
 
     Args:
         file_path: Path to the document file
@@ -134,23 +74,12 @@ def extract_text_from_document(file_path: str) -> Optional[str]:
     if not file_path:
         return None
 
-    path = Path(file_path)
-    extension = path.suffix.lower()
+    extension = Path(file_path).suffix.lower()
 
     if extension == ".pdf":
         return extract_text_from_pdf(file_path)
-    elif extension in (".docx", ".doc"):
-        return extract_text_from_docx(file_path)
-    elif extension == ".txt":
-        # Plain text files
-        try:
-            with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                content = f.read()
-            logger.info(f"Read {len(content)} chars from text file: {file_path}")
-            return content.strip()
-        except Exception as e:
-            logger.error(f"Error reading text file {file_path}: {e}")
-            return None
+    elif extension in (".docx", ".doc", ".txt"):
+        return _read_stored_text(file_path)
     else:
         logger.warning(f"Unsupported document format: {extension} for {file_path}")
         return None
@@ -0,0 +1,121 @@
+"""
+Keyword classification shared by the category, compliance and Q&A categorizers.
+
+A KeywordClassifier compiles an ordered mapping of category -> keywords into
+an Aho-Corasick automaton (pyahocorasick) once. Each text is lowercased once
+and scanned in a single pass for the distinct keywords of all categories,
+whatever their number; the set of keywords found then answers every category
+question (best-scoring category, keywords per category) without rescanning.
+Keywords match as substrings, like the ``keyword in text`` chains this
+replaces.
+
+``first`` on a single text skips the automaton for small dictionaries: with
+a few dozen keywords, ``keyword in text`` checks in category order stop at
+the first hit and beat a full automaton pass.
+
+``first_many`` classifies a whole DataFrame column in one batch instead of a
+row-wise ``apply``: the texts are joined and scanned by the automaton in one
+call, and the hits are mapped back to their texts with numpy.
+"""
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+import ahocorasick
+import numpy as np
+
+# Joins texts for a batch scan; lowercased text keeps it, keywords never contain it
+_SEPARATOR = "\x00"
+# Largest vocabulary ``first`` checks with substring scans instead of the automaton
+_SUBSTRING_SCAN_MAX_KEYWORDS = 32
+
+
+class KeywordClassifier:
+    """Classify texts against an ordered dictionary of category keywords."""
+
+    def __init__(self, keywords: Mapping[Any, Iterable[str]]):
+        """
+        Args:
+            keywords: Category -> keywords; category order sets priority for ``first``
+                and breaks ties for ``best``
+        """
+        self.categories = list(keywords)
+        self.keywords = {category: [word.lower() for word in words] for category, words in keywords.items()}
+        self.vocabulary = list(dict.fromkeys(word for words in self.keywords.values() for word in words))
+        position = {word: i for i, word in enumerate(self.vocabulary)}
+        # First category, in dictionary order, each keyword belongs to
+        self._first_category = np.full(len(self.vocabulary), len(self.categories), dtype=np.int64)
+        for c, words in reversed(list(enumerate(self.keywords.values()))):
+            self._first_category[[position[word] for word in words]] = c
+        self._first_category_list = self._first_category.tolist()
+        self._substring_scan = len(self.vocabulary) <= _SUBSTRING_SCAN_MAX_KEYWORDS
+
+        self._automaton = ahocorasick.Automaton()
+        for i, word in enumerate(self.vocabulary):
+            self._automaton.add_word(word, i)
+        if self.vocabulary:
+            self._automaton.make_automaton()
+
+    def find(self, text: str) -> set[str]:
+        """Distinct keywords occurring in ``text``."""
+        if not self.vocabulary:
+            return set()
+        return {self.vocabulary[i] for _end, i in self._automaton.iter(text.lower())}
+
+    def matches(self, text: str) -> dict[Any, list[str]]:
+        """Keywords found per category, in dictionary order; categories without hits are left out."""
+        found = self.find(text)
+        matched = {}
+        for category, words in self.keywords.items():
+            words_found = [word for word in words if word in found]
+            if words_found:
+                matched[category] = words_found
+        return matched
+
+    def first(self, text: str, default: Any = None) -> Any:
+        """First category, in dictionary order, with any keyword in ``text``."""
+        if not self.vocabulary:
+            return default
+        if self._substring_scan:
+            text = text.lower()
+            for category, words in self.keywords.items():
+                if any(word in text for word in words):
+                    return category
+            return default
+        first = len(self.categories)
+        for _end, k in self._automaton.iter(text.lower()):
+            if self._first_category_list[k] < first:
+                first = self._first_category_list[k]
+                if first == 0:  # Nothing ranks higher
+                    break
+        return self.categories[first] if first < len(self.categories) else default
+
+    def best(self, text: str, default: Any = None) -> Any:
+        """Category with the most keywords in ``text``; ties go to the earlier one."""
+        found = self.find(text)
+        best_category, best_score = default, 0
+        for category, words in self.keywords.items():
+            score = sum(1 for word in words if word in found)
+            if score > best_score:
+                best_category, best_score = category, score
+        return best_category
+
+    def first_many(self, texts: Iterable[str], default: Any = None) -> list[Any]:
+        """``first`` for many texts, e.g. a DataFrame text column, in one automaton scan."""
+        texts = [str(text).lower() for text in texts]
+        if not texts:
+            return []
+        if not self.vocabulary:
+            return [default] * len(texts)
+
+        hits = np.fromiter(
+            (item for end, k in self._automaton.iter(_SEPARATOR.join(texts)) for item in (end, k)),
+            dtype=np.int64,
+        ).reshape(-1, 2)
+        # Text t spans [starts[t], starts[t] + len(texts[t])) of the joined string
+        lengths = np.fromiter((len(text) for text in texts), dtype=np.int64, count=len(texts))
+        starts = np.concatenate(([0], np.cumsum(lengths[:-1] + len(_SEPARATOR))))
+        owner = np.searchsorted(starts, hits[:, 0], side="right") - 1
+
+        first = np.full(len(texts), len(self.categories), dtype=np.int64)
+        np.minimum.at(first, owner, self._first_category[hits[:, 1]])
+        return [self.categories[c] if c < len(self.categories) else default for c in first.tolist()]
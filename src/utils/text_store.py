@@ -0,0 +1,466 @@
+"""
+Persistent extracted-text store for RFP attachments.
+
+Extracting text from a large PDF (text layer, and OCR for scanned files) is
+far more expensive than reading it back, so every reader goes through this
+module: text and page offsets are extracted once per file content, keyed by
+SHA-256 checksum, and persisted under ``data/extracted_text``. Extraction can
+be pushed to a process pool at upload/download time so request handlers only
+ever read the stored result; on a miss the text is extracted inline and stored.
+
+PDFs are checked page by page: only pages without a usable text layer are
+OCR'd, each rendered and recognized on its own, so a scan never has all of
+its page images in memory at once. Inline extraction spreads the pages over
+the store's process pool; extraction already running in that pool OCRs its
+pages one after another rather than starting processes of its own. So does
+inline extraction when the store has a single worker
+(``settings.extraction.workers = 1`` or one CPU): a scan is then OCR'd page
+by page in the calling process, and ``submit``/``warm`` at upload time are
+what keep it off request paths. The OCR page budget and DPI come from
+``settings.extraction``, and DPI drops for large scans.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+from src.config.paths import PathConfig
+from src.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Bump when extraction output changes so stale entries are re-extracted
+EXTRACTOR_VERSION = 2
+
+SUPPORTED_EXTENSIONS = {".pdf", ".docx", ".doc", ".txt", ".md", ".xlsx", ".xls"}
+
+_PAGE_SEPARATOR = "\n\n"
+
+
+class DocumentExtractionError(Exception):
+    """Raised when a document cannot be read."""
+    pass
+
+
+@dataclass
+class ExtractedText:
+    """Text of one file, with the character offset where each page starts."""
+    checksum: str
+    text: str
+    page_offsets: list[int]
+    method: str
+    extracted_at: str
+
+    @classmethod
+    def from_pages(cls, checksum: str, pages: list[str], method: str) -> "ExtractedText":
+        offsets = []
+        position = 0
+        for page in pages:
+            offsets.append(position)
+            position += len(page) + len(_PAGE_SEPARATOR)
+        return cls(
+            checksum=checksum,
+            text=_PAGE_SEPARATOR.join(pages),
+            page_offsets=offsets,
+            method=method,
+            extracted_at=datetime.now(timezone.utc).isoformat(),
+        )
+
+    @property
+    def page_count(self) -> int:
+        return len(self.page_offsets)
+
+    def pages(self, start: int = 0, end: int | None = None) -> str:
+        """Text of pages ``[start, end)``."""
+        end = self.page_count if end is None else min(end, self.page_count)
+        if start >= end:
+            return ""
+        if end < self.page_count:
+            stop = self.page_offsets[end] - len(_PAGE_SEPARATOR)
+        else:
+            stop = len(self.text)
+        return self.text[self.page_offsets[start]:stop]
+
+
+def file_checksum(file_path: str | Path) -> str:
+    """SHA-256 of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Extraction
+# ---------------------------------------------------------------------------
+
+def _pdf_text_pages(file_path: Path, max_pages: int | None = None) -> list[str]:
+    """Text-layer pages (the first ``max_pages``) via PyMuPDF, pdfplumber or PyPDF2."""
+    try:
+        import fitz  # type: ignore[import-untyped] # PyMuPDF
+
+        with fitz.open(str(file_path)) as doc:
+            count = min(doc.page_count, max_pages or doc.page_count)
+            return [doc[i].get_text() for i in range(count)]
+    except ImportError:
+        pass
+
+    try:
+        import pdfplumber  # type: ignore[import-untyped]
+
+        with pdfplumber.open(str(file_path)) as pdf:
+            return [page.extract_text() or "" for page in pdf.pages[:max_pages]]
+    except ImportError:
+        pass
+
+    try:
+        from PyPDF2 import PdfReader
+
+        reader = PdfReader(str(file_path))
+        count = min(len(reader.pages), max_pages or len(reader.pages))
+        return [reader.pages[i].extract_text() or "" for i in range(count)]
+    except ImportError as err:
+        raise DocumentExtractionError("PDF processing libraries not available") from err
+
+
+def plan_ocr(scanned_pages: int) -> tuple[int, int]:
+    """
+    Decide how many scanned pages to OCR and at what DPI.
+
+    Small scans are rendered at ``ocr_max_dpi``. Past ``ocr_full_dpi_pages``
+    the DPI falls linearly towards ``ocr_min_dpi`` at ``ocr_max_pages`` so the
+    total render/OCR cost of a large scan stays bounded.
+    """
+    config = settings.extraction
+    pages = min(scanned_pages, config.ocr_max_pages)
+    if pages <= config.ocr_full_dpi_pages or config.ocr_max_pages <= config.ocr_full_dpi_pages:
+        return pages, config.ocr_max_dpi
+
+    full_dpi_pages = config.ocr_full_dpi_pages
+    fraction = (pages - full_dpi_pages) / (config.ocr_max_pages - full_dpi_pages)
+    dpi = round(config.ocr_max_dpi - fraction * (config.ocr_max_dpi - config.ocr_min_dpi))
+    return pages, max(config.ocr_min_dpi, dpi)
+
+
+def _ocr_page(file_path: str, page_number: int, dpi: int) -> str:
+    """Render and OCR a single page (1-based)."""
+    import pytesseract
+    from pdf2image import convert_from_path
+
+    images = convert_from_path(file_path, dpi=dpi, first_page=page_number, last_page=page_number)
+    try:
+        return pytesseract.image_to_string(images[0]) if images else ""
+    finally:
+        for image in images:
+            image.close()
+
+
+def _ocr_pages(
+    file_path: Path, page_indexes: list[int], dpi: int, pool: Executor | None = None
+) -> dict[int, str]:
+    """OCR the given 0-based pages, spread over ``pool`` when given and there is more than one."""
+    try:
+        import pdf2image  # noqa: F401
+        import pytesseract  # noqa: F401
+    except ImportError:
+        logger.warning("OCR libraries (pytesseract, pdf2image) not available for scanned PDF")
+        return {}
+
+    if pool is None or len(page_indexes) == 1:
+        return {i: _ocr_page(str(file_path), i + 1, dpi) for i in page_indexes}
+
+    # Each task renders one page, so at most one page image per worker is alive
+    texts = pool.map(
+        _ocr_page,
+        [str(file_path)] * len(page_indexes),
+        [i + 1 for i in page_indexes],
+        [dpi] * len(page_indexes),
+    )
+    return dict(zip(page_indexes, texts, strict=True))
+
+
+def _extract_pdf(
+    file_path: Path, pool: Executor | None = None, max_pages: int | None = None
+) -> tuple[list[str], str]:
+    pages = _pdf_text_pages(file_path, max_pages)
+    scanned = [
+        i for i, page in enumerate(pages)
+        if len(page.strip()) < settings.extraction.min_page_chars
+    ]
+    if not scanned:
+        return pages, "text_layer"
+
+    count, dpi = plan_ocr(len(scanned))
+    if count < len(scanned):
+        logger.warning(f"OCR limited to {count} of {len(scanned)} scanned pages: {file_path}")
+    logger.info(f"OCR of {count} scanned pages at {dpi} dpi: {file_path}")
+
+    try:
+        ocr_texts = _ocr_pages(file_path, scanned[:count], dpi, pool)
+    except Exception as e:
+        logger.warning(f"OCR failed: {e}")
+        ocr_texts = {}
+
+    recognized = 0
+    for i, text in ocr_texts.items():
+        if len(text.strip()) > len(pages[i].strip()):
+            pages[i] = text
+            recognized += 1
+
+    if not recognized:
+        return pages, "text_layer"
+    return pages, "ocr" if recognized == len(pages) else "mixed"
+
+
+def _extract_docx(file_path: Path) -> list[str]:
+    try:
+        from docx import Document
+    except ImportError as err:
+        raise DocumentExtractionError("DOCX processing library not available") from err
+
+    doc = Document(str(file_path))
+    parts = [para.text for para in doc.paragraphs if para.text.strip()]
+
+    # Also extract from tables
+    for table in doc.tables:
+        for row in table.rows:
+            cells = [cell.text.strip() for cell in row.cells if cell.text.strip()]
+            if cells:
+                parts.append(" | ".join(cells))
+    return ["\n".join(parts)]
+
+
+def _extract_spreadsheet(file_path: Path) -> list[str]:
+    try:
+        import pandas as pd
+    except ImportError as err:
+        raise DocumentExtractionError("Excel processing library not available") from err
+
+    sheets = pd.read_excel(str(file_path), sheet_name=None)
+    return [df.to_string() for df in sheets.values()]
+
+
+def extract_pages(
+    file_path: str | Path, pool: Executor | None = None, max_pages: int | None = None
+) -> tuple[list[str], str]:
+    """
+    Extract per-page text from a document without touching the store.
+
+    Args:
+        file_path: Document to read
+        pool: Executor scanned PDF pages are OCR'd in (default: one after another)
+        max_pages: Only read the first pages of a PDF; other formats are read whole
+
+    Returns:
+        Tuple of (pages, method). DOCX and plain-text files are a single page,
+        spreadsheets are one page per sheet.
+
+    Raises:
+        DocumentExtractionError: If the format is unsupported or parsing fails
+    """
+    path = Path(file_path)
+    suffix = path.suffix.lower()
+
+    try:
+        if suffix in {".txt", ".md"}:
+            return [path.read_text(encoding="utf-8", errors="ignore")], "plain_text"
+        if suffix == ".pdf":
+            return _extract_pdf(path, pool, max_pages)
+        if suffix in {".docx", ".doc"}:
+            return _extract_docx(path), "docx"
+        if suffix in {".xlsx", ".xls"}:
+            return _extract_spreadsheet(path), "spreadsheet"
+    except DocumentExtractionError:
+        raise
+    except Exception as e:
+        raise DocumentExtractionError(f"Failed to extract text from {path.name}: {e}") from e
+
+    raise DocumentExtractionError(f"Unsupported document format: {suffix}")
+
+
+# ---------------------------------------------------------------------------
+# Store
+# ---------------------------------------------------------------------------
+
+class ExtractedTextStore:
+    """Checksum-keyed, on-disk store of extracted document text."""
+
+    def __init__(self, root: str | Path | None = None, max_workers: int | None = None):
+        self.root = Path(
+            root or settings.extraction.store_dir or PathConfig.DATA_DIR / "extracted_text"
+        )
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_workers = max_workers or settings.extraction.workers or min(4, os.cpu_count() or 1)
+        self._checksums: dict[tuple[str, int, int], str] = {}
+        self._lock = threading.Lock()
+        self._pool: ProcessPoolExecutor | None = None
+
+    def _entry_path(self, checksum: str) -> Path:
+        return self.root / checksum[:2] / f"{checksum}.v{EXTRACTOR_VERSION}.json.gz"
+
+    def checksum(self, file_path: str | Path) -> str:
+        """File checksum, memoized by path, size and mtime."""
+        stat = os.stat(file_path)
+        key = (str(file_path), stat.st_size, stat.st_mtime_ns)
+        checksum = self._checksums.get(key)
+        if checksum is None:
+            checksum = file_checksum(file_path)
+            with self._lock:
+                self._checksums[key] = checksum
+        return checksum
+
+    def load(self, checksum: str) -> ExtractedText | None:
+        """Stored text for a checksum, or None."""
+        path = self._entry_path(checksum)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                return ExtractedText(**json.load(f))
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Discarding unreadable text store entry {path}: {e}")
+            return None
+
+    def save(self, extracted: ExtractedText) -> None:
+        path = self._entry_path(extracted.checksum)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump(extracted.__dict__, f)
+        os.replace(tmp_path, path)
+
+    def get(self, file_path: str | Path) -> ExtractedText | None:
+        """Stored text for a file, without extracting on a miss."""
+        if not file_path or not os.path.exists(file_path):
+            return None
+        return self.load(self.checksum(file_path))
+
+    def get_or_extract(self, file_path: str | Path) -> ExtractedText:
+        """
+        Stored text for a file, extracting and storing it on a miss.
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            DocumentExtractionError: If the file cannot be read
+        """
+        checksum = self.checksum(file_path)
+        extracted = self.load(checksum)
+        if extracted is not None:
+            return extracted
+
+        pages, method = extract_pages(file_path, pool=self._ocr_pool())
+        extracted = ExtractedText.from_pages(checksum, pages, method)
+        self.save(extracted)
+        logger.info(
+            f"Extracted {len(extracted.text)} chars "
+            f"({extracted.page_count} pages, {method}): {file_path}"
+        )
+        return extracted
+
+    def read(self, file_path: str | Path, max_pages: int | None = None) -> str:
+        """
+        Text of a file's first ``max_pages`` pages.
+
+        On a miss only those pages are extracted here; the whole file is
+        extracted and stored in the pool, so later reads hit the store.
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            DocumentExtractionError: If the file cannot be read
+        """
+        checksum = self.checksum(file_path)
+        extracted = self.load(checksum)
+        if extracted is None and max_pages is not None and Path(file_path).suffix.lower() == ".pdf":
+            pages, method = extract_pages(file_path, pool=self._ocr_pool(), max_pages=max_pages)
+            partial = ExtractedText.from_pages(checksum, pages, method)
+            if len(pages) < max_pages:
+                # The document ended within the range, so this is the whole file
+                self.save(partial)
+            else:
+                try:
+                    self.submit(file_path)
+                except Exception as e:
+                    logger.warning(f"Could not queue text extraction for {file_path}: {e}")
+            return partial.text
+        if extracted is None:
+            extracted = self.get_or_extract(file_path)
+        return extracted.pages(0, max_pages)
+
+    def _ocr_pool(self) -> ProcessPoolExecutor | None:
+        """
+        Pool inline extraction OCRs scanned pages in, or None to OCR them here.
+
+        A single-worker store (including the one extraction inside the pool
+        runs with) has no pool to spread pages over, so it OCRs serially in
+        the calling process.
+        """
+        return self._get_pool() if self.max_workers > 1 else None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                # spawn: the API process runs threads, which fork does not copy safely
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._pool
+
+    def submit(self, file_path: str | Path) -> Future:
+        """
+        Extract a file in the process pool and store the result.
+
+        The future resolves to the file checksum. Files already in the store
+        resolve immediately without using the pool.
+        """
+        checksum = self.checksum(file_path)
+        if self._entry_path(checksum).exists():
+            future: Future = Future()
+            future.set_result(checksum)
+            return future
+        return self._get_pool().submit(_extract_into_store, str(self.root), str(file_path))
+
+    def warm(self, file_paths: list[str | Path]) -> list[Future]:
+        """Queue extraction for files that are not stored yet (fire and forget)."""
+        futures = []
+        for file_path in file_paths:
+            if not file_path or not os.path.exists(file_path):
+                continue
+            if Path(file_path).suffix.lower() not in SUPPORTED_EXTENSIONS:
+                continue
+            try:
+                futures.append(self.submit(file_path))
+            except Exception as e:
+                logger.warning(f"Could not queue text extraction for {file_path}: {e}")
+        return futures
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+
+
+def _extract_into_store(root: str, file_path: str) -> str:
+    """Process-pool entry point."""
+    return ExtractedTextStore(root, max_workers=1).get_or_extract(file_path).checksum
+
+
+_store: ExtractedTextStore | None = None
+
+
+def get_text_store() -> ExtractedTextStore:
+    """Get the process-wide text store."""
+    global _store
+    if _store is None:
+        _store = ExtractedTextStore()
+    return _store
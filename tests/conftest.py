@@ -75,6 +75,16 @@ def override_get_db(db_session):
     return _override
 
 
+@pytest.fixture(autouse=True)
+def clear_response_cache():
+    """Keep cached endpoint responses from leaking between tests."""
+    from app.core.cache import response_cache
+
+    response_cache.clear()
+    yield
+    response_cache.clear()
+
+
 # =============================================================================
 # Sample Data Factories
 # =============================================================================
@@ -56,6 +56,46 @@ def test_get_analytics_overview_empty(client):
     assert data["stats"]["win_rate"] == 0.0
 
 
+def test_get_analytics_overview_aggregates(client, db_session):
+    """GET /analytics/overview groups trends and win rates in SQL."""
+    from datetime import datetime
+
+    rows = [
+        # (agency, naics, status, award, created_at)
+        ("GSA", "541511", "won", 1000.0, datetime(2025, 1, 5)),
+        ("GSA", "541511", "lost", None, datetime(2025, 1, 20)),
+        ("GSA", "", "won", 500.0, datetime(2025, 3, 1)),
+        ("DOD", "236220", "lost", None, datetime(2025, 3, 2)),
+        ("DOD", "236220", "pending", None, datetime(2025, 4, 2)),
+        ("DOD", "236220", "no_bid", None, datetime(2024, 12, 1)),
+    ]
+    for i, (agency, naics, status, award, created_at) in enumerate(rows):
+        rfp = RFPOpportunity(rfp_id=f"AGG-{i}", title=f"Aggregate RFP {i}", agency=agency, naics_code=naics)
+        db_session.add(rfp)
+        db_session.flush()
+        db_session.add(BidOutcome(rfp_id=rfp.id, status=status, award_amount=award, created_at=created_at))
+    db_session.commit()
+
+    data = client.get("/api/v1/analytics/overview", params={"start_date": "2025-01-01T00:00:00"}).json()
+
+    assert data["stats"]["total_bids"] == 5
+    assert data["stats"]["no_bid"] == 0
+    assert data["stats"]["total_revenue_won"] == 1500.0
+    assert data["stats"]["average_deal_size"] == 750.0
+    assert [(t["period"], t["wins"], t["losses"], t["win_rate"], t["revenue"]) for t in data["trends"]] == [
+        ("2025-01", 1, 1, 0.5, 1000.0),
+        ("2025-03", 1, 1, 0.5, 500.0),
+        ("2025-04", 0, 0, 0.0, 0.0),
+    ]
+    assert data["win_rate_by_category"] == {"541511": 0.5, "Unknown": 1.0, "236220": 0.0}
+    assert data["win_rate_by_agency"] == {"GSA": 0.667, "DOD": 0.0}
+
+    data = client.get("/api/v1/analytics/overview", params={"agency": "DOD"}).json()
+    assert data["stats"]["total_bids"] == 3
+    assert data["stats"]["no_bid"] == 1
+    assert [t["period"] for t in data["trends"]] == ["2024-12", "2025-03", "2025-04"]
+
+
 # =============================================================================
 # CRUD Endpoints for Bid Outcomes (Task 5)
 # =============================================================================
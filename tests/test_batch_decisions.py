@@ -0,0 +1,243 @@
+"""Tests for batch go/no-go scoring."""
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from app.core.cache import CacheTag, response_cache
+from app.models.database import PipelineStage, RFPOpportunity
+from app.services.batch_decisions import score_pipeline_rfps
+from app.services.pipeline_stream import pipeline_stream, register_delta_listeners
+
+from src.decision.batch_scoring import compute_decision_inputs, decision_inputs_key, score_rfps
+from src.decision.go_nogo_engine import GoNoGoEngine
+
+DESCRIPTIONS = [
+    "Annual maintenance of existing systems",
+    "Six month pilot, specialized staff required",
+    "Emergency repair, urgent response",
+    "Immediate need for certified inspectors",
+    "Security clearance required for current facility support",
+    "",
+    None,
+]
+
+
+class StubCompliance:
+    def __init__(self, matrices=None):
+        self.matrices = matrices or {}
+        self.calls = 0
+
+    def generate_compliance_matrix(self, rfp_data):
+        self.calls += 1
+        if rfp_data.get("title") in self.matrices:
+            return self.matrices[rfp_data["title"]]
+        requirements = len((rfp_data.get("description") or "").split())
+        return {"compliance_summary": {"total_requirements": requirements, "compliance_rate": 0.85}}
+
+
+class StubPricing:
+    def __init__(self, strategies=None):
+        self.strategies = strategies or {}
+
+    def compare_strategies(self, rfp_data, requirements):
+        if rfp_data.get("title") in self.strategies:
+            return self.strategies[rfp_data["title"]]
+        return {"cost_plus": SimpleNamespace(confidence_score=0.9, margin_percentage=32.0, risk_factors=["Tight market"])}
+
+
+def _engine(tmp_path, compliance=None, pricing=None):
+    engine = GoNoGoEngine(
+        compliance_generator=compliance,
+        pricing_engine=pricing,
+        config_dir=str(tmp_path / "config"),
+        historical_data_dir=str(tmp_path),
+    )
+    engine.win_rate_patterns = {
+        "naics_541511": 0.8,
+        "naics_236220": 0.35,
+        "naics_484110": 0.5,
+        "small_contracts": 0.75,
+        "medium_contracts": 0.6,
+        "large_contracts": 0.35,
+    }
+    return engine
+
+
+def _random_cases(count=300, seed=0):
+    rng = np.random.default_rng(seed)
+    rfps, matrices, strategies = [], {}, {}
+    for i in range(count):
+        title = f"RFP {i}"
+        rfp = {
+            "title": title,
+            "description": DESCRIPTIONS[rng.integers(len(DESCRIPTIONS))],
+            "naics_code": rng.choice(["541511", "236220", "484110", "999999", None]),
+            "award_amount": rng.choice([None, 0, 5e4, 5e5, 5e6]),
+        }
+        if rng.random() < 0.7:
+            rfp["lead_time_days"] = int(rng.integers(1, 90))
+        rfps.append(rfp)
+
+        if rng.random() < 0.8:
+            matrices[title] = {"compliance_summary": {
+                "total_requirements": int(rng.integers(0, 40)),
+                "compliance_rate": float(rng.random()),
+            }}
+        else:
+            matrices[title] = {}
+        strategies[title] = {
+            name: SimpleNamespace(
+                confidence_score=float(rng.choice([0, rng.random()])),
+                margin_percentage=float(rng.uniform(5, 50)),
+                risk_factors=[f"risk {j}" for j in range(rng.integers(0, 4))],
+            )
+            for name in ["competitive", "value_based", "cost_plus"][:rng.integers(0, 4)]
+        }
+    return rfps, matrices, strategies
+
+
+def test_batch_scores_match_single_analysis(tmp_path):
+    rfps, matrices, strategies = _random_cases()
+    engine = _engine(tmp_path, StubCompliance(matrices), StubPricing(strategies))
+
+    inputs = compute_decision_inputs(rfps, engine=engine, max_workers=1)
+    batch = score_rfps(rfps, inputs, engine)
+
+    assert len(batch) == len(rfps)
+    for rfp, row in zip(rfps, batch.to_dict("records"), strict=True):
+        single = engine.analyze_rfp_opportunity(rfp)
+        for field in ["margin_score", "complexity_score", "duration_score", "historical_score",
+                      "resource_score", "overall_score", "confidence_level"]:
+            assert row[field] == pytest.approx(getattr(single, field)), field
+        assert row["recommendation"] == single.recommendation
+        assert row["risk_factors"] == single.risk_factors
+        assert row["opportunities"] == single.opportunities
+        assert row["justification"] == single.justification
+
+
+def test_empty_batch(tmp_path):
+    assert score_rfps([], [], _engine(tmp_path)).empty
+
+
+def test_decision_inputs_key_tracks_analyzed_fields():
+    rfp = {"title": "Paving", "description": "Annual paving", "naics_code": "237310", "rfp_id": "A"}
+
+    assert decision_inputs_key(rfp) == decision_inputs_key({**rfp, "rfp_id": "B", "response_deadline": "2026-01-01"})
+    assert decision_inputs_key(rfp) != decision_inputs_key({**rfp, "description": "Annual paving and striping"})
+
+
+def _pipeline(db_session):
+    rfps = [
+        RFPOpportunity(
+            rfp_id=f"BATCH-{i}",
+            title=f"Batch RFP {i}",
+            description=description,
+            naics_code="541511",
+            estimated_value=5e5,
+            current_stage=stage,
+        )
+        for i, (description, stage) in enumerate([
+            ("Annual maintenance of existing systems", PipelineStage.DISCOVERED),
+            ("Emergency repair, urgent response across many sites and buildings", PipelineStage.TRIAGED),
+            ("Six month pilot", PipelineStage.DECISION_PENDING),
+            ("Already decided", PipelineStage.APPROVED),
+        ])
+    ]
+    db_session.add_all(rfps)
+    db_session.commit()
+    return rfps
+
+
+def test_score_pipeline_reuses_stored_inputs(db_session, tmp_path):
+    rfps = _pipeline(db_session)
+    compliance = StubCompliance()
+    engine = _engine(tmp_path, compliance, StubPricing())
+    phases = []
+
+    summary = score_pipeline_rfps(db_session, engine=engine, max_workers=1, progress=lambda *p: phases.append(p))
+
+    assert summary["scored"] == 3 and summary["computed_inputs"] == 3
+    assert compliance.calls == 3
+    assert phases[0] == ("analyzing", 1, 3) and phases[-1] == ("scoring", 0, 3)
+    expected = score_rfps(
+        [{"description": rfp.description, "naics_code": "541511", "award_amount": 5e5} for rfp in rfps[:3]],
+        [engine.decision_inputs({"description": rfp.description}) for rfp in rfps[:3]],
+        engine,
+    )
+    db_session.expire_all()
+    for rfp, result, row in zip(rfps[:3], summary["results"], expected.itertuples(), strict=True):
+        assert result["rfp_id"] == rfp.rfp_id
+        assert rfp.overall_score == pytest.approx(row.overall_score)
+        assert rfp.triage_score == rfp.overall_score
+        assert rfp.decision_recommendation == row.recommendation
+        assert rfp.confidence_level == pytest.approx(row.confidence_level)
+        assert rfp.rfp_metadata["decision_inputs"]["inputs"]["total_requirements"] == len(rfp.description.split())
+    assert rfps[3].overall_score is None
+
+    # Unchanged RFPs are scored from their stored inputs
+    compliance.calls = 0
+    rfps[1].description = "Emergency repair"
+    db_session.commit()
+    summary = score_pipeline_rfps(db_session, engine=engine, max_workers=1)
+    assert (summary["reused_inputs"], summary["computed_inputs"], compliance.calls) == (2, 1, 1)
+    db_session.expire_all()
+    assert rfps[1].rfp_metadata["decision_inputs"]["inputs"]["total_requirements"] == 2
+
+    summary = score_pipeline_rfps(db_session, rfp_ids=[rfps[3].id], refresh=True, engine=engine, max_workers=1)
+    assert summary["scored"] == 1 and summary["computed_inputs"] == 1
+
+
+def test_score_pipeline_invalidates_cache_and_publishes_deltas(db_session, tmp_path):
+    rfps = _pipeline(db_session)
+    register_delta_listeners()
+    response_cache.set("batch-test", {"stale": True}, ttl=60, tags=[CacheTag.RFPS])
+
+    with patch.object(pipeline_stream, "publish") as publish:
+        score_pipeline_rfps(db_session, engine=_engine(tmp_path, StubCompliance(), StubPricing()), max_workers=1)
+
+    assert response_cache.get("batch-test") is None
+    [deltas] = [call.args[0] for call in publish.call_args_list]
+    db_session.expire_all()
+    assert [(d["event"], d["rfp"]["id"], d["rfp"]["triage_score"]) for d in deltas] == [
+        ("rfp_updated", rfp.id, pytest.approx(rfp.triage_score)) for rfp in rfps[:3]
+    ]
+
+
+def test_analyze_batch_route(client, db_session, tmp_path):
+    from api.app.core.feature_flags import FeatureFlag, feature_flags
+
+    rfps = _pipeline(db_session)
+    engine = _engine(tmp_path, StubCompliance(), StubPricing())
+
+    feature_flags.set_override(FeatureFlag.CELERY_JOBS, False)
+    try:
+        with patch("app.routes.rfps.processor.go_nogo_engine", engine):
+            response = client.post("/api/v1/rfps/analyze-batch", json={"rfp_ids": [rfps[0].id, rfps[3].id]})
+    finally:
+        feature_flags.clear_override(FeatureFlag.CELERY_JOBS)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "completed"
+    assert [r["rfp_id"] for r in body["results"]] == ["BATCH-0", "BATCH-3"]
+    db_session.expire_all()
+    assert rfps[3].decision_recommendation == body["results"][1]["recommendation"]
+
+
+def test_score_pipeline_task_reports_progress():
+    from api.app.worker.tasks.decisions import score_pipeline
+
+    def fake_score(db, progress=None, **kwargs):
+        progress("analyzing", 1, 4)
+        progress("scoring", 0, 4)
+        return {"scored": 4, "computed_inputs": 4, "reused_inputs": 0, "recommendations": {"go": 4}, "results": []}
+
+    with patch("api.app.core.database.SessionLocal"), patch(
+        "api.app.services.batch_decisions.score_pipeline_rfps", side_effect=fake_score
+    ) as score, patch.object(score_pipeline, "update_state") as update_state:
+        result = score_pipeline(rfp_ids=[1, 2], max_workers=2)
+
+    assert result["status"] == "completed" and result["scored"] == 4
+    assert score.call_args.kwargs["rfp_ids"] == [1, 2]
+    assert [c.kwargs["meta"]["progress"] for c in update_state.call_args_list] == [0, 22, 90]
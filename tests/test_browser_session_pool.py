@@ -0,0 +1,140 @@
+"""Tests for the pooled Stagehand browser sessions."""
+import asyncio
+
+import pytest
+
+from src.agents.scrapers.session_pool import (
+    BrowserSessionPool,
+    close_browser_pools,
+    get_browser_pool,
+)
+
+
+class _FakeSession:
+    """Stands in for a Stagehand session on local Chromium."""
+
+    def __init__(self, number):
+        self.number = number
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+def _factory(created):
+    async def factory():
+        session = _FakeSession(len(created))
+        created.append(session)
+        return session
+
+    return factory
+
+
+class TestBrowserSessionPool:
+    """Checkout, reuse, limits and eviction."""
+
+    def test_reuses_warm_session(self):
+        created = []
+
+        async def run():
+            pool = BrowserSessionPool(_factory(created))
+            async with pool.session("https://a.example/rfp/1") as first:
+                pass
+            async with pool.session("https://b.example/rfp/2") as second:
+                pass
+            await pool.close()
+            return first, second, pool
+
+        first, second, pool = asyncio.run(run())
+
+        assert first is second
+        assert len(created) == 1
+        assert pool.stats == {"created": 1, "reused": 1, "closed": 1}
+        assert first.closed
+
+    def test_per_domain_limit(self):
+        created = []
+        active = {"a.example": 0}
+        peak = {"a.example": 0}
+
+        async def use(pool, url):
+            async with pool.session(url):
+                active["a.example"] += 1
+                peak["a.example"] = max(peak["a.example"], active["a.example"])
+                await asyncio.sleep(0.01)
+                active["a.example"] -= 1
+
+        async def run():
+            pool = BrowserSessionPool(_factory(created), max_sessions=4, per_domain_limit=2)
+            await asyncio.gather(*(use(pool, f"https://a.example/rfp/{i}") for i in range(6)))
+            await pool.close()
+
+        asyncio.run(run())
+
+        assert peak["a.example"] == 2
+        assert len(created) == 2
+
+    def test_idle_sessions_are_evicted(self):
+        created = []
+
+        async def run():
+            pool = BrowserSessionPool(_factory(created), idle_timeout=0.02)
+            async with pool.session("https://a.example/"):
+                pass
+            assert pool.idle_count == 1
+            await asyncio.sleep(0.1)
+            return pool
+
+        pool = asyncio.run(run())
+
+        assert pool.idle_count == 0
+        assert created[0].closed
+
+    @pytest.mark.parametrize("discard", [True, False])
+    def test_discarded_or_failed_sessions_are_closed(self, discard):
+        created = []
+
+        async def run():
+            pool = BrowserSessionPool(_factory(created))
+            if discard:
+                async with pool.session("https://a.example/", discard=True):
+                    pass
+            else:
+                with pytest.raises(RuntimeError):
+                    async with pool.session("https://a.example/"):
+                        raise RuntimeError("page crashed")
+            return pool
+
+        pool = asyncio.run(run())
+
+        assert pool.idle_count == 0
+        assert created[0].closed
+
+    def test_session_retired_after_max_uses(self):
+        created = []
+
+        async def run():
+            pool = BrowserSessionPool(_factory(created), max_uses=2)
+            for _ in range(3):
+                async with pool.session("https://a.example/"):
+                    pass
+            await pool.close()
+
+        asyncio.run(run())
+
+        assert len(created) == 2
+        assert created[0].closed
+
+    def test_pools_are_per_event_loop(self):
+        created = []
+
+        async def run():
+            pool = get_browser_pool("test", _factory(created))
+            assert get_browser_pool("test", _factory(created)) is pool
+            await close_browser_pools()
+            return pool
+
+        first = asyncio.run(run())
+        second = asyncio.run(run())
+
+        assert first is not second
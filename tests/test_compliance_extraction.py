@@ -0,0 +1,198 @@
+"""Tests for single-pass requirement extraction in the compliance matrix generator."""
+import os
+
+import pytest
+
+from src.compliance.compliance_matrix import ComplianceMatrixGenerator
+
+SOLICITATION = """Project overview for road maintenance.
+SECTION C: STATEMENT OF WORK
+[Page 1]
+The contractor shall provide all labor, equipment and materials for pavement repair.
+Vendors must submit three references from similar projects
+completed in the last five years.
+[Page 2]
+TECHNICAL REQUIREMENTS
+The software system must support single sign-on and audit logging.
+Offerors should demonstrate at least 5 years of experience in asphalt work.
+
+=== Document: Attachment A.pdf ===
+[Page 1]
+PRICING:
+All pricing must include fuel surcharges and mobilization costs.
+"""
+
+
+@pytest.fixture
+def generator(tmp_path):
+    return ComplianceMatrixGenerator(output_dir=str(tmp_path / "out"), templates_dir=str(tmp_path / "templates"))
+
+
+class TestRequirementExtraction:
+    """Source tracking and the shared sentence scan."""
+
+    def test_tracks_page_and_section_per_sentence(self, generator):
+        requirements = generator.extract_requirements_rule_based(SOLICITATION)
+        by_text = {r["text"]: r for r in requirements}
+
+        labor = by_text["shall provide all labor, equipment and materials for pavement repair."]
+        assert (labor["source_section"], labor["source_page"]) == ("SECTION C: STATEMENT OF WORK", 1)
+
+        # Sentence wrapped across lines is kept whole
+        references = next(r for r in requirements if r["text"].startswith("must submit three references"))
+        assert references["text"].endswith("completed in the last five years.")
+        assert references["source_page"] == 1
+
+        sso = by_text["must support single sign-on and audit logging."]
+        assert (sso["source_section"], sso["source_page"], sso["category"]) == ("TECHNICAL REQUIREMENTS", 2, "mandatory")
+
+        pricing = by_text["must include fuel surcharges and mobilization costs."]
+        assert (pricing["source_document"], pricing["source_section"]) == ("Attachment A.pdf", "PRICING")
+
+    def test_heuristic_path_reuses_scan(self, generator, monkeypatch):
+        generator.extract_requirements_rule_based(SOLICITATION)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("text scanned twice")
+
+        monkeypatch.setattr(generator, "_keyword_regex", type("Regex", (), {"finditer": fail})())
+        requirements = generator.extract_requirements_llm(SOLICITATION)
+
+        texts = [r["text"] for r in requirements]
+        assert "Offerors should demonstrate at least 5 years of experience in asphalt work" in texts
+        assert all(r["source_page"] is not None for r in requirements)
+
+    def test_keywords_match_at_word_start(self, generator):
+        requirements = generator.extract_requirements_rule_based(
+            "Applicable legislation covers the whole region and its parks."
+        )
+
+        assert requirements == []
+
+    def test_matrix_covers_attached_documents(self, generator):
+        matrix = generator.generate_compliance_matrix({
+            "title": "Road Repair",
+            "description": "The contractor shall provide all labor and materials for pavement repair.",
+            "documents": [{"filename": "Attachment A.pdf", "content": "All pricing must include fuel surcharges."}],
+        })
+
+        texts = [r["requirement_text"] for r in matrix["requirements_and_responses"]]
+        assert "must include fuel surcharges." in texts
+        assert matrix["extraction_summary"]["documents_analyzed"] == 2
+        ids = [r["requirement_id"] for r in matrix["requirements_and_responses"]]
+        assert len(ids) == len(set(ids))
+
+
+class TestComplianceMatrixCache:
+    """Reuse of generated matrices and invalidation by input changes."""
+
+    RFP = {
+        "rfp_id": "RFP-CACHE-1",
+        "title": "Road Repair",
+        "description": "The contractor shall provide all labor and materials for pavement repair.",
+        "documents": [{"filename": "Attachment A.pdf", "content": "All pricing must include fuel surcharges."}],
+        "qa_items": [{"question_text": "Is there a site visit?", "answer_text": "No."}],
+    }
+
+    def test_repeat_analysis_reuses_matrix(self, generator, tmp_path, monkeypatch):
+        first = generator.generate_compliance_matrix(self.RFP)
+        first["requirements_and_responses"].clear()
+
+        # Another generator over the same directory reads the stored matrix
+        other = ComplianceMatrixGenerator(output_dir=str(tmp_path / "out"), templates_dir=str(tmp_path / "templates"))
+        monkeypatch.setattr(other, "iter_requirements", lambda *args: pytest.fail("matrix regenerated"))
+        second = other.generate_compliance_matrix(dict(self.RFP))
+
+        assert len(second["requirements_and_responses"]) == second["extraction_summary"]["total_requirements"] > 0
+        assert second["rfp_info"]["rfp_id"] == "RFP-CACHE-1"
+
+    def test_changed_documents_or_qa_regenerate(self, generator):
+        first = generator.generate_compliance_matrix(self.RFP)
+
+        with_qa = {**self.RFP, "qa_items": [{"question_text": "Is there a site visit?", "answer_text": "Vendors must attend the site visit on May 1."}]}
+        with_document = {**self.RFP, "documents": [{"filename": "Attachment A.pdf", "content": "All bonds must be submitted with the bid."}]}
+
+        qa_texts = [r["requirement_text"] for r in generator.generate_compliance_matrix(with_qa)["requirements_and_responses"]]
+        document_texts = [r["requirement_text"] for r in generator.generate_compliance_matrix(with_document)["requirements_and_responses"]]
+
+        assert "must attend the site visit on May 1." in qa_texts
+        assert "must be submitted with the bid." in document_texts
+        assert "must include fuel surcharges." not in document_texts
+
+        again = generator.generate_compliance_matrix(self.RFP)
+        assert not first["cached"] and again["cached"]
+        assert again.pop("cached_at") == first["generated_at"] <= again["generated_at"]
+        timing = ("generated_at", "cached")
+        assert {k: v for k, v in again.items() if k not in timing} == {
+            k: v for k, v in first.items() if k not in timing
+        }
+
+    def test_cache_can_be_disabled(self, tmp_path):
+        generator = ComplianceMatrixGenerator(
+            output_dir=str(tmp_path / "out"), templates_dir=str(tmp_path / "templates"), use_cache=False
+        )
+        generator.generate_compliance_matrix(self.RFP)
+
+        assert generator.matrix_cache is None
+        assert not (tmp_path / "out" / "cache").exists()
+
+    def test_rebuilt_rag_index_regenerates(self, tmp_path):
+        class StubRAG:
+            def __init__(self):
+                self.stats = {"collection_name": "rfp_documents", "total_documents": 10, "built_at": "2026-01-01"}
+                self.retrievals = 0
+
+            def get_statistics(self):
+                return dict(self.stats)
+
+            def retrieve(self, text, k=3):
+                self.retrievals += 1
+                return [{"text": f"Past performance on {self.stats['total_documents']} projects"}]
+
+        rag = StubRAG()
+        generator = ComplianceMatrixGenerator(
+            rag_engine=rag, output_dir=str(tmp_path / "out"), templates_dir=str(tmp_path / "templates")
+        )
+        generator.generate_compliance_matrix(self.RFP)
+        per_matrix = generated = rag.retrievals
+        generator.generate_compliance_matrix(self.RFP)
+        assert rag.retrievals == generated > 0
+
+        for change in ({"total_documents": 12}, {"built_at": "2026-02-01"}):
+            rag.stats.update(change)
+            generator.generate_compliance_matrix(self.RFP)
+            assert rag.retrievals > generated
+            generated = rag.retrievals
+
+        # Without index statistics nothing is cached
+        rag.get_statistics = lambda: {}
+        generator.generate_compliance_matrix(self.RFP)
+        generator.generate_compliance_matrix(self.RFP)
+        assert rag.retrievals == generated + 2 * per_matrix
+
+    def test_entries_expire_and_are_capped(self, tmp_path, monkeypatch):
+        import src.compliance.matrix_cache as matrix_cache
+
+        cache = matrix_cache.ComplianceMatrixCache(tmp_path / "cache", memory_entries=2, disk_entries=3, max_age=100)
+        clock = [1_000_000.0]
+        monkeypatch.setattr(matrix_cache.time, "time", lambda: clock[0])
+        monkeypatch.setattr(matrix_cache, "PRUNE_EVERY", 1)
+
+        def put(key):
+            cache.put(key, {"key": key})
+            os.utime(cache._entry_path(key), (clock[0], clock[0]))
+            clock[0] += 1
+
+        for key in ["a1", "b2", "c3"]:
+            put(key)
+        assert cache.get("a1") == {"key": "a1"}  # now the most recently used
+        put("d4")
+        assert sorted(p.name for p in (tmp_path / "cache").glob("*/*.json.gz")) == [
+            "a1.json.gz", "c3.json.gz", "d4.json.gz",
+        ]
+        assert cache.get("b2") is None
+
+        clock[0] += 101
+        assert cache.get("d4") is None
+        assert not cache._entry_path("d4").exists()
+        assert cache.prune() == 2
@@ -0,0 +1,107 @@
+"""Tests for streaming compliance matrix generation over all RFP attachments."""
+import asyncio
+import json
+
+import pytest
+from app.models.database import ComplianceRequirement, RFPDocument
+from app.services import compliance_stream
+from sqlalchemy.orm import sessionmaker
+
+from src.compliance.compliance_matrix import ComplianceMatrixGenerator
+from src.utils.text_store import ExtractedTextStore
+
+SOW = """SECTION C: STATEMENT OF WORK
+The contractor shall provide all labor, equipment and materials for pavement repair.
+Vendors must submit weekly progress reports to the contracting officer.
+"""
+PRICING = """PRICING:
+All pricing must include fuel surcharges and mobilization costs.
+The contractor shall provide all labor, equipment and materials for pavement repair.
+"""
+
+
+@pytest.fixture
+def generator(tmp_path, monkeypatch):
+    generator = ComplianceMatrixGenerator(
+        output_dir=str(tmp_path / "out"), templates_dir=str(tmp_path / "templates")
+    )
+    monkeypatch.setattr(compliance_stream, "_create_generator", lambda: generator)
+    return generator
+
+
+@pytest.fixture
+def attachments(db_session, sample_rfp, tmp_path, monkeypatch):
+    import src.utils.text_store as text_store_module
+
+    store = ExtractedTextStore(tmp_path / "store")
+    monkeypatch.setattr(text_store_module, "get_text_store", lambda: store)
+
+    sample_rfp.description = "Road maintenance services for the county."
+    for filename, text in (("SOW.txt", SOW), ("Pricing.txt", PRICING)):
+        path = tmp_path / filename
+        path.write_text(text, encoding="utf-8")
+        db_session.add(RFPDocument(rfp_id=sample_rfp.id, filename=filename, file_path=str(path)))
+    db_session.commit()
+    return sample_rfp
+
+
+def _parse_sse(body: str) -> list[tuple[str, dict]]:
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def test_stream_covers_attachments_and_skips_duplicates(client, db_session, attachments, generator):
+    response = client.get(f"/api/v1/compliance/rfps/{attachments.id}/matrix/stream")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = _parse_sse(response.text)
+    assert events[0] == (
+        "started",
+        {"rfp_id": attachments.rfp_id, "documents": ["SOW.txt", "Pricing.txt"], "existing_requirements": 0},
+    )
+
+    records = [payload for event, payload in events if event == "requirement"]
+    assert [(r["source_document"], r["source_page"]) for r in records] == [("SOW.txt", 1)] * 4 + [
+        ("Pricing.txt", 1)
+    ] * 2
+    # The labor requirement repeated in the pricing attachment is not saved twice
+    assert [r["requirement_text"] for r in records[4:]] == [
+        "must include fuel surcharges and mobilization costs.",
+        "All pricing must include fuel surcharges and mobilization costs",
+    ]
+    assert all(r["response_text"] for r in records)
+    assert events[-1][0] == "complete"
+    assert events[-1][1]["saved"] == 6
+
+    saved = db_session.query(ComplianceRequirement).filter(ComplianceRequirement.rfp_id == attachments.id)
+    assert sorted((r.id, r.order_index) for r in saved) == [(r["id"], r["order_index"]) for r in records]
+
+
+def test_batches_are_saved_before_later_ones_are_generated(db_session, test_engine, attachments, generator):
+    session_factory = sessionmaker(bind=test_engine)
+    saved_counts = []
+
+    async def run():
+        events = []
+        stream = compliance_stream.stream_compliance_matrix(
+            attachments.id, session_factory=session_factory, batch_size=1
+        )
+        async for event, payload in stream:
+            if event == "requirement":
+                with session_factory() as db:
+                    saved_counts.append(db.query(ComplianceRequirement).count())
+            events.append((event, payload))
+        return events
+
+    events = asyncio.run(run())
+    assert saved_counts == [1, 2, 3, 4, 5, 6]
+
+    # A second run finds nothing new
+    rerun = asyncio.run(run())
+    assert rerun[0][1]["existing_requirements"] == 6
+    assert [event for event, _ in rerun if event == "requirement"] == []
+    assert events[-1][1]["saved"] == 6
@@ -0,0 +1,123 @@
+"""Tests for persistent document processing jobs."""
+import sys
+import types
+from unittest.mock import patch
+
+import pytest
+from app.models.database import DocumentProcessingJob
+from app.services.document_processing import (
+    INDEX_BATCH_SIZE,
+    create_processing_job,
+    get_processing_jobs,
+    process_document,
+)
+from sqlalchemy.orm import sessionmaker
+
+from src.utils.text_store import ExtractedTextStore
+
+
+class _FakeRAG:
+    def __init__(self):
+        self.batches = []
+
+    def add_documents(self, documents, ids=None):
+        self.batches.append(ids)
+        return len(documents)
+
+
+@pytest.fixture
+def rag(monkeypatch):
+    engine = _FakeRAG()
+    module = types.ModuleType("src.rag.chroma_rag_engine")
+    module.get_rag_engine = lambda: engine
+    monkeypatch.setitem(sys.modules, "src.rag.chroma_rag_engine", module)
+    return engine
+
+
+@pytest.fixture
+def text_store(tmp_path, monkeypatch):
+    import src.utils.text_store as text_store_module
+
+    store = ExtractedTextStore(tmp_path / "store")
+    monkeypatch.setattr(text_store_module, "get_text_store", lambda: store)
+    return store
+
+
+def _upload(db_session, rfp, tmp_path, text, document_id="doc-abc123"):
+    path = tmp_path / f"{document_id}.txt"
+    path.write_text(text, encoding="utf-8")
+    return create_processing_job(db_session, rfp.id, document_id, "sow.txt", path)
+
+
+class TestDocumentProcessing:
+    """Stages, progress and status visibility across sessions."""
+
+    def test_completed_job_is_visible_from_another_session(
+        self, db_session, test_engine, sample_rfp, tmp_path, rag, text_store
+    ):
+        words = " ".join(f"word{i}" for i in range(462 * (INDEX_BATCH_SIZE + 1)))
+        _upload(db_session, sample_rfp, tmp_path, words)
+
+        process_document("doc-abc123", sessionmaker(bind=test_engine))
+
+        # A fresh session stands in for another API replica
+        with sessionmaker(bind=test_engine)() as other:
+            job = get_processing_jobs(other, ["doc-abc123"])["doc-abc123"]
+            assert job.status == "completed"
+            assert job.stage == "done"
+            assert job.progress == 100
+            assert job.chunks_total == INDEX_BATCH_SIZE + 1
+            assert job.chunks_indexed == INDEX_BATCH_SIZE + 1
+            assert set(job.timings) == {"extracting", "chunking", "indexing"}
+        assert len(rag.batches) == 2
+
+    def test_empty_document_fails(self, db_session, test_engine, sample_rfp, tmp_path, rag, text_store):
+        _upload(db_session, sample_rfp, tmp_path, "   ")
+
+        result = process_document("doc-abc123", sessionmaker(bind=test_engine))
+
+        assert result["status"] == "failed"
+        assert result["error"] == "No text content extracted"
+        assert rag.batches == []
+
+    def test_progress_callback_sees_stages(self, db_session, test_engine, sample_rfp, tmp_path, rag, text_store):
+        _upload(db_session, sample_rfp, tmp_path, "Scope of work for janitorial services")
+        stages = []
+
+        process_document(
+            "doc-abc123",
+            sessionmaker(bind=test_engine),
+            on_progress=lambda job: stages.append(job.stage),
+        )
+
+        assert stages[0] == "extracting"
+        assert "indexing" in stages
+        assert stages[-1] == "done"
+
+    def test_unknown_document(self, test_engine):
+        with pytest.raises(ValueError):
+            process_document("doc-missing", sessionmaker(bind=test_engine))
+
+    def test_job_row_defaults(self, db_session, sample_rfp, tmp_path):
+        job = _upload(db_session, sample_rfp, tmp_path, "text")
+
+        assert db_session.get(DocumentProcessingJob, job.id).status == "pending"
+        assert job.stage == "queued"
+
+
+def test_upload_records_queued_task_id(client, db_session, sample_rfp, tmp_path, monkeypatch):
+    monkeypatch.setenv("UPLOAD_DIR", str(tmp_path))
+
+    with patch("app.routes.documents.enqueue_processing", return_value="task-123") as enqueue:
+        response = client.post(
+            f"/api/v1/documents/{sample_rfp.rfp_id}/upload",
+            files={"file": ("sow.txt", b"Scope of work", "text/plain")},
+        )
+
+    assert response.status_code == 200
+    document_id = response.json()["id"]
+    enqueue.assert_called_once_with(document_id)
+    db_session.expire_all()
+    job = get_processing_jobs(db_session, [document_id])[document_id]
+    assert job.task_id == "task-123"
+    assert job.to_dict()["task_id"] == "task-123"
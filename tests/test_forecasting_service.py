@@ -0,0 +1,169 @@
+"""Tests for recurrence detection in ForecastingService."""
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.agents import forecasting_archive
+from src.agents.forecasting_service import ForecastingService
+
+TODAY = datetime(2026, 3, 15, 10, 30)
+
+
+def _reference_predictions(service, df, today, confidence_threshold=0.3):
+    """Per-group loop the vectorized implementation replaced."""
+    predictions = []
+    for (agency, _title_norm), group in df.groupby(['agency', 'title_normalized']):
+        if len(group) < 2:
+            continue
+        dates = group['posted_date'].sort_values()
+        deltas = dates.diff().dt.days.dropna().values
+        mean_delta = float(np.mean(deltas))
+        std_delta = float(np.std(deltas)) if len(deltas) > 1 else mean_delta * 0.3
+        if mean_delta < 30 or mean_delta > 1000:
+            continue
+        cycle_type, base_confidence = service._detect_cycle_type(mean_delta, std_delta)
+        last_date = dates.iloc[-1]
+        next_date = last_date + timedelta(days=mean_delta)
+        if (today - next_date.to_pydatetime()).days > 180:
+            continue
+        confidence = service._calculate_confidence(
+            len(group), std_delta, mean_delta, (today - last_date.to_pydatetime()).days,
+            cycle_type, base_confidence,
+        )
+        if confidence >= confidence_threshold:
+            latest_row = group.iloc[-1]
+            naics = latest_row.get('naics_code', '')
+            predictions.append({
+                "predicted_title": str(latest_row['title']),
+                "agency": str(agency),
+                "predicted_date": next_date.strftime("%Y-%m-%d"),
+                "confidence": confidence,
+                "cycle_type": cycle_type,
+                "cycle_days": int(mean_delta),
+                "variance_days": int(std_delta),
+                "num_observations": len(group),
+                "last_posted": last_date.strftime("%Y-%m-%d"),
+                "days_until": max(0, (next_date.to_pydatetime() - today).days),
+                "naics_code": str(naics) if naics else None,
+                "historical_value": (
+                    float(latest_row['award_amount']) if pd.notna(latest_row['award_amount']) else None
+                ),
+            })
+    predictions.sort(key=lambda x: (-x['confidence'], x['days_until']))
+    return predictions
+
+
+def _archive(groups=400, seed=0):
+    rng = np.random.default_rng(seed)
+    rows = []
+    for g in range(groups):
+        cycle = rng.choice([20, 90, 120, 180, 365, 400, 730, 1200])
+        jitter = rng.choice([0, 5, 40])
+        count = int(rng.integers(1, 8))
+        start = TODAY - timedelta(days=int(cycle * count + rng.integers(-200, 400)))
+        for i in range(count):
+            posted = start + timedelta(days=int(cycle * i + rng.integers(-jitter, jitter + 1)),
+                                       hours=int(rng.integers(0, 24)))
+            rows.append({
+                "agency": f"Agency {g % 37}" if rng.random() > 0.02 else None,
+                "title": f"Service contract {g} FY{2018 + i} Q{i % 4 + 1}",
+                "posted_date": posted,
+                "naics_code": rng.choice(["541511", "236220", None]),
+                "award_amount": rng.choice([np.nan, float(rng.integers(1000, 10**6))]),
+            })
+    df = pd.DataFrame(rows).sample(frac=1, random_state=seed).reset_index(drop=True)
+    return df
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_vectorized_predictions_match_group_loop(seed):
+    service = ForecastingService()
+    df = _archive(seed=seed)
+
+    with patch("src.agents.forecasting_service.datetime") as clock:
+        clock.now.return_value = TODAY
+        predictions = service.predict_upcoming_opportunities(df, confidence_threshold=0.3, use_ai_insights=False)
+    expected = _reference_predictions(service, df, TODAY)
+
+    assert len(predictions) == len(expected) > 0
+    for got, want in zip(predictions, expected, strict=True):
+        assert {k: got[k] for k in want} == want
+        assert got["basis"].startswith(f"Based on {want['num_observations']} historical postings")
+
+
+def test_cycle_types_match_scalar_detection():
+    service = ForecastingService()
+    mean = np.array([45.0, 60.0, 90.0, 130.0, 180.0, 300.0, 365.0, 500.0, 640.0, 900.0])
+    std = np.array([5.0, 30.0, 10.0, 100.0, 0.0, 20.0, 60.0, 200.0, 10.0, 100.0])
+
+    cycle_types, base = service._detect_cycle_types(mean, std)
+
+    for i in range(len(mean)):
+        cycle_type, base_confidence = service._detect_cycle_type(mean[i], std[i])
+        assert cycle_types[i] == cycle_type
+        assert base[i] == pytest.approx(base_confidence)
+
+
+def test_empty_archive():
+    service = ForecastingService()
+    df = pd.DataFrame({
+        "agency": pd.Series([], dtype=object),
+        "title": pd.Series([], dtype=object),
+        "posted_date": pd.to_datetime([]),
+    })
+
+    assert service.predict_upcoming_opportunities(df, use_ai_insights=False) == []
+
+
+def _write_archive_csv(path, df):
+    df.rename(columns={
+        "agency": "Department/Ind.Agency", "title": "Title", "posted_date": "PostedDate",
+        "naics_code": "NaicsCode", "award_amount": "AwardAmount",
+    }).assign(Notes="free text").to_csv(path, index=False)
+
+
+def test_archive_cache_reused_until_file_changes(tmp_path):
+    source = tmp_path / "archive.csv"
+    _write_archive_csv(source, _archive(groups=50))
+    service = ForecastingService(cache_dir=tmp_path / "cache")
+
+    parsed = service.train_on_file(str(source))
+    assert list(parsed.columns) == [
+        "agency", "title", "title_normalized", "posted_date", "naics_code", "award_amount",
+    ]
+    [cached_file] = (tmp_path / "cache").glob("*.parquet")
+
+    # Unchanged file: no re-parse and no re-hash
+    with patch.object(service, "_parse_archive", side_effect=AssertionError("re-parsed")), patch(
+        "src.agents.forecasting_archive.file_checksum", side_effect=AssertionError("re-hashed")
+    ):
+        cached = service.train_on_file(str(source))
+    pd.testing.assert_frame_equal(cached, parsed.reset_index(drop=True), check_dtype=False)
+
+    with patch("src.agents.forecasting_service.datetime") as clock:
+        clock.now.return_value = TODAY
+        assert service.predict_upcoming_opportunities(cached, use_ai_insights=False) == \
+            service.predict_upcoming_opportunities(parsed, use_ai_insights=False)
+
+    # New contents get a new cache file, hashed once, and the old one is removed
+    _write_archive_csv(source, _archive(groups=20, seed=5))
+    with patch(
+        "src.agents.forecasting_archive.file_checksum", wraps=forecasting_archive.file_checksum
+    ) as hashed:
+        assert len(service.train_on_file(str(source))) < len(parsed)
+    assert hashed.call_count == 1
+    assert [p.name for p in (tmp_path / "cache").glob("*.parquet")] != [cached_file.name]
+    assert not cached_file.exists()
+
+
+def test_archive_without_required_columns_is_not_cached(tmp_path):
+    source = tmp_path / "archive.csv"
+    pd.DataFrame({"title": ["A"], "posted": ["2024-01-01"]}).to_csv(source, index=False)
+    service = ForecastingService(cache_dir=tmp_path / "cache")
+
+    assert service.train_on_file(str(source)).empty
+    assert service.prepare_archive(str(source)) is None
+    assert not list((tmp_path / "cache").glob("*.parquet"))
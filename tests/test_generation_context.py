@@ -0,0 +1,99 @@
+"""Tests for the shared generation context builder."""
+from app.models.database import RFPQandA
+from app.services.generation_context import GenerationContextBuilder
+from sqlalchemy import event
+
+
+class _QueryCounter:
+    def __init__(self, engine):
+        self.count = 0
+        self.engine = engine
+
+    def __enter__(self):
+        event.listen(self.engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, *args):
+        self.count += 1
+
+
+class _FakeRAG:
+    is_built = True
+
+    def __init__(self):
+        self.queries = []
+
+    def retrieve(self, query, top_k=5):
+        self.queries.append(query)
+        return [{"content": f"past proposal for {query}"}]
+
+
+def _add_qa(db_session, rfp, text, related=None):
+    db_session.add(
+        RFPQandA(
+            rfp_id=rfp.id,
+            question_number="1",
+            question_text=text,
+            answer_text="Yes",
+            related_sections=related or [],
+        )
+    )
+    db_session.commit()
+
+
+class TestGenerationContext:
+    """Memoization and invalidation."""
+
+    def test_builds_full_context(self, db_session, sample_rfp, sample_company_profile):
+        _add_qa(db_session, sample_rfp, "Is staffing flexible?", related=["staffing_plan"])
+
+        context = GenerationContextBuilder().get(db_session, sample_rfp.rfp_id)
+
+        assert context.rfp_data["title"] == sample_rfp.title
+        assert context.company_profile["company_name"] == sample_company_profile.name
+        assert "Is staffing flexible?" in context.qa_context("staffing_plan")
+
+    def test_second_section_costs_no_queries(self, db_session, test_engine, sample_rfp):
+        builder = GenerationContextBuilder()
+        builder.get(db_session, sample_rfp.rfp_id)
+
+        with _QueryCounter(test_engine) as counter:
+            context = builder.get(db_session, sample_rfp.rfp_id)
+
+        assert context is not None
+        assert counter.count == 0
+
+    def test_qa_write_invalidates_context(self, db_session, sample_rfp):
+        builder = GenerationContextBuilder()
+        assert builder.get(db_session, sample_rfp.rfp_id).qa_items == []
+
+        _add_qa(db_session, sample_rfp, "When is the site visit?")
+
+        assert len(builder.get(db_session, sample_rfp.rfp_id).qa_items) == 1
+
+    def test_rfp_update_rebuilds_context(self, db_session, sample_rfp):
+        builder = GenerationContextBuilder()
+        first = builder.get(db_session, sample_rfp.rfp_id)
+
+        sample_rfp.title = "Renamed RFP"
+        db_session.commit()
+        second = builder.get(db_session, sample_rfp.rfp_id)
+
+        assert second.cache_key != first.cache_key
+        assert second.rfp_data["title"] == "Renamed RFP"
+
+    def test_rag_snippets_retrieved_once_per_section(self, db_session, sample_rfp):
+        builder = GenerationContextBuilder()
+        rag = _FakeRAG()
+
+        for _ in range(2):
+            context = builder.get(db_session, sample_rfp.rfp_id)
+            builder.rag_context(context, "executive_summary", rag)
+
+        assert len(rag.queries) == 1
+
+    def test_unknown_rfp(self, db_session):
+        assert GenerationContextBuilder().get(db_session, "missing") is None
@@ -0,0 +1,123 @@
+"""Tests for the shared keyword classifier and the categorizers built on it."""
+import random
+import re
+
+import pandas as pd
+import pytest
+
+from src.bid_generation.compliance_signals import ComplianceSignalDetector, _literal_anchor
+from src.utils.category import CATEGORY_KEYWORDS, determine_category
+from src.utils.keyword_classifier import KeywordClassifier
+
+KEYWORDS = {
+    "water": ["water", "bottle"],
+    "it": ["software", "it", "cloud"],
+    "repair": ["repair", "water line"],
+}
+WORDS = (
+    "Water delivery construction paving SOFTWARE cloud maintenance repair network it "
+    "water line bottle county pipe fema domestic preference hipaa 508 section the of"
+).split()
+
+
+def _texts(count, seed=5):
+    rng = random.Random(seed)
+    return [" ".join(rng.choice(WORDS) for _ in range(rng.randint(0, 12))) for _ in range(count)]
+
+
+def _first(text, default=None):
+    text = text.lower()
+    return next((c for c, words in KEYWORDS.items() if any(w in text for w in words)), default)
+
+
+def _best(text, default=None):
+    text = text.lower()
+    best, top = default, 0
+    for category, words in KEYWORDS.items():
+        score = sum(1 for w in words if w in text)
+        if score > top:
+            best, top = category, score
+    return best
+
+
+@pytest.fixture
+def classifier():
+    return KeywordClassifier(KEYWORDS)
+
+
+class TestKeywordClassifier:
+    """Agreement with the keyword chains the classifier replaces."""
+
+    def test_matches_keyword_chains(self, classifier):
+        for text in _texts(500):
+            lowered = text.lower()
+            assert classifier.first(text) == _first(text)
+            assert classifier.best(text, "other") == _best(text, "other")
+            assert classifier.matches(text) == {
+                c: [w for w in words if w in lowered]
+                for c, words in KEYWORDS.items()
+                if any(w in lowered for w in words)
+            }
+
+    def test_batch_matches_single_texts(self, classifier):
+        texts = _texts(300)
+        assert classifier.first_many(pd.Series(texts), default="none") == [
+            classifier.first(text, "none") for text in texts
+        ]
+        assert classifier.first_many([]) == []
+        # Keywords do not match across neighbouring texts
+        assert classifier.first_many(["wat", "er", "cloud", ""], default="none") == ["none", "none", "it", "none"]
+        assert KeywordClassifier({}).first_many(["water"], default="none") == ["none"]
+
+    def test_large_dictionary_scan_agrees(self, classifier):
+        # Past the substring-scan size `first` runs on the automaton
+        padded = {**KEYWORDS, "filler": [f"zz{i}" for i in range(40)]}
+        large = KeywordClassifier(padded)
+        assert not large._substring_scan and classifier._substring_scan
+        for text in _texts(500):
+            assert large.first(text) == classifier.first(text)
+
+    def test_substring_matching(self, classifier):
+        # Keywords match inside words, as the `in` checks did
+        assert classifier.first("Waterproofing") == "water"
+        assert classifier.first("Digital services") == "it"
+        assert classifier.matches("Replace the WATER LINE") == {
+            "water": ["water"],
+            "repair": ["water line"],
+        }
+
+
+def test_determine_category_keeps_keyword_priority():
+    for text in _texts(300):
+        lowered = text.lower()
+        expected = next(
+            (c.value for c, words in CATEGORY_KEYWORDS.items() if any(w in lowered for w in words)),
+            "professional_services",
+        )
+        assert determine_category({"title": text}) == expected
+    assert determine_category({"title": "Office rental", "naics_code": "236220"}) == "construction"
+
+
+def test_signal_detection_matches_full_regex_scan():
+    detector = ComplianceSignalDetector()
+    patterns = (
+        detector.FEMA_PATTERNS
+        + detector.FEDERAL_FUNDING_PATTERNS
+        + detector.SECURITY_PATTERNS
+        + detector.ACCESSIBILITY_PATTERNS
+        + detector.HEALTHCARE_PATTERNS
+    )
+    texts = _texts(200) + [
+        "Subject to 2 C.F.R. § 200.322 domestic preferences for procurement",
+        "Federally funded through a FEMA grant; US-based hosting and Fed-RAMP required",
+    ]
+    for text in texts:
+        expected = [m for p in patterns for m in re.findall(p, text, re.IGNORECASE)]
+        assert detector._detect_patterns(text, patterns) == expected
+
+
+def test_literal_anchor():
+    assert _literal_anchor(r"2\s*c\.?f\.?r\.?\s*§?\s*200\.322") == "200.322"
+    assert _literal_anchor(r"domestic\s*preferences?\s*for") == "preference"
+    assert _literal_anchor(r"fed[\-\s]*ramp") == "ramp"
+    assert _literal_anchor(r"(a|b)cde") == ""
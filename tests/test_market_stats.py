@@ -0,0 +1,184 @@
+"""Tests for the precomputed market statistics behind the pricing engine."""
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import src.pricing.pricing_engine as pricing_engine_module
+from src.pricing.market_stats import MarketStatsStore, build_market_stats, index_terms
+from src.pricing.pricing_engine import PricingEngine
+
+
+def _awards(seed=0, count=400):
+    rng = np.random.default_rng(seed)
+    naics = rng.choice(["541512", "541511", "236220", "484110", "999999"], count, p=[0.4, 0.3, 0.2, 0.09, 0.01])
+    words = np.array(["bottled_water supply", "construction of a school", "it_services help desk", "delivery"])
+    return pd.DataFrame({
+        "naics_code": naics,
+        "agency": rng.choice(["Dept of Transportation", "DEPT OF EDUCATION", "City of Austin", None], count),
+        "title": rng.choice(words, count),
+        "description": rng.choice(np.append(words, None), count),
+        "posted_date": rng.choice(["2021-03-01", "2022-06-15", "2023-01-20", "not a date"], count),
+        "award_amount": rng.choice([np.nan, -5.0, 0.0, *rng.lognormal(12, 1, 50)], count),
+    })
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    path = tmp_path / "processed"
+    path.mkdir()
+    _awards().to_parquet(path / "rfp_master_dataset.parquet")
+    _awards(seed=1, count=100).to_parquet(path / "construction_rfps.parquet")
+    return path
+
+
+@pytest.fixture
+def history(data_dir):
+    df = pd.concat(
+        [pd.read_parquet(data_dir / "rfp_master_dataset.parquet"), pd.read_parquet(data_dir / "construction_rfps.parquet")],
+        ignore_index=True,
+    )
+    return df[df["award_amount"].notna() & (df["award_amount"] > 0)]
+
+
+def test_statistics_match_pandas_scans(data_dir, history, tmp_path):
+    store = MarketStatsStore(data_dir, tmp_path / "pricing" / "market_stats.json")
+
+    # NAICS patterns as the engine computed them with groupby lambdas
+    grouped = history.groupby("naics_code")["award_amount"]
+    patterns = store.naics_patterns()
+    expected_codes = {code for code, n in grouped.size().items() if n >= 5}
+    assert set(patterns) == expected_codes
+    for code in expected_codes:
+        awards = grouped.get_group(code)
+        assert patterns[code]["count"] == len(awards)
+        assert patterns[code]["median"] == pytest.approx(awards.median())
+        assert patterns[code]["q25"] == pytest.approx(awards.quantile(0.25))
+        assert patterns[code]["q75"] == pytest.approx(awards.quantile(0.75))
+        assert patterns[code]["std"] == pytest.approx(awards.std())
+
+    mask = history["description"].str.contains("construction", case=False, na=False) | history[
+        "title"
+    ].str.contains("construction", case=False, na=False)
+    category = store.category("construction")
+    assert category["count"] == mask.sum()
+    assert category["mean"] == pytest.approx(history.loc[mask, "award_amount"].mean())
+    assert category["max"] == pytest.approx(history.loc[mask, "award_amount"].max())
+    assert store.category("maintenance") is None
+
+    agency = history[history["agency"].str.contains("dept of", case=False, na=False)]
+    assert store.agency("DEPT of") == {
+        "count": len(agency),
+        "mean": pytest.approx(agency["award_amount"].mean()),
+    }
+
+    dated = history.assign(year=pd.to_datetime(history["posted_date"], errors="coerce").dt.year).dropna(subset=["year"])
+    yearly = dated[dated["naics_code"].str.startswith("5415")].groupby("year")["award_amount"].median()
+    trend = store.naics_trend("5415")
+    assert [point["year"] for point in trend] == list(yearly.index)
+    assert [point["median"] for point in trend] == pytest.approx(list(yearly))
+
+
+def test_term_index_matches_substring_scans(history):
+    history = history.reset_index(drop=True)
+    terms = ["bottled_water", "construction", "IT_SERVICES", "help", "nowhere"]
+    spans, postings = index_terms(history, terms)
+
+    for term in terms:
+        mask = history["description"].str.contains(term, case=False, na=False) | history[
+            "title"
+        ].str.contains(term, case=False, na=False)
+        span = spans.get(term.lower())
+        rows = postings[span[0]:span[1]] if span else []
+        assert list(rows) == list(history.index[mask])
+
+
+def test_strategies_share_one_pricing_context(data_dir, tmp_path):
+    class RecordingRAG:
+        calls = 0
+
+        def retrieve(self, query, k=5):
+            self.calls += 1
+            return [{"metadata": {"title": "Prior award", "total_contract_value": 250000}, "score": 0.9}]
+
+    rag = RecordingRAG()
+    engine = PricingEngine(rag_engine=rag, data_dir=str(data_dir), pricing_dir=str(tmp_path / "pricing"))
+    rfp = {"title": "School construction", "naics_code": "236220", "description": "Construction services"}
+
+    results = engine.compare_strategies(rfp)
+
+    assert set(results) == set(engine.pricing_strategies)
+    assert rag.calls == 1
+    for name, result in results.items():
+        assert result.total_price == engine.generate_pricing(rfp, strategy_name=name).total_price
+
+
+def test_store_rebuilds_when_sources_change(data_dir, tmp_path):
+    stats_path = tmp_path / "pricing" / "market_stats.json"
+    store = MarketStatsStore(data_dir, stats_path, check_interval=0)
+    before = store.naics("541512")["count"]
+    matrix_files = list(stats_path.parent.glob("*.npy"))
+
+    extra = pd.DataFrame({"naics_code": ["541512"] * 3, "award_amount": [1000.0, 2000.0, 3000.0]})
+    extra.to_parquet(data_dir / "delivery_rfps.parquet")
+    assert store.naics("541512")["count"] == before + 3
+    assert list(stats_path.parent.glob("*.npy")) != matrix_files
+    # matrix, amounts and postings of the new build, plus the previous build's for readers still opening it
+    assert len(list(stats_path.parent.glob("*.npy"))) == 6
+
+    # Another process picks up the rebuilt file instead of building again
+    other = MarketStatsStore(data_dir, stats_path, check_interval=0)
+    mtime = os.stat(stats_path).st_mtime_ns
+    assert other.naics("541512")["count"] == before + 3
+    assert os.stat(stats_path).st_mtime_ns == mtime
+
+
+def test_readers_survive_concurrent_rebuilds(data_dir, tmp_path):
+    stats_path = tmp_path / "pricing" / "market_stats.json"
+    first = build_market_stats(data_dir, stats_path)
+    store = MarketStatsStore(data_dir, stats_path, check_interval=0)
+    count = store.naics("541512")["count"]
+
+    # The previous build's arrays outlive the next build
+    build_market_stats(data_dir, stats_path)
+    for name in first["arrays"].values():
+        np.load(stats_path.parent / name, mmap_mode="r")
+
+    # A manifest whose arrays are gone leaves the loaded statistics in place
+    build_market_stats(data_dir, stats_path)
+    stats_path.write_text(json.dumps(first), encoding="utf-8")
+    os.utime(stats_path, ns=(1, 1))
+    assert store.naics("541512")["count"] == count
+
+
+def test_engine_uses_statistics_without_loading_history(data_dir, tmp_path):
+    build_market_stats(data_dir, tmp_path / "pricing" / "market_stats.json")
+    engine = PricingEngine(data_dir=str(data_dir), pricing_dir=str(tmp_path / "pricing"))
+
+    context = engine._get_historical_pricing_context({"title": "School construction", "naics_code": "236220"})
+
+    assert context["naics_statistics"]["count"] >= 5
+    assert context["category_statistics"]["count"] > 0
+    assert engine._historical_data is None
+
+
+def test_pricing_routes_use_shared_engine(client, db_session, sample_rfp, data_dir, tmp_path, monkeypatch):
+    engine = PricingEngine(data_dir=str(data_dir), pricing_dir=str(tmp_path / "pricing"))
+    monkeypatch.setattr(pricing_engine_module, "_engine_instance", engine)
+    sample_rfp.naics_code, sample_rfp.agency = "541512", "Dept of Transportation"
+    sample_rfp.title = "Bottled_water supply"
+    db_session.commit()
+
+    response = client.get(f"/api/v1/pricing/{sample_rfp.id}/market-intelligence")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["naics_stats"]["count"] == engine.market_stats.naics("541512")["count"]
+    assert body["category_stats"]["count"] == engine.market_stats.category("bottled_water")["count"]
+    assert body["agency_insights"]["contract_count"] > 0
+
+    trends = client.get("/api/v1/pricing/trends/541512").json()
+    assert [t["year"] for t in trends["trends"]] == [2021, 2022, 2023]
+    assert trends["yoy_change"] is not None
+    assert engine._historical_data is None
@@ -0,0 +1,136 @@
+"""Tests for the versioned pricing model registry and model hot-swapping."""
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import src.pricing.model_registry as model_registry_module
+import src.pricing.pricing_ml as pricing_ml_module
+from src.pricing.model_registry import ModelRegistry
+from src.pricing.pricing_ml import PricingMLModel, get_pricing_ml_model, reset_pricing_ml_model
+
+ROW = {"naics_code": "541512", "agency": "City of Austin", "description_length": 800, "requirement_count": 10}
+
+
+def _awards(scale, count=300, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "naics_code": rng.choice(["541511", "541512", "236220"], count),
+        "agency": rng.choice(["Dept of Transportation", "City of Austin"], count),
+        "description": [" ".join(["word"] * n) for n in rng.integers(10, 400, count)],
+        "award_amount": scale * rng.lognormal(0, 0.3, count),
+    })
+
+
+def _trained(tmp_path, scale):
+    model = PricingMLModel(model_path=tmp_path / "unused.pkl")
+    metrics = model.train(_awards(scale), save=False, n_threads=1)
+    return model, metrics
+
+
+@pytest.fixture
+def registry(tmp_path, monkeypatch):
+    root = tmp_path / "registry"
+    monkeypatch.setattr(model_registry_module, "DEFAULT_ROOT", root)
+    monkeypatch.setattr(pricing_ml_module, "CHECK_INTERVAL_SECONDS", 0)
+    reset_pricing_ml_model()
+    yield ModelRegistry(root)
+    reset_pricing_ml_model()
+
+
+def test_publish_activate_and_rollback(registry, tmp_path):
+    small, small_metrics = _trained(tmp_path, 1e5)
+    large, _ = _trained(tmp_path, 1e7)
+
+    first = registry.publish(small, small_metrics)
+    assert registry.pointer()["current"] == first
+    assert registry.pointer()["previous"] is None
+    second = registry.publish(large, {"test_r2": 0.5})
+
+    assert registry.pointer()["current"] == second
+    assert registry.pointer()["previous"] == first
+    versions = registry.versions()
+    assert [v["version"] for v in versions] == [second, first]
+    assert versions[1]["metrics"] == small_metrics
+    assert versions[1]["estimator"] == "HistGradientBoostingRegressor"
+    assert registry.load(first).predict(**ROW).predicted_price == pytest.approx(small.predict(**ROW).predicted_price)
+
+    assert registry.rollback() == first
+    assert registry.pointer() | {"updated_at": None} == {"current": first, "previous": second, "updated_at": None}
+    with pytest.raises(ValueError):
+        registry.activate("20000101T000000000000Z")
+
+
+def test_running_processes_hot_swap_versions(registry, tmp_path):
+    small, metrics = _trained(tmp_path, 1e5)
+    large, _ = _trained(tmp_path, 1e7)
+    registry.publish(small, metrics)
+
+    served = get_pricing_ml_model()
+    assert served.predict(**ROW).predicted_price < 1e6
+    assert get_pricing_ml_model() is served
+
+    # Published by another process: picked up on the next check
+    registry.publish(large, metrics)
+    assert get_pricing_ml_model().predict(**ROW).predicted_price > 1e6
+
+    registry.rollback()
+    assert get_pricing_ml_model().predict(**ROW).predicted_price < 1e6
+
+
+def test_prune_keeps_current_and_previous(registry, tmp_path):
+    model, metrics = _trained(tmp_path, 1e5)
+    registry.keep_versions = 1
+    versions = [registry.publish(model, metrics) for _ in range(4)]
+    registry.activate(versions[0])  # previous: versions[3]
+
+    removed = registry.prune()
+
+    assert sorted(removed) == sorted(versions[1:3])
+    assert {v["version"] for v in registry.versions()} == {versions[0], versions[3]}
+
+
+def test_training_task_publishes_version(registry, tmp_path):
+    from api.app.worker.tasks.pricing import train_pricing_model
+
+    with patch("src.pricing.market_stats.load_award_history", return_value=_awards(1e5)), patch.object(
+        train_pricing_model, "update_state"
+    ):
+        result = train_pricing_model(n_threads=1)
+
+    assert result["status"] == "trained"
+    assert registry.current_version() == result["version"]
+    assert result["metrics"]["samples_trained"] == 240
+    assert get_pricing_ml_model().is_trained
+
+
+def test_model_routes(client, registry, tmp_path):
+    model, metrics = _trained(tmp_path, 1e5)
+    first = registry.publish(model, metrics)
+
+    assert client.post("/api/v1/pricing/models/rollback").status_code == 409
+    second = registry.publish(model, metrics)
+
+    listing = client.get("/api/v1/pricing/models").json()
+    assert listing["current"] == second
+    assert [v["version"] for v in listing["versions"]] == [second, first]
+
+    assert client.post("/api/v1/pricing/models/rollback").json() == {"status": "activated", "version": first}
+    assert client.post(f"/api/v1/pricing/models/{second}/activate").status_code == 200
+    assert registry.current_version() == second
+    assert client.post("/api/v1/pricing/models/unknown/activate").status_code == 404
+
+
+def test_train_route_in_process(client, registry):
+    from api.app.core.feature_flags import feature_flags
+
+    with patch.object(feature_flags, "is_enabled", return_value=False):
+        with patch("src.pricing.market_stats.load_award_history", return_value=pd.DataFrame()):
+            assert client.post("/api/v1/pricing/train-model").status_code == 400
+
+        with patch("src.pricing.market_stats.load_award_history", return_value=_awards(1e5)):
+            response = client.post("/api/v1/pricing/train-model")
+
+    assert response.status_code == 200
+    assert registry.current_version() == response.json()["version"]
@@ -0,0 +1,82 @@
+"""Tests for pipeline status aggregation and the pipeline delta stream."""
+import asyncio
+from datetime import datetime, timedelta
+
+from app.models.database import PipelineStage, RFPOpportunity
+from app.services.pipeline_stream import PipelineDeltaStream, _collect_deltas
+
+
+def _seed_stage(db_session, stage: PipelineStage, count: int) -> list[RFPOpportunity]:
+    now = datetime(2025, 1, 1)
+    rfps = [
+        RFPOpportunity(
+            rfp_id=f"{stage.value}-{i}",
+            title=f"{stage.value} {i}",
+            current_stage=stage,
+            updated_at=now + timedelta(minutes=i),
+        )
+        for i in range(count)
+    ]
+    db_session.add_all(rfps)
+    db_session.commit()
+    return rfps
+
+
+class TestPipelineStatus:
+    """GET /pipeline/status."""
+
+    def test_counts_and_grouping(self, client, db_session):
+        _seed_stage(db_session, PipelineStage.DISCOVERED, 3)
+        _seed_stage(db_session, PipelineStage.REVIEW, 2)
+
+        data = client.get("/api/v1/pipeline/status").json()
+
+        assert data["stages"]["discovered"] == 3
+        assert data["stages"]["review"] == 2
+        assert data["stages"]["approved"] == 0
+        assert data["total_count"] == 5
+        # Stage order follows the PipelineStage enum, newest first within a stage
+        assert [r["rfp_id"] for r in data["rfps"]] == [
+            "discovered-2", "discovered-1", "discovered-0", "review-1", "review-0",
+        ]
+
+    def test_per_stage_paging(self, client, db_session):
+        _seed_stage(db_session, PipelineStage.DISCOVERED, 5)
+        _seed_stage(db_session, PipelineStage.TRIAGED, 1)
+
+        data = client.get("/api/v1/pipeline/status?skip=1&limit=2").json()
+
+        assert [r["rfp_id"] for r in data["rfps"]] == ["discovered-3", "discovered-2"]
+        assert data["stages"]["discovered"] == 5
+
+
+class TestPipelineDeltas:
+    """Deltas derived from session writes."""
+
+    def test_collects_added_and_moved(self, db_session):
+        rfp = RFPOpportunity(rfp_id="DELTA-1", title="Delta", current_stage=PipelineStage.DISCOVERED)
+        db_session.add(rfp)
+        assert [d["event"] for d in _collect_deltas(db_session)] == ["rfp_added"]
+        db_session.commit()
+
+        assert rfp.current_stage == PipelineStage.DISCOVERED
+        rfp.current_stage = PipelineStage.TRIAGED
+        deltas = _collect_deltas(db_session)
+
+        assert deltas[0]["event"] == "rfp_moved"
+        assert deltas[0]["rfp"]["current_stage"] == "triaged"
+        assert deltas[0]["rfp"]["previous_stage"] == "discovered"
+
+    def test_slow_subscriber_gets_resync(self):
+        stream = PipelineDeltaStream(max_queue_size=2)
+
+        async def run():
+            queue = stream.subscribe()
+            stream.bind_loop(asyncio.get_running_loop())
+            deltas = [{"event": "rfp_added", "rfp": {"id": i}} for i in range(3)]
+            await stream.dispatch(deltas)
+            return [queue.get_nowait() for _ in range(queue.qsize())]
+
+        received = asyncio.run(run())
+
+        assert received[-1] == {"event": "resync"}
@@ -0,0 +1,130 @@
+"""Tests for batched ML price prediction."""
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.ensemble import GradientBoostingRegressor
+
+import src.pricing.pricing_ml as pricing_ml_module
+from src.pricing.pricing_ml import PricingMLModel
+
+NAICS = ["541511", "541512", "236220", "484110"]
+AGENCIES = ["Dept of Transportation", "DEPT OF EDUCATION", "City of Austin"]
+
+
+def _awards(count=600, seed=0):
+    rng = np.random.default_rng(seed)
+    naics = rng.choice(NAICS, count)
+    scale = pd.Series(naics).map({"541511": 2e5, "541512": 5e5, "236220": 2e6, "484110": 8e4}).to_numpy()
+    return pd.DataFrame({
+        "naics_code": naics,
+        "agency": rng.choice(AGENCIES, count),
+        "description": [" ".join(["word"] * n) for n in rng.integers(10, 400, count)],
+        "set_aside": rng.choice(["None", "8(a)", "SDVOSB"], count),
+        "award_amount": scale * rng.lognormal(0, 0.4, count),
+    })
+
+
+@pytest.fixture(scope="module")
+def model(tmp_path_factory):
+    model = PricingMLModel(model_path=tmp_path_factory.mktemp("models") / "pricing_model.pkl")
+    model.train(_awards())
+    return model
+
+
+def _rows():
+    return pd.DataFrame({
+        "naics_code": ["541512", "236220", "999999", None],
+        "agency": ["City of Austin", "Unknown agency", "Dept of Transportation", "DEPT OF EDUCATION"],
+        "description_length": [120, 3000, 0, 55],
+        "requirement_count": [10, 25, 3, 10],
+        "set_aside": ["8(a)", None, "Unheard of", "SDVOSB"],
+    })
+
+
+def test_batch_matches_single_predictions(model):
+    rows = _rows()
+    batch = model.predict_batch(rows)
+
+    assert len(batch) == len(rows)
+    for prediction, row in zip(batch, rows.to_dict("records"), strict=True):
+        single = model.predict(**row)
+        assert prediction.predicted_price == pytest.approx(single.predicted_price)
+        assert prediction.confidence_interval == pytest.approx(single.confidence_interval)
+        assert prediction.model_confidence == pytest.approx(single.model_confidence)
+        lower, upper = prediction.confidence_interval
+        assert 0 <= lower <= prediction.predicted_price <= upper
+    assert model.predict_batch(rows.iloc[:0]) == []
+
+
+def test_encoding_matches_label_encoders(model):
+    rows = _rows()
+    encoded = model._encode_frame(rows)
+
+    for i, col in enumerate(model.feature_names):
+        if col not in model.label_encoders:
+            continue
+        encoder = model.label_encoders[col]
+        default = "None" if col == "set_aside" else "Unknown"
+        values = rows[col] if col in rows else pd.Series(["FFP"] * len(rows))
+        expected = [
+            encoder.transform([value])[0] if value in encoder.classes_ else encoder.transform(["Unknown"])[0]
+            for value in values.fillna(default).astype(str)
+        ]
+        assert encoded[:, i].tolist() == expected
+
+    # description_length is derived from description when given
+    described = model._encode_frame(pd.DataFrame({"naics_code": ["541512"], "description": ["x" * 42]}))
+    assert described[0, model.feature_names.index("description_length")] == 42
+
+
+def test_tree_spread_interval_matches_per_tree_loop(model, monkeypatch):
+    # A model pickled before the registry: gradient boosting, no quantile models
+    awards = _awards()
+    legacy = GradientBoostingRegressor(n_estimators=100, max_depth=5, subsample=0.8, random_state=42)
+    legacy.fit(model.scaler.transform(model._encode_frame(awards)), np.log1p(awards["award_amount"]))
+    monkeypatch.setattr(model, "model", legacy)
+    monkeypatch.setattr(model, "quantile_models", {})
+    monkeypatch.setattr(model, "feature_importance", {})
+    rows = _rows()
+    batch = model.predict_batch(rows)
+
+    features = model.scaler.transform(model._encode_frame(rows))
+    for i, prediction in enumerate(batch):
+        row = features[i:i + 1]
+        std = np.expm1([tree[0].predict(row)[0] for tree in model.model.estimators_]).std()
+        price = np.expm1(model.model.predict(row)[0])
+        assert prediction.confidence_interval == pytest.approx((max(0, price - 1.96 * std), price + 1.96 * std))
+        assert prediction.feature_importance == dict(
+            zip(model.feature_names, legacy.feature_importances_, strict=True)
+        )
+
+
+def test_quantile_models_are_saved(model):
+    reloaded = PricingMLModel(model_path=model.model_path)
+
+    assert reloaded.is_trained
+    assert set(reloaded.quantile_models) == set(model.quantile_models)
+    assert [p.confidence_interval for p in reloaded.predict_batch(_rows())] == [
+        p.confidence_interval for p in model.predict_batch(_rows())
+    ]
+
+
+def test_batch_prediction_route(client, db_session, sample_rfp, model, monkeypatch):
+    monkeypatch.setattr(pricing_ml_module, "_pricing_ml_model", model)
+    sample_rfp.naics_code = "541512"
+    db_session.commit()
+
+    response = client.post("/api/v1/pricing/ml-predictions", json={"rfp_ids": [sample_rfp.id, 99999]})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["not_found"] == [99999]
+    [prediction] = body["predictions"]
+    single = model.predict(
+        naics_code="541512",
+        agency=sample_rfp.agency or "Unknown",
+        description_length=len(sample_rfp.description or ""),
+        requirement_count=10,
+    )
+    assert prediction["rfp_id"] == sample_rfp.id
+    assert prediction["predicted_price"] == pytest.approx(single.predicted_price)
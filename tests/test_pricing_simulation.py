@@ -0,0 +1,123 @@
+"""Tests for the Monte Carlo pricing simulation and the batched win-probability grid."""
+import numpy as np
+import pytest
+
+import src.pricing.simulation as simulation_module
+from src.pricing.pricing_engine import PricingEngine
+from src.pricing.pricing_ml import PricingMLModel
+from src.pricing.simulation import MonteCarloParams, margin_grid, simulate_pricing
+from src.pricing.win_probability import WinProbabilityModel
+
+
+def _loop_optimize(base_cost, min_margin, max_margin, target_win_prob, market_median):
+    """The per-margin loop ``optimize_price`` used before it was batched."""
+    model = WinProbabilityModel()
+    best = (-1, base_cost * (1 + min_margin), min_margin, 0.5)
+    for margin in np.arange(min_margin, max_margin + 0.01, 0.01):
+        price = base_cost * (1 + margin)
+        win_prob = model.predict(price, market_median)
+        score = margin * 0.6 + win_prob * 0.4 if win_prob >= target_win_prob else win_prob
+        if score > best[0]:
+            best = (score, price, margin, win_prob)
+    return best
+
+
+def test_predict_many_matches_predict():
+    rng = np.random.default_rng(3)
+    model = WinProbabilityModel()
+    bids = rng.uniform(1e4, 3e6, 2000)
+    medians = np.append(rng.uniform(1e4, 3e6, 1990), [0.0, -1.0, 0.0, 5e5, 5e5, 1e6, 1e6, 2e6, 2e6, 3e6])
+
+    batch = model.predict_many(bids, medians)
+
+    assert batch.tolist() == [model.predict(b, m) for b, m in zip(bids, medians, strict=True)]
+    assert model.predict_many(bids[:3, None], medians[None, :4]).shape == (3, 4)
+
+
+@pytest.mark.parametrize(
+    "base_cost, min_margin, max_margin, target, median",
+    [
+        (100_000, 0.10, 0.35, 0.7, None),
+        (250_000, 0.05, 0.60, 0.3, 260_000),
+        (80_000, 0.0, 0.5, 0.95, 200_000),
+        (80_000, 0.3, 0.1, 0.5, None),  # empty grid keeps the defaults
+    ],
+)
+def test_optimize_price_matches_loop(base_cost, min_margin, max_margin, target, median):
+    result = PricingMLModel().optimize_price(base_cost, min_margin, max_margin, target, median)
+    score, price, margin, win_prob = _loop_optimize(
+        base_cost, min_margin, max_margin, target, base_cost * 1.25 if median is None else median
+    )
+
+    assert result["optimization_score"] == pytest.approx(score)
+    assert result["optimal_price"] == pytest.approx(price)
+    assert result["margin"] == pytest.approx(margin)
+    assert result["win_probability"] == pytest.approx(win_prob)
+
+
+def test_simulation_without_variance_is_deterministic():
+    params = MonteCarloParams(
+        draws=2000,
+        material_cost_sd=0.0,
+        labor_cost_sd=0.0,
+        risk_contingency=(0.05, 0.05, 0.05),
+        competitor_price_sd=0.0,
+    )
+    model = WinProbabilityModel()
+
+    result = simulate_pricing(40_000, 45_000, 15_000, 140_000, params)
+
+    cost = 100_000 * 1.05
+    assert result.planned_cost == pytest.approx(cost)
+    assert result.cost_percentiles["p5"] == result.cost_percentiles["p95"] == pytest.approx(cost)
+    assert len(result.margin_grid) == 56
+    for point, margin in zip(result.margin_grid, margin_grid(0.05, 0.60), strict=True):
+        price = cost * (1 + margin)
+        win = model.predict(price, 140_000)
+        assert point["win_probability"] == pytest.approx(win)
+        assert point["expected_profit"] == pytest.approx(win * (price - cost), abs=0.01)
+        assert point["probability_of_loss"] == 0.0
+    assert result.optimal["expected_profit"] == max(p["expected_profit"] for p in result.margin_grid)
+
+
+def test_simulation_is_reproducible_and_chunk_independent(monkeypatch):
+    params = MonteCarloParams(draws=30_000, seed=11)
+    first = simulate_pricing(40_000, 45_000, 15_000, 130_000, params)
+    monkeypatch.setattr(simulation_module, "CHUNK_SIZE", 7_000)
+    second = simulate_pricing(40_000, 45_000, 15_000, 130_000, params)
+
+    for a, b in zip(first.margin_grid, second.margin_grid, strict=True):
+        assert a["win_probability"] == pytest.approx(b["win_probability"])
+        assert a["expected_profit"] == pytest.approx(b["expected_profit"], abs=0.02)
+    assert first.optimal["margin"] == second.optimal["margin"]
+
+    # Sampled cost spreads around the planned cost; higher margins lose less often
+    assert first.cost_percentiles["p5"] < first.planned_cost < first.cost_percentiles["p95"]
+    losses = [point["probability_of_loss"] for point in first.margin_grid]
+    assert losses == sorted(losses, reverse=True)
+    assert sum(first.cost_histogram["counts"]) == params.draws
+
+
+def test_pricing_scenarios_route(client, db_session, sample_rfp, tmp_path, monkeypatch):
+    from app.services.rfp_processor import processor
+
+    engine = PricingEngine(data_dir=str(tmp_path / "processed"), pricing_dir=str(tmp_path / "pricing"))
+    monkeypatch.setattr(processor, "pricing_engine", engine)
+
+    response = client.post(
+        f"/api/v1/rfps/{sample_rfp.rfp_id}/pricing-scenarios",
+        json={"draws": 5000, "seed": 1, "min_margin": 0.1, "max_margin": 0.3},
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["draws"] == 5000
+    assert [point["margin"] for point in body["margin_grid"]] == pytest.approx(np.arange(0.10, 0.305, 0.01))
+    assert body["optimal"] in body["margin_grid"]
+    assert body["market_basis"].startswith("Cost-Plus")
+
+    invalid = client.post(
+        f"/api/v1/rfps/{sample_rfp.rfp_id}/pricing-scenarios",
+        json={"risk_contingency_min": 0.2, "risk_contingency_likely": 0.1},
+    )
+    assert invalid.status_code == 422
@@ -0,0 +1,253 @@
+"""Tests for the background refresh scheduler of scraped RFPs."""
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from app.models.database import RFPOpportunity, RFPQandA, RFPRefreshState
+from app.services.pipeline_stream import pipeline_stream
+from app.services.refresh_scheduler import (
+    RefreshScheduler,
+    TrackedRFP,
+    page_fingerprint,
+    run_refresh_loop,
+)
+from sqlalchemy.orm import sessionmaker
+
+from src.agents.scrapers import ScrapedQA, ScrapedRFP
+
+
+class _Portal:
+    """Portal page with an ETag that changes with its content."""
+
+    def __init__(self):
+        self.body = "<html><body><h1>Road Repair</h1><p>No questions yet</p></body></html>"
+        self.requests = []
+
+    async def handle(self, request):
+        self.requests.append(request.method)
+        etag = f'"{page_fingerprint(self.body)[:16]}"'
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers={"ETag": etag})
+        return web.Response(text=self.body, content_type="text/html", headers={"ETag": etag})
+
+
+class _FakeScraper:
+    DOWNLOAD_HEADERS = {}
+
+    def __init__(self, url):
+        self.refresh = AsyncMock(
+            return_value={
+                "has_changes": True,
+                "updated_rfp": ScrapedRFP(
+                    source_url=url,
+                    source_platform="test",
+                    title="Road Repair",
+                    qa_items=[ScrapedQA(question_number="1", question_text="Is there a site visit?")],
+                ),
+            }
+        )
+
+
+@pytest.fixture
+def session_factory(test_engine):
+    return sessionmaker(bind=test_engine)
+
+
+def _add_rfp(db_session, url, rfp_id="RFP-REFRESH-1", **fields):
+    values = {
+        "rfp_id": rfp_id,
+        "title": "Road Repair",
+        "source_url": url,
+        "source_platform": "test",
+        "scrape_checksum": "old",
+        "last_scraped_at": datetime.utcnow(),
+        "response_deadline": datetime.utcnow() + timedelta(days=5),
+        **fields,
+    }
+    rfp = RFPOpportunity(**values)
+    db_session.add(rfp)
+    db_session.commit()
+    return rfp
+
+
+def _make_due(db_session):
+    db_session.query(RFPRefreshState).update({RFPRefreshState.next_check_at: None})
+    db_session.commit()
+
+
+def _run_against_portal(portal, run):
+    async def main():
+        app = web.Application()
+        app.router.add_route("*", "/rfp", portal.handle)
+        async with TestServer(app) as server:
+            return await run(str(server.make_url("/rfp")))
+
+    return asyncio.run(main())
+
+
+class TestRefreshPriority:
+    """Scheduling order and check intervals."""
+
+    def test_interval_shrinks_near_deadline_and_for_changing_pages(self, session_factory):
+        scheduler = RefreshScheduler(session_factory=session_factory, scraper_factory=_FakeScraper)
+        now = datetime.utcnow()
+
+        def tracked(days_left, checks=0, changes=0):
+            return TrackedRFP(
+                db_id=1, rfp_id="R", url="https://x", platform="test", checksum=None,
+                deadline=now + timedelta(days=days_left), last_scraped_at=now,
+                checks=checks, changes=changes,
+            )
+
+        assert scheduler.check_interval(tracked(2), now) < scheduler.check_interval(tracked(20), now)
+        assert scheduler.check_interval(tracked(10, checks=10, changes=9), now) < scheduler.check_interval(
+            tracked(10, checks=10, changes=0), now
+        )
+
+    def test_due_skips_closed_and_scheduled_rfps(self, db_session, session_factory):
+        _add_rfp(db_session, "https://a.example/1", rfp_id="OPEN")
+        _add_rfp(
+            db_session, "https://a.example/2", rfp_id="CLOSED",
+            response_deadline=datetime.utcnow() - timedelta(days=1),
+        )
+        later = _add_rfp(db_session, "https://a.example/3", rfp_id="LATER")
+        db_session.add(RFPRefreshState(rfp_id=later.id, next_check_at=datetime.utcnow() + timedelta(hours=1)))
+        db_session.add(RFPOpportunity(rfp_id="MANUAL", title="Manual"))
+        db_session.commit()
+
+        scheduler = RefreshScheduler(session_factory=session_factory, scraper_factory=_FakeScraper)
+        due = scheduler.due(db_session, datetime.utcnow())
+
+        assert [t.rfp_id for t in due] == ["OPEN"]
+
+
+class TestRefreshRun:
+    """Cheap change detection before full extraction."""
+
+    def test_page_fingerprint_ignores_markup_and_scripts(self):
+        assert page_fingerprint("<p>Deadline  March 1</p><script>var t=1</script>") == page_fingerprint(
+            "<div>Deadline March 1</div><script>var t=2</script>"
+        )
+
+    def test_unchanged_page_is_not_scraped(self, db_session, session_factory):
+        portal = _Portal()
+        scrapers = []
+
+        def factory(url):
+            scrapers.append(_FakeScraper(url))
+            return scrapers[-1]
+
+        async def run(url):
+            _add_rfp(db_session, url)
+            scheduler = RefreshScheduler(session_factory=session_factory, scraper_factory=factory)
+            first = await scheduler.run()
+            _make_due(db_session)
+            portal.requests.clear()
+            second = await scheduler.run()
+            return first, second
+
+        first, second = _run_against_portal(portal, run)
+
+        assert first["unchanged"] == 1
+        assert second["unchanged"] == 1
+        # Second check is answered by the ETag on HEAD alone
+        assert portal.requests == ["HEAD"]
+        assert all(not s.refresh.called for s in scrapers)
+
+    def test_changed_page_is_refreshed_and_broadcast(self, db_session, session_factory):
+        portal = _Portal()
+        broadcasts = []
+
+        async def broadcast(rfp_id, changes):
+            broadcasts.append((rfp_id, changes))
+
+        async def run(url):
+            rfp = _add_rfp(db_session, url)
+            scheduler = RefreshScheduler(
+                session_factory=session_factory, scraper_factory=_FakeScraper, broadcast=broadcast
+            )
+            await scheduler.run()
+            portal.body = portal.body.replace("No questions yet", "Q1: Is there a site visit?")
+            _make_due(db_session)
+            return rfp, await scheduler.run()
+
+        rfp, summary = _run_against_portal(portal, run)
+
+        assert summary["changed"] == 1
+        assert db_session.query(RFPQandA).filter(RFPQandA.rfp_id == rfp.id).count() == 1
+        assert [(rfp_id, changes["new_qa_count"]) for rfp_id, changes in broadcasts] == [("RFP-REFRESH-1", 1)]
+        state = db_session.query(RFPRefreshState).filter(RFPRefreshState.rfp_id == rfp.id).one()
+        assert (state.checks, state.changes) == (2, 1)
+
+    def test_unchanged_full_scrape_leaves_rfp_row_alone(self, db_session, session_factory):
+        portal = _Portal()
+        scraped_at = datetime.utcnow() - timedelta(days=10)
+
+        def unchanged_scraper(url):
+            scraper = _FakeScraper(url)
+            scraper.refresh.return_value = {
+                "has_changes": False,
+                "updated_rfp": ScrapedRFP(source_url=url, source_platform="test", title="Road Repair"),
+            }
+            return scraper
+
+        async def run(url):
+            rfp = _add_rfp(db_session, url, last_scraped_at=scraped_at)
+            scheduler = RefreshScheduler(session_factory=session_factory, scraper_factory=unchanged_scraper)
+            return rfp, await scheduler.run()
+
+        rfp, summary = _run_against_portal(portal, run)
+
+        assert summary["refreshed"] == 1
+        db_session.refresh(rfp)
+        # The stale scrape is recorded on the refresh state, not the RFP
+        assert rfp.last_scraped_at == scraped_at
+        state = db_session.query(RFPRefreshState).filter(RFPRefreshState.rfp_id == rfp.id).one()
+        assert state.last_full_scrape_at > scraped_at
+        tracked = TrackedRFP.from_rows(rfp, state)
+        assert tracked.last_scraped_at == state.last_full_scrape_at
+
+
+class TestRefreshLoop:
+    """Scheduling inside the API process."""
+
+    def test_loop_survives_failed_runs(self):
+        scheduler = AsyncMock()
+        scheduler.run.side_effect = [RuntimeError("portal down"), {"checked": 0}, asyncio.CancelledError()]
+
+        with pytest.raises(asyncio.CancelledError):
+            asyncio.run(run_refresh_loop(scheduler, interval=0))
+        assert scheduler.run.await_count == 3
+
+    def test_lifespan_runs_loop_on_app_event_loop(self, app, override_get_db, monkeypatch):
+        from app.core.config import settings
+        from fastapi.testclient import TestClient
+
+        monkeypatch.setattr(settings, "REFRESH_SCHEDULER_ENABLED", True)
+        state = {}
+
+        async def loop():
+            state["loop"] = asyncio.get_running_loop()
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                state["cancelled"] = True
+                raise
+
+        with patch("app.services.refresh_scheduler.run_refresh_loop", loop):
+            with TestClient(app) as client:
+                client.get("/health")
+                assert state["loop"] is pipeline_stream._loop
+        assert state["cancelled"]
+
+    def test_lifespan_leaves_scheduler_off_by_default(self, app, override_get_db):
+        from fastapi.testclient import TestClient
+
+        loop = AsyncMock()
+        with patch("app.services.refresh_scheduler.run_refresh_loop", loop):
+            with TestClient(app) as client:
+                client.get("/health")
+        loop.assert_not_called()
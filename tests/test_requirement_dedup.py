@@ -0,0 +1,114 @@
+"""Tests for MinHash/LSH near-duplicate detection of requirement texts."""
+import random
+import re
+
+from app.models.database import ComplianceRequirement
+
+from src.compliance.compliance_checklist import ComplianceChecklistGenerator
+from src.compliance.dedup import RequirementDedupIndex, deduplicate_requirements
+
+WORDS = (
+    "the contractor shall must provide submit all labor equipment materials reports monthly "
+    "system support access logging personnel clearance pricing include travel costs within days"
+).split()
+
+
+def _pairwise_dedup(requirements):
+    """The all-pairs overlap comparison the index replaces."""
+    unique, seen = [], set()
+    for req in requirements:
+        normalized = re.sub(r'\s+', ' ', req['text'].lower().strip())
+        is_duplicate = any(
+            len(set(normalized.split()) & set(seen_text.split()))
+            / max(len(normalized.split()), len(seen_text.split())) > 0.8
+            for seen_text in seen
+        )
+        if not is_duplicate and len(normalized) > 20:
+            unique.append(req)
+            seen.add(normalized)
+    return unique
+
+
+def _variants(rng, count):
+    """Requirement sentences, many of them light edits of earlier ones."""
+    texts = []
+    for _ in range(count):
+        if texts and rng.random() < 0.6:
+            words = rng.choice(texts).split()
+            for _ in range(rng.randint(0, 3)):
+                position = rng.randrange(len(words))
+                if rng.random() < 0.5:
+                    words[position] = rng.choice(WORDS).upper()
+                else:
+                    words.insert(position, rng.choice(WORDS))
+            texts.append("  ".join(words))
+        else:
+            texts.append(" ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 18))))
+    return [{"id": f"req_{i}", "text": text} for i, text in enumerate(texts)]
+
+
+class TestRequirementDedupIndex:
+    """Agreement with the overlap rule and incremental use."""
+
+    def test_matches_pairwise_overlap(self):
+        rng = random.Random(3)
+        for _ in range(5):
+            requirements = _variants(rng, 300)
+            assert deduplicate_requirements(requirements) == _pairwise_dedup(requirements)
+
+    def test_seeded_index_rejects_known_texts(self):
+        index = RequirementDedupIndex()
+        assert index.add("The contractor shall submit monthly status reports.")
+        assert not index.add("the contractor shall submit MONTHLY status reports")
+        assert not index.add("Too short to keep.")
+
+        assert index.is_duplicate("The contractor shall submit monthly status reports")
+        assert not index.is_duplicate("Personnel must hold an active Secret clearance.")
+        assert len(index) == 1
+
+
+def test_extraction_skips_requirements_already_saved(client, db_session, sample_rfp):
+    sample_rfp.description = (
+        "The contractor shall provide monthly status reports to the program office. "
+        "Offerors must submit three references from similar projects."
+    )
+    db_session.add(
+        ComplianceRequirement(
+            rfp_id=sample_rfp.id,
+            requirement_id="R.1",
+            requirement_text="shall provide monthly status reports to the program office.",
+            order_index=0,
+        )
+    )
+    db_session.commit()
+
+    response = client.post(
+        f"/api/v1/compliance/rfps/{sample_rfp.id}/extract-requirements", json={"use_llm": False}
+    )
+
+    assert response.status_code == 200
+    texts = [r["requirement_text"] for r in response.json()["requirements"]]
+    assert texts == ["must submit three references from similar projects."]
+
+
+def test_checklist_skips_repeated_requirements_and_tasks(tmp_path):
+    generator = ComplianceChecklistGenerator(output_dir=str(tmp_path))
+    matrix = {
+        "requirements_and_responses": [
+            {"requirement_id": "req_1", "requirement_text": "shall provide all labor and equipment for repairs"},
+            {"requirement_id": "llm_req_1", "requirement_text": "Contractor shall provide all labor and equipment for repairs"},
+            {"requirement_id": "req_2", "requirement_text": "must submit weekly safety reports"},
+        ]
+    }
+    approach = {"project_management": "- Hold kickoff meeting with the agency\n1. Hold kickoff meeting with the agency"}
+
+    checklist = generator.generate_from_bid_document(
+        {"rfp_id": "R"}, {"sections": {"compliance_matrix": matrix, "technical_approach": approach}}
+    )
+
+    sources = [(item.meta.get("original_requirement_id"), item.meta["source"]) for item in checklist.items]
+    assert sources == [
+        ("req_1", "compliance_matrix"),
+        ("req_2", "compliance_matrix"),
+        (None, "technical_approach_text"),
+    ]
@@ -0,0 +1,113 @@
+"""Tests for the shared response cache."""
+import asyncio
+
+import pytest
+from app.core.cache import (
+    CacheTag,
+    LocalLRUCache,
+    ResponseCache,
+    make_cache_key,
+    response_cache,
+)
+from app.models.database import PipelineStage, RFPOpportunity
+
+
+@pytest.fixture
+def local_cache():
+    """Cache with only the in-process tier."""
+    return ResponseCache(local=LocalLRUCache(max_entries=3), remote=None)
+
+
+class TestCacheKeys:
+    """Key normalization."""
+
+    def test_param_order_does_not_matter(self):
+        assert make_cache_key("ns", {"a": 1, "b": 2}) == make_cache_key("ns", {"b": 2, "a": 1})
+
+    def test_enums_normalize_to_values(self):
+        assert make_cache_key("ns", {"stage": PipelineStage.REVIEW}) == make_cache_key(
+            "ns", {"stage": "review"}
+        )
+
+    def test_different_params_different_keys(self):
+        assert make_cache_key("ns", {"skip": 0}) != make_cache_key("ns", {"skip": 50})
+
+
+class TestResponseCache:
+    """Local tier, tags and single-flight."""
+
+    def test_lru_eviction(self, local_cache):
+        for i in range(4):
+            local_cache.set(f"k{i}", i, ttl=60)
+
+        assert local_cache.get("k0") is None
+        assert local_cache.get("k3") == 3
+
+    def test_tag_invalidation(self, local_cache):
+        local_cache.set("stats", {"total": 1}, ttl=60, tags=[CacheTag.RFPS])
+        local_cache.set("preds", [1, 2], ttl=60, tags=[CacheTag.PREDICTIONS])
+
+        local_cache.invalidate_tags(CacheTag.RFPS)
+
+        assert local_cache.get("stats") is None
+        assert local_cache.get("preds") == [1, 2]
+
+    def test_expired_entry_served_only_when_stale_allowed(self, local_cache):
+        local_cache.set("k", "v", ttl=-1)
+
+        assert local_cache.get("k") is None
+        assert local_cache.get_entry("k", allow_stale=True).value == "v"
+
+    def test_single_flight(self, local_cache):
+        calls = 0
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"value": calls}
+
+        async def run():
+            return await asyncio.gather(
+                *(local_cache.get_or_load("k", loader, ttl=60) for _ in range(5))
+            )
+
+        results = asyncio.run(run())
+
+        assert calls == 1
+        assert all(value == {"value": 1} for value, _ in results)
+
+
+class TestCachedEndpoints:
+    """Endpoints migrated onto the cache."""
+
+    def test_pipeline_status_pages_cached_separately(self, client, sample_rfp_list):
+        first = client.get("/api/v1/pipeline/status?limit=1").json()
+        second = client.get("/api/v1/pipeline/status?limit=2").json()
+
+        assert first["cached"] is False
+        assert second["cached"] is False
+        assert len(second["rfps"]) > len(first["rfps"])
+
+        repeat = client.get("/api/v1/pipeline/status?limit=1").json()
+        assert repeat["cached"] is True
+        assert repeat["rfps"] == first["rfps"]
+
+    def test_rfp_write_invalidates_stats(self, client, db_session, sample_rfp_list):
+        before = client.get("/api/v1/rfps/stats/overview").json()
+
+        db_session.add(
+            RFPOpportunity(rfp_id="RFP-CACHE-001", title="New", current_stage=PipelineStage.DISCOVERED)
+        )
+        db_session.commit()
+
+        after = client.get("/api/v1/rfps/stats/overview").json()
+        assert after["total_discovered"] == before["total_discovered"] + 1
+
+    def test_clear_pipeline_cache(self, client, sample_rfp_list):
+        client.get("/api/v1/pipeline/status")
+        assert len(response_cache.local) > 0
+
+        client.delete("/api/v1/pipeline/cache")
+
+        assert client.get("/api/v1/pipeline/status").json()["cached"] is False
@@ -241,6 +241,24 @@ class TestScrapedDataClasses:
         assert qa.asked_date is None
         assert qa.answered_date is None
 
+    def test_scraped_rfp_round_trips_through_dict(self):
+        """Should survive serialization for the scrape-result cache."""
+        import json
+        from datetime import datetime
+
+        rfp = ScrapedRFP(
+            source_url="https://example.com/rfp/1",
+            source_platform="test",
+            title="Test RFP",
+            response_deadline=datetime(2026, 3, 1, 17, 0),
+            documents=[ScrapedDocument(filename="sow.pdf", source_url="https://example.com/sow.pdf")],
+            qa_items=[ScrapedQA(question_text="Deadline?", asked_date=datetime(2026, 1, 5))],
+        )
+
+        restored = ScrapedRFP.from_dict(json.loads(json.dumps(rfp.to_dict())))
+
+        assert restored == rfp
+
 
 class TestDateParsing:
     """Tests for date parsing in scrapers."""
@@ -347,3 +365,204 @@ class TestFilenameSanitization:
         scraper = GenericWebScraper()
         assert scraper._sanitize_filename("file-name_v1.pdf") == "file-name_v1.pdf"
         assert scraper._sanitize_filename("File Name (1).pdf") == "File Name (1).pdf"
+
+
+class TestDirectDownloads:
+    """Tests for concurrent streaming downloads in BaseScraper."""
+
+    @staticmethod
+    async def _serve(handlers, run):
+        from aiohttp import web
+        from aiohttp.test_utils import TestServer
+
+        app = web.Application()
+        for path, handler in handlers.items():
+            app.router.add_get(path, handler)
+        async with TestServer(app) as server:
+            return await run(server)
+
+    def test_downloads_concurrently_and_hashes(self, tmp_path):
+        """Should stream every document to disk with a SHA-256 checksum."""
+        import asyncio
+        import hashlib
+
+        from aiohttp import web
+
+        in_flight = 0
+        peak = 0
+        body = b"%PDF-1.4 " + b"x" * 200_000
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+            return web.Response(body=body)
+
+        scraper = GenericWebScraper(document_storage_path=str(tmp_path))
+
+        async def run(server):
+            docs = [
+                ScrapedDocument(filename=f"doc{i}.pdf", source_url=str(server.make_url(f"/doc{i}")))
+                for i in range(6)
+            ]
+            return await scraper.download_documents_direct(docs, tmp_path)
+
+        handlers = {f"/doc{i}": handler for i in range(6)}
+        downloaded = asyncio.run(self._serve(handlers, run))
+
+        assert len(downloaded) == 6
+        assert peak == scraper.DOWNLOAD_CONCURRENCY
+        assert downloaded[0].checksum == hashlib.sha256(body).hexdigest()
+        assert downloaded[0].file_size == len(body)
+        assert (tmp_path / "doc0.pdf").read_bytes() == body
+
+    def test_unchanged_document_is_not_refetched(self, tmp_path):
+        """Should send the previous ETag and reuse the file on 304."""
+        import asyncio
+
+        from aiohttp import web
+
+        bodies_sent = 0
+
+        async def handler(request):
+            nonlocal bodies_sent
+            if request.headers.get("If-None-Match") == '"v1"':
+                return web.Response(status=304)
+            bodies_sent += 1
+            return web.Response(body=b"solicitation", headers={"ETag": '"v1"'})
+
+        scraper = GenericWebScraper(document_storage_path=str(tmp_path))
+
+        async def run(server):
+            results = []
+            for _ in range(2):
+                doc = ScrapedDocument(filename="sow.pdf", source_url=str(server.make_url("/sow")))
+                results.append(await scraper.download_documents_direct([doc], tmp_path))
+            return results
+
+        first, second = asyncio.run(self._serve({"/sow": handler}, run))
+
+        assert bodies_sent == 1
+        assert second[0].checksum == first[0].checksum
+        assert second[0].file_path == first[0].file_path
+
+    def test_size_match_without_validators_skips_body(self, tmp_path):
+        """Should fall back to Content-Length when there is no ETag or Last-Modified."""
+        import asyncio
+
+        from aiohttp import web
+
+        async def handler(request):
+            return web.Response(body=b"same size")
+
+        scraper = GenericWebScraper(document_storage_path=str(tmp_path))
+
+        async def run(server):
+            url = str(server.make_url("/doc"))
+            await scraper.download_documents_direct([ScrapedDocument("a.pdf", url)], tmp_path)
+            # Same length, so a re-fetch would be visible as a changed file
+            (tmp_path / "a.pdf").write_bytes(b"SAME SIZE")
+            return await scraper.download_documents_direct([ScrapedDocument("a.pdf", url)], tmp_path)
+
+        result = asyncio.run(self._serve({"/doc": handler}, run))
+
+        assert len(result) == 1
+        assert (tmp_path / "a.pdf").read_bytes() == b"SAME SIZE"
+
+    def test_failed_download_is_dropped(self, tmp_path):
+        """Should return only documents that downloaded."""
+        import asyncio
+
+        from aiohttp import web
+
+        async def missing(request):
+            return web.Response(status=404)
+
+        scraper = GenericWebScraper(document_storage_path=str(tmp_path))
+        scraper.DOWNLOAD_MAX_RETRIES = 1
+
+        async def run(server):
+            doc = ScrapedDocument("gone.pdf", str(server.make_url("/gone")))
+            return await scraper.download_documents_direct([doc], tmp_path)
+
+        assert asyncio.run(self._serve({"/gone": missing}, run)) == []
+
+
+class TestScrapeResultCache:
+    """Tests for sharing one scrape between preview and confirm."""
+
+    def test_confirm_reuses_preview_scrape(self, client):
+        """Should scrape the URL once for preview followed by confirm."""
+        url = "https://portal.example.gov/rfp/42"
+        scraper = MagicMock()
+        scraper.scrape = AsyncMock(
+            return_value=ScrapedRFP(source_url=url, source_platform="generic", title="Road Repair")
+        )
+
+        with patch("app.routes.scraper.get_scraper", return_value=scraper):
+            preview = client.post("/api/v1/scraper/preview", json={"url": url})
+            confirm = client.post(
+                "/api/v1/scraper/confirm",
+                json={"source_url": url, "overrides": {"title": "Road Repair 2026"}},
+            )
+
+        assert preview.status_code == 200
+        assert preview.json()["detected_fields"]["title"] == "Road Repair"
+        assert confirm.status_code == 200
+        assert confirm.json()["title"] == "Road Repair 2026"
+        assert scraper.scrape.await_count == 1
+
+    def test_direct_scrape_is_not_cached(self, client):
+        """Should scrape fresh on /scrape even after a preview of the URL."""
+        url = "https://portal.example.gov/rfp/43"
+        scraper = MagicMock()
+        scraper.scrape = AsyncMock(
+            return_value=ScrapedRFP(source_url=url, source_platform="generic", title="Road Repair")
+        )
+
+        with patch("app.routes.scraper.get_scraper", return_value=scraper):
+            assert client.post("/api/v1/scraper/preview", json={"url": url}).status_code == 200
+            assert client.post("/api/v1/scraper/scrape", json={"url": url}).status_code == 200
+
+        assert scraper.scrape.await_count == 2
+
+
+class TestStagehandSession:
+    """Tests for the shared Stagehand session factory."""
+
+    def test_default_session_uses_configured_options(self, monkeypatch):
+        """Should create and initialize Stagehand for any scraper."""
+        import asyncio
+        import sys
+        import types
+
+        created = []
+
+        class FakeStagehand:
+            def __init__(self, **options):
+                self.options = options
+                self.init = AsyncMock()
+                created.append(self)
+
+        monkeypatch.setitem(sys.modules, "stagehand", types.SimpleNamespace(Stagehand=FakeStagehand))
+        scraper = GenericWebScraper()
+
+        session = asyncio.run(scraper._create_stagehand_session())
+
+        assert created == [session]
+        session.init.assert_awaited_once()
+        assert session.options["env"] in ("LOCAL", "BROWSERBASE")
+
+    def test_missing_stagehand_raises_scraper_error(self, monkeypatch):
+        """Should report a missing Stagehand package as a scraper error."""
+        import asyncio
+        import sys
+
+        from src.agents.scrapers.base_scraper import ScraperError
+
+        monkeypatch.setitem(sys.modules, "stagehand", None)
+
+        with pytest.raises(ScraperError):
+            asyncio.run(GenericWebScraper()._create_stagehand_session())
@@ -0,0 +1,96 @@
+"""Tests for the proposal section DAG scheduler."""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.bid_generation.section_scheduler import SectionScheduler, SectionTask
+
+
+def _slow(value, delay=0.05):
+    def run(_deps):
+        time.sleep(delay)
+        return value
+    return run
+
+
+class TestSectionScheduler:
+    """Ordering, concurrency, failures and retries."""
+
+    def test_independent_sections_run_concurrently(self):
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+
+        def section(_deps):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.05)
+            with lock:
+                in_flight -= 1
+            return "ok"
+
+        tasks = [SectionTask(f"s{i}", section) for i in range(5)]
+        run = asyncio.run(SectionScheduler(tasks, max_concurrency=3).run())
+
+        assert run.succeeded
+        assert peak == 3
+
+    def test_dependents_receive_inputs(self):
+        tasks = [
+            SectionTask("matrix", _slow({"requirements": 2})),
+            SectionTask("summary", lambda deps: f"{deps['matrix']['requirements']} reqs", depends_on=("matrix",)),
+        ]
+
+        run = asyncio.run(SectionScheduler(tasks).run())
+
+        assert run.results["summary"] == "2 reqs"
+
+    def test_failure_skips_dependents_only(self):
+        def boom(_deps):
+            raise RuntimeError("api down")
+
+        tasks = [
+            SectionTask("pricing", boom),
+            SectionTask("summary", _slow("s"), depends_on=("pricing",)),
+            SectionTask("management", _slow("m")),
+        ]
+
+        run = asyncio.run(SectionScheduler(tasks).run())
+
+        assert run.failed == {"pricing": "api down"}
+        assert run.skipped == ["summary"]
+        assert run.results == {"management": "m"}
+
+    def test_retry_reuses_completed_sections(self):
+        calls = []
+
+        def section(name):
+            def run(_deps):
+                calls.append(name)
+                return name
+            return run
+
+        tasks = [SectionTask(name, section(name), checkpoint=True) for name in ("a", "b", "c")]
+        events = []
+
+        async def on_event(event):
+            events.append((event.name, event.status))
+
+        run = asyncio.run(SectionScheduler(tasks, on_event=on_event).run(completed={"a": "a", "b": "b"}))
+
+        assert calls == ["c"]
+        assert run.reused == ["a", "b"]
+        assert ("c", "completed") in events
+
+    def test_rejects_cycles(self):
+        tasks = [
+            SectionTask("a", _slow(1), depends_on=("b",)),
+            SectionTask("b", _slow(2), depends_on=("a",)),
+        ]
+
+        with pytest.raises(ValueError):
+            SectionScheduler(tasks)
@@ -0,0 +1,164 @@
+"""Tests for the persistent extracted-text store."""
+import sys
+import types
+from concurrent.futures import ThreadPoolExecutor
+
+from src.utils.text_store import ExtractedText, ExtractedTextStore
+
+
+def _write(path, text):
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+class TestExtractedText:
+    """Page offsets."""
+
+    def test_page_slices(self):
+        extracted = ExtractedText.from_pages("abc", ["one", "two", "three"], "text_layer")
+
+        assert extracted.page_count == 3
+        assert extracted.pages(1, 2) == "two"
+        assert extracted.pages(1) == "two\n\nthree"
+        assert extracted.pages(0, 50) == extracted.text
+
+
+class TestExtractedTextStore:
+    """Persistence and reuse."""
+
+    def test_extracts_once_per_checksum(self, tmp_path, monkeypatch):
+        store = ExtractedTextStore(tmp_path / "store")
+        doc = _write(tmp_path / "rfp.txt", "Scope of work")
+        calls = []
+
+        import src.utils.text_store as text_store
+
+        original = text_store.extract_pages
+
+        def counting_extract(path, pool=None):
+            calls.append(path)
+            return original(path, pool)
+
+        monkeypatch.setattr(text_store, "extract_pages", counting_extract)
+
+        assert store.get_or_extract(doc).text == "Scope of work"
+        # A fresh store (e.g. another worker) reads the persisted entry
+        assert ExtractedTextStore(tmp_path / "store").get_or_extract(doc).text == "Scope of work"
+        assert len(calls) == 1
+
+    def test_changed_content_is_re_extracted(self, tmp_path):
+        store = ExtractedTextStore(tmp_path / "store")
+        doc = _write(tmp_path / "rfp.md", "v1")
+        store.get_or_extract(doc)
+
+        _write(doc, "version two")
+
+        assert store.get_or_extract(doc).text == "version two"
+
+    def test_get_does_not_extract(self, tmp_path):
+        store = ExtractedTextStore(tmp_path / "store")
+        doc = _write(tmp_path / "rfp.txt", "text")
+
+        assert store.get(doc) is None
+
+    def test_pool_extraction(self, tmp_path):
+        store = ExtractedTextStore(tmp_path / "store", max_workers=1)
+        doc = _write(tmp_path / "rfp.txt", "pooled")
+        try:
+            checksum = store.submit(doc).result(timeout=60)
+        finally:
+            store.shutdown()
+
+        assert store.load(checksum).text == "pooled"
+
+    def test_bounded_read_extracts_only_requested_pages(self, tmp_path, monkeypatch):
+        import src.utils.text_store as text_store
+
+        pages = [f"page {i} " * 20 for i in range(10)]
+        requested = []
+
+        def fake_pages(path, max_pages=None):
+            requested.append(max_pages)
+            return pages[:max_pages]
+
+        monkeypatch.setattr(text_store, "_pdf_text_pages", fake_pages)
+        (tmp_path / "rfp.pdf").write_bytes(b"pdf")
+        store = ExtractedTextStore(tmp_path / "store")
+        submitted = []
+        monkeypatch.setattr(store, "submit", submitted.append)
+
+        assert store.read(tmp_path / "rfp.pdf", max_pages=3) == "\n\n".join(pages[:3])
+        assert requested == [3]
+        # The whole file goes to the pool instead of being stored half-read
+        assert submitted == [tmp_path / "rfp.pdf"]
+        assert store.get(tmp_path / "rfp.pdf") is None
+
+    def test_bounded_read_stores_short_documents(self, tmp_path, monkeypatch):
+        import src.utils.text_store as text_store
+
+        monkeypatch.setattr(text_store, "_pdf_text_pages", lambda path, max_pages=None: ["only page " * 20])
+        (tmp_path / "rfp.pdf").write_bytes(b"pdf")
+        store = ExtractedTextStore(tmp_path / "store")
+
+        store.read(tmp_path / "rfp.pdf", max_pages=50)
+
+        assert store.get(tmp_path / "rfp.pdf").page_count == 1
+
+
+class TestScannedPdf:
+    """Per-page OCR planning."""
+
+    def test_plan_ocr_lowers_dpi_for_large_scans(self):
+        from src.utils.text_store import plan_ocr
+
+        assert plan_ocr(3) == (3, 200)
+        pages, dpi = plan_ocr(30)
+        assert pages == 30 and 100 < dpi < 200
+        assert plan_ocr(500) == (50, 100)
+
+    def test_only_scanned_pages_are_ocrd(self, tmp_path, monkeypatch):
+        import src.utils.text_store as text_store
+
+        text_page = "Section L instructions to offerors " * 3
+        monkeypatch.setattr(text_store, "_pdf_text_pages", lambda path, max_pages=None: [text_page, "", "  "])
+        requested = []
+
+        def fake_ocr(path, page_indexes, dpi, pool=None):
+            requested.extend(page_indexes)
+            return {i: f"scanned page {i}" for i in page_indexes}
+
+        monkeypatch.setattr(text_store, "_ocr_pages", fake_ocr)
+
+        pages, method = text_store._extract_pdf(tmp_path / "rfp.pdf")
+
+        assert requested == [1, 2]
+        assert pages == [text_page, "scanned page 1", "scanned page 2"]
+        assert method == "mixed"
+
+    def test_ocr_runs_in_the_store_pool(self, tmp_path, monkeypatch):
+        import src.utils.text_store as text_store
+
+        monkeypatch.setattr(text_store, "_pdf_text_pages", lambda path, max_pages=None: ["", ""])
+        monkeypatch.setattr(text_store, "_ocr_page", lambda path, page, dpi: f"scanned page {page}")
+        pools = []
+        real_ocr_pages = text_store._ocr_pages
+
+        def recording_ocr(path, page_indexes, dpi, pool=None):
+            pools.append(pool)
+            return real_ocr_pages(path, page_indexes, dpi, pool)
+
+        monkeypatch.setattr(text_store, "_ocr_pages", recording_ocr)
+        monkeypatch.setitem(sys.modules, "pdf2image", types.ModuleType("pdf2image"))
+        monkeypatch.setitem(sys.modules, "pytesseract", types.ModuleType("pytesseract"))
+        (tmp_path / "a.pdf").write_bytes(b"scan a")
+        (tmp_path / "b.pdf").write_bytes(b"scan b")
+
+        store = ExtractedTextStore(tmp_path / "store", max_workers=2)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            monkeypatch.setattr(store, "_get_pool", lambda: pool)
+            assert store.get_or_extract(tmp_path / "a.pdf").text == "scanned page 1\n\nscanned page 2"
+        assert pools == [pool]
+
+        # Extraction inside the pool does not start processes of its own
+        ExtractedTextStore(tmp_path / "store", max_workers=1).get_or_extract(tmp_path / "b.pdf")
+        assert pools == [pool, None]
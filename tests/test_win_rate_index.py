@@ -0,0 +1,191 @@
+"""Tests for the historical win-rate index."""
+import pytest
+from app.models.database import BidOutcome, RFPOpportunity, WinRateCell
+from app.services.win_rate_index import (
+    get_win_rate_index,
+    invalidate_win_rate_index,
+    rebuild_win_rate_index,
+    register_win_rate_listeners,
+)
+
+from src.decision.go_nogo_engine import GoNoGoEngine
+from src.decision.win_rates import WinRateIndex, outcome_cells, set_win_rate_source, value_band
+
+
+@pytest.fixture(autouse=True)
+def win_rate_listeners():
+    register_win_rate_listeners()
+    invalidate_win_rate_index()
+    yield
+    set_win_rate_source(None)
+    invalidate_win_rate_index()
+
+
+def _cells(db_session):
+    db_session.expire_all()
+    return {
+        (cell.dimension, cell.key): (cell.wins, cell.losses)
+        for cell in db_session.query(WinRateCell).all()
+        if cell.wins or cell.losses
+    }
+
+
+def _rfp(db_session, i, **fields):
+    rfp = RFPOpportunity(rfp_id=f"WR-{i}", title=f"Win rate RFP {i}", **fields)
+    db_session.add(rfp)
+    db_session.flush()
+    return rfp
+
+
+def test_value_band():
+    assert [value_band(v) for v in (None, 0, 5e4, 1e5, 5e5, 5e6)] == [
+        "Unknown", "Unknown", "small", "small", "medium", "large",
+    ]
+
+
+def test_outcome_writes_update_cells(db_session):
+    rfp = _rfp(
+        db_session, 1, naics_code="541511", agency="GSA", estimated_value=5e5,
+        rfp_metadata={"set_asides": ["8(a)", "SDVOSB"]},
+    )
+    outcome = BidOutcome(rfp_id=rfp.id, status="pending")
+    db_session.add(outcome)
+    db_session.commit()
+    assert _cells(db_session) == {}
+
+    outcome.status = "won"
+    db_session.commit()
+    assert _cells(db_session) == dict.fromkeys(outcome_cells("541511", "GSA", 5e5, "8(a)"), (1, 0))
+
+    outcome.status = "lost"
+    db_session.commit()
+    assert _cells(db_session)[("naics", "541511")] == (0, 1)
+
+    # Moving the RFP moves its outcome between cells
+    rfp.agency = "DOD"
+    rfp.award_amount = 2e6
+    db_session.commit()
+    cells = _cells(db_session)
+    assert ("agency", "GSA") not in cells and cells[("agency", "DOD")] == (0, 1)
+    assert ("value_band", "medium") not in cells and cells[("value_band", "large")] == (0, 1)
+
+    db_session.delete(outcome)
+    db_session.commit()
+    assert _cells(db_session) == {}
+
+
+def test_rolled_back_outcome_is_not_counted(db_session):
+    rfp = _rfp(db_session, 1, naics_code="541511")
+    db_session.commit()
+
+    db_session.add(BidOutcome(rfp_id=rfp.id, status="won"))
+    db_session.flush()
+    assert _cells(db_session)[("overall", "all")] == (1, 0)
+    db_session.rollback()
+    assert _cells(db_session) == {}
+
+
+def test_rebuild_matches_incremental_counts(db_session):
+    for i, status in enumerate(["won", "lost", "lost", "no_bid", "won"]):
+        rfp = _rfp(db_session, i, naics_code=["541511", "236220"][i % 2], agency="GSA", estimated_value=5e4)
+        db_session.add(BidOutcome(rfp_id=rfp.id, status=status))
+    db_session.commit()
+    incremental = _cells(db_session)
+
+    assert rebuild_win_rate_index(db_session) == 4
+    assert _cells(db_session) == incremental
+    assert incremental[("naics", "541511")] == (2, 1)
+    assert incremental[("overall", "all")] == (2, 2)
+
+
+def test_smoothing_shrinks_sparse_cells():
+    index = WinRateIndex({
+        ("overall", "all"): (30, 70),
+        ("naics", "541511"): (1, 0),
+        ("naics", "236220"): (60, 20),
+    }, prior_strength=10)
+
+    assert index.prior_rate == pytest.approx(31 / 102)
+    assert index.rate("naics", "541511") == pytest.approx((1 + 10 * 31 / 102) / 11)
+    assert index.rate("naics", 236220) == pytest.approx((60 + 10 * 31 / 102) / 90)
+    assert index.rate("naics", "111111", default=0.5) == 0.5
+    assert index.observed_rates("naics") == {"236220": 0.75, "541511": 1.0}
+
+
+def test_snapshot_self_heals_and_follows_commits(db_session):
+    rfp = _rfp(db_session, 1, naics_code="541511")
+    db_session.add(BidOutcome(rfp_id=rfp.id, status="won"))
+    db_session.commit()
+    db_session.query(WinRateCell).delete()
+    db_session.commit()
+
+    # Outcomes recorded without the index are counted on first read
+    assert get_win_rate_index(db_session).decided == 1
+
+    rfp = _rfp(db_session, 2, naics_code="541511")
+    db_session.add(BidOutcome(rfp_id=rfp.id, status="lost"))
+    db_session.commit()
+    assert get_win_rate_index(db_session).counts[("naics", "541511")] == (1, 1)
+
+
+def test_engine_uses_recorded_win_rates(db_session, tmp_path):
+    engine = GoNoGoEngine(config_dir=str(tmp_path / "config"), historical_data_dir=str(tmp_path))
+    assumed = dict(engine.win_rate_patterns)
+    assert "naics_541511" not in assumed
+
+    for i, status in enumerate(["won", "won", "won", "lost"]):
+        rfp = _rfp(db_session, i, naics_code="541511", estimated_value=5e4)
+        db_session.add(BidOutcome(rfp_id=rfp.id, status=status))
+    db_session.commit()
+    set_win_rate_source(lambda: get_win_rate_index(db_session))
+
+    index = get_win_rate_index(db_session)
+    patterns = engine.win_rate_patterns
+    assert patterns["naics_541511"] == pytest.approx(index.rate("naics", "541511"))
+    assert patterns["small_contracts"] == pytest.approx(index.rate("value_band", "small"))
+    assert "large_contracts" not in patterns
+
+    score, _, _ = engine._calculate_historical_score({"naics_code": "541511", "award_amount": 5e4})
+    assert score == pytest.approx((patterns["naics_541511"] * 0.6 + patterns["small_contracts"] * 0.4) * 100)
+
+    set_win_rate_source(None)
+    assert engine.win_rate_patterns == assumed
+
+
+def test_win_rates_endpoint(client, db_session):
+    for i, status in enumerate(["won", "lost", "lost"]):
+        rfp = _rfp(db_session, i, naics_code="541511", agency=["GSA", "DOD", "DOD"][i])
+        db_session.add(BidOutcome(rfp_id=rfp.id, status=status))
+    db_session.commit()
+
+    response = client.get("/api/v1/analytics/win-rates", params={"dimension": "agency"})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["decided_bids"] == 3
+    assert [(c["key"], c["wins"], c["losses"]) for c in body["dimensions"]["agency"]] == [
+        ("DOD", 0, 2), ("GSA", 1, 0),
+    ]
+
+    overview = client.get("/api/v1/analytics/overview").json()
+    assert overview["win_rate_by_agency"] == {"DOD": 0.0, "GSA": 1.0}
+    assert overview["win_rate_by_category"] == {"541511": 0.333}
+
+    assert client.get("/api/v1/analytics/win-rates", params={"dimension": "color"}).status_code == 400
+
+
+def test_overview_rates_agree_with_and_without_filters(client, db_session):
+    outcomes = []
+    for i, agency in enumerate(["GSA", "DOD", "NASA"]):
+        rfp = _rfp(db_session, i, naics_code="541511", agency=agency)
+        outcomes.append(BidOutcome(rfp_id=rfp.id, status="pending" if agency == "NASA" else "won"))
+        db_session.add(outcomes[-1])
+    db_session.commit()
+    # GSA's only decided bid is reopened, leaving a zero-count cell behind
+    outcomes[0].status = "pending"
+    db_session.commit()
+
+    unfiltered = client.get("/api/v1/analytics/overview").json()
+    filtered = client.get("/api/v1/analytics/overview", params={"naics_code": "541511"}).json()
+
+    assert unfiltered["win_rate_by_agency"] == filtered["win_rate_by_agency"] == {"DOD": 1.0}
+    assert unfiltered["win_rate_by_category"] == filtered["win_rate_by_category"] == {"541511": 1.0}